@@ -2,16 +2,18 @@ import importlib
 import json
 import os
 import sys
-from functools import partial
 from pathlib import Path
 import logging
 import asyncio
 import re
-from typing import List, Tuple
-from opentrons.hardware_control import API, ThreadManager
+from typing import List, Tuple, TYPE_CHECKING
 from opentrons.config import (feature_flags as ff, name,
                               robot_configs, IS_ROBOT, ROBOT_FIRMWARE_DIR)
 from opentrons.util import logging_config
+from opentrons.calibration_storage import file_operators as cal_io
+
+if TYPE_CHECKING:
+    from opentrons.hardware_control import API, ThreadManager
 
 version = sys.version_info[0:2]
 if version < (3, 7):
@@ -33,6 +35,10 @@ from opentrons import config  # noqa(E402)
 LEGACY_MODULES = [
     'robot', 'reset', 'instruments', 'containers', 'labware', 'modules']
 
+#: Attributes imported from hardware_control on first use, since importing it
+#: pulls in numpy and the hardware drivers
+HARDWARE_CONTROL_ATTRS = ['API', 'ThreadManager']
+
 __all__ = ['version', 'HERE', 'LEGACY_MODULES', 'config']
 
 
@@ -54,29 +60,42 @@ def __getattr__(attrname):
             setattr(sys.modules[__name__], attrname,
                     getattr(legacy_api, attrname))
         return getattr(sys.modules[__name__], attrname)
+    if attrname in HARDWARE_CONTROL_ATTRS:
+        hardware_control = importlib.import_module(
+            '.'.join([__name__, 'hardware_control']))
+        value = getattr(hardware_control, attrname)
+        setattr(sys.modules[__name__], attrname, value)
+        return value
     raise AttributeError(attrname)
 
 
 def __dir__():
-    return sorted(__all__ + LEGACY_MODULES)
+    return sorted(__all__ + LEGACY_MODULES + HARDWARE_CONTROL_ATTRS)
 
 
-try:
-    from opentrons.hardware_control.socket_server\
-        import run as install_hardware_server
-except ImportError:
-    async def install_hardware_server(sock_path, api):  # type: ignore
-        log.warning("Cannot start hardware server: missing dependency")
+log = logging.getLogger(__name__)
 
 
-log = logging.getLogger(__name__)
+async def install_hardware_server(sock_path: str, api: 'API'):
+    """ Start the hardware socket server, which needs extra dependencies
+    that are only installed on the robot """
+    try:
+        from opentrons.hardware_control.socket_server import run
+    except ImportError:
+        log.warning("Cannot start hardware server: missing dependency")
+        return None
+    return await run(sock_path, api)
 
-try:
-    import systemd.daemon  # type: ignore
-    systemdd_notify = partial(systemd.daemon.notify, "READY=1")
-except ImportError:
-    log.info("Systemd couldn't be imported, not notifying")
-    systemdd_notify = partial(lambda: None)
+
+def systemdd_notify():
+    """ Tell systemd that the server is ready, if it is running under
+    systemd """
+    try:
+        import systemd.daemon  # type: ignore
+    except ImportError:
+        log.info("Systemd couldn't be imported, not notifying")
+        return
+    systemd.daemon.notify("READY=1")
 
 
 SMOOTHIE_HEX_RE = re.compile('smoothie-(.*).hex')
@@ -101,7 +120,9 @@ def _find_smoothie_file() -> Tuple[Path, str]:
     raise OSError(f"Could not find smoothie firmware file in {resources_path}")
 
 
-async def initialize_robot() -> ThreadManager:
+async def initialize_robot() -> 'ThreadManager':
+    from opentrons.hardware_control import API, ThreadManager
+
     if os.environ.get("ENABLE_VIRTUAL_SMOOTHIE"):
         log.info("Initialized robot using virtual Smoothie")
         systemdd_notify()
@@ -144,7 +165,7 @@ async def initialize_robot() -> ThreadManager:
 async def initialize(
         hardware_server: bool = False,
         hardware_server_socket: str = None) \
-        -> ThreadManager:
+        -> 'ThreadManager':
     """
     Initialize the Opentrons hardware returning a hardware instance.
 
@@ -161,6 +182,10 @@ async def initialize(
     log.info(f"API server version:  {__version__}")
     log.info(f"Robot Name: {name()}")
 
+    # Finish any calibration save that a power loss interrupted before
+    # the hardware controller loads calibration
+    cal_io.replay_journal()
+
     hardware = await initialize_robot()
 
     if hardware_server:
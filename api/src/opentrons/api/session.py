@@ -24,9 +24,9 @@ from opentrons.protocol_api import (ProtocolContext,
                                     labware)
 from opentrons.protocols.geometry import module_geometry
 from opentrons.protocols.execution.execute import run_protocol
-from opentrons.hardware_control import (API, ThreadManager,
-                                        ExecutionCancelledError,
+from opentrons.hardware_control import (ExecutionCancelledError,
                                         ThreadedAsyncLock)
+from opentrons.hardware_control.simulator_pool import get_default_pool
 from opentrons.hardware_control.types import (DoorState, HardwareEventType,
                                               HardwareEvent)
 from .models import Container, Instrument, Module
@@ -217,16 +217,19 @@ class Session(RobotBusy):
 
     @classmethod
     def build_and_prep(
-        cls, name, contents, hardware, loop, broker, motion_lock, extra_labware
+        cls, name, contents, hardware, loop, broker, motion_lock,
+        extra_labware, simulator_pool=None
     ):
         protocol = parse(contents, filename=name,
                          extra_labware={helpers.uri_from_definition(defn): defn
                                         for defn in extra_labware})
-        sess = cls(name, protocol, hardware, loop, broker, motion_lock)
+        sess = cls(name, protocol, hardware, loop, broker, motion_lock,
+                   simulator_pool)
         sess.prepare()
         return sess
 
-    def __init__(self, name, protocol, hardware, loop, broker, motion_lock):
+    def __init__(self, name, protocol, hardware, loop, broker, motion_lock,
+                 simulator_pool=None):
         self._broker = broker
         self._default_logger = self._broker.logger
         self._sim_logger = self._broker.logger.getChild('sim')
@@ -244,6 +247,9 @@ class Session(RobotBusy):
         self.metadata = getattr(self._protocol, 'metadata', {})
 
         self._hardware = hardware
+        # Simulations borrow their hardware from here rather than building
+        # a new simulator every time
+        self._simulator_pool = simulator_pool or get_default_pool()
         self._simulating_ctx = ProtocolContext.build_using(
             self._protocol, loop=self._loop, broker=self._broker)
 
@@ -370,22 +376,20 @@ class Session(RobotBusy):
                     if pip:
                         instrs[mount] = {'model': pip['model'],
                                          'id': pip.get('pipette_id', '')}
-                sync_sim = ThreadManager(
-                        API.build_hardware_simulator,
+                with self._simulator_pool.simulator(
                         instrs,
                         [mod.name()
-                            for mod in self._hardware.attached_modules],
-                        strict_attached_instruments=False
-                        ).sync
-                sync_sim.home()
-                self._simulating_ctx = ProtocolContext.build_using(
-                    self._protocol,
-                    loop=self._loop,
-                    hardware=sync_sim,
-                    broker=self._broker,
-                    extra_labware=getattr(self._protocol, 'extra_labware', {}))
-                run_protocol(self._protocol,
-                             context=self._simulating_ctx)
+                            for mod in self._hardware.attached_modules]
+                ) as sync_sim:
+                    self._simulating_ctx = ProtocolContext.build_using(
+                        self._protocol,
+                        loop=self._loop,
+                        hardware=sync_sim,
+                        broker=self._broker,
+                        extra_labware=getattr(
+                            self._protocol, 'extra_labware', {}))
+                    run_protocol(self._protocol,
+                                 context=self._simulating_ctx)
             else:
                 robot.broker = self._broker
                 # we don't rely on being connected anymore so make sure we are
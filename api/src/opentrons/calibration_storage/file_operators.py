@@ -4,10 +4,24 @@ manipulate the file system.
 These methods should only be imported inside the calibration_storage
 module, except in the special case of v2 labware support in
 the v1 API.
+
+Files are saved by writing a temporary file in the same directory, syncing
+it and renaming it over the target, so a power loss leaves either the old
+or the new contents. Saves made inside :py:func:`batch` are committed
+together: they are first recorded in a journal, which
+:py:func:`replay_journal` applies at startup if the commit was interrupted.
 """
+import contextlib
 import json
 import datetime
+import logging
+import os
+import tempfile
+import threading
 import typing
+from pathlib import Path
+
+from opentrons import config
 
 from .types import StrPath
 from .encoder_decoder import DateTimeEncoder, DateTimeDecoder
@@ -16,6 +30,27 @@ from .encoder_decoder import DateTimeEncoder, DateTimeDecoder
 DecoderType = typing.Type[json.JSONDecoder]
 EncoderType = typing.Type[json.JSONEncoder]
 
+log = logging.getLogger(__name__)
+
+JOURNAL_FILE_NAME = 'calibration_journal.json'
+
+# The saves of the batch in progress on each thread, by absolute path
+_batches = threading.local()
+
+
+def _pending_writes() -> typing.Optional[typing.Dict[str, str]]:
+    return getattr(_batches, 'writes', None)
+
+
+def _key(filepath: StrPath) -> str:
+    return os.path.abspath(os.fspath(filepath))
+
+
+def journal_path() -> Path:
+    """ Where an in-progress batch records its saves """
+    return Path(config.get_opentrons_path('robot_calibration_dir'))\
+        / JOURNAL_FILE_NAME
+
 
 def read_cal_file(
         filepath: StrPath,
@@ -34,8 +69,12 @@ def read_cal_file(
     # This can be done when the labware endpoints
     # are refactored to grab tip length calibration
     # from the correct locations.
-    with open(filepath, 'r') as f:
-        calibration_data = json.load(f, cls=decoder)
+    pending = _pending_writes()
+    if pending is not None and _key(filepath) in pending:
+        calibration_data = json.loads(pending[_key(filepath)], cls=decoder)
+    else:
+        with open(filepath, 'r') as f:
+            calibration_data = json.load(f, cls=decoder)
     if isinstance(calibration_data.values(), dict):
         for value in calibration_data.values():
             if value.get('lastModified'):
@@ -54,10 +93,122 @@ def save_to_file(
     """
     Function used to save data to a file
 
+    Inside :py:func:`batch` the file is written when the batch ends, and
+    reads of it see the new data until then.
+
     :param filepath: path to save data at
     :param data: data to save
     :param encoder: if there is any specialized encoder needed.
     The default encoder is the date time encoder.
     """
-    with open(filepath, 'w') as f:
-        json.dump(data, f, cls=encoder)
+    contents = json.dumps(data, cls=encoder)
+    pending = _pending_writes()
+    if pending is not None:
+        pending[_key(filepath)] = contents
+    else:
+        _write_atomic(_key(filepath), contents)
+
+
+@contextlib.contextmanager
+def batch() -> typing.Iterator[None]:
+    """
+    Commit every file saved in the block together when it ends.
+
+    If the block raises, none of its saves are written. Nested batches are
+    part of the outermost one.
+    """
+    if _pending_writes() is not None:
+        yield
+        return
+    _batches.writes = {}
+    try:
+        yield
+        writes = _batches.writes
+    finally:
+        _batches.writes = None
+    _commit(writes)
+
+
+def replay_journal() -> bool:
+    """
+    Finish a batch that was interrupted before all of its files were
+    written. Call at startup, before reading any calibration.
+
+    :return: Whether there was a batch to finish
+    """
+    journal = journal_path()
+    try:
+        with open(journal, 'r') as f:
+            writes = json.load(f)['files']
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError, KeyError):
+        log.exception(f'Discarding unreadable calibration journal {journal}')
+        journal.unlink()
+        return False
+    log.warning(f'Finishing interrupted calibration save of {len(writes)} '
+                f'files')
+    try:
+        _apply(writes)
+    except OSError:
+        log.exception('Could not finish interrupted calibration save')
+    journal.unlink()
+    return True
+
+
+def _commit(writes: typing.Dict[str, str]):
+    if not writes:
+        return
+    if len(writes) == 1:
+        [(path, contents)] = writes.items()
+        _write_atomic(path, contents)
+        return
+    journal = journal_path()
+    journal.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(str(journal), json.dumps({'files': writes}))
+    _apply(writes)
+    journal.unlink()
+
+
+def _apply(writes: typing.Dict[str, str]):
+    """ Write the files, syncing each directory once at the end """
+    for path, contents in writes.items():
+        _write_atomic(path, contents, sync_dir=False)
+    for directory in {os.path.dirname(path) for path in writes}:
+        _fsync_dir(directory)
+
+
+def _write_atomic(path: str, contents: str, sync_dir: bool = True):
+    directory, name = os.path.split(path)
+    fd, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=f'.{name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(contents)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp makes files only the owner can read
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    if sync_dir:
+        _fsync_dir(directory)
+
+
+def _fsync_dir(directory: str):
+    """ Make renames in a directory durable, where the OS allows it """
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
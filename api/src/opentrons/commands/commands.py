@@ -6,17 +6,16 @@ import functools
 import inspect
 from typing import Union, Sequence, List, Any, Optional, TYPE_CHECKING
 
-from opentrons.legacy_api.containers import (Well as OldWell,
-                                             Container as OldContainer,
-                                             Slot as OldSlot,
-                                             location_to_list)
 from opentrons.protocol_api.labware import Well
 from opentrons.protocols.api_support.util import FlowRates
 from opentrons.types import Location
 from opentrons.drivers import utils
+from opentrons.util import tracing
 
 if TYPE_CHECKING:
     from opentrons.protocol_api.instrument_context import InstrumentContext
+    from opentrons.legacy_api.containers import (  # noqa(F401)
+        Well as OldWell, Container as OldContainer, Slot as OldSlot)
 
 
 Apiv2Locations = Sequence[Union[Location, Well]]
@@ -24,8 +23,8 @@ Apiv2Instruments = Sequence['InstrumentContext']
 
 
 def is_new_loc(location: Union[Location, Well, None,
-                               OldWell, OldContainer,
-                               OldSlot, Sequence]) -> bool:
+                               'OldWell', 'OldContainer',
+                               'OldSlot', Sequence]) -> bool:
     return isinstance(listify(location)[0], (Location, Well))
 
 
@@ -64,8 +63,18 @@ def _stringify_new_loc(loc: Union[Location, Well]) -> str:
         raise TypeError(loc)
 
 
-def _stringify_legacy_loc(loc: Union[OldWell, OldContainer,
-                                     OldSlot, None]) -> str:
+def _legacy_list(location: Any) -> List:
+    """ Flatten a legacy location, which only v1 protocols have, so only
+    they pay for importing the legacy api """
+    from opentrons.legacy_api.containers import location_to_list
+    return location_to_list(location)
+
+
+def _stringify_legacy_loc(loc: Union['OldWell', 'OldContainer',
+                                     'OldSlot', None]) -> str:
+    from opentrons.legacy_api.containers import (
+        Well as OldWell, Container as OldContainer, Slot as OldSlot)
+
     def get_slot(location):
         trace = location.get_trace()
         for item in trace:
@@ -85,7 +94,7 @@ def _stringify_legacy_loc(loc: Union[OldWell, OldContainer,
     if loc is None:
         return '?'
 
-    location = location_to_list(loc)
+    location = _legacy_list(loc)
     multiple = len(location) > 1
 
     return '{object_text}{suffix} {first}{last} in "{slot_text}"'.format(
@@ -110,8 +119,8 @@ def combine_locations(location: Sequence) -> str:
 
 
 def stringify_location(location: Union[Location, None,
-                                       OldWell, OldContainer,
-                                       OldSlot, Sequence]) -> str:
+                                       'OldWell', 'OldContainer',
+                                       'OldSlot', Sequence]) -> str:
     if is_new_loc(location):
         loc_str_list = [_stringify_new_loc(loc)
                         for loc in listify(location)]
@@ -243,11 +252,11 @@ def consolidate(instrument, volume, source, dest):
     )
     if is_new_loc(source):
         # Dest is assumed as new location too
-        locations = [] + listify(source) + listify(dest)
+        locations: List[Any] = [] + listify(source) + listify(dest)
     else:
         # incase either source or dest is list of tuple location
         # strip both down to simply lists of Placeables
-        locations = [] + location_to_list(source) + location_to_list(dest)
+        locations = [] + _legacy_list(source) + _legacy_list(dest)
     return make_command(
         name=command_types.CONSOLIDATE,
         payload={
@@ -269,11 +278,11 @@ def distribute(instrument, volume, source, dest):
     )
     if is_new_loc(source):
         # Dest is assumed as new location too
-        locations = [] + listify(source) + listify(dest)
+        locations: List[Any] = [] + listify(source) + listify(dest)
     else:
         # incase either source or dest is list of tuple location
         # strip both down to simply lists of Placeables
-        locations = [] + location_to_list(source) + location_to_list(dest)
+        locations = [] + _legacy_list(source) + _legacy_list(dest)
     return make_command(
         name=command_types.DISTRIBUTE,
         payload={
@@ -295,11 +304,11 @@ def transfer(instrument, volume, source, dest):
     )
     if is_new_loc(source):
         # Dest is assumed as new location too
-        locations = [] + listify(source) + listify(dest)
+        locations: List[Any] = [] + listify(source) + listify(dest)
     else:
         # incase either source or dest is list of tuple location
         # strip both down to simply lists of Placeables
-        locations = [] + location_to_list(source) + location_to_list(dest)
+        locations = [] + _legacy_list(source) + _legacy_list(dest)
     return make_command(
         name=command_types.TRANSFER,
         payload={
@@ -763,11 +772,17 @@ def do_publish(broker, cmd, f, when, res, meta, *args, **kwargs):
 
     payload = cmd(**command_args)
 
+    tracer = tracing.get_tracer()
+    if tracer and when == 'before':
+        tracer.begin(payload['name'], 'command',
+                     {'text': payload['payload'].get('text')})
     message = {**payload, '$': when}
     if when == 'after':
         message['return'] = res
     publish_command(
         message={**payload, '$': when})
+    if tracer and when == 'after':
+        tracer.end(payload['name'], 'command')
 
 
 def publish_paired(broker, cmd, when, res, *args, pub_type='Paired Pipettes'):
@@ -780,11 +795,17 @@ def publish_paired(broker, cmd, when, res, *args, pub_type='Paired Pipettes'):
 
     payload = cmd(*args, pub_type)
 
+    tracer = tracing.get_tracer()
+    if tracer and when == 'before':
+        tracer.begin(payload['name'], 'command',
+                     {'text': payload['payload'].get('text')})
     message = {**payload, '$': when}
     if when == 'after':
         message['return'] = res
 
     publish_command(message=message)
+    if tracer and when == 'after':
+        tracer.end(payload['name'], 'command')
 
 
 def _publish_dec(before, after, command, meta=None):
@@ -796,13 +817,21 @@ def _publish_dec(before, after, command, meta=None):
             except AttributeError:
                 raise RuntimeError("Only methods of CommandPublisher \
                     classes should be decorated.")
-            if before:
-                do_publish(
-                    broker, command, f, 'before', None, meta, *args, **kwargs)
-            res = f(*args, **kwargs)
-            if after:
-                do_publish(
-                    broker, command, f, 'after', res, meta, *args, **kwargs)
+            tracer = tracing.get_tracer()
+            depth = tracer.open_spans() if tracer else 0
+            try:
+                if before:
+                    do_publish(broker, command, f, 'before', None, meta,
+                               *args, **kwargs)
+                res = f(*args, **kwargs)
+                if after:
+                    do_publish(broker, command, f, 'after', res, meta,
+                               *args, **kwargs)
+            finally:
+                if tracer:
+                    # A command that raises never publishes 'after', so
+                    # end its span, and any left open inside it, here
+                    tracer.end_open_spans(depth)
             return res
         return decorated
 
@@ -1,11 +1,15 @@
 from __future__ import annotations
+from bisect import bisect_left
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import json
 import numbers
 from typing import (Any, Dict, List, Union, Tuple,
                     Sequence, TYPE_CHECKING)
 
+import numpy as np  # type: ignore
+
 from opentrons import config
 from opentrons.config import feature_flags as ff
 from opentrons_shared_data.pipette import (
@@ -13,7 +17,8 @@ from opentrons_shared_data.pipette import (
 
 if TYPE_CHECKING:
     from opentrons_shared_data.pipette.dev_types import (
-        PipetteName, PipetteModel, UlPerMm, Quirk, PipetteFusedSpec
+        PipetteName, PipetteModel, UlPerMm, Quirk, PipetteFusedSpec,
+        PipetteModelSpec, PipetteModelSpecs
     )
 
 
@@ -86,14 +91,53 @@ NOZZLE_OFFSET_DEFAULT = [0.0, 0.0, 0.0]
 
 LOW_CURRENT_DEFAULT = 0.05
 
-config_models = list(model_config()['config'].keys())
-config_names = list(name_config().keys())
-configs = model_config()['config']
+
+# These are loaded from the pipette definitions the first time they're used,
+# by __getattr__ below
 #: A list of pipette model names for which we have config entries
-MUTABLE_CONFIGS = model_config()['mutableConfigs']
+config_models: List[PipetteModel]
+#: A list of pipette names
+config_names: List[PipetteName]
+#: The config entry for each pipette model
+configs: Dict[PipetteModel, PipetteModelSpec]
 #: A list of mutable configs for pipettes
-VALID_QUIRKS = model_config()['validQuirks']
+MUTABLE_CONFIGS: List[str]
 #: A list of valid quirks for pipettes
+VALID_QUIRKS: List[str]
+
+
+@lru_cache(maxsize=None)
+def _model_specs() -> PipetteModelSpecs:
+    """ The pipette model specs, parsed on first use rather than on import """
+    return model_config()
+
+
+def __getattr__(name: str) -> Any:
+    """ Load the constants declared above """
+    if name == 'config_models':
+        value: Any = list(_model_specs()['config'].keys())
+    elif name == 'config_names':
+        value = list(name_config().keys())
+    elif name == 'configs':
+        value = _model_specs()['config']
+    elif name == 'MUTABLE_CONFIGS':
+        value = _model_specs()['mutableConfigs']
+    elif name == 'VALID_QUIRKS':
+        value = _model_specs()['validQuirks']
+    else:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def _constant(name: str) -> Any:
+    """ Get one of the constants declared above from inside this module,
+    where using it by name would skip __getattr__ """
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
 
 
 def load(
@@ -168,37 +212,38 @@ def load(
         ul_per_mm = cfg['ulPerMm'][-1]
 
     smoothie_configs = cfg['smoothieConfigs']
+    mutable_configs = _constant('MUTABLE_CONFIGS')
     res = PipetteConfig(
         top=ensure_value(
-            cfg, 'top', MUTABLE_CONFIGS),
+            cfg, 'top', mutable_configs),
         bottom=ensure_value(
-            cfg, 'bottom', MUTABLE_CONFIGS),
+            cfg, 'bottom', mutable_configs),
         blow_out=ensure_value(
-            cfg, 'blowout', MUTABLE_CONFIGS),
+            cfg, 'blowout', mutable_configs),
         drop_tip=ensure_value(
-            cfg, 'dropTip', MUTABLE_CONFIGS),
-        pick_up_current=ensure_value(cfg, 'pickUpCurrent', MUTABLE_CONFIGS),
-        pick_up_distance=ensure_value(cfg, 'pickUpDistance', MUTABLE_CONFIGS),
+            cfg, 'dropTip', mutable_configs),
+        pick_up_current=ensure_value(cfg, 'pickUpCurrent', mutable_configs),
+        pick_up_distance=ensure_value(cfg, 'pickUpDistance', mutable_configs),
         pick_up_increment=ensure_value(
-            cfg, 'pickUpIncrement', MUTABLE_CONFIGS),
-        pick_up_presses=ensure_value(cfg, 'pickUpPresses', MUTABLE_CONFIGS),
-        pick_up_speed=ensure_value(cfg, 'pickUpSpeed', MUTABLE_CONFIGS),
+            cfg, 'pickUpIncrement', mutable_configs),
+        pick_up_presses=ensure_value(cfg, 'pickUpPresses', mutable_configs),
+        pick_up_speed=ensure_value(cfg, 'pickUpSpeed', mutable_configs),
         aspirate_flow_rate=cfg['defaultAspirateFlowRate']['value'],
         dispense_flow_rate=cfg['defaultDispenseFlowRate']['value'],
-        channels=ensure_value(cfg, 'channels', MUTABLE_CONFIGS),
-        model_offset=ensure_value(cfg, 'modelOffset', MUTABLE_CONFIGS),
+        channels=ensure_value(cfg, 'channels', mutable_configs),
+        model_offset=ensure_value(cfg, 'modelOffset', mutable_configs),
         nozzle_offset=cfg.get(  # type: ignore
             'nozzleOffset', NOZZLE_OFFSET_DEFAULT),
-        plunger_current=ensure_value(cfg, 'plungerCurrent', MUTABLE_CONFIGS),
-        drop_tip_current=ensure_value(cfg, 'dropTipCurrent', MUTABLE_CONFIGS),
-        drop_tip_speed=ensure_value(cfg, 'dropTipSpeed', MUTABLE_CONFIGS),
-        min_volume=ensure_value(cfg, 'minVolume', MUTABLE_CONFIGS),
-        max_volume=ensure_value(cfg, 'maxVolume', MUTABLE_CONFIGS),
+        plunger_current=ensure_value(cfg, 'plungerCurrent', mutable_configs),
+        drop_tip_current=ensure_value(cfg, 'dropTipCurrent', mutable_configs),
+        drop_tip_speed=ensure_value(cfg, 'dropTipSpeed', mutable_configs),
+        min_volume=ensure_value(cfg, 'minVolume', mutable_configs),
+        max_volume=ensure_value(cfg, 'maxVolume', mutable_configs),
         ul_per_mm=ul_per_mm,
-        quirks=validate_quirks(ensure_value(cfg, 'quirks', MUTABLE_CONFIGS)),
+        quirks=validate_quirks(ensure_value(cfg, 'quirks', mutable_configs)),
         tip_overlap=cfg['tipOverlap'],
-        tip_length=ensure_value(cfg, 'tipLength', MUTABLE_CONFIGS),
-        display_name=ensure_value(cfg, 'displayName', MUTABLE_CONFIGS),
+        tip_length=ensure_value(cfg, 'tipLength', mutable_configs),
+        display_name=ensure_value(cfg, 'displayName', mutable_configs),
         name=cfg['name'],
         back_compat_names=cfg.get('backCompatNames', []),
         return_tip_height=cfg.get('returnTipHeight', 0.5),
@@ -238,9 +283,53 @@ def piecewise_volume_conversion(
     """
     # pick the first item from the seq for which the target is less than
     # the bracketing element
-    i = list(filter(lambda x: ul <= x[0], sequence))[0]
-    # use that element to calculate the movement distance in mm
-    return i[1]*ul + i[2]
+    for i in sequence:
+        if ul <= i[0]:
+            # use that element to calculate the movement distance in mm
+            return i[1]*ul + i[2]
+    raise IndexError(f'{ul}ul is beyond the ul/mm function')
+
+
+class VolumeConversionTable:
+    """
+    A piecewise ul/mm function (see :py:func:`piecewise_volume_conversion`)
+    compiled into sorted breakpoints, so that the right piece is found by
+    bisection instead of by scanning the sequence.
+    """
+
+    def __init__(self, sequence: List[List[float]]) -> None:
+        # A piece is only ever picked for volumes above the max volumes of
+        # all the pieces before it, so the pieces that can be picked are
+        # the ones that raise that running maximum
+        pieces: List[List[float]] = []
+        for piece in sequence:
+            if not pieces or piece[0] > pieces[-1][0]:
+                pieces.append(piece)
+        self._max_volumes = [piece[0] for piece in pieces]
+        self._slopes = [piece[1] for piece in pieces]
+        self._intercepts = [piece[2] for piece in pieces]
+        self._max_volume_array = np.array(self._max_volumes, dtype=float)
+        self._slope_array = np.array(self._slopes, dtype=float)
+        self._intercept_array = np.array(self._intercepts, dtype=float)
+
+    def ul_per_mm(self, ul: float) -> float:
+        """ The ul/mm value for one volume """
+        index = bisect_left(self._max_volumes, ul)
+        if index == len(self._max_volumes):
+            raise IndexError(f'{ul}ul is beyond the ul/mm function')
+        return self._slopes[index]*ul + self._intercepts[index]
+
+    def ul_per_mm_array(self, ul: Any) -> Any:
+        """ The ul/mm values for an array (or any sequence) of volumes, as
+        a numpy array of the same shape
+        """
+        volumes = np.asarray(ul, dtype=float)
+        indices = np.searchsorted(self._max_volume_array, volumes)
+        if np.any(indices == len(self._max_volumes)):
+            raise IndexError(
+                f'{volumes.max()}ul is beyond the ul/mm function')
+        return self._slope_array[indices]*volumes\
+            + self._intercept_array[indices]
 
 
 TypeOverrides = Dict[str, Union[float, bool, None]]
@@ -299,7 +388,7 @@ def save_overrides(pipette_id: str,
     :return: None
     """
     override_dir = config.CONFIG['pipette_config_overrides_dir']
-    model_configs = configs[model]
+    model_configs = _constant('configs')[model]
     model_configs_quirks = {key: True for key in model_configs['quirks']}
     try:
         existing = load_overrides(pipette_id)
@@ -327,7 +416,7 @@ def save_overrides(pipette_id: str,
                     = model_config_value['value']
             model_config_value['value'] = value
             existing[key] = model_config_value
-    assert model in config_models
+    assert model in _constant('config_models')
     existing['model'] = model
     json.dump(existing, (override_dir/f'{pipette_id}.json').open('w'))
 
@@ -362,7 +451,7 @@ def load_overrides(pipette_id: str) -> Dict[str, Any]:
 def validate_quirks(quirks: List[str]):
     valid_quirks = []
     for quirk in quirks:
-        if quirk in VALID_QUIRKS:
+        if quirk in _constant('VALID_QUIRKS'):
             valid_quirks.append(quirk)
         else:
             log.warning(f'{quirk} is not a valid quirk')
@@ -442,6 +531,6 @@ def list_mutable_configs(pipette_id: str) -> Dict[str, Any]:
         return cfg
 
     for key in config:
-        if key in MUTABLE_CONFIGS:
+        if key in _constant('MUTABLE_CONFIGS'):
             cfg[key] = config[key]  # type: ignore
     return cfg
@@ -3,8 +3,6 @@ import json
 import logging
 import os
 
-from numpy import array, array_equal  # type: ignore
-from opentrons.util import linal
 from typing import Any, Dict, List, NamedTuple, Tuple, Union
 
 from opentrons import config
@@ -337,6 +335,10 @@ def _determine_calibration_to_use(deck_cal_to_check, api_v1):
     matrix with a Z offset if we are not running on a
     robot.
     """
+    # numpy is slow to import, and this is the only place it's needed
+    from numpy import array, array_equal  # type: ignore
+    from opentrons.util import linal
+
     id_matrix = linal.identity_deck_transform()
     deck_cal_to_use = deck_cal_to_check
     if not config.IS_ROBOT and not api_v1:
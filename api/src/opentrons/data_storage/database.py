@@ -1,6 +1,8 @@
 import sqlite3
+import threading
 # import warnings
-from typing import List
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 from opentrons.legacy_api.containers.placeable\
     import Container, Well, Module, Placeable
 from opentrons.data_storage import database_queries as db_queries
@@ -11,11 +13,102 @@ import os
 
 SUPPORTED_MODULES = ['magdeck', 'tempdeck']
 
+#: How many deserialized container templates to keep in memory
+CONTAINER_CACHE_SIZE = 64
+
+#: How many prepared statements sqlite should keep per connection
+STATEMENT_CACHE_SIZE = 128
+
 log = logging.getLogger(__file__)
 
+# All access to the labware database goes through one connection per
+# database file, guarded by _db_lock since the legacy api may be driven
+# from more than one thread. The connection keeps its own cache of prepared
+# statements, so repeated queries skip sqlite's parse step.
+_db_lock = threading.RLock()
+_db_conn: Optional[sqlite3.Connection] = None
+_db_path: Optional[str] = None
+
+# LRU of container templates keyed by (database path, container name).
+# Templates are never handed out directly; load_container returns a clone.
+_container_cache: 'OrderedDict[Tuple[str, str], Placeable]' = OrderedDict()
+
 # ======================== Private Functions ======================== #
 
 
+def _get_db_connection() -> sqlite3.Connection:
+    """ Get the shared connection to the configured labware database,
+    (re)opening it if the configured path has changed. Must be called with
+    _db_lock held.
+    """
+    global _db_conn, _db_path
+    path = str(CONFIG['labware_database_file'])
+    if _db_conn is None or _db_path != path:
+        _close_db_connection()
+        _db_conn = sqlite3.connect(
+            path,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE)
+        try:
+            _db_conn.execute('PRAGMA journal_mode=WAL')
+        except sqlite3.OperationalError:
+            log.warning(
+                "Could not enable write-ahead log for labware database")
+        _db_path = path
+    return _db_conn
+
+
+def _close_db_connection():
+    global _db_conn, _db_path
+    if _db_conn is not None:
+        _db_conn.close()
+    _db_conn = None
+    _db_path = None
+    _container_cache.clear()
+
+
+def _checkpoint(db):
+    """ Fold the write-ahead log back into the database file so that the
+    file on disk is complete on its own (it may be copied or removed
+    without going through this module)
+    """
+    try:
+        db.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    except sqlite3.OperationalError:
+        log.debug("Labware database checkpoint failed", exc_info=True)
+
+
+def _clone_container(template):
+    """ Copy a cached container template and its wells without going back
+    to the database. Coordinates are immutable and can be shared.
+    """
+    container = template.__class__(properties=dict(template.properties))
+    container._coordinates = template._coordinates
+    for well, name in template.children_by_reference.items():
+        new_well = Well(properties=dict(well.properties))
+        new_well._coordinates = well._coordinates
+        container.add(new_well, name)
+    return container
+
+
+def _cache_get(container_name: str) -> Optional[Placeable]:
+    key = (str(_db_path), container_name)
+    template = _container_cache.get(key)
+    if template is not None:
+        _container_cache.move_to_end(key)
+    return template
+
+
+def _cache_put(container_name: str, template: Placeable):
+    _container_cache[(str(_db_path), container_name)] = template
+    while len(_container_cache) > CONTAINER_CACHE_SIZE:
+        _container_cache.popitem(last=False)
+
+
+def _cache_invalidate(container_name: str):
+    _container_cache.pop((str(_db_path), container_name), None)
+
+
 def _parse_container_obj(container: Container):
     # Note: in the new labware system, container coordinates are always (0,0,0)
     return dict(zip('xyz', container._coordinates))
@@ -148,64 +241,93 @@ def _get_db_version(db):
 
 # ======================== Public Functions ======================== #
 def save_new_container(container: Container, container_name: str) -> bool:
-    db_conn = sqlite3.connect(str(CONFIG['labware_database_file']))
-    _create_container_obj_in_db(db_conn, container, container_name)
+    with _db_lock:
+        db_conn = _get_db_connection()
+        _cache_invalidate(container_name)
+        _create_container_obj_in_db(db_conn, container, container_name)
+        _checkpoint(db_conn)
     res = True  # old create fn does not return anything
     return res
 
 
 def load_container(container_name: str) -> Container:
-    db_conn = sqlite3.connect(str(CONFIG['labware_database_file']))
-    res = _load_container_object_from_db(db_conn, container_name)
+    with _db_lock:
+        db_conn = _get_db_connection()
+        template = _cache_get(container_name)
+        if template is None:
+            template = _load_container_object_from_db(
+                db_conn, container_name)
+            _cache_put(container_name, template)
+        res = _clone_container(template)
     return res
 
 
 def overwrite_container(container: Container) -> bool:
     log.debug("Overwriting container definition: {}".format(
         container.get_type()))
-    db_conn = sqlite3.connect(str(CONFIG['labware_database_file']))
-    _update_container_object_in_db(db_conn, container)
+    with _db_lock:
+        db_conn = _get_db_connection()
+        _cache_invalidate(container.get_type())
+        _update_container_object_in_db(db_conn, container)
+        _checkpoint(db_conn)
     res = True  # old overwrite fn does not return anything
     return res
 
 
 def delete_container(container_name) -> bool:
-    db_conn = sqlite3.connect(str(CONFIG['labware_database_file']))
-    _delete_container_object_in_db(db_conn, container_name)
+    with _db_lock:
+        db_conn = _get_db_connection()
+        _cache_invalidate(container_name)
+        _delete_container_object_in_db(db_conn, container_name)
+        _checkpoint(db_conn)
     res = True  # old delete fn does not return anything
     return res
 
 
 def list_all_containers() -> List[str]:
-    db_conn = sqlite3.connect(str(CONFIG['labware_database_file']))
-    res = _list_all_containers_by_name(db_conn)
+    with _db_lock:
+        res = _list_all_containers_by_name(_get_db_connection())
     return res
 
 
 def load_module(module_name: str) -> Container:
-    db_conn = sqlite3.connect(str(CONFIG['labware_database_file']))
-    res = _load_module_dict_from_db(db_conn, module_name)
+    with _db_lock:
+        res = _load_module_dict_from_db(_get_db_connection(), module_name)
     return res
 
 
 def get_version():
     '''Get the Opentrons-defined database version'''
-    db_conn = sqlite3.connect(str(CONFIG['labware_database_file']))
-    return _get_db_version(db_conn)
+    with _db_lock:
+        return _get_db_version(_get_db_connection())
 
 
 def set_version(version):
-    db_conn = sqlite3.connect(str(CONFIG['labware_database_file']))
-    db_queries.set_user_version(db_conn, version)
+    with _db_lock:
+        db_queries.set_user_version(_get_db_connection(), version)
+
+
+def clear_cache():
+    """ Drop all cached container templates. Use this if the database file
+    was changed by something other than this module.
+    """
+    with _db_lock:
+        _container_cache.clear()
 
 
 def reset():
     """ Unmount and remove the sqlite database (used in robot reset) """
+    with _db_lock:
+        _close_db_connection()
     if os.path.exists(str(CONFIG['labware_database_file'])):
         os.remove(str(CONFIG['labware_database_file']))
     # Not an os.path.join because it is a suffix to the full filename
     journal_path = str(CONFIG['labware_database_file']) + '-journal'
     if os.path.exists(journal_path):
         os.remove(journal_path)
+    for suffix in ('-wal', '-shm'):
+        wal_path = str(CONFIG['labware_database_file']) + suffix
+        if os.path.exists(wal_path):
+            os.remove(wal_path)
 
 # ======================== END Public Functions ======================== #
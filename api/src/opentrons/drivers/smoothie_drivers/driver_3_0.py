@@ -2,9 +2,10 @@ import asyncio
 import contextlib
 from os import environ
 import logging
-from time import sleep, time
+from time import sleep
 from threading import Event, RLock
-from typing import Any, Dict, Optional, Union, List, Tuple
+from typing import (
+    Dict, Optional, Union, List, Tuple, Mapping, Sequence)
 
 from math import isclose
 from serial.serialutil import SerialException  # type: ignore
@@ -15,6 +16,7 @@ from opentrons.drivers.utils import (
     AxisMoveTimestamp, parse_key_from_substring, parse_number_from_substring)
 from opentrons.drivers.rpi_drivers.gpio_simulator import SimulatingGPIOCharDev
 from opentrons.system import smoothie_update
+from opentrons.util import tracing
 """
 - Driver is responsible for providing an interface for motion control
 - Driver is the only system component that knows about GCODES or how smoothie
@@ -451,17 +453,10 @@ class SmoothieDriver_3_0_0:
         :param mount: string with value 'left' or 'right'
         :return id string, or None
         """
-        res: Optional[str] = None
         if self.simulating:
-            res = '1234567890'
-        else:
-            try:
-                res = self._read_from_pipette(
-                    GCODES['READ_INSTRUMENT_ID'], mount)
-            except UnicodeDecodeError:
-                log.exception("Failed to decode pipette ID string:")
-                res = None
-        return res
+            return '1234567890'
+        self._prepare_pipette_read()
+        return self._read_pipette_id(mount)
 
     def read_pipette_model(self, mount) -> Optional[str]:
         """
@@ -472,20 +467,60 @@ class SmoothieDriver_3_0_0:
         :return model string, or None
         """
         if self.simulating:
-            res = None
-        else:
-            res = self._read_from_pipette(
-                GCODES['READ_INSTRUMENT_MODEL'], mount)
-            if res and '_v' not in res:
-                # Backward compatibility for pipettes programmed with model
-                # strings that did not include the _v# designation
-                res = res + '_v1'
-            elif res and '_v13' in res:
-                # Backward compatibility for pipettes programmed with model
-                # strings that did not include the "." to seperate version
-                # major and minor values
-                res = res.replace('_v13', '_v1.3')
+            return None
+        self._prepare_pipette_read()
+        return self._read_pipette_model(mount)
+
+    def read_pipettes(
+            self,
+            mounts: Sequence[str] = ('left', 'right'),
+            known: Mapping[str, Tuple[str, Optional[str]]] = None
+    ) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        Read the (id, model) of the pipettes on several mounts, disengaging
+        the motors and waiting for the I2C lines to settle only once rather
+        than for every read.
+
+        :param mounts: strings with values 'left' or 'right'
+        :param known: The (id, model) previously read from some mounts. If
+                      the same id is read again, the pipette has not been
+                      swapped and its model is not read again.
+        :return a dict of mount to (id string or None, model string or None)
+        """
+        if self.simulating:
+            return {mount: ('1234567890', None) for mount in mounts}
+        known = known or {}
+        self._prepare_pipette_read()
+        found: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        for mount in mounts:
+            pipette_id = self._read_pipette_id(mount)
+            previous = known.get(mount)
+            if pipette_id and previous and previous[0] == pipette_id:
+                found[mount] = previous
+            else:
+                found[mount] = (pipette_id, self._read_pipette_model(mount))
+        return found
+
+    def _read_pipette_id(self, mount: str) -> Optional[str]:
+        try:
+            return self._read_from_pipette(
+                GCODES['READ_INSTRUMENT_ID'], mount)
+        except UnicodeDecodeError:
+            log.exception("Failed to decode pipette ID string:")
+            return None
 
+    def _read_pipette_model(self, mount: str) -> Optional[str]:
+        res = self._read_from_pipette(
+            GCODES['READ_INSTRUMENT_MODEL'], mount)
+        if res and '_v' not in res:
+            # Backward compatibility for pipettes programmed with model
+            # strings that did not include the _v# designation
+            res = res + '_v1'
+        elif res and '_v13' in res:
+            # Backward compatibility for pipettes programmed with model
+            # strings that did not include the "." to seperate version
+            # major and minor values
+            res = res.replace('_v13', '_v1.3')
         return res
 
     def write_pipette_id(self, mount: str, data_string: str):
@@ -1011,7 +1046,7 @@ class SmoothieDriver_3_0_0:
         if self.simulating:
             return
         try:
-            with self._serial_lock:
+            with tracing.span('send_command', 'smoothie'), self._serial_lock:
                 return self._send_command_unsynchronized(command,
                                                          ack_timeout,
                                                          timeout)
@@ -1037,15 +1072,18 @@ class SmoothieDriver_3_0_0:
                                      command: str,
                                      ack_timeout: float,
                                      execute_timeout: float):
-        cmd_ret = self._write_with_retries(
-            command + SMOOTHIE_COMMAND_TERMINATOR,
-            ack_timeout, DEFAULT_COMMAND_RETRIES)
+        with tracing.span(command.split(' ', 1)[0], 'smoothie.gcode',
+                          {'command': command}):
+            cmd_ret = self._write_with_retries(
+                command + SMOOTHIE_COMMAND_TERMINATOR,
+                ack_timeout, DEFAULT_COMMAND_RETRIES)
         cmd_ret = self._remove_unwanted_characters(command, cmd_ret)
         self._handle_return(cmd_ret)
-        wait_ret = serial_communication.write_and_return(
-            GCODES['WAIT'] + SMOOTHIE_COMMAND_TERMINATOR,
-            SMOOTHIE_ACK, self._connection, timeout=execute_timeout,
-            tag='smoothie')
+        with tracing.span(GCODES['WAIT'], 'smoothie.gcode'):
+            wait_ret = serial_communication.write_and_return(
+                GCODES['WAIT'] + SMOOTHIE_COMMAND_TERMINATOR,
+                SMOOTHIE_ACK, self._connection, timeout=execute_timeout,
+                tag='smoothie')
         wait_ret = self._remove_unwanted_characters(
             GCODES['WAIT'], wait_ret)
         self._handle_return(wait_ret)
@@ -1269,12 +1307,28 @@ class SmoothieDriver_3_0_0:
             cmd = self._build_steps_per_mm(data)
             self._send_command(cmd)
 
+    def _prepare_pipette_read(self):
+        """
+        Get ready to read from the attached pipettes' internal memory.
+
+        EMI interference from both plunger motors has been found to prevent
+        the I2C lines from communicating between Smoothieware and pipette's
+        onboard EEPROM. To avoid, turn off both plunger motors and let the
+        lines settle. This needs doing once before any number of reads.
+        """
+        try:
+            self.disengage_axis('ZABC')
+            self.delay(PIPETTE_READ_DELAY)
+        except SmoothieError:
+            pass
+
     def _read_from_pipette(self, gcode: str, mount: str) -> Optional[str]:
         """
         Read from an attached pipette's internal memory. The gcode used
         determines which portion of memory is read and returned.
 
-        All motors must be disengaged to consistently read over I2C lines
+        All motors must be disengaged to consistently read over I2C lines,
+        see :py:meth:`_prepare_pipette_read`
 
         gcode:
             String (str) containing a GCode
@@ -1287,11 +1341,6 @@ class SmoothieDriver_3_0_0:
         if not allowed_mount:
             raise ValueError('Unexpected mount: {}'.format(mount))
         try:
-            # EMI interference from both plunger motors has been found to
-            # prevent the I2C lines from communicating between Smoothieware and
-            # pipette's onboard EEPROM. To avoid, turn off both plunger motors
-            self.disengage_axis('ZABC')
-            self.delay(PIPETTE_READ_DELAY)
             # request from Smoothieware the information from that pipette
             res = self._send_command(
                 gcode + allowed_mount, suppress_error_msg=True)
@@ -1939,10 +1988,14 @@ class SmoothieDriver_3_0_0:
             sleep(0.25)
             self.run_flag.set()
 
-    async def update_firmware(self,  # noqa(C901)
-                              filename: str,
-                              loop: asyncio.AbstractEventLoop = None,
-                              explicit_modeset: bool = True) -> str:
+    async def update_firmware(  # noqa(C901)
+            self,
+            filename: str,
+            loop: asyncio.AbstractEventLoop = None,
+            explicit_modeset: bool = True,
+            progress: smoothie_update.ProgressCallback = None,
+            timeouts: Mapping[smoothie_update.UpdatePhase, float] = None)\
+            -> str:
         """
         Program the smoothie board with a given hex file.
 
@@ -1951,7 +2004,24 @@ class SmoothieDriver_3_0_0:
 
         If explicit_modeset is False, assume the smoothie is already in
         programming mode.
+
+        The update runs in the phases of :py:class:`.UpdatePhase`, each
+        limited by its entry in ``timeouts`` (by default
+        :py:data:`.DEFAULT_PHASE_TIMEOUTS`). Anything that blocks on the
+        smoothie runs in an executor so the event loop keeps running. A
+        thread can't be stopped, so when one of those phases (prepare,
+        restart and verify) times out, the error is raised only once its
+        thread is done with the port and GPIO (see
+        :py:func:`.run_blocking_phase`).
+        ``progress`` is called with an :py:class:`.UpdateProgress` as the
+        image is checked and programmed.
+
+        :raises SmoothieUpdateError: If a phase fails or times out
+        :returns: The output of the programmer
         """
+        checked_loop = loop or asyncio.get_event_loop()
+        phase_timeouts = {**smoothie_update.DEFAULT_PHASE_TIMEOUTS,
+                          **(timeouts or {})}
         try:
             smoothie_update._ensure_programmer_executable()
         except OSError as ose:
@@ -1961,58 +2031,64 @@ class SmoothieDriver_3_0_0:
             else:
                 raise
 
-        if not self.is_connected():
-            log.info("Getting port to connect")
-            self._connect_to_port()
+        image_size = await smoothie_update.run_phase(
+            smoothie_update.UpdatePhase.CHECK,
+            smoothie_update.check_image(filename, progress),
+            phase_timeouts)
 
-        assert self._connection,\
-            'driver must have been initialized with a port'
-        # get port name
-        port = self._connection.port
+        def prepare() -> str:
+            if not self.is_connected():
+                log.info("Getting port to connect")
+                self._connect_to_port()
 
-        if explicit_modeset:
-            log.info("Setting programming mode")
-            # set smoothieware into programming mode
-            self._smoothie_programming_mode()
-            # close the port so other application can access it
-            self._connection.close()
+            assert self._connection,\
+                'driver must have been initialized with a port'
+
+            if explicit_modeset:
+                log.info("Setting programming mode")
+                # set smoothieware into programming mode
+                self._smoothie_programming_mode()
+                # close the port so other application can access it
+                self._connection.close()
+            return self._connection.port
+
+        port = await smoothie_update.run_blocking_phase(
+            smoothie_update.UpdatePhase.PREPARE, prepare, phase_timeouts,
+            checked_loop)
 
         # run lpc21isp, THIS WILL TAKE AROUND 1 MINUTE TO COMPLETE
-        update_cmd = 'lpc21isp -wipe -donotstart {0} {1} {2} 12000'.format(
-            filename, port, self._config.serial_speed)
-        kwargs: Dict[str, Any] = {
-            'stdout': asyncio.subprocess.PIPE,
-            'stderr': asyncio.subprocess.PIPE}
-        if loop:
-            kwargs['loop'] = loop
-        log.info(update_cmd)
-        before = time()
-        proc = await asyncio.create_subprocess_shell(
-            update_cmd, **kwargs)
-        created = time()
-        log.info(f"created lpc21isp subproc in {created-before}")
-        out_b, err_b = await proc.communicate()
-        done = time()
-        log.info(f"ran lpc21isp subproc in {done-created}")
-        if proc.returncode != 0:
-            log.error(
-                f"Smoothie update failed: {proc.returncode}"
-                f" {out_b!r} {err_b!r}")
-            raise RuntimeError(
-                f"Failed to program smoothie: {proc.returncode}: {err_b!r}")
-        else:
-            log.info("Smoothie update complete")
-        try:
-            self._connection.close()
-        except Exception:
-            log.exception('Failed to close smoothie connection.')
-        # re-open the port
-        self._connection.open()
-        # reset smoothieware
-        self._smoothie_reset()
-        # run setup gcodes
-        self._setup()
+        output = await smoothie_update.run_phase(
+            smoothie_update.UpdatePhase.PROGRAM,
+            smoothie_update.program(
+                ['lpc21isp', '-wipe', '-donotstart', filename, port,
+                 str(self._config.serial_speed), '12000'],
+                image_size, progress, loop),
+            phase_timeouts)
+        log.info("Smoothie update complete")
+
+        def restart():
+            assert self._connection
+            try:
+                self._connection.close()
+            except Exception:
+                log.exception('Failed to close smoothie connection.')
+            # re-open the port
+            self._connection.open()
+            # reset smoothieware
+            self._smoothie_reset()
+            # run setup gcodes
+            self._setup()
+
+        await smoothie_update.run_blocking_phase(
+            smoothie_update.UpdatePhase.RESTART, restart, phase_timeouts,
+            checked_loop)
+
+        # Make sure the new firmware is up and answering
+        version = await smoothie_update.run_blocking_phase(
+            smoothie_update.UpdatePhase.VERIFY, self.get_fw_version,
+            phase_timeouts, checked_loop)
+        log.info(f"Smoothie firmware is now {version}")
 
-        return out_b.decode().strip()
+        return output
 
     # ----------- END Public interface ------------ #
@@ -22,6 +22,7 @@ from opentrons import commands
 from opentrons.protocols.parse import parse, version_from_string
 from opentrons.protocols.types import APIVersion, PythonProtocol
 from opentrons.hardware_control import API, ThreadManager
+from opentrons.util import tracing
 from .util.entrypoint_util import labware_from_paths, datafiles_from_paths
 
 if TYPE_CHECKING:
@@ -165,6 +166,13 @@ def get_arguments(
              'is passed). Can be specified multiple times with different '
              'files. It is usually a better idea to use this than -D because '
              'there is less possibility of accidentally including something.')
+    parser.add_argument(
+        '-t', '--trace', action='store', default=None, metavar='TRACE_FILE',
+        help='Record timing spans of the run (protocol commands, hardware '
+             'calls, motion planning and serial traffic to the robot) and '
+             'write them to TRACE_FILE. A TRACE_FILE ending in .bin is '
+             'written in a compact binary format; anything else is written '
+             'as a Chrome trace (load it in chrome://tracing).')
     parser.add_argument(
         'protocol', metavar='PROTOCOL',
         type=argparse.FileType('rb'),
@@ -348,8 +356,9 @@ def main() -> int:
     else:
         log_level = 'warning'
     # Try to migrate containers from database to v2 format
-    execute(args.protocol, args.protocol.name,
-            log_level=log_level, emit_runlog=printer)
+    with tracing.recording(getattr(args, 'trace', None)):
+        execute(args.protocol, args.protocol.name,
+                log_level=log_level, emit_runlog=printer)
     return 0
 
 
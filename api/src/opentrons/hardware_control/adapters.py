@@ -4,6 +4,7 @@ import asyncio
 import functools
 from typing import TYPE_CHECKING
 
+from opentrons.util import tracing
 from .types import HardwareAPILike
 
 if TYPE_CHECKING:
@@ -52,8 +53,12 @@ class SynchronousAdapter(HardwareAPILike):
 
     @staticmethod
     def call_coroutine_sync(loop, to_call, *args, **kwargs):
-        fut = asyncio.run_coroutine_threadsafe(to_call(*args, **kwargs), loop)
-        return fut.result()
+        with tracing.span(
+                getattr(to_call, '__qualname__', 'coroutine'),
+                'hardware.sync'):
+            fut = asyncio.run_coroutine_threadsafe(
+                to_call(*args, **kwargs), loop)
+            return fut.result()
 
     def __getattribute__(self, attr_name):
         """ Retrieve attributes from our API and wrap coroutines """
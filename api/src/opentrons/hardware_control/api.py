@@ -3,18 +3,20 @@ import contextlib
 import logging
 import pathlib
 from collections import OrderedDict
-from typing import (Any, Dict, Union, List, Optional, Tuple,
+from typing import (Any, ContextManager, Dict, Union, List, Optional, Tuple,
                     TYPE_CHECKING, cast, overload, Sequence)
 
 from opentrons_shared_data.pipette import name_config
 from opentrons import types as top_types
-from opentrons.util import linal
+from opentrons.system import smoothie_update
+from opentrons.util import linal, tracing
 from functools import lru_cache
 from opentrons.config import (
     robot_configs, feature_flags as ff)
 
 from .util import (
-    use_or_initialize_loop, DeckTransformState, check_motion_bounds)
+    use_or_initialize_loop, DeckTransformState, check_motion_bounds,
+    PhaseTimer)
 from .pipette import (
     Pipette, generate_hardware_configs, load_from_config_and_check_skip)
 from .controller import Controller
@@ -27,7 +29,7 @@ from .types import (Axis, HardwareAPILike, CriticalPoint,
                     MustHomeError, NoTipAttachedError, DoorState,
                     DoorStateNotification, PipettePair, TipAttachedError,
                     HardwareAction, PairedPipetteConfigValueError,
-                    MotionChecks)
+                    MotionChecks, PositionSnapshot)
 from . import modules, robot_calibration as rb_cal
 
 if TYPE_CHECKING:
@@ -39,6 +41,8 @@ if TYPE_CHECKING:
 
 mod_log = logging.getLogger(__name__)
 
+#: How long a module gets to connect before it is left out
+MODULE_BUILD_TIMEOUT_S = 10.0
 
 InstrumentsByMount = Dict[top_types.Mount, Optional[Pipette]]
 PipetteHandlingData = Tuple[Pipette, top_types.Mount]
@@ -75,7 +79,11 @@ class API(HardwareAPILike):
         self._execution_manager = ExecutionManager(loop=loop)
         self._callbacks: set = set()
         # {'X': 0.0, 'Y': 0.0, 'Z': 0.0, 'A': 0.0, 'B': 0.0, 'C': 0.0}
-        self._current_position: Dict[Axis, float] = {}
+        self._position_snapshot = PositionSnapshot(generation=0, position={})
+        # Set while a refreshing current_position call is reading the
+        # position from the backend, so that calls made meanwhile can share
+        # the result
+        self._position_refresh: Optional['asyncio.Task[None]'] = None
 
         self._attached_instruments: InstrumentsByMount = {
             top_types.Mount.LEFT: None,
@@ -84,13 +92,17 @@ class API(HardwareAPILike):
         self._attached_modules: List[modules.AbstractModule] = []
         self._last_moved_mount: Optional[top_types.Mount] = None
         # The motion lock synchronizes calls to long-running physical tasks
-        # involved in motion. This fixes issue where for instance a move()
-        # or home() call is in flight and something else calls
-        # current_position(), which will not be updated until the move() or
-        # home() call succeeds or fails.
+        # involved in motion. Reading the cached position doesn't take it,
+        # and sees the position from before any move() or home() call that
+        # is in flight; refreshing the position from the backend waits for
+        # them.
         self._motion_lock = asyncio.Lock(loop=self._loop)
         self._door_state = DoorState.CLOSED
         self._robot_calibration = rb_cal.load()
+        self._startup_timer = PhaseTimer()
+        # Whether modules being connected are part of the hardware bring-up,
+        # and so are timed with the rest of it
+        self._bringing_up_modules = False
 
     @property
     def robot_calibration(self) -> rb_cal.RobotCalibration:
@@ -101,6 +113,15 @@ class API(HardwareAPILike):
         self._calculate_valid_attitude.cache_clear()
         self._robot_calibration = robot_calibration
 
+    @property
+    def startup_timing(self) -> Dict[str, float]:
+        """ How long each phase of bringing up the hardware took, in
+        seconds. Connections to the modules attached at startup overlap
+        each other and the rest of the bring-up; modules attached later
+        aren't timed.
+        """
+        return self._startup_timer.durations
+
     @property
     def door_state(self) -> DoorState:
         return self._door_state
@@ -144,7 +165,10 @@ class API(HardwareAPILike):
         """
         checked_loop = use_or_initialize_loop(loop)
         backend = Controller(config)
-        await backend.setup_gpio_chardev()
+        api_instance = cls(backend, loop=checked_loop, config=config)
+        timer = api_instance._startup_timer
+        with timer.phase('gpio'):
+            await backend.setup_gpio_chardev()
         backend.set_lights(button=None, rails=False)
 
         async def blink():
@@ -155,39 +179,84 @@ class API(HardwareAPILike):
                 await asyncio.sleep(0.5)
 
         blink_task = checked_loop.create_task(blink())
-        try:
+        # Modules have their own serial ports, so they can be discovered
+        # and connected while the motor controller comes up. The first
+        # registration is of the modules attached at startup; later ones
+        # are hotplugs.
+        initial_modules: 'asyncio.Future[None]' = checked_loop.create_future()
+
+        async def register_modules(
+                new_mods_at_ports: List[modules.ModuleAtPort] = None,
+                removed_mods_at_ports: List[modules.ModuleAtPort] = None
+        ) -> None:
             try:
-                await backend.connect(port)
-                fw_version = backend.fw_version
-            except Exception:
-                mod_log.exception(
-                    'Motor driver could not connect, reprogramming if possible'
-                )
-                fw_version = None
-
-            if firmware is not None:
-                if fw_version != firmware[1]:
-                    await backend.update_firmware(
-                        str(firmware[0]), checked_loop, True)
-                    await backend.connect(port)
-            elif firmware is None and fw_version is None:
-                msg = 'Motor controller could not be connected and no '\
-                    'firmware was provided for (re)programming'
-                mod_log.error(msg)
-                raise RuntimeError(msg)
-
-            api_instance = cls(backend, loop=checked_loop, config=config)
-            await api_instance.cache_instruments()
-            checked_loop.create_task(backend.watch_modules(
-                loop=checked_loop,
-                register_modules=api_instance.register_modules))
+                await api_instance.register_modules(
+                    new_mods_at_ports, removed_mods_at_ports)
+            finally:
+                api_instance._bringing_up_modules = False
+                if not initial_modules.done():
+                    initial_modules.set_result(None)
+
+        api_instance._bringing_up_modules = True
+        watch_task = checked_loop.create_task(backend.watch_modules(
+            loop=checked_loop,
+            register_modules=register_modules))
+        try:
+            await cls._connect_smoothie(
+                backend, port, firmware, checked_loop, timer)
+            with timer.phase('instruments'):
+                await api_instance.cache_instruments()
             backend.start_gpio_door_watcher(
                 loop=checked_loop,
                 update_door_state=api_instance._update_door_state)
-            return api_instance
+        except BaseException:
+            watch_task.cancel()
+            raise
         finally:
             blink_task.cancel()
 
+        async def report():
+            # Modules may still be connecting, so wait for them (or for
+            # module watching to fail) to report the whole bring-up
+            await asyncio.wait({initial_modules, watch_task},
+                               return_when=asyncio.FIRST_COMPLETED)
+            mod_log.info(f'Hardware bring-up: {timer.report()}')
+
+        checked_loop.create_task(report())
+        return api_instance
+
+    @staticmethod
+    async def _connect_smoothie(
+            backend: Controller,
+            port: Optional[str],
+            firmware: Optional[Tuple[pathlib.Path, str]],
+            loop: asyncio.AbstractEventLoop,
+            timer: PhaseTimer) -> None:
+        """ Connect to the motor controller, (re)programming it if it needs
+        it and firmware was provided
+        """
+        try:
+            with timer.phase('smoothie connect'):
+                await backend.connect(port)
+            fw_version = backend.fw_version
+        except Exception:
+            mod_log.exception(
+                'Motor driver could not connect, reprogramming if possible'
+            )
+            fw_version = None
+
+        if firmware is not None:
+            if fw_version != firmware[1]:
+                with timer.phase('smoothie firmware'):
+                    await backend.update_firmware(
+                        str(firmware[0]), loop, True)
+                    await backend.connect(port)
+        elif firmware is None and fw_version is None:
+            msg = 'Motor controller could not be connected and no '\
+                'firmware was provided for (re)programming'
+            mod_log.error(msg)
+            raise RuntimeError(msg)
+
     @classmethod
     async def build_hardware_simulator(
             cls,
@@ -372,7 +441,8 @@ class API(HardwareAPILike):
 
     async def cache_instruments(
             self,
-            require: Dict[top_types.Mount, 'PipetteName'] = None):
+            require: Dict[top_types.Mount, 'PipetteName'] = None,
+            force: bool = False):
         """
         Scan the attached instruments, take necessary configuration actions,
         and set up hardware controller internal state if necessary.
@@ -383,6 +453,10 @@ class API(HardwareAPILike):
                         save a subsequent of :py:attr:`attached_instruments`
                         and also serves as the hook for the hardware
                         simulator to decide what is attached.
+        :param force: If ``True``, read everything about the attached
+                      pipettes. Otherwise, a pipette with the same serial
+                      number as in the last scan is assumed to be the same
+                      model, and only its serial number is read.
         :raises RuntimeError: If an instrument is expected but not found.
 
         .. note::
@@ -401,7 +475,8 @@ class API(HardwareAPILike):
         for mount, name in checked_require.items():
             if name not in name_config():
                 raise RuntimeError(f'{name} is not a valid pipette name')
-        found = self._backend.get_attached_instruments(checked_require)
+        found = self._backend.get_attached_instruments(
+            checked_require, force=force)
 
         for mount, instrument_data in found.items():
             config = instrument_data.get('config')
@@ -504,7 +579,8 @@ class API(HardwareAPILike):
             self,
             firmware_file: str,
             loop: asyncio.AbstractEventLoop = None,
-            explicit_modeset: bool = True) -> str:
+            explicit_modeset: bool = True,
+            progress: smoothie_update.ProgressCallback = None) -> str:
         """ Update the firmware on the Smoothie board.
 
         :param firmware_file: The path to the firmware file.
@@ -513,6 +589,9 @@ class API(HardwareAPILike):
                                  programming mode.
         :param loop: An asyncio event loop to use; if not specified, the one
                      associated with this instance will be used.
+        :param progress: Called with a
+                         :py:class:`.smoothie_update.UpdateProgress` as the
+                         update goes on.
         :returns: The stdout of the tool used to update the smoothie
         """
         if None is loop:
@@ -521,7 +600,8 @@ class API(HardwareAPILike):
             checked_loop = loop
         return await self._backend.update_firmware(firmware_file,
                                                    checked_loop,
-                                                   explicit_modeset)
+                                                   explicit_modeset,
+                                                   progress)
 
     # Global actions API
     def pause(self):
@@ -599,7 +679,7 @@ class API(HardwareAPILike):
         await self._execution_manager.reset()
         self._attached_instruments = {
             k: None for k in self._attached_instruments.keys()}
-        await self.cache_instruments()
+        await self.cache_instruments(force=True)
 
     # Gantry/frame (i.e. not pipette) action API
     async def home_z(self, mount: top_types.Mount = None):
@@ -752,6 +832,45 @@ class API(HardwareAPILike):
         deck_pos.update(plunger_axes)
         return deck_pos
 
+    @property
+    def _current_position(self) -> Dict[Axis, float]:
+        return cast(Dict[Axis, float], self._position_snapshot.position)
+
+    @_current_position.setter
+    def _current_position(self, position: Dict[Axis, float]):
+        # Replaced in one assignment so that readers on other threads see
+        # either the old snapshot or the new one
+        self._position_snapshot = PositionSnapshot(
+            generation=self._position_snapshot.generation + 1,
+            position=position)
+
+    @property
+    def position_snapshot(self) -> PositionSnapshot:
+        """ The cached deck position of every axis, and its generation.
+
+        Reading it never waits for motion. See :py:class:`.PositionSnapshot`.
+        """
+        return self._position_snapshot
+
+    async def _refresh_position(self):
+        """ Read the position from the backend, sharing one read between
+        all callers that ask while it is in flight """
+        refresh = self._position_refresh
+        if refresh is None:
+            # The read runs in its own task so that no caller being
+            # cancelled cancels it for the others
+            refresh = self._position_refresh = self._loop.create_task(
+                self._read_position())
+        await asyncio.shield(refresh)
+
+    async def _read_position(self):
+        try:
+            async with self._motion_lock:
+                self._current_position = self._deck_from_smoothie(
+                    self._backend.update_position())
+        finally:
+            self._position_refresh = None
+
     async def current_position(
             self,
             mount: top_types.Mount,
@@ -770,29 +889,33 @@ class API(HardwareAPILike):
         the next one down is returned - for instance, if there is no tip on the
         specified mount but `CriticalPoint.TIP` was specified, the position of
         the nozzle will be returned.
+
+        Without ``refresh``, this doesn't wait for motion in progress and
+        returns the position from before it. With ``refresh``, this waits for
+        motion in progress, and calls made while another refresh is reading
+        from the smoothie share its result.
         """
-        if not self._current_position and not refresh:
+        if refresh:
+            await self._refresh_position()
+        position = self._position_snapshot.position
+        if not position:
             raise MustHomeError
-        async with self._motion_lock:
-            if refresh:
-                self._current_position = self._deck_from_smoothie(
-                    self._backend.update_position())
-            if mount == top_types.Mount.RIGHT:
-                offset = top_types.Point(0, 0, 0)
+        if mount == top_types.Mount.RIGHT:
+            offset = top_types.Point(0, 0, 0)
+        else:
+            if ff.enable_calibration_overhaul():
+                offset = top_types.Point(*self._config.left_mount_offset)
             else:
-                if ff.enable_calibration_overhaul():
-                    offset = top_types.Point(*self._config.left_mount_offset)
-                else:
-                    offset = top_types.Point(*self._config.mount_offset)
-            z_ax = Axis.by_mount(mount)
-            plunger_ax = Axis.of_plunger(mount)
-            cp = self._critical_point_for(mount, critical_point)
-            return {
-                Axis.X: self._current_position[Axis.X] + offset[0] + cp.x,
-                Axis.Y: self._current_position[Axis.Y] + offset[1] + cp.y,
-                z_ax: self._current_position[z_ax] + offset[2] + cp.z,
-                plunger_ax: self._current_position[plunger_ax]
-            }
+                offset = top_types.Point(*self._config.mount_offset)
+        z_ax = Axis.by_mount(mount)
+        plunger_ax = Axis.of_plunger(mount)
+        cp = self._critical_point_for(mount, critical_point)
+        return {
+            Axis.X: position[Axis.X] + offset[0] + cp.x,
+            Axis.Y: position[Axis.Y] + offset[1] + cp.y,
+            z_ax: position[z_ax] + offset[2] + cp.z,
+            plunger_ax: position[plunger_ax]
+        }
 
     async def gantry_position(
             self,
@@ -1086,8 +1209,10 @@ class API(HardwareAPILike):
                                     target_position))
             raise ValueError("Moves must specify either exactly an "
                              "x, y, and (z or a) or none of them")
-        primary_transformed, secondary_transformed =\
-            self._get_transformed(to_transform_primary, to_transform_secondary)
+        with tracing.span('transform', 'hardware.transform'):
+            primary_transformed, secondary_transformed =\
+                self._get_transformed(
+                    to_transform_primary, to_transform_secondary)
         transformed = (*primary_transformed, secondary_transformed[2])
         # Since target_position is an OrderedDict with the axes ordered by
         # (x, y, z, a, b, c), and we’ll only have one of a or z (as checked
@@ -1107,17 +1232,20 @@ class API(HardwareAPILike):
         str_maxes = {ax.name: val for ax, val in checked_maxes.items()}
         async with contextlib.AsyncExitStack() as stack:
             if acquire_lock:
-                await stack.enter_async_context(self._motion_lock)
+                with tracing.span('motion_lock', 'hardware.lock'):
+                    await stack.enter_async_context(self._motion_lock)
             try:
-                self._backend.move(smoothie_pos, speed=speed,
-                                   home_flagged_axes=home_flagged_axes,
-                                   axis_max_speeds=str_maxes)
+                with tracing.span('backend.move', 'hardware'):
+                    self._backend.move(smoothie_pos, speed=speed,
+                                       home_flagged_axes=home_flagged_axes,
+                                       axis_max_speeds=str_maxes)
             except Exception:
                 self._log.exception('Move failed')
-                self._current_position.clear()
+                self._current_position = {}
                 raise
             else:
-                self._current_position.update(target_position)
+                self._current_position = {
+                    **self._current_position, **target_position}
 
     def get_engaged_axes(self) -> Dict[Axis, bool]:
         """ Which axes are engaged and holding. """
@@ -1774,18 +1902,49 @@ class API(HardwareAPILike):
         # destroy removed mods
         self._unregister_modules(removed_mods_at_ports)
 
-        # build new mods
-        for port, name in new_mods_at_ports:
-            new_instance = await self._backend.build_module(
-                    port=port,
-                    model=name,
-                    interrupt_callback=self.pause_with_message,
-                    loop=self.loop,
-                    execution_manager=self._execution_manager)
+        # build new mods. Each one has its own serial port, so connect to
+        # them all at once rather than one after the other
+        new_instances = await asyncio.gather(
+            *(self._build_module(port, name)
+              for port, name in new_mods_at_ports))
+        for (port, name), new_instance in zip(new_mods_at_ports,
+                                              new_instances):
+            if new_instance is None:
+                continue
             self._attached_modules.append(new_instance)
             self._log.info(f"Module {name} discovered and attached"
                            f" at port {port}, new_instance: {new_instance}")
 
+    async def _build_module(
+            self, port: str, name: str) -> Optional[modules.AbstractModule]:
+        """ Build and connect a module, or log why it could not be and
+        return ``None``
+        """
+        timing: ContextManager[None]
+        if self._bringing_up_modules:
+            timing = self._startup_timer.phase(f'module {name} at {port}')
+        else:
+            timing = contextlib.nullcontext()
+        try:
+            with timing:
+                return await asyncio.wait_for(
+                    self._backend.build_module(
+                        port=port,
+                        model=name,
+                        interrupt_callback=self.pause_with_message,
+                        loop=self.loop,
+                        execution_manager=self._execution_manager),
+                    MODULE_BUILD_TIMEOUT_S)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self._log.error(f"Module {name} at port {port} did not connect"
+                            f" within {MODULE_BUILD_TIMEOUT_S}s")
+        except Exception:
+            self._log.exception(f"Could not build module {name}"
+                                f" at port {port}")
+        return None
+
     async def _do_tp(self, pip, mount) -> top_types.Point:
         """ Execute the work of tip probe.
 
@@ -11,6 +11,7 @@ except OSError:
 
 from opentrons.drivers.smoothie_drivers import driver_3_0
 from opentrons.drivers.rpi_drivers import build_gpio_chardev
+from opentrons.system import smoothie_update
 import opentrons.config
 from opentrons.config import pipette_config
 from opentrons.types import Mount
@@ -62,6 +63,9 @@ class Controller:
             config=self.config, gpio_chardev=self._gpio_chardev,
             handle_locks=False)
         self._cached_fw_version: Optional[str] = None
+        # The (id, model) last read from each mount's pipette memory
+        self._instrument_fingerprints: Dict[
+            str, Tuple[str, Optional[str]]] = {}
         try:
             self._module_watcher = aionotify.Watcher()
             self._module_watcher.watch(
@@ -121,19 +125,16 @@ class Controller:
     def _query_mount(
             self,
             mount: Mount,
+            found_model: Optional[PipetteModel],
+            found_id: Optional[str],
             expected: Union[PipetteModel, PipetteName, None]
     ) -> AttachedInstrument:
-        found_model: Optional[PipetteModel]\
-                = self._smoothie_driver.read_pipette_model(  # type: ignore
-                    mount.name.lower())
         if found_model and found_model not in pipette_config.config_models:
             # TODO: Consider how to handle this error - it bubbles up now
             # and will cause problems at higher levels
             MODULE_LOG.error(
                 f'Bad model on {mount.name}: {found_model}')
             found_model = None
-        found_id = self._smoothie_driver.read_pipette_id(
-            mount.name.lower())
 
         if found_model:
             config = pipette_config.load(found_model, found_id)
@@ -153,12 +154,14 @@ class Controller:
             return {'config': None, 'id': None}
 
     def get_attached_instruments(
-            self, expected: Dict[Mount, PipetteName])\
-            -> AttachedInstruments:
+            self, expected: Dict[Mount, PipetteName],
+            force: bool = False) -> AttachedInstruments:
         """ Find the instruments attached to our mounts.
         :param expected: is ignored, it is just meant to enforce
                           the same interface as the simulator, where
                           required instruments can be manipulated.
+        :param force: Read each pipette's model even if it has the same
+                      serial number as the last time it was read.
 
         :returns: A dict with mounts as the top-level keys. Each mount value is
             a dict with keys 'model' (containing an instrument model name or
@@ -166,8 +169,19 @@ class Controller:
             attached to that mount, or `None`). Both mounts will always be
             specified.
         """
-        return {mount: self._query_mount(mount, expected.get(mount))
-                for mount in Mount}
+        found = self._smoothie_driver.read_pipettes(
+            [mount.name.lower() for mount in Mount],
+            known=None if force else self._instrument_fingerprints)
+        self._instrument_fingerprints = {
+            mount: (pipette_id, model)
+            for mount, (pipette_id, model) in found.items() if pipette_id}
+        attached = {}
+        for mount in Mount:
+            pipette_id, model = found[mount.name.lower()]
+            attached[mount] = self._query_mount(
+                mount, model, pipette_id,  # type: ignore
+                expected.get(mount))
+        return attached
 
     def set_active_current(self, axis_currents: Dict[Axis, float]):
         """
@@ -262,12 +276,14 @@ class Controller:
     async def update_fw_version(self):
         self._cached_fw_version = self._smoothie_driver.get_fw_version()
 
-    async def update_firmware(self,
-                              filename: str,
-                              loop: asyncio.AbstractEventLoop,
-                              modeset: bool) -> str:
+    async def update_firmware(
+            self,
+            filename: str,
+            loop: asyncio.AbstractEventLoop,
+            modeset: bool,
+            progress: smoothie_update.ProgressCallback = None) -> str:
         msg = await self._smoothie_driver.update_firmware(
-            filename, loop, modeset)
+            filename, loop, modeset, progress)
         await self.update_fw_version()
         return msg
 
@@ -189,6 +189,19 @@ class MagDeck(mod_abc.AbstractModule):
         """
         Connect to the serial port
         """
+        # The serial handshake blocks, so run it in a worker thread to let
+        # other modules connect at the same time
+        connecting = asyncio.ensure_future(
+            self._loop.run_in_executor(None, self._connect_driver))
+        try:
+            await asyncio.shield(connecting)
+        except asyncio.CancelledError:
+            # The handshake can't be interrupted, so if connecting is given
+            # up on (as when it times out) close the port once it's done
+            connecting.add_done_callback(lambda _: self._disconnect())
+            raise
+
+    def _connect_driver(self):
         if not self._driver.is_connected():
             self._driver.connect(self._port)
         self._device_info = self._driver.get_device_info()
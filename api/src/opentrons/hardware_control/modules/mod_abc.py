@@ -2,7 +2,6 @@ import abc
 import asyncio
 import logging
 import re
-from pkg_resources import parse_version
 from typing import Mapping, Optional
 from opentrons.config import IS_ROBOT, ROBOT_FIRMWARE_DIR
 from opentrons.hardware_control.util import use_or_initialize_loop
@@ -67,6 +66,8 @@ class AbstractModule(abc.ABC):
     def has_available_update(self) -> bool:
         """ Return whether a newer firmware file is available """
         if self._device_info and self._bundled_fw:
+            # pkg_resources is slow to import, so wait until it's needed
+            from pkg_resources import parse_version
             device_version = parse_version(self._device_info['version'])
             available_version = parse_version(self._bundled_fw.version)
             return available_version > device_version
@@ -41,8 +41,11 @@ class Poller(Thread):
     def __init__(self, driver: Union[TempDeckDriver, SimulatingDriver]):
         self._driver_ref = driver
         self._stop_event = Event()
+        # A daemon thread, so a module that is never deleted doesn't keep
+        # the process from exiting
         super().__init__(target=self._poll_temperature,
-                         name='Temperature poller for tempdeck')
+                         name='Temperature poller for tempdeck',
+                         daemon=True)
 
     def _poll_temperature(self):
         while not self._stop_event.wait(TEMP_POLL_INTERVAL_SECS):
@@ -224,11 +227,24 @@ class TempDeck(mod_abc.AbstractModule):
         if self._poller:
             self._poller.stop()
             self._poller.join()
+        # The serial handshake blocks, so run it in a worker thread to let
+        # other modules connect at the same time
+        connecting = asyncio.ensure_future(
+            self._loop.run_in_executor(None, self._connect_driver))
+        try:
+            await asyncio.shield(connecting)
+        except asyncio.CancelledError:
+            # The handshake can't be interrupted, so if connecting is given
+            # up on (as when it times out) close the port once it's done
+            connecting.add_done_callback(lambda _: self._driver.disconnect())
+            raise
+        self._poller = Poller(self._driver)
+        self._poller.start()
+
+    def _connect_driver(self):
         if not self._driver.is_connected():
             self._driver.connect(self._port)
         self._device_info = self._driver.get_device_info()
-        self._poller = Poller(self._driver)
-        self._poller.start()
 
     def __del__(self):
         if hasattr(self, '_poller') and self._poller:
@@ -316,8 +316,14 @@ class Thermocycler(mod_abc.AbstractModule):
         self._loop = newLoop
 
     async def _connect(self):
-        await self._driver.connect(self._port)
-        self._device_info = await self._driver.get_device_info()
+        try:
+            await self._driver.connect(self._port)
+            self._device_info = await self._driver.get_device_info()
+        except asyncio.CancelledError:
+            # If connecting is given up on (as when it times out), don't
+            # leave the port open and polling
+            self._driver.disconnect()
+            raise
 
     @property
     def port(self):
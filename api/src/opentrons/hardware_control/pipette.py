@@ -77,6 +77,7 @@ class Pipette:
             = self._config.default_dispense_flow_rates['2.0']
         self._blow_out_flow_rate\
             = self._config.default_blow_out_flow_rates['2.0']
+        self._compile_ul_per_mm()
 
     def act_as(self, name: PipetteName):
         """ Reconfigure to act as ``name``. ``name`` must be either the
@@ -118,6 +119,8 @@ class Pipette:
         self._log.info("updated config: {}={}".format(elem_name, elem_val))
         self._config = replace(self._config,
                                **{elem_name: elem_val})
+        if elem_name == 'ul_per_mm':
+            self._compile_ul_per_mm()
 
     @property
     def name(self) -> PipetteName:
@@ -295,9 +298,19 @@ class Pipette:
     def has_tip(self) -> bool:
         return self._has_tip
 
+    def _compile_ul_per_mm(self):
+        self._ul_per_mm_tables = {
+            action: pipette_config.VolumeConversionTable(sequence)
+            for action, sequence in self._config.ul_per_mm.items()}
+
     def ul_per_mm(self, ul: float, action: UlPerMmAction) -> float:
-        sequence = self._config.ul_per_mm[action]
-        return pipette_config.piecewise_volume_conversion(ul, sequence)
+        return self._ul_per_mm_tables[action].ul_per_mm(ul)
+
+    def ul_per_mm_array(self, ul: Any, action: UlPerMmAction) -> Any:
+        """ Like :py:meth:`ul_per_mm`, but for a whole array of volumes at
+        once, returning a numpy array
+        """
+        return self._ul_per_mm_tables[action].ul_per_mm_array(ul)
 
     def __str__(self) -> str:
         return '{} current volume {}ul critical point: {} at {}'\
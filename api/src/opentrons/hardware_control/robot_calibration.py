@@ -86,9 +86,13 @@ def migrate_affine_xy_to_attitude(
 
 
 def save_attitude_matrix(
-        expected: linal.SolvePoints, actual: linal.SolvePoints,
+        expected: linal.FitPoints, actual: linal.FitPoints,
         pipette_id: str, tiprack_hash: str):
-    attitude = linal.solve_attitude(expected, actual)
+    fit = linal.fit_attitude(expected, actual)
+    log.info(
+        f'Deck attitude residuals {fit.residuals.round(3).tolist()} mm, '
+        f'condition number {fit.condition_number:.1f}')
+    attitude = fit.transform.round(4).tolist()
     modify.save_robot_deck_attitude(attitude, pipette_id, tiprack_hash)
 
 
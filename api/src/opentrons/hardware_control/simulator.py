@@ -200,8 +200,8 @@ class Simulator:
                 'id': None}
 
     def get_attached_instruments(
-            self, expected: Dict[types.Mount, PipetteName]
-    ) -> AttachedInstruments:
+            self, expected: Dict[types.Mount, PipetteName],
+            force: bool = False) -> AttachedInstruments:
         """ Update the internal cache of attached instruments.
 
         This method allows after-init-time specification of attached simulated
@@ -217,6 +217,8 @@ class Simulator:
                          specified in the `attached_instruments` argument of
                          :py:meth:`__init__`, :py:attr:`RuntimeError` is
                          raised.
+        :param force: is ignored, it is just meant to enforce the same
+                      interface as the controller.
         :raises RuntimeError: If an instrument is expected but not found.
         :returns: A dict of mount to either instrument model names or `None`.
         """
@@ -275,7 +277,8 @@ class Simulator:
     def board_revision(self) -> BoardRevision:
         return BoardRevision.OG
 
-    async def update_firmware(self, filename, loop, modeset) -> str:
+    async def update_firmware(
+            self, filename, loop, modeset, progress=None) -> str:
         return 'Did nothing (simulating)'
 
     def engaged_axes(self):
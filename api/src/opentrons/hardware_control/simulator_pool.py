@@ -0,0 +1,139 @@
+""" A pool of simulating hardware controllers that can be reused.
+
+Building a simulating :py:class:`.API` in a :py:class:`.ThreadManager`
+starts a thread and an event loop, loads configuration and builds the
+simulated modules, which is a large part of the cost of simulating a short
+protocol. Simulations that ask for the same instruments and modules can
+share one instead, reset to how it was built between uses.
+"""
+import contextlib
+import logging
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from opentrons import types as top_types
+from .adapters import SynchronousAdapter
+from .api import API
+from .modules import ModuleAtPort
+from .thread_manager import ThreadManager
+
+MODULE_LOG = logging.getLogger(__name__)
+
+#: How many unused simulators a pool keeps by default
+DEFAULT_MAX_IDLE = 2
+
+AttachedInstruments = Dict[top_types.Mount, Dict[str, Optional[str]]]
+PoolKey = Tuple[Tuple[Tuple[str, Optional[str], Optional[str]], ...],
+                Tuple[str, ...]]
+
+
+def _key(attached_instruments: AttachedInstruments,
+         attached_modules: Sequence[str]) -> PoolKey:
+    instruments = tuple(sorted(
+        (mount.name, spec.get('model'), spec.get('id'))
+        for mount, spec in attached_instruments.items()
+        if spec.get('model')))
+    return instruments, tuple(attached_modules)
+
+
+def _reset(hardware: SynchronousAdapter) -> None:
+    """ Put a used simulator back into the state it was built in """
+    # Clears the execution state and rebuilds the instruments, which drops
+    # tips, volumes and flow rates
+    hardware.reset()
+    modules = [ModuleAtPort(port=mod.port, name=mod.name())
+               for mod in hardware.attached_modules]
+    hardware.register_modules(
+        new_mods_at_ports=modules, removed_mods_at_ports=modules)
+    hardware.set_lights(button=False, rails=False)
+
+
+class SimulatorPool:
+    """ Hands out simulating hardware controllers, reusing ones built for
+    the same attached instruments and modules.
+
+    Example
+    -------
+    .. code-block::
+    >>> pool = SimulatorPool()
+    >>> with pool.simulator({}, ['tempdeck']) as hardware:
+    ...     hardware.home()
+    """
+
+    def __init__(self, max_idle: int = DEFAULT_MAX_IDLE) -> None:
+        self._max_idle = max_idle
+        self._lock = threading.Lock()
+        # Unused simulators, least recently used first
+        self._idle: List[Tuple[PoolKey, ThreadManager]] = []
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    @contextlib.contextmanager
+    def simulator(
+            self,
+            attached_instruments: AttachedInstruments,
+            attached_modules: Sequence[str]) -> Iterator[SynchronousAdapter]:
+        """ Lend out a homed simulator for the duration of the block.
+
+        :param attached_instruments: The instruments the simulator should
+                                     consider attached, as for
+                                     :py:meth:`.API.build_hardware_simulator`.
+                                     Other instruments may be loaded too.
+        :param attached_modules: The names of the modules the simulator
+                                 should consider attached.
+        """
+        key = _key(attached_instruments, attached_modules)
+        manager = self._take(key)
+        if manager is not None:
+            try:
+                _reset(manager.sync)
+            except Exception:
+                MODULE_LOG.exception(
+                    'Could not reset a pooled simulator, building a new one')
+                manager.clean_up()
+                manager = None
+        if manager is None:
+            manager = ThreadManager(
+                API.build_hardware_simulator,
+                attached_instruments,
+                list(attached_modules),
+                strict_attached_instruments=False)
+        try:
+            manager.sync.home()
+            yield manager.sync
+        finally:
+            self._put(key, manager)
+
+    def clear(self) -> None:
+        """ Shut down the unused simulators """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for _, manager in idle:
+            manager.clean_up()
+
+    def _take(self, key: PoolKey) -> Optional[ThreadManager]:
+        with self._lock:
+            for index in reversed(range(len(self._idle))):
+                if self._idle[index][0] == key:
+                    return self._idle.pop(index)[1]
+        return None
+
+    def _put(self, key: PoolKey, manager: ThreadManager) -> None:
+        evicted = []
+        with self._lock:
+            self._idle.append((key, manager))
+            while len(self._idle) > self._max_idle:
+                evicted.append(self._idle.pop(0)[1])
+        for old in evicted:
+            old.clean_up()
+
+
+_default_pool = SimulatorPool()
+
+
+def get_default_pool() -> SimulatorPool:
+    """ The pool shared by everything simulating protocols in this process
+    """
+    return _default_pool
@@ -3,12 +3,17 @@ to a hardware controller.
 """
 
 import asyncio
+import codecs
 from collections import namedtuple
+import enum
 import functools
 import inspect
 import json
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+import re
+import struct
+from typing import (Any, Awaitable, Callable, Dict, List, Optional, Sequence,
+                    Set, Union)
 
 import jsonrpcserver  # type: ignore
 
@@ -149,22 +154,287 @@ def build_jrpc_methods(api: API) -> jsonrpcserver.methods.Methods:
     return methods
 
 
+class Framing(str, enum.Enum):
+    """ How messages are delimited on a connection.
+
+    Connections start out ``concatenated``: messages are json values written
+    back to back, and the end of each one is found by matching brackets. A
+    client can switch to a cheaper framing by sending an
+    ``rpc.framing`` request (see :py:func:`negotiate_framing`).
+    """
+    #: JSON values written back to back
+    concatenated = 'concatenated'
+    #: One message per line
+    newline = 'newline'
+    #: Each message is preceded by its length in bytes as a big endian
+    #: unsigned 32 bit integer
+    length = 'length'
+
+
+#: The method a client calls to change the framing of its connection
+FRAMING_METHOD = 'rpc.framing'
+
+#: The largest length-prefixed message accepted
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+#: How much a :py:class:`JsonStreamDecoder` reads from its stream at once
+READ_SIZE = 64 * 1024
+
+_LENGTH_PREFIX = struct.Struct('>I')
+_VALUE_START = re.compile(r'[{\[]')
+_STRUCTURAL = re.compile(r'[{}\[\]"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class FramingError(Exception):
+    """ Raised when a peer sends data that cannot be framed """
+    pass
+
+
+class ConcatenatedFramer:
+    """ Splits back to back json objects and arrays.
+
+    Rather than trying to decode the whole buffer after every read, this
+    tracks bracket depth and whether it is inside a string, so each byte is
+    scanned once. Anything before the start of an object or array is
+    dropped, so garbage on the connection can't wedge it. Bytes are decoded
+    incrementally, so a multibyte character split between reads is fine.
+    """
+    framing = Framing.concatenated
+
+    def __init__(self):
+        self._utf8 = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._text = ''
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, data: bytes):
+        self._text += self._utf8.decode(data)
+
+    def pop(self) -> Optional[str]:
+        """ Return the next complete message, or None if there isn't one """
+        if not self._depth and not self._find_start():
+            return None
+        text = self._text
+        pos = self._pos
+        while True:
+            if self._in_string:
+                pos = self._skip_string(text, pos)
+                if self._in_string:
+                    break
+            match = _STRUCTURAL.search(text, pos)
+            if not match:
+                pos = len(text)
+                break
+            pos = match.end()
+            char = match.group()
+            if char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if not self._depth:
+                    self._text = text[pos:]
+                    self._pos = 0
+                    return text[:pos]
+        self._text = text
+        self._pos = pos
+        return None
+
+    def _find_start(self) -> bool:
+        """ Drop everything before the next object or array """
+        match = _VALUE_START.search(self._text)
+        if not match:
+            self._text = ''
+            self._pos = 0
+            return False
+        self._text = self._text[match.start():]
+        self._depth = 1
+        self._pos = 1
+        return True
+
+    def _skip_string(self, text: str, pos: int) -> int:
+        """ Scan to the end of the string that pos is in, returning where
+        to continue from """
+        while True:
+            match = _STRING_SPECIAL.search(text, pos)
+            if not match:
+                return len(text)
+            if match.group() == '"':
+                self._in_string = False
+                return match.end()
+            if match.end() == len(text):
+                # The escaped character hasn't arrived yet
+                return match.start()
+            pos = match.end() + 1
+
+    def remaining(self) -> bytes:
+        """ Everything fed but not yet popped """
+        return self._text.encode() + self._utf8.getstate()[0]
+
+    def frame(self, message: str) -> bytes:
+        return message.encode()
+
+
+class NewlineFramer:
+    """ Splits messages on newlines. Blank lines are ignored. """
+    framing = Framing.newline
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._searched = 0
+
+    def feed(self, data: bytes):
+        self._buf += data
+
+    def pop(self) -> Optional[str]:
+        while True:
+            end = self._buf.find(b'\n', self._searched)
+            if end < 0:
+                self._searched = len(self._buf)
+                return None
+            line = bytes(self._buf[:end])
+            del self._buf[:end + 1]
+            self._searched = 0
+            if line.strip():
+                return line.decode('utf-8', errors='replace')
+
+    def remaining(self) -> bytes:
+        return bytes(self._buf)
+
+    def frame(self, message: str) -> bytes:
+        return message.encode() + b'\n'
+
+
+class LengthPrefixedFramer:
+    """ Splits messages preceded by their length """
+    framing = Framing.length
+
+    def __init__(self, max_size: int = MAX_FRAME_SIZE):
+        self._buf = bytearray()
+        self._max_size = max_size
+
+    def feed(self, data: bytes):
+        self._buf += data
+
+    def pop(self) -> Optional[str]:
+        if len(self._buf) < _LENGTH_PREFIX.size:
+            return None
+        size, = _LENGTH_PREFIX.unpack_from(self._buf)
+        if size > self._max_size:
+            raise FramingError(
+                f'Message of {size} bytes is larger than the limit of '
+                f'{self._max_size}')
+        end = _LENGTH_PREFIX.size + size
+        if len(self._buf) < end:
+            return None
+        message = bytes(self._buf[_LENGTH_PREFIX.size:end])
+        del self._buf[:end]
+        return message.decode('utf-8', errors='replace')
+
+    def remaining(self) -> bytes:
+        return bytes(self._buf)
+
+    def frame(self, message: str) -> bytes:
+        data = message.encode()
+        return _LENGTH_PREFIX.pack(len(data)) + data
+
+
+Framer = Union[ConcatenatedFramer, NewlineFramer, LengthPrefixedFramer]
+
+_FRAMERS: Dict[Framing, Callable[[], Framer]] = {
+    Framing.concatenated: ConcatenatedFramer,
+    Framing.newline: NewlineFramer,
+    Framing.length: LengthPrefixedFramer,
+}
+
+
+def build_framer(framing: Framing, pending: bytes = b'') -> Framer:
+    """ Build a framer, feeding it data already read from the connection """
+    framer = _FRAMERS[framing]()
+    if pending:
+        framer.feed(pending)
+    return framer
+
+
+def choose_framing(requested: Any) -> Framing:
+    """ Pick the first framing in a client's list of preferences that we
+    support, falling back to concatenated json
+    """
+    if isinstance(requested, str):
+        requested = [requested]
+    if not isinstance(requested, list):
+        return Framing.concatenated
+    for name in requested:
+        try:
+            return Framing(name)
+        except ValueError:
+            continue
+    return Framing.concatenated
+
+
 class JsonStreamDecoder:
-    def __init__(self, reader: asyncio.StreamReader):
+    """ Reads json messages from a stream, for clients of the server """
+    def __init__(self, reader: asyncio.StreamReader,
+                 framing: Framing = Framing.concatenated):
         self._reader = reader
-        self._buf = b''
-        self._decoder = json.JSONDecoder()
+        self._framer = build_framer(framing)
+
+    @property
+    def framing(self) -> Framing:
+        return self._framer.framing
+
+    def set_framing(self, framing: Framing):
+        """ Switch framing, keeping anything already read """
+        self._framer = build_framer(framing, self._framer.remaining())
+
+    def frame(self, message: str) -> bytes:
+        """ Frame an outgoing message to match the connection """
+        return self._framer.frame(message)
 
     async def read_object(self) -> Any:
         while True:
-            self._buf += await self._reader.read(1)
-            try:
-                decoded, offset = self._decoder.raw_decode(self._buf.decode())
-            except json.JSONDecodeError:
-                pass
-            else:
-                self._buf = self._buf[offset:]
-                return decoded
+            message = self._framer.pop()
+            if message is not None:
+                return json.loads(message)
+            data = await self._reader.read(READ_SIZE)
+            if not data:
+                raise asyncio.IncompleteReadError(
+                    self._framer.remaining(), None)
+            self._framer.feed(data)
+
+
+async def negotiate_framing(
+        decoder: JsonStreamDecoder,
+        writer: asyncio.StreamWriter,
+        preferred: Sequence[Framing] = (Framing.length, Framing.newline))\
+        -> Framing:
+    """ Ask the server to switch the connection to a different framing.
+
+    This must be done before any other calls are in flight. Servers that
+    don't support it leave the connection concatenated.
+
+    :param decoder: The decoder reading from the connection
+    :param writer: The writer for the connection
+    :param preferred: Framings to ask for, most preferred first
+    :returns: The framing now in use, which the decoder is switched to
+    """
+    request = json.dumps({
+        'jsonrpc': '2.0', 'method': FRAMING_METHOD,
+        'params': {'framing': list(preferred)},
+        'id': FRAMING_METHOD})
+    writer.write(decoder.frame(request))
+    await writer.drain()
+    response = await decoder.read_object()
+    try:
+        framing = Framing(response['result']['framing'])
+    except (KeyError, TypeError, ValueError):
+        LOG.debug(f'Server does not support framing negotiation: {response}')
+        return decoder.framing
+    decoder.set_framing(framing)
+    return framing
 
 
 class Server:
@@ -221,8 +491,7 @@ class JsonRpcProtocol(asyncio.Protocol):
         self._api = api
         self._loop = loop
         self._log = LOG.getChild('jsonrpc')
-        self._decoder = json.JSONDecoder()
-        self._buffer = ''
+        self._framer: Framer = build_framer(Framing.concatenated)
         self._transport: Optional[asyncio.Transport] = None
         self._inflight: Set[asyncio.Future] = set()
         self._onclose = on_close
@@ -245,61 +514,80 @@ class JsonRpcProtocol(asyncio.Protocol):
     def resume_writing(self):
         self._log.debug('resume writing')
 
-    def data_received(self, data: bytes):  # noqa(C901)
+    def _write(self, message: str):
+        if self._transport:
+            self._transport.write(self._framer.frame(message))
+
+    def data_received(self, data: bytes):
         self._log.debug(f'data received: {data!r}')
-        self._buffer += data.decode()  # hope this isn't incomplete
-        try:
-            _, pos = self._decoder.raw_decode(self._buffer)
-        except json.JSONDecodeError:
-            # If someone sends us garbage that isn't valid json, we need to
-            # not get stuck in a bad state. If we're always accumulating data
-            # until we no longer get an error, then consider if the first thing
-            # we saw was "aaaaaaaa" - this would always be invalid because it's
-            # impossible to make it valid json just by adding more data.
-            # Since we are only accepting jsonrpc, every message should be an
-            # object and therefore should start with {.
-            if self._buffer[0] != '{':
-                obj_start = self._buffer.find('{')
-                if obj_start == -1:
-                    # There is no '{' character in the buffer, wait for more
-                    # data
-                    return
-                else:
-                    # Recurse now that we've made the buffer safe
-                    self._buffer = self._buffer[obj_start:]
-                    return self.data_received(b'')
-            else:
-                # This is an incomplete json object, we can't dispatch anything
-                # and should wait for more data
+        self._framer.feed(data)
+        while True:
+            try:
+                message = self._framer.pop()
+            except FramingError as e:
+                self._log.error(f'Closing connection: {e}')
+                self._write(_build_jrpc_error('invalid frame', e))
+                if self._transport:
+                    self._transport.close()
                 return
-        to_dispatch = self._buffer[:pos]
-        self._buffer = self._buffer[pos:]
-        task = self._loop.create_task(self._dispatch(to_dispatch))
-        self._inflight.add(task)
-
-        def done_callback(fut):
-            if not self._transport:  # closed under us
+            if message is None:
                 return
-            try:
-                res = fut.result()
-            except asyncio.InvalidStateError:
-                self._log.exception("Invalid state in jrpc dispatch")
-                pass
-            except asyncio.CancelledError as e:
-                self._log.error("jsonrpc invocation cancelled")
-                self._transport.write(
-                    _build_jrpc_error('execution cancelled', e).encode())
-            except Exception as e:
-                self._log.exception('Uncaught exception in jsonrpc dispatch')
-                self._transport.write(
-                    _build_jrpc_error('uncaught exception in dispatch',
-                                      e).encode())
-            else:
-                self._transport.write(res.encode())
-            finally:
-                self._inflight.remove(task)
-
-        task.add_done_callback(done_callback)
+            if FRAMING_METHOD in message and self._negotiate(message):
+                continue
+            # Each message gets its own task, so a slow call doesn't hold up
+            # the ones sent after it. Batches go to jsonrpcserver as they are.
+            task = self._loop.create_task(self._dispatch(message))
+            self._inflight.add(task)
+            task.add_done_callback(self._dispatch_done)
+
+    def _negotiate(self, message: str) -> bool:
+        """ Handle a framing request, returning False if the message turns
+        out to be something else
+        """
+        try:
+            request = json.loads(message)
+        except ValueError:
+            return False
+        if not isinstance(request, dict)\
+                or request.get('method') != FRAMING_METHOD:
+            return False
+        if self._inflight:
+            # Responses to calls already in flight would be framed
+            # differently from what the client expects
+            self._write(json.dumps({
+                'jsonrpc': '2.0', 'id': request.get('id'),
+                'error': {'code': -32600,
+                          'message': 'framing must be negotiated before '
+                                     'any other calls'}}))
+            return True
+        params = request.get('params')
+        framing = choose_framing(
+            params.get('framing') if isinstance(params, dict) else None)
+        self._write(json.dumps({'jsonrpc': '2.0', 'id': request.get('id'),
+                                'result': {'framing': framing.value}}))
+        self._framer = build_framer(framing, self._framer.remaining())
+        self._log.info(f'Switched to {framing.value} framing')
+        return True
+
+    def _dispatch_done(self, fut: asyncio.Future):
+        self._inflight.discard(fut)
+        if not self._transport:  # closed under us
+            return
+        try:
+            res = fut.result()
+        except asyncio.InvalidStateError:
+            self._log.exception("Invalid state in jrpc dispatch")
+        except asyncio.CancelledError as e:
+            self._log.error("jsonrpc invocation cancelled")
+            self._write(_build_jrpc_error('execution cancelled', e))
+        except Exception as e:
+            self._log.exception('Uncaught exception in jsonrpc dispatch')
+            self._write(_build_jrpc_error('uncaught exception in dispatch',
+                                          e))
+        else:
+            if res:
+                # Notifications have no response
+                self._write(res)
 
     def eof_received(self):
         self._log.info('eof received')
@@ -0,0 +1,104 @@
+""" Throughput benchmark for the hardware control socket server.
+
+Runs the server on a simulator over a local socket and times calls to a
+cheap method in each framing, one at a time, pipelined, and as json-rpc
+batches. For example:
+
+    python -m opentrons.hardware_control.socket_server_benchmark -c 2000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import List
+
+from . import API
+from . import socket_server as sockserv
+
+
+def _request(call_id: int) -> dict:
+    return {'jsonrpc': '2.0', 'method': 'delay',
+            'params': {'duration_s': 0}, 'id': call_id}
+
+
+async def _connect(sock: str, framing: sockserv.Framing):
+    reader, writer = await asyncio.open_unix_connection(sock)
+    decoder = sockserv.JsonStreamDecoder(reader)
+    if framing != sockserv.Framing.concatenated:
+        chosen = await sockserv.negotiate_framing(
+            decoder, writer, [framing])
+        assert chosen == framing, f'server chose {chosen}'
+    return decoder, writer
+
+
+async def _sequential(decoder, writer, calls: int):
+    for call_id in range(calls):
+        writer.write(decoder.frame(json.dumps(_request(call_id))))
+        await writer.drain()
+        await decoder.read_object()
+
+
+async def _pipelined(decoder, writer, calls: int):
+    for call_id in range(calls):
+        writer.write(decoder.frame(json.dumps(_request(call_id))))
+    await writer.drain()
+    for _ in range(calls):
+        await decoder.read_object()
+
+
+async def _batched(decoder, writer, calls: int, batch_size: int):
+    for first in range(0, calls, batch_size):
+        batch = [_request(call_id)
+                 for call_id in range(first, min(first + batch_size, calls))]
+        writer.write(decoder.frame(json.dumps(batch)))
+        await writer.drain()
+        await decoder.read_object()
+
+
+async def arun(calls: int, batch_size: int,
+               framings: List[sockserv.Framing]):
+    api = await API.build_hardware_simulator()
+    # Not a tmp_path: unix socket paths are limited to about 100 characters
+    with tempfile.TemporaryDirectory() as td:
+        sock = os.path.join(td, 'bench')
+        server = await sockserv.run(sock, api)
+        try:
+            for framing in framings:
+                for name, runner in (
+                        ('sequential', _sequential),
+                        ('pipelined', _pipelined),
+                        ('batched', lambda d, w, c: _batched(
+                            d, w, c, batch_size))):
+                    decoder, writer = await _connect(sock, framing)
+                    start = time.perf_counter()
+                    await runner(decoder, writer, calls)
+                    elapsed = time.perf_counter() - start
+                    writer.close()
+                    print(f'{framing.value:>12} {name:>10}: '
+                          f'{calls / elapsed:10.0f} calls/s '
+                          f'({elapsed * 1e6 / calls:8.1f}us per call)')
+        finally:
+            await server.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Opentrons hardware control socket server benchmark')
+    parser.add_argument(
+        '-c', '--calls', type=int, default=1000,
+        help='How many calls to make in each test')
+    parser.add_argument(
+        '-b', '--batch-size', type=int, default=50,
+        help='How many calls to send in each batch')
+    parser.add_argument(
+        '-f', '--framing', action='append',
+        choices=[f.value for f in sockserv.Framing],
+        help='Framings to test, all by default')
+    args = parser.parse_args()
+    framings = [sockserv.Framing(f) for f in args.framing]\
+        if args.framing else list(sockserv.Framing)
+    asyncio.get_event_loop().run_until_complete(
+        arun(args.calls, args.batch_size, framings))
@@ -5,6 +5,7 @@ import logging
 import asyncio
 import functools
 from typing import Generic, TypeVar, Any
+from opentrons.util import tracing
 from .adapters import SynchronousAdapter
 from .modules.mod_abc import AbstractModule
 
@@ -51,8 +52,9 @@ class CallBridger(Generic[WrappedObj]):
 
             @functools.wraps(attr)
             async def wrapper(*args, **kwargs):
-                return await call_coroutine_threadsafe(
-                    loop, attr, *args, **kwargs)
+                with tracing.span(attr.__qualname__, 'hardware.bridge'):
+                    return await call_coroutine_threadsafe(
+                        loop, attr, *args, **kwargs)
 
             return wrapper
 
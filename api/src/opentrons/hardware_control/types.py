@@ -3,7 +3,7 @@ import asyncio
 import enum
 import logging
 from dataclasses import dataclass
-from typing import Tuple, Union, TYPE_CHECKING
+from typing import Mapping, Tuple, Union, TYPE_CHECKING
 from opentrons import types as top_types
 
 if TYPE_CHECKING:
@@ -95,6 +95,19 @@ class DoorStateNotification:
 HardwareEvent = Union[DoorStateNotification]
 
 
+@dataclass(frozen=True)
+class PositionSnapshot:
+    """ The cached deck position of every axis.
+
+    The hardware controller replaces its snapshot rather than changing it,
+    so a snapshot is always consistent. ``generation`` goes up by one every
+    time the position is replaced, so callers that derive something from
+    the position can skip recomputing it while the generation is the same.
+    """
+    generation: int
+    position: Mapping[Axis, float]
+
+
 class HardwareAPILike(abc.ABC):
     """ A dummy class useful in isinstance checks to accept an API or adapter
     """
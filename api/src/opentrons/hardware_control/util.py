@@ -1,11 +1,14 @@
 """ Utility functions and classes for the hardware controller"""
 import asyncio
 import logging
+import time
+from contextlib import contextmanager
 from enum import Enum
-from typing import Dict, Any, Optional, List, Mapping, Tuple
+from typing import Dict, Any, Iterator, Optional, List, Mapping, Tuple
 
 from .types import CriticalPoint, MotionChecks, OutOfBoundsMove, Axis
 from opentrons.types import Point
+from opentrons.util import tracing
 
 mod_log = logging.getLogger(__name__)
 
@@ -91,3 +94,42 @@ def check_motion_bounds(
             mod_log.warning(bounds_message)
             if checks.value & MotionChecks.HIGH.value:
                 raise OutOfBoundsMove(bounds_message)
+
+
+class PhaseTimer:
+    """ Records how long named (and possibly overlapping) phases take.
+
+    Used to report what dominates hardware bring-up.
+    """
+
+    def __init__(self) -> None:
+        self._spans: Dict[str, Tuple[float, float]] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """ Time the body of the block as the phase ``name``. A phase that
+        runs again replaces its earlier timing.
+        """
+        start = time.monotonic()
+        try:
+            with tracing.span(name, 'startup'):
+                yield
+        finally:
+            self._spans[name] = (start, time.monotonic())
+
+    @property
+    def durations(self) -> Dict[str, float]:
+        """ The duration of each phase in seconds, in the order they ended """
+        return {name: end - start
+                for name, (start, end) in self._spans.items()}
+
+    def report(self) -> str:
+        """ Summarize the phases, longest first """
+        if not self._spans:
+            return 'no phases recorded'
+        wall = max(end for _, end in self._spans.values())\
+            - min(start for start, _ in self._spans.values())
+        phases = sorted(
+            self.durations.items(), key=lambda item: item[1], reverse=True)
+        return f'{wall:.3f}s total; ' + ', '.join(
+            f'{name} {duration:.3f}s' for name, duration in phases)
@@ -57,3 +57,13 @@ class SlotDoesNotExistError(ProtocolEngineError):
 class FailedToPlanMoveError(ProtocolEngineError):
     """An error raised when a requested movement could not be planned."""
     pass
+
+
+class StateRevisionDoesNotExistError(ProtocolEngineError):
+    """An error raised when referencing a state revision that doesn't exist."""
+    pass
+
+
+class StateRevisionPrunedError(StateRevisionDoesNotExistError):
+    """An error raised when referencing a state revision too old to rebuild."""
+    pass
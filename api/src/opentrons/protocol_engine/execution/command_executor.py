@@ -1,5 +1,7 @@
 """Command executor router class."""
 from __future__ import annotations
+import asyncio
+import logging
 from typing import Union
 
 from opentrons.util.helpers import utc_now
@@ -10,6 +12,8 @@ from .. import resources, command_models as cmd
 from .equipment import EquipmentHandler
 from .pipetting import PipettingHandler
 
+log = logging.getLogger(__name__)
+
 
 class CommandExecutor:
     """
@@ -68,6 +72,26 @@ class CommandExecutor:
                 utc_now()
             )
 
+    async def prepare_command(self, request: cmd.CommandRequestType) -> None:
+        """
+        Do the work of a command that does not depend on the commands before
+        it, so that it can overlap their execution.
+
+        Preparation is only an optimization: it never fails, and whatever it
+        could not do is done when the command is executed.
+        """
+        try:
+            if isinstance(request, cmd.LoadLabwareRequest):
+                await self._equipment_handler.prepare_load_labware(request)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log.debug("Failed to prepare %s", request, exc_info=True)
+
+    def discard_prepared(self) -> None:
+        """Forget the preparations of commands that will not be executed."""
+        self._equipment_handler.discard_prepared()
+
     async def _try_to_execute_command(
         self,
         command: cmd.RunningCommandType,
@@ -1,9 +1,13 @@
 """Equipment command side-effect logic."""
+from typing import Dict, Tuple
+
+from opentrons_shared_data.labware.dev_types import LabwareDefinition
 from opentrons.hardware_control.api import API as HardwareAPI
 
 from ..errors import FailedToLoadPipetteError
 from ..resources import IdGenerator, LabwareData
 from ..state import StateView
+from ..types import LabwareLocation
 
 from ..command_models import (
     LoadLabwareRequest,
@@ -13,9 +17,15 @@ from ..command_models import (
 )
 
 
+PreparedLabwareKey = Tuple[str, str, int, LabwareLocation]
+PreparedLabware = Tuple[LabwareDefinition, Tuple[float, float, float]]
+
+
 class EquipmentHandler:
     """Implementation logic for labware, pipette, and module loading."""
 
+    _prepared_labware: Dict[PreparedLabwareKey, PreparedLabware]
+
     def __init__(
         self,
         hardware: HardwareAPI,
@@ -28,6 +38,16 @@ class EquipmentHandler:
         self._state: StateView = state
         self._id_generator: IdGenerator = id_generator
         self._labware_data: LabwareData = labware_data
+        self._prepared_labware = {}
+
+    async def prepare_load_labware(self, request: LoadLabwareRequest) -> None:
+        """Fetch labware definition and calibration data ahead of loading."""
+        self._prepared_labware[self._get_prepared_key(request)] = \
+            await self._get_labware_data(request)
+
+    def discard_prepared(self) -> None:
+        """Forget any data fetched for loads that were never handled."""
+        self._prepared_labware.clear()
 
     async def handle_load_labware(
         self,
@@ -35,6 +55,26 @@ class EquipmentHandler:
     ) -> LoadLabwareResult:
         """Load labware definition and calibration data."""
         labware_id = self._id_generator.generate_id()
+        prepared = self._prepared_labware.pop(
+            self._get_prepared_key(request),
+            None
+        )
+        labware_def, cal_data = (
+            prepared
+            if prepared is not None else
+            await self._get_labware_data(request)
+        )
+
+        return LoadLabwareResult(
+            labwareId=labware_id,
+            definition=labware_def,
+            calibration=cal_data
+        )
+
+    async def _get_labware_data(
+        self,
+        request: LoadLabwareRequest
+    ) -> PreparedLabware:
         labware_def = await self._labware_data.get_labware_definition(
             load_name=request.loadName,
             namespace=request.namespace,
@@ -44,11 +84,15 @@ class EquipmentHandler:
             definition=labware_def,
             location=request.location,
         )
+        return labware_def, cal_data
 
-        return LoadLabwareResult(
-            labwareId=labware_id,
-            definition=labware_def,
-            calibration=cal_data
+    @staticmethod
+    def _get_prepared_key(request: LoadLabwareRequest) -> PreparedLabwareKey:
+        return (
+            request.loadName,
+            request.namespace,
+            request.version,
+            request.location,
         )
 
     async def handle_load_pipette(
@@ -1,6 +1,8 @@
 """ProtocolEngine class definition."""
 from __future__ import annotations
-from typing import Union
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Deque, Iterable, Tuple, Union
 
 from opentrons_shared_data.deck import load as load_deck
 from opentrons.protocols.api_support.constants import STANDARD_DECK
@@ -15,7 +17,8 @@ from .command_models import (
     RunningCommandType,
     CompletedCommandType,
     FailedCommandType,
-    RunningCommand
+    RunningCommand,
+    FailedCommand,
 )
 
 
@@ -72,3 +75,57 @@ class ProtocolEngine:
         self.state_store.handle_command(completed_cmd, command_id=command_id)
 
         return completed_cmd
+
+    async def execute_commands(
+        self,
+        requests: Iterable[Tuple[CommandRequestType, str]],
+        lookahead: int = 1,
+    ) -> AsyncIterator[Union[CompletedCommandType, FailedCommandType]]:
+        """
+        Execute a stream of (request, command_id) pairs in order, yielding
+        each completed or failed command.
+
+        While a command executes, the next `lookahead` commands are prepared
+        (for instance, their labware definitions are loaded). Commands are
+        still created, executed and stored one at a time, so the results
+        and state are the same as calling `execute_command` for each request.
+        Execution stops at the first failed command, and the preparations of
+        the commands after it are discarded.
+        """
+        pending = iter(requests)
+        preparing: Deque[
+            Tuple[CommandRequestType, str, asyncio.Task]
+        ] = deque()
+
+        def prepare_next() -> None:
+            # the next command to execute, and the lookahead after it
+            while len(preparing) < lookahead + 1:
+                try:
+                    request, command_id = next(pending)
+                except StopIteration:
+                    return
+                preparing.append((
+                    request,
+                    command_id,
+                    asyncio.create_task(
+                        self.executor.prepare_command(request)
+                    ),
+                ))
+
+        try:
+            while True:
+                prepare_next()
+                if not preparing:
+                    return
+                request, command_id, preparation = preparing.popleft()
+                await preparation
+
+                result = await self.execute_command(request, command_id)
+                yield result
+
+                if isinstance(result, FailedCommand):
+                    return
+        finally:
+            for _, _, preparation in preparing:
+                preparation.cancel()
+            self.executor.discard_prepared()
@@ -1,6 +1,7 @@
 """Resources used by command execution handlers."""
 # TODO(mc, 2020-10-21): break this module up when it becames > 100 lines
 
+import asyncio
 from uuid import uuid4
 from typing import Tuple
 from opentrons_shared_data.labware.dev_types import LabwareDefinition
@@ -27,8 +28,6 @@ class IdGenerator:
 class LabwareData:
     """Labware data provider."""
 
-    # NOTE(mc, 2020-10-18): async to allow file reading and parsing to be
-    # async on a worker thread in the future
     async def get_labware_definition(
         self,
         load_name: str,
@@ -36,7 +35,15 @@ class LabwareData:
         version: int,
     ) -> LabwareDefinition:
         """Get a labware definition given the labware's identification."""
-        return get_labware_definition(load_name, namespace, version)
+        # read and parse the definition on a worker thread, so that loading
+        # labware ahead of time doesn't hold up the commands executing now
+        return await asyncio.get_event_loop().run_in_executor(
+            None,
+            get_labware_definition,
+            load_name,
+            namespace,
+            version,
+        )
 
     # NOTE(mc, 2020-10-18): async to allow file reading and parsing to be
     # async on a worker thread in the future
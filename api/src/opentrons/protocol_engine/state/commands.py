@@ -1,4 +1,5 @@
 """Protocol engine commands sub-state."""
+from bisect import bisect_left
 from typing import Dict, List, Optional, Tuple
 
 from .. import command_models as cmd
@@ -6,21 +7,80 @@ from .substore import Substore
 
 
 class CommandState:
-    """Command state and getters."""
+    """Command state and getters.
 
-    _commands_by_id: Dict[str, cmd.CommandType]
+    Every command a store handles is appended to a log shared by all of its
+    states, and a state only sees the first `revision` entries of that log.
+    The store never changes an entry, so a state stays the same after the
+    store moves on, and making a new state doesn't copy anything. The log
+    lasts as long as the store, like the command list it backs.
+    """
+
+    # (command_id, command) for every command handled, including each update
+    # to a command that was already handled
+    _log: List[Tuple[str, cmd.CommandType]]
+    # log positions of each version of a command, in order
+    _positions_by_id: Dict[str, List[int]]
+    # command ids in the order they were first handled, and the log position
+    # where each was first handled
+    _ids: List[str]
+    _first_positions: List[int]
+    _revision: int
 
     def __init__(self) -> None:
         """Initialize a CommandState instance."""
-        self._commands_by_id = {}
+        self._log = []
+        self._positions_by_id = {}
+        self._ids = []
+        self._first_positions = []
+        self._revision = 0
+
+    @property
+    def revision(self) -> int:
+        """Get how many times commands have been handled."""
+        return self._revision
 
     def get_command_by_id(self, uid: str) -> Optional[cmd.CommandType]:
         """Get a command by its unique identifier."""
-        return self._commands_by_id.get(uid)
+        positions = self._positions_by_id.get(uid, [])
+        # versions handled after this state's revision aren't part of it
+        count = bisect_left(positions, self._revision)
+        return self._log[positions[count - 1]][1] if count else None
+
+    def get_command_count(self) -> int:
+        """Get how many commands are in state."""
+        return bisect_left(self._first_positions, self._revision)
+
+    def get_commands(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[str, cmd.CommandType]]:
+        """Get a page of command entries, in the order they were added."""
+        count = self.get_command_count()
+        end = count if limit is None else min(count, offset + limit)
+        return [
+            (uid, self._get_visible_command(uid))
+            for uid in self._ids[offset:end]
+        ]
 
     def get_all_commands(self) -> List[Tuple[str, cmd.CommandType]]:
         """Get a list of all command entries in state."""
-        return [entry for entry in self._commands_by_id.items()]
+        return self.get_commands()
+
+    def _get_visible_command(self, uid: str) -> cmd.CommandType:
+        command = self.get_command_by_id(uid)
+        assert command is not None, f"{uid} is not in this state"
+        return command
+
+    def _at_revision(self, revision: int) -> "CommandState":
+        state = CommandState.__new__(CommandState)
+        state._log = self._log
+        state._positions_by_id = self._positions_by_id
+        state._ids = self._ids
+        state._first_positions = self._first_positions
+        state._revision = revision
+        return state
 
 
 class CommandStore(Substore[CommandState]):
@@ -38,4 +98,13 @@ class CommandStore(Substore[CommandState]):
         command_id: str
     ) -> None:
         """Modify state in reaction to any command."""
-        self._state._commands_by_id[command_id] = command
+        state = self._state
+        position = len(state._log)
+        state._log.append((command_id, command))
+        if command_id in state._positions_by_id:
+            state._positions_by_id[command_id].append(position)
+        else:
+            state._positions_by_id[command_id] = [position]
+            state._ids.append(command_id)
+            state._first_positions.append(position)
+        self._state = state._at_revision(position + 1)
@@ -1,26 +1,46 @@
 """Geometry state store and getters."""
+import heapq
+from copy import copy
+from typing import Dict, List, Tuple
+
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2, SlotDefV2
 from opentrons.types import Point, DeckSlotName
 
-from .. import errors
+from .. import command_models as cmd, errors
 from .substore import Substore, CommandReactive
-from .labware import LabwareStore, LabwareData
+from .labware import LabwareState, LabwareData
 
 
 class GeometryState:
-    """Geometry getters."""
+    """Geometry getters.
+
+    Labware geometry is indexed as labware is loaded, so getters used while
+    planning moves do not depend on how much labware is on the deck.
+    """
 
     _deck_definition: DeckDefinitionV2
-    _labware_store: LabwareStore
+    _labware_store: Substore[LabwareState]
+    _slots_by_id: Dict[str, SlotDefV2]
+    _highest_z_by_labware_id: Dict[str, float]
+    # max-heap of (-highest_z, labware_id); the top entry is always current
+    _highest_z_heap: List[Tuple[float, str]]
+    _well_positions_by_labware_id: Dict[str, Dict[str, Point]]
 
     def __init__(
         self,
         deck_definition: DeckDefinitionV2,
-        labware_store: LabwareStore
+        labware_store: Substore[LabwareState]
     ) -> None:
         """Initialize a GeometryState instance."""
         self._deck_definition = deck_definition
         self._labware_store = labware_store
+        self._slots_by_id = {
+            slot_def["id"]: slot_def
+            for slot_def in deck_definition["locations"]["orderedSlots"]
+        }
+        self._highest_z_by_labware_id = {}
+        self._highest_z_heap = []
+        self._well_positions_by_labware_id = {}
 
     def get_deck_definition(self) -> DeckDefinitionV2:
         """Get the current deck definition."""
@@ -28,15 +48,13 @@ class GeometryState:
 
     def get_slot_definition(self, slot: DeckSlotName) -> SlotDefV2:
         """Get the current deck definition."""
-        deck_def = self.get_deck_definition()
-
-        for slot_def in deck_def["locations"]["orderedSlots"]:
-            if slot_def["id"] == str(slot):
-                return slot_def
-
-        raise errors.SlotDoesNotExistError(
-            f"Slot ID {slot} does not exist in deck {deck_def['otId']}"
-        )
+        try:
+            return self._slots_by_id[str(slot)]
+        except KeyError:
+            raise errors.SlotDoesNotExistError(
+                f"Slot ID {slot} does not exist in deck "
+                f"{self._deck_definition['otId']}"
+            )
 
     def get_slot_position(self, slot: DeckSlotName) -> Point:
         """Get the position of a deck slot."""
@@ -47,38 +65,48 @@ class GeometryState:
 
     def get_labware_highest_z(self, labware_id: str) -> float:
         """Get the highest Z-point of a labware."""
-        labware_data = self._labware_store.state.get_labware_data_by_id(
-            labware_id
-        )
-
-        return self._get_highest_z_from_labware_data(labware_data)
+        try:
+            return self._highest_z_by_labware_id[labware_id]
+        except KeyError:
+            # raises the appropriate LabwareDoesNotExistError
+            labware_data = self._labware_store.state.get_labware_data_by_id(
+                labware_id
+            )
+            return self._get_highest_z_from_labware_data(labware_data)
 
     def get_all_labware_highest_z(self) -> float:
-        """Get the highest Z-point of a labware."""
-        return max([
-            self._get_highest_z_from_labware_data(lw_data)
-            for uid, lw_data in self._labware_store.state.get_all_labware()
-        ])
+        """Get the highest Z-point of all labware, or 0 if there is none."""
+        if not self._highest_z_heap:
+            return 0.0
+        return -self._highest_z_heap[0][0]
 
     def get_well_position(self, labware_id: str, well_name: str) -> Point:
         """Get the absolute position of a well in a labware."""
         # TODO(mc, 2020-10-29): implement CSS-style key point + offset option
         # rather than defaulting to well top
-        labware_data = self._labware_store.state.get_labware_data_by_id(
-            labware_id
-        )
-        well_def = self._labware_store.state.get_well_definition(
-            labware_id,
-            well_name
-        )
-        slot_pos = self.get_slot_position(labware_data.location.slot)
-        cal_offset = labware_data.calibration
-
-        return Point(
-            x=slot_pos[0] + cal_offset[0] + well_def["x"],
-            y=slot_pos[1] + cal_offset[1] + well_def["y"],
-            z=slot_pos[2] + cal_offset[2] + well_def["z"] + well_def["depth"],
-        )
+        try:
+            return self._well_positions_by_labware_id[labware_id][well_name]
+        except KeyError:
+            # raises the appropriate labware or well does not exist error
+            labware_data = self._labware_store.state.get_labware_data_by_id(
+                labware_id
+            )
+            self._labware_store.state.get_well_definition(
+                labware_id,
+                well_name
+            )
+            return self._get_well_positions_from_labware_data(
+                labware_data
+            )[well_name]
+
+    def _bind(
+        self,
+        labware_store: Substore[LabwareState]
+    ) -> "GeometryState":
+        """Get a copy of this state that reads labware from another store."""
+        state = copy(self)
+        state._labware_store = labware_store
+        return state
 
     def _get_highest_z_from_labware_data(self, lw_data: LabwareData) -> float:
         z_dim = lw_data.definition["dimensions"]["zDimension"]
@@ -86,6 +114,24 @@ class GeometryState:
 
         return z_dim + slot_pos[2] + lw_data.calibration[2]
 
+    def _get_well_positions_from_labware_data(
+        self,
+        lw_data: LabwareData
+    ) -> Dict[str, Point]:
+        slot_pos = self.get_slot_position(lw_data.location.slot)
+        x = slot_pos[0] + lw_data.calibration[0]
+        y = slot_pos[1] + lw_data.calibration[1]
+        z = slot_pos[2] + lw_data.calibration[2]
+
+        return {
+            well_name: Point(
+                x=x + well_def["x"],
+                y=y + well_def["y"],
+                z=z + well_def["z"] + well_def["depth"],
+            )
+            for well_name, well_def in lw_data.definition["wells"].items()
+        }
+
 
 class GeometryStore(Substore[GeometryState], CommandReactive):
     """Geometry state container."""
@@ -95,10 +141,42 @@ class GeometryStore(Substore[GeometryState], CommandReactive):
     def __init__(
         self,
         deck_definition: DeckDefinitionV2,
-        labware_store: LabwareStore
+        labware_store: Substore[LabwareState]
     ) -> None:
         """Initialize a geometry store and its state."""
         self._state = GeometryState(
             deck_definition=deck_definition,
             labware_store=labware_store,
         )
+
+    def handle_completed_command(
+        self,
+        command: cmd.CompletedCommandType
+    ) -> None:
+        """Modify state in reaction to a completed command."""
+        if isinstance(command.result, cmd.LoadLabwareResult):
+            labware_id = command.result.labwareId
+            labware_data = LabwareData(
+                location=command.request.location,
+                definition=command.result.definition,
+                calibration=command.result.calibration
+            )
+            state = copy(self._state)
+            highest_z = state._get_highest_z_from_labware_data(labware_data)
+            heap = list(state._highest_z_heap)
+            highest_z_by_id = dict(state._highest_z_by_labware_id)
+
+            highest_z_by_id[labware_id] = highest_z
+            heapq.heappush(heap, (-highest_z, labware_id))
+            # drop entries of reloaded labware that are no longer current
+            while highest_z_by_id[heap[0][1]] != -heap[0][0]:
+                heapq.heappop(heap)
+
+            well_positions_by_id = dict(state._well_positions_by_labware_id)
+            well_positions_by_id[labware_id] = \
+                state._get_well_positions_from_labware_data(labware_data)
+
+            state._highest_z_heap = heap
+            state._highest_z_by_labware_id = highest_z_by_id
+            state._well_positions_by_labware_id = well_positions_by_id
+            self._state = state
@@ -1,4 +1,5 @@
 """Basic labware data state and store."""
+from copy import copy
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
@@ -77,8 +78,11 @@ class LabwareStore(Substore[LabwareState], CommandReactive):
     ) -> None:
         """Modify state in reaction to a completed command."""
         if isinstance(command.result, cmd.LoadLabwareResult):
-            self._state._labware_by_id[command.result.labwareId] = LabwareData(
+            labware_by_id = dict(self._state._labware_by_id)
+            labware_by_id[command.result.labwareId] = LabwareData(
                 location=command.request.location,
                 definition=command.result.definition,
                 calibration=command.result.calibration
             )
+            self._state = copy(self._state)
+            self._state._labware_by_id = labware_by_id
@@ -1,4 +1,5 @@
 """Motion state store and getters."""
+from copy import copy
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -13,9 +14,9 @@ from opentrons.motion_planning import (
 
 from .. import command_models as cmd, errors
 from .substore import Substore, CommandReactive
-from .labware import LabwareStore
-from .pipettes import PipetteStore
-from .geometry import GeometryStore
+from .labware import LabwareState
+from .pipettes import PipetteState
+from .geometry import GeometryState
 
 
 @dataclass(frozen=True)
@@ -38,16 +39,16 @@ class PipetteLocationData:
 class MotionState:
     """Motion planning state and getter methods."""
 
-    _labware_store: LabwareStore
-    _pipette_store: PipetteStore
-    _geometry_store: GeometryStore
+    _labware_store: Substore[LabwareState]
+    _pipette_store: Substore[PipetteState]
+    _geometry_store: Substore[GeometryState]
     _current_location: Optional[LocationData]
 
     def __init__(
         self,
-        labware_store: LabwareStore,
-        pipette_store: PipetteStore,
-        geometry_store: GeometryStore,
+        labware_store: Substore[LabwareState],
+        pipette_store: Substore[PipetteState],
+        geometry_store: Substore[GeometryState],
     ) -> None:
         """Initialize a MotionState instance."""
         self._labware_store = labware_store
@@ -83,6 +84,19 @@ class MotionState:
 
         return PipetteLocationData(mount=mount, critical_point=critical_point)
 
+    def _bind(
+        self,
+        labware_store: Substore[LabwareState],
+        pipette_store: Substore[PipetteState],
+        geometry_store: Substore[GeometryState],
+    ) -> "MotionState":
+        """Get a copy of this state that reads from other stores."""
+        state = copy(self)
+        state._labware_store = labware_store
+        state._pipette_store = pipette_store
+        state._geometry_store = geometry_store
+        return state
+
     def get_movement_waypoints(
         self,
         pipette_id: str,
@@ -145,9 +159,9 @@ class MotionStore(Substore[MotionState], CommandReactive):
 
     def __init__(
         self,
-        labware_store: LabwareStore,
-        pipette_store: PipetteStore,
-        geometry_store: GeometryStore,
+        labware_store: Substore[LabwareState],
+        pipette_store: Substore[PipetteState],
+        geometry_store: Substore[GeometryState],
     ) -> None:
         """Initialize a MotionStore and its state."""
         self._state = MotionState(
@@ -165,6 +179,7 @@ class MotionStore(Substore[MotionState], CommandReactive):
             command.result,
             (cmd.MoveToWellResult, cmd.AspirateResult, cmd.DispenseResult)
         ):
+            self._state = copy(self._state)
             self._state._current_location = LocationData(
                 pipette_id=command.request.pipetteId,
                 labware_id=command.request.labwareId,
@@ -1,4 +1,5 @@
 """Basic pipette data state and store."""
+from copy import copy
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
@@ -65,8 +66,10 @@ class PipetteStore(Substore[PipetteState], CommandReactive):
     ) -> None:
         """Modify state in reaction to a completed command."""
         if isinstance(command.result, cmd.LoadPipetteResult):
-            pipette_id = command.result.pipetteId
-            self._state._pipettes_by_id[pipette_id] = PipetteData(
+            pipettes_by_id = dict(self._state._pipettes_by_id)
+            pipettes_by_id[command.result.pipetteId] = PipetteData(
                 pipette_name=command.request.pipetteName,
                 mount=command.request.mount
             )
+            self._state = copy(self._state)
+            self._state._pipettes_by_id = pipettes_by_id
@@ -1,26 +1,57 @@
 """Protocol engine state management."""
 from __future__ import annotations
-from typing import List
+from collections import deque
+from typing import Deque, List, NamedTuple, Optional, Tuple
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
 
-from .. import command_models as cmd
-from .substore import CommandReactive
+from .. import command_models as cmd, errors
+from .substore import Substore, PinnedSubstore, CommandReactive
 from .commands import CommandStore, CommandState
 from .labware import LabwareStore, LabwareState
 from .pipettes import PipetteStore, PipetteState
 from .geometry import GeometryStore, GeometryState
 from .motion import MotionStore, MotionState
 
+DEFAULT_CHECKPOINT_INTERVAL = 100
+DEFAULT_MAX_CHECKPOINTS = 10
+
+
+class _Substates(NamedTuple):
+    """The states of every substore at one revision."""
+
+    commands: CommandState
+    labware: LabwareState
+    pipettes: PipetteState
+    geometry: GeometryState
+    motion: MotionState
+
+
+def _create_lifecycle_substores(
+    deck_definition: DeckDefinitionV2
+) -> Tuple[LabwareStore, PipetteStore, GeometryStore, MotionStore]:
+    labware_store = LabwareStore()
+    pipette_store = PipetteStore()
+    geometry_store = GeometryStore(
+        deck_definition=deck_definition,
+        labware_store=labware_store,
+    )
+    motion_store = MotionStore(
+        labware_store=labware_store,
+        pipette_store=pipette_store,
+        geometry_store=geometry_store,
+    )
+    return labware_store, pipette_store, geometry_store, motion_store
+
 
 class StateView:
     def __init__(
         self,
-        command_store: CommandStore,
-        labware_store: LabwareStore,
-        pipette_store: PipetteStore,
-        geometry_store: GeometryStore,
-        motion_store: MotionStore,
+        command_store: Substore[CommandState],
+        labware_store: Substore[LabwareState],
+        pipette_store: Substore[PipetteState],
+        geometry_store: Substore[GeometryState],
+        motion_store: Substore[MotionState],
     ) -> None:
         """A StateView class provides a read-only interface to a StateStore."""
         self._command_store = command_store
@@ -40,6 +71,27 @@ class StateView:
             motion_store=target._motion_store,
         )
 
+    @classmethod
+    def _pin(cls, substates: _Substates) -> StateView:
+        """Create a read-only view of fixed substates."""
+        labware_store = PinnedSubstore(substates.labware)
+        pipette_store = PinnedSubstore(substates.pipettes)
+        geometry_store = PinnedSubstore(
+            substates.geometry._bind(labware_store)
+        )
+        motion_store = PinnedSubstore(
+            substates.motion._bind(
+                labware_store, pipette_store, geometry_store
+            )
+        )
+        return cls(
+            command_store=PinnedSubstore(substates.commands),
+            labware_store=labware_store,
+            pipette_store=pipette_store,
+            geometry_store=geometry_store,
+            motion_store=motion_store,
+        )
+
     @property
     def commands(self) -> CommandState:
         """Get commands sub-state."""
@@ -73,22 +125,39 @@ class StateStore(StateView):
     A StateStore manages several substores, which will modify themselves in
     reaction to commands and other protocol events. Only Store classes should
     be allowed to modify State classes.
+
+    Substores replace their state rather than modifying it, and a new state
+    shares everything that didn't change with the one before it. That makes
+    snapshots free: a snapshot just holds on to the current states. The
+    states at every `checkpoint_interval`-th revision are kept so that the
+    state at any earlier revision can be rebuilt by replaying at most that
+    many commands. Only the last `max_checkpoints` checkpoints are kept, so
+    revisions older than the oldest one can no longer be rebuilt.
+
+    The command log is not trimmed along with the checkpoints: it is the
+    engine's command history, which the current state serves in full.
     """
 
-    def __init__(self, deck_definition: DeckDefinitionV2):
+    _command_store: CommandStore
+    _labware_store: LabwareStore
+    _pipette_store: PipetteStore
+    _geometry_store: GeometryStore
+    _motion_store: MotionStore
+
+    def __init__(
+        self,
+        deck_definition: DeckDefinitionV2,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+        max_checkpoints: int = DEFAULT_MAX_CHECKPOINTS,
+    ):
         """Initialize a StateStore."""
         command_store = CommandStore()
-        labware_store = LabwareStore()
-        pipette_store = PipetteStore()
-        geometry_store = GeometryStore(
-            deck_definition=deck_definition,
-            labware_store=labware_store,
-        )
-        motion_store = MotionStore(
-            labware_store=labware_store,
-            pipette_store=pipette_store,
-            geometry_store=geometry_store,
-        )
+        (
+            labware_store,
+            pipette_store,
+            geometry_store,
+            motion_store,
+        ) = _create_lifecycle_substores(deck_definition)
 
         # attach stores to self via StateView constructor
         super().__init__(
@@ -106,6 +175,88 @@ class StateStore(StateView):
             motion_store,
         ]
 
+        self._deck_definition = deck_definition
+        self._checkpoint_interval = checkpoint_interval
+        self._substates = self._get_substates()
+        self._snapshot: Optional[Tuple[_Substates, StateView]] = None
+        self._checkpoints: Deque[_Substates] = deque(
+            [self._substates], maxlen=max_checkpoints
+        )
+
+    @property
+    def revision(self) -> int:
+        """Get how many commands and command updates have been handled."""
+        return self._command_store.state.revision
+
+    def get_snapshot(self) -> StateView:
+        """
+        Get a read-only view of the current state.
+
+        Handling later commands does not change the view, so it can be read
+        while commands execute without seeing a half-applied update.
+        """
+        substates = self._substates
+        snapshot = self._snapshot
+        if snapshot is None or snapshot[0] is not substates:
+            snapshot = (substates, StateView._pin(substates))
+            self._snapshot = snapshot
+        return snapshot[1]
+
+    def get_state_at(self, revision: int) -> StateView:
+        """
+        Get a read-only view of the state as of an earlier revision.
+
+        Revision 0 is the initial state, and revision N is the state after
+        the first N calls to `handle_command`. Revisions from before the
+        oldest kept checkpoint raise a `StateRevisionPrunedError`.
+        """
+        if not 0 <= revision <= self.revision:
+            raise errors.StateRevisionDoesNotExistError(
+                f"Revision {revision} does not exist; "
+                f"the current revision is {self.revision}."
+            )
+
+        oldest = self._checkpoints[0].commands.revision
+        if revision < oldest:
+            raise errors.StateRevisionPrunedError(
+                f"Revision {revision} is no longer kept; "
+                f"the oldest revision available is {oldest}."
+            )
+
+        checkpoint = self._checkpoints[
+            (revision - oldest) // self._checkpoint_interval
+        ]
+        commands = self._command_store.state._at_revision(revision)
+        (
+            labware_store,
+            pipette_store,
+            geometry_store,
+            motion_store,
+        ) = _create_lifecycle_substores(self._deck_definition)
+        # states are never modified in place, so replaying commands on top
+        # of the checkpoint doesn't change it
+        labware_store._state = checkpoint.labware
+        pipette_store._state = checkpoint.pipettes
+        geometry_store._state = checkpoint.geometry._bind(labware_store)
+        motion_store._state = checkpoint.motion._bind(
+            labware_store, pipette_store, geometry_store
+        )
+        replayed = commands._log[checkpoint.commands.revision:revision]
+        for _, command in replayed:
+            if isinstance(command, cmd.CompletedCommand):
+                for substore in (
+                    labware_store, pipette_store, geometry_store, motion_store
+                ):
+                    substore.handle_completed_command(command)
+
+        return StateView._pin(_Substates(
+            commands=commands,
+            labware=labware_store.state,
+            pipettes=pipette_store.state,
+            geometry=geometry_store.state,
+            motion=motion_store.state,
+        ))
+
     def handle_command(
         self,
         command: cmd.CommandType,
@@ -117,3 +268,17 @@ class StateStore(StateView):
         if isinstance(command, cmd.CompletedCommand):
             for substore in self._lifecycle_substores:
                 substore.handle_completed_command(command)
+
+        # publish all of the new states at once
+        self._substates = self._get_substates()
+        if self.revision % self._checkpoint_interval == 0:
+            self._checkpoints.append(self._substates)
+
+    def _get_substates(self) -> _Substates:
+        return _Substates(
+            commands=self._command_store.state,
+            labware=self._labware_store.state,
+            pipettes=self._pipette_store.state,
+            geometry=self._geometry_store.state,
+            motion=self._motion_store.state,
+        )
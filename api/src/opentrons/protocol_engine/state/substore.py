@@ -23,3 +23,11 @@ class CommandReactive(ABC):
     def handle_completed_command(self, command: CompletedCommandType) -> None:
         """React to a CompletedCommand."""
         pass
+
+
+class PinnedSubstore(Substore[SubstateT]):
+    """A read-only sub-store that always holds the same state."""
+
+    def __init__(self, state: SubstateT) -> None:
+        """Initialize a PinnedSubstore with its state."""
+        self._state = state
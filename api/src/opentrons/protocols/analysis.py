@@ -0,0 +1,301 @@
+"""
+Static analysis of a protocol's run log.
+
+:py:func:`analyze` walks the run log from :py:func:`opentrons.simulate.simulate`
+once and precomputes what a protocol will use: tips from each rack, the
+liquid each well gives and gets, the labware and modules it touches and
+which pipette mount does what when. The result only holds strings and
+numbers, so it can be cached as JSON next to the protocol with
+:py:func:`save_cached` and checked again with :py:func:`load_cached`
+without simulating the protocol again.
+
+Only Protocol API v2 run logs are analyzed. Commands from older protocols
+are counted, but their locations are not.
+"""
+import hashlib
+import json
+import pathlib
+from typing import (Any, Dict, Iterator, List, Mapping, Optional, Sequence,
+                    Tuple)
+
+import opentrons
+from opentrons.commands import types as command_types
+from opentrons.protocol_api.labware import Well
+from opentrons.protocols.implementations.well import WellImplementation
+from opentrons.types import Location
+
+#: Bump this when the shape of an analysis changes so that cached analyses
+#: from older versions are ignored
+ANALYSIS_VERSION = 1
+
+#: Appended to a protocol's file name to name its cached analysis
+CACHE_SUFFIX = '.analysis.json'
+
+_LIQUID_COMMANDS = (command_types.ASPIRATE, command_types.DISPENSE)
+_LOCATED_COMMANDS = (command_types.ASPIRATE, command_types.DISPENSE,
+                     command_types.BLOW_OUT, command_types.PICK_UP_TIP,
+                     command_types.DROP_TIP)
+#: Each well under a pipette's channels, with how many channels are in it
+_ChannelWells = List[Tuple[WellImplementation, int]]
+
+_MODULE_PREFIXES = {
+    'MAGDECK_': 'magdeck',
+    'TEMPDECK_': 'tempdeck',
+    'THERMOCYCLER_': 'thermocycler',
+}
+
+
+def _targets(payload: Mapping[str, Any]) -> Iterator[Tuple[Any, Any]]:
+    """ The (instrument, location) pairs of a command, for both single and
+    paired pipette commands """
+    if 'instrument' in payload:
+        yield payload['instrument'], payload.get('location')
+    elif 'instruments' in payload:
+        locations = payload.get('locations') or []
+        for idx, instrument in enumerate(payload['instruments']):
+            yield instrument, \
+                locations[idx] if idx < len(locations) else None
+
+
+def _well_of(location: Any) -> Optional[WellImplementation]:
+    if isinstance(location, Well):
+        return location._impl
+    if isinstance(location, Location) and location.labware.is_well:
+        return location.labware.as_well()._impl
+    return None
+
+
+def _channel_wells(well: WellImplementation,
+                   channels: int) -> _ChannelWells:
+    """ The wells under each channel of a pipette targeting ``well``, and how
+    many channels are in each.
+
+    Channels go down the well's column, skipping wells if the column has
+    more wells than channels (like a 384 well plate). If there aren't enough
+    wells below the target, as in a reservoir, every channel goes into the
+    target well.
+    """
+    if channels == 1:
+        return [(well, 1)]
+    labware = well.get_geometry().parent
+    column = labware.get_well_grid().get_column(well.get_column_name())
+    start = [w.get_name() for w in column].index(well.get_name())
+    spacing = max(len(column) // channels, 1)
+    below = column[start::spacing][:channels]
+    if len(below) < channels:
+        return [(well, channels)]
+    return [(w, 1) for w in below]
+
+
+class _Analyzer:
+    def __init__(self):
+        self.command_count = 0
+        self.commands_by_name: Dict[str, int] = {}
+        self.tips: Dict[str, Dict[str, Any]] = {}
+        self.wells: Dict[str, Dict[str, Any]] = {}
+        self.labware: Dict[str, Dict[str, Any]] = {}
+        self.modules: Dict[str, Dict[str, int]] = {}
+        self.timeline: List[Dict[str, Any]] = []
+        self.warnings: List[str] = []
+
+    def add(self, index: int, name: str, payload: Mapping[str, Any]):
+        self.command_count += 1
+        self.commands_by_name[name] = self.commands_by_name.get(name, 0) + 1
+        short_name = name.split('.', 1)[-1]
+        for prefix, module in _MODULE_PREFIXES.items():
+            if short_name.startswith(prefix):
+                by_name = self.modules.setdefault(module, {})
+                by_name[short_name] = by_name.get(short_name, 0) + 1
+
+        for instrument, location in _targets(payload):
+            self._add_to_timeline(index, short_name, instrument)
+            well = _well_of(location)
+            if well is None or name not in _LOCATED_COMMANDS:
+                continue
+            channels = getattr(instrument, 'channels', 1)
+            wells = _channel_wells(well, channels)
+            self._add_labware_use(wells)
+            if name == command_types.PICK_UP_TIP:
+                self._add_tips(wells)
+            elif name in _LIQUID_COMMANDS:
+                sign = -1 if name == command_types.ASPIRATE else 1
+                self._add_volume(wells, sign * payload.get('volume', 0))
+
+    def _add_to_timeline(self, index: int, short_name: str, instrument: Any):
+        mount = getattr(instrument, 'mount', None)
+        if mount is None:
+            return
+        if self.timeline and self.timeline[-1]['mount'] == mount:
+            segment = self.timeline[-1]
+            segment['last'] = index
+            if segment['commands'][-1] != short_name:
+                segment['commands'].append(short_name)
+            return
+        self.timeline.append({
+            'mount': mount,
+            'instrument': getattr(instrument, 'name', str(instrument)),
+            'first': index,
+            'last': index,
+            'commands': [short_name],
+        })
+
+    def _add_labware_use(self, wells: _ChannelWells):
+        labware = wells[0][0].get_geometry().parent
+        entry = self.labware.setdefault(labware.get_display_name(), {
+            'load_name': labware.get_parameters()['loadName'],
+            'uri': labware.get_uri(),
+            'commands': 0,
+            'wells': [],
+        })
+        entry['commands'] += 1
+        for well, _ in wells:
+            well_name = well.get_name()
+            if well_name not in entry['wells']:
+                entry['wells'].append(well_name)
+
+    def _add_tips(self, wells: _ChannelWells):
+        rack = wells[0][0].get_geometry().parent
+        entry = self.tips.setdefault(rack.get_display_name(), {
+            'pick_ups': 0,
+            'tips_used': [],
+            'capacity': len(rack.get_wells()),
+        })
+        entry['pick_ups'] += 1
+        for well, _ in wells:
+            well_name = well.get_name()
+            if well_name not in entry['tips_used']:
+                entry['tips_used'].append(well_name)
+
+    def _add_volume(self, wells: _ChannelWells, volume: float):
+        for well, channels in wells:
+            display_name = well.get_display_name()
+            entry = self.wells.setdefault(display_name, {
+                'aspirated': 0.0,
+                'dispensed': 0.0,
+                'net': 0.0,
+                'required': 0.0,
+                'peak': 0.0,
+                'max_volume': well.get_geometry().max_volume,
+            })
+            delta = volume * channels
+            if delta < 0:
+                entry['aspirated'] -= delta
+            else:
+                entry['dispensed'] += delta
+            entry['net'] += delta
+            entry['required'] = max(entry['required'], -entry['net'])
+            entry['peak'] = max(entry['peak'], entry['net'])
+
+    def result(self) -> Dict[str, Any]:
+        for name, entry in self.wells.items():
+            # A well that starts with the volume it needs ends up with its
+            # peak plus that volume at its fullest
+            if entry['required'] + entry['peak'] > entry['max_volume']:
+                self.warnings.append(
+                    f'{name} would hold up to '
+                    f'{entry["required"] + entry["peak"]:g} uL but only '
+                    f'fits {entry["max_volume"]:g} uL')
+        for rack, entry in self.tips.items():
+            entry['tips_used'] = len(entry['tips_used'])
+        return {
+            'commands': {
+                'count': self.command_count,
+                'by_name': self.commands_by_name,
+            },
+            'tips': self.tips,
+            'wells': self.wells,
+            'labware': self.labware,
+            'modules': self.modules,
+            'pipette_timeline': self.timeline,
+            'warnings': self.warnings,
+        }
+
+
+def analyze(runlog: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+    """ Analyze a run log without simulating anything again.
+
+    The result has the following keys:
+
+        - ``commands``: How many commands the run log has, in total and by
+                        command name.
+        - ``tips``: For each tip rack by display name, how many times tips
+                    were picked up from it, how many distinct tips were used
+                    and how many tips it holds.
+        - ``wells``: A volume ledger for each well that was aspirated from
+                     or dispensed to: the total aspirated and dispensed, the
+                     net change, the ``required`` volume the well has to
+                     start with to never go below empty, the ``peak`` volume
+                     above its starting volume, and its ``max_volume``.
+                     Multichannel pipettes count for every well under a
+                     channel.
+        - ``labware``: For each labware a pipette went to, its load name
+                       and uri, how many commands went to it and the names
+                       of the wells they went to.
+        - ``modules``: For each kind of module, how many of each of its
+                       commands ran.
+        - ``pipette_timeline``: The run log split into spans of consecutive
+                                commands on the same mount, with the run
+                                log indices of their first and last
+                                commands and the names of the commands.
+        - ``warnings``: Human readable problems, like a well that would
+                        overflow.
+
+    :param runlog: The run log from :py:func:`opentrons.simulate.simulate`
+    """
+    analyzer = _Analyzer()
+    for index, entry in enumerate(runlog):
+        analyzer.add(index, entry['name'], entry['payload'])
+    return analyzer.result()
+
+
+def fingerprint(contents: bytes,
+                inputs: Mapping[str, bytes] = None) -> str:
+    """ A hash of a protocol's contents and everything else an analysis
+    depends on.
+
+    :param contents: The protocol file's contents
+    :param inputs: Everything else the protocol was simulated with, like
+                   custom labware and data files, by name
+    """
+    digest = hashlib.sha256(contents)
+    digest.update(
+        f'{opentrons.__version__}:{ANALYSIS_VERSION}'.encode())
+    for name, value in sorted((inputs or {}).items()):
+        # Hash each input separately so that no two sets of inputs run
+        # together into the same bytes
+        digest.update(name.encode() + b'\0')
+        digest.update(hashlib.sha256(value).digest())
+    return digest.hexdigest()
+
+
+def cache_path(protocol_path: pathlib.Path) -> pathlib.Path:
+    """ Where the cached analysis of a protocol file goes """
+    return protocol_path.with_name(protocol_path.name + CACHE_SUFFIX)
+
+
+def load_cached(protocol_path: pathlib.Path,
+                contents: bytes,
+                inputs: Mapping[str, bytes] = None) -> Optional[Dict[str, Any]]:
+    """ Load the cached analysis of a protocol, or ``None`` if there isn't
+    one or it was made for different contents, different inputs (see
+    :py:func:`fingerprint`) or a different version of this package """
+    try:
+        cached = json.loads(cache_path(protocol_path).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict)\
+       or cached.get('fingerprint') != fingerprint(contents, inputs):
+        return None
+    return cached.get('analysis')
+
+
+def save_cached(protocol_path: pathlib.Path, contents: bytes,
+                analysis: Dict[str, Any],
+                inputs: Mapping[str, bytes] = None) -> pathlib.Path:
+    """ Cache the analysis of a protocol next to it and return where """
+    path = cache_path(protocol_path)
+    path.write_text(json.dumps(
+        {'fingerprint': fingerprint(contents, inputs),
+         'analysis': analysis},
+        indent=2))
+    return path
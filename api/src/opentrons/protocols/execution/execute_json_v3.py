@@ -1,9 +1,12 @@
+import functools
 import logging
-from typing import Dict, TYPE_CHECKING
+from typing import Any, Dict, List, Mapping, TYPE_CHECKING, Union
 
 from opentrons.protocol_api.contexts import ProtocolContext, InstrumentContext
 from opentrons.protocol_api import labware
 from opentrons.protocols.api_support.labware_like import LabwareLike
+from opentrons.protocols.execution.types import (
+    CompiledCommand, LoadedWells)
 from opentrons.types import Point, Location
 from opentrons_shared_data.protocol.constants import (
     JsonPipetteCommand, JsonRobotCommand)
@@ -34,7 +37,7 @@ def load_pipettes_from_json(
     return pipettes_by_id
 
 
-def _get_well(loaded_labware: Dict[str, labware.Labware],
+def _get_well(loaded_labware: Union[Dict[str, labware.Labware], LoadedWells],
               params: 'PipetteAccessParams') -> labware.Well:
     labwareId = params['labware']
     well = params['well']
@@ -220,12 +223,71 @@ dispatcher_map: 'PipetteDispatch' = {
 }
 
 
-def dispatch_json(context: ProtocolContext,
-                  protocol_data: 'JsonProtocolV3',
-                  instruments: Dict[str, InstrumentContext],
-                  loaded_labware: Dict[str, labware.Labware]) -> None:
-    commands = protocol_data['commands']
-
+def _resolve_wells(
+        index: int,
+        command_type: str,
+        loaded_labware: Mapping[str, labware.Labware],
+        wells: LoadedWells,
+        params: Mapping[str, Any]) -> None:
+    """ Make sure the labware and well a command targets exist, building the
+    labware's well table in ``wells`` the first time it is referenced.
+    """
+    labware_id = params['labware']
+    if labware_id not in wells:
+        if labware_id not in loaded_labware:
+            raise RuntimeError(
+                f'Command {index} ({command_type}) references unknown '
+                f'labware {labware_id}')
+        wells[labware_id] = loaded_labware[labware_id].wells_by_name()
+    if params['well'] not in wells[labware_id]:
+        raise RuntimeError(
+            f'Command {index} ({command_type}) references unknown well '
+            f'{params["well"]} in labware {labware_id}')
+
+
+def _validate_pipette_params(
+        index: int,
+        command_type: str,
+        instruments: Mapping[str, InstrumentContext],
+        loaded_labware: Mapping[str, labware.Labware],
+        wells: LoadedWells,
+        params: Mapping[str, Any]) -> None:
+    """ Check everything a pipette command refers to before any command of
+    the protocol is run.
+    """
+    if params['pipette'] not in instruments:
+        raise RuntimeError(
+            f'Command {index} ({command_type}) references unknown '
+            f'pipette {params["pipette"]}')
+    if 'labware' in params:
+        _resolve_wells(index, command_type, loaded_labware, wells, params)
+    if 'flowRate' in params and not (params['flowRate'] > 0):
+        raise RuntimeError(
+            f'Command {index} ({command_type}): '
+            'Positive flowRate param required')
+
+
+def _validate_slot(
+        index: int,
+        context: ProtocolContext,
+        params: 'MoveToSlotParams') -> None:
+    if params['slot'] not in context.deck:
+        raise ValueError(
+            f'Command {index}: Invalid "slot" for "moveToSlot": '
+            f'{params["slot"]}')
+
+
+def compile_json(context: ProtocolContext,
+                 protocol_data: 'JsonProtocolV3',
+                 instruments: Dict[str, InstrumentContext],
+                 loaded_labware: Dict[str, labware.Labware]
+                 ) -> List[CompiledCommand]:
+    """ Turn the commands of a JSON protocol into calls with their handler,
+    pipette, labware and wells already looked up and validated.
+
+    Any reference to a pipette, labware, well or slot that does not exist
+    raises here, before anything moves.
+    """
     pipette_commands = {
         JsonPipetteCommand.blowout.value,
         JsonPipetteCommand.pickUpTip.value,
@@ -234,20 +296,45 @@ def dispatch_json(context: ProtocolContext,
         JsonPipetteCommand.dispense.value,
         JsonPipetteCommand.touchTip.value,
     }
+    wells: LoadedWells = {}
+    compiled: List[CompiledCommand] = []
 
-    for command_item in commands:
+    for index, command_item in enumerate(protocol_data['commands']):
         command_type = command_item['command']
         params = command_item['params']
 
         # different `_command` helpers take different args
         if command_type in pipette_commands:
-            dispatcher_map[command_type](  # type: ignore
-                instruments, loaded_labware, params)  # type: ignore
+            _validate_pipette_params(
+                index, command_type, instruments, loaded_labware,
+                wells, params)  # type: ignore
+            compiled.append(functools.partial(
+                dispatcher_map[command_type],  # type: ignore
+                instruments, wells, params))
         elif command_type == JsonRobotCommand.delay.value:
-            dispatcher_map[command_type](context, params)  # type: ignore
+            compiled.append(functools.partial(
+                dispatcher_map[command_type],  # type: ignore
+                context, params))
         elif command_type == JsonPipetteCommand.moveToSlot.value:
-            dispatcher_map[command_type](
-                context, instruments, params)  # type: ignore
+            _validate_pipette_params(
+                index, command_type, instruments, loaded_labware,
+                wells, params)  # type: ignore
+            _validate_slot(index, context, params)  # type: ignore
+            compiled.append(functools.partial(
+                dispatcher_map[command_type],  # type: ignore
+                context, instruments, params))
         else:
             raise RuntimeError(
                 "Unsupported command type {}".format(command_type))
+
+    return compiled
+
+
+def dispatch_json(context: ProtocolContext,
+                  protocol_data: 'JsonProtocolV3',
+                  instruments: Dict[str, InstrumentContext],
+                  loaded_labware: Dict[str, labware.Labware]) -> None:
+    compiled = compile_json(
+        context, protocol_data, instruments, loaded_labware)
+    for command in compiled:
+        command()
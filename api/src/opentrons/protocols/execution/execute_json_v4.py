@@ -1,10 +1,13 @@
+import functools
 import logging
-from typing import Dict, List, TYPE_CHECKING, Union
+from typing import Dict, List, TYPE_CHECKING, Type, Union
 from opentrons.protocol_api.contexts import ProtocolContext, \
     MagneticModuleContext, TemperatureModuleContext, ModuleContext, \
     ThermocyclerContext
-from .execute_json_v3 import _delay, _move_to_slot
-from opentrons.protocols.execution.types import LoadedLabware, Instruments
+from .execute_json_v3 import (
+    _delay, _move_to_slot, _validate_pipette_params, _validate_slot)
+from opentrons.protocols.execution.types import (
+    LoadedLabware, LoadedWells, Instruments, CompiledCommand)
 from opentrons_shared_data.protocol.constants import (
     JsonRobotCommand, JsonPipetteCommand)
 
@@ -16,9 +19,7 @@ if TYPE_CHECKING:
         MagneticModuleEngageParams,
         ModuleIDParams, TemperatureParams,
         ThermocyclerSetTargetBlockParams,
-        ThermocyclerRunProfileParams, Command,
-        TemperatureModuleCommandId, MagneticModuleCommandId,
-        ThermocyclerCommandId
+        ThermocyclerRunProfileParams, Command
     )
     from opentrons.protocols.execution.dev_types import (
         PipetteDispatch, JsonV4MagneticModuleDispatch,
@@ -223,7 +224,27 @@ def assert_tc_commands_do_not_use_unimplemented_params(
                     "the robot server").format(command_type, k))
 
 
-def dispatch_json(
+def _resolve_module(
+        index: int,
+        command_type: str,
+        modules: Dict[str, ModuleContext],
+        params: Union['ModuleIDParams', 'TemperatureParams'],
+        context_type: Type[ModuleContext],
+        module_name: str) -> ModuleContext:
+    module_id = params['module']
+    if module_id not in modules:
+        raise RuntimeError(
+            f'Command {index} ({command_type}) references unknown '
+            f'module {module_id}')
+    module = modules[module_id]
+    if not isinstance(module, context_type):
+        raise RuntimeError(
+            f"{module_name} does not match "
+            f"{context_type.__name__} interface")
+    return module
+
+
+def compile_json(
         context: ProtocolContext,
         protocol_data: Union['JsonProtocolV4', 'JsonProtocolV5'],
         instruments: Instruments,
@@ -233,98 +254,84 @@ def dispatch_json(
         magnetic_module_command_map: 'JsonV4MagneticModuleDispatch',
         temperature_module_command_map: 'JsonV4TemperatureModuleDispatch',
         thermocycler_module_command_map: 'JsonV4ThermocyclerDispatch'
-) -> None:
+) -> List[CompiledCommand]:
+    """ Turn the commands of a JSON protocol into calls with their handler,
+    pipette, labware, wells and modules already looked up and validated.
+
+    Any reference to a pipette, labware, well, module or slot that does not
+    exist raises here, before anything moves.
+    """
     commands = protocol_data['commands']
 
     assert_no_async_tc_behavior(commands)
     assert_tc_commands_do_not_use_unimplemented_params(commands)
 
-    for command_item in commands:
+    wells: LoadedWells = {}
+    compiled: List[CompiledCommand] = []
+
+    for index, command_item in enumerate(commands):
         command_type = command_item['command']
         params = command_item['params']
         # because of https://github.com/python/mypy/issues/8940
         # we can't narrow down types using in sadly
         if command_type in pipette_command_map:
-            pipette_command_map[command_type](  # type: ignore
-                instruments, loaded_labware, params)
+            _validate_pipette_params(
+                index, command_type, instruments, loaded_labware,
+                wells, params)  # type: ignore
+            compiled.append(functools.partial(
+                pipette_command_map[command_type],  # type: ignore
+                instruments, wells, params))
         elif command_type in magnetic_module_command_map:
-            handleMagnetCommand(
-                params,  # type: ignore
-                modules,
-                command_type,  # type: ignore
-                magnetic_module_command_map
-            )
+            module = _resolve_module(
+                index, command_type, modules, params,  # type: ignore
+                MagneticModuleContext, 'Magnetic Module')
+            compiled.append(functools.partial(
+                magnetic_module_command_map[command_type],  # type: ignore
+                module, params))
         elif command_type in temperature_module_command_map:
-            handleTemperatureCommand(params,  # type: ignore
-                                     modules,
-                                     command_type,  # type: ignore
-                                     temperature_module_command_map)
+            module = _resolve_module(
+                index, command_type, modules, params,  # type: ignore
+                TemperatureModuleContext, 'Temperature Module')
+            compiled.append(functools.partial(
+                temperature_module_command_map[command_type],  # type: ignore
+                module, params))
         elif command_type in thermocycler_module_command_map:
-            handleThermocyclerCommand(params,  # type: ignore
-                                      modules,  # type: ignore
-                                      command_type,  # type: ignore
-                                      thermocycler_module_command_map)
+            module = _resolve_module(
+                index, command_type, modules, params,  # type: ignore
+                ThermocyclerContext, 'Thermocycler Module')
+            compiled.append(functools.partial(
+                thermocycler_module_command_map[command_type],  # type: ignore
+                module, params))
         elif command_item['command'] == JsonRobotCommand.delay.value:
-            _delay(context, params)  # type: ignore
+            compiled.append(functools.partial(_delay, context, params))
         elif command_type == JsonPipetteCommand.moveToSlot.value:
-            _move_to_slot(context, instruments, params)  # type: ignore
+            _validate_pipette_params(
+                index, command_type, instruments, loaded_labware,
+                wells, params)  # type: ignore
+            _validate_slot(index, context, params)  # type: ignore
+            compiled.append(functools.partial(
+                _move_to_slot, context, instruments, params))
         else:
             raise RuntimeError(
                 "Unsupported command type {}".format(command_type))
 
-
-def handleTemperatureCommand(
-        params: Union['TemperatureParams', 'ModuleIDParams'],
-        modules: Dict[str, ModuleContext],
-        command_type: 'TemperatureModuleCommandId',
-        temperature_module_command_map
-) -> None:
-    module_id = params['module']
-    module = modules[module_id]
-    if isinstance(module, TemperatureModuleContext):
-        temperature_module_command_map[command_type](
-            module, params
-        )
-    else:
-        raise RuntimeError(
-            "Temperature Module does not match " +
-            "TemperatureModuleContext interface"
-        )
-
-
-def handleThermocyclerCommand(
-        params: Union['ModuleIDParams', 'TemperatureParams',
-                      'ThermocyclerRunProfileParams',
-                      'ThermocyclerSetTargetBlockParams'],
-        modules: Dict[str, ThermocyclerContext],
-        command_type: 'ThermocyclerCommandId',
-        thermocycler_module_command_map
-) -> None:
-    module_id = params['module']
-    module = modules[module_id]
-    if isinstance(module, ThermocyclerContext):
-        thermocycler_module_command_map[command_type](
-            module, params
-        )
-    else:
-        raise RuntimeError(
-            "Thermocycler Module does not match ThermocyclerContext interface"
-        )
+    return compiled
 
 
-def handleMagnetCommand(
-        params: Union['ModuleIDParams', 'MagneticModuleEngageParams'],
+def dispatch_json(
+        context: ProtocolContext,
+        protocol_data: Union['JsonProtocolV4', 'JsonProtocolV5'],
+        instruments: Instruments,
+        loaded_labware: LoadedLabware,
         modules: Dict[str, ModuleContext],
-        command_type: 'MagneticModuleCommandId',
-        magnetic_module_command_map
+        pipette_command_map: 'PipetteDispatch',
+        magnetic_module_command_map: 'JsonV4MagneticModuleDispatch',
+        temperature_module_command_map: 'JsonV4TemperatureModuleDispatch',
+        thermocycler_module_command_map: 'JsonV4ThermocyclerDispatch'
 ) -> None:
-    module_id = params['module']
-    module = modules[module_id]
-    if isinstance(module, MagneticModuleContext):
-        magnetic_module_command_map[command_type](
-            module, params
-        )
-    else:
-        raise RuntimeError(
-            "Magnetic Module does not match MagneticModuleContext interface"
-        )
+    compiled = compile_json(
+        context, protocol_data, instruments, loaded_labware, modules,
+        pipette_command_map, magnetic_module_command_map,
+        temperature_module_command_map, thermocycler_module_command_map)
+    for command in compiled:
+        command()
@@ -1,8 +1,15 @@
-from typing import Dict
-from opentrons.protocol_api.labware import Labware
+from typing import Callable, Dict
+from opentrons.protocol_api.labware import Labware, Well
 from opentrons.protocol_api.contexts import InstrumentContext
 
 
 Instruments = Dict[str, InstrumentContext]
 
 LoadedLabware = Dict[str, Labware]
+
+# Wells of each loaded labware keyed by labware id and then well name. This
+# is what compiled JSON commands look their wells up in.
+LoadedWells = Dict[str, Dict[str, Well]]
+
+# A JSON protocol command with all of its targets bound and validated
+CompiledCommand = Callable[[], None]
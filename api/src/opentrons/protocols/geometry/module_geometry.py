@@ -15,7 +15,6 @@ from typing import (Mapping, Optional,
                     Type, TypeVar, Union, TYPE_CHECKING)
 
 import numpy as np  # type: ignore
-import jsonschema  # type: ignore
 from opentrons.protocols.implementations.labware import LabwareImplementation
 
 from opentrons_shared_data import module
@@ -497,6 +496,9 @@ def load_module_from_definition(
         v1def: 'ModuleDefinitionV1' = definition  # type: ignore
         return _load_from_v1(v1def, parent, api_level)
     if schema == 'module/schemas/2':
+        # jsonschema is slow to import, so wait until it's needed
+        import jsonschema  # type: ignore
+
         schema_doc = module.load_schema('2')
         try:
             jsonschema.validate(definition, schema_doc)
@@ -17,6 +17,7 @@ from opentrons.motion_planning import (
 
 from opentrons.protocols.api_support.labware_like import LabwareLike
 from opentrons.protocols.geometry.deck import Deck
+from opentrons.util import tracing
 from opentrons.protocols.geometry.module_geometry import (
     ThermocyclerGeometry, ModuleGeometry)
 
@@ -197,6 +198,7 @@ def _build_safe_height(from_loc: types.Location,
         constraints.minimum_z_height)
 
 
+@tracing.traced('planning')
 def plan_moves(
     from_loc: types.Location,
     to_loc: types.Location,
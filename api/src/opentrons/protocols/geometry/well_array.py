@@ -0,0 +1,132 @@
+import re
+from typing import Dict, List, Sequence
+
+import numpy as np  # type: ignore
+
+from opentrons.types import Point
+from opentrons_shared_data.labware.constants import WELL_NAME_PATTERN
+from opentrons_shared_data.labware.dev_types import WellDefinition
+
+#: One record per well. x, y and z are the center of the top of the well in
+#: deck coordinates, like :py:attr:`.WellGeometry.position`. diameter is nan
+#: for rectangular wells.
+WELL_DTYPE = np.dtype([
+    ('x', 'f8'),
+    ('y', 'f8'),
+    ('z', 'f8'),
+    ('depth', 'f8'),
+    ('x_size', 'f8'),
+    ('y_size', 'f8'),
+    ('diameter', 'f8'),
+    ('max_volume', 'f8'),
+])
+
+_well_name = re.compile(WELL_NAME_PATTERN, re.X)
+
+
+class WellArray:
+    """ The geometry of every well in a labware as one numpy array, for
+    operations on whole rows, columns or plates.
+
+    Position accessors return an (N, 3) array of x, y, z with one row per
+    selected well. Wells are selected by an index array from
+    :py:meth:`indices`, :py:meth:`row` or :py:meth:`column`, or default to
+    every well in the definition's ordering.
+    """
+
+    def __init__(self,
+                 well_definitions: Dict[str, WellDefinition],
+                 ordering: Sequence[str],
+                 offset: Point):
+        """
+        Construct the array.
+
+        :param well_definitions: The wells from the labware definition
+        :param ordering: The flattened well ordering of the labware
+        :param offset: The calibrated offset of the labware
+        """
+        self._names = list(ordering)
+        self._index = {name: idx for idx, name in enumerate(self._names)}
+        self._relative = np.zeros(len(self._names), dtype=WELL_DTYPE)
+        for idx, name in enumerate(self._names):
+            props = well_definitions[name]
+            if props['shape'] == 'circular':
+                diameter = props['diameter']  # type: ignore
+                x_size = y_size = diameter
+            else:
+                diameter = np.nan
+                x_size = props['xDimension']  # type: ignore
+                y_size = props['yDimension']  # type: ignore
+            self._relative[idx] = (
+                props['x'], props['y'], props['z'] + props['depth'],
+                props['depth'], x_size, y_size, diameter,
+                props['totalLiquidVolume'])
+
+        rows: Dict[str, List[int]] = {}
+        columns: Dict[str, List[int]] = {}
+        for idx, name in enumerate(self._names):
+            match = _well_name.match(name)
+            assert match, f"could not match '{name}'"
+            rows.setdefault(match.group(1), []).append(idx)
+            columns.setdefault(match.group(2), []).append(idx)
+        self._rows = {row: np.array(indices) for row, indices in rows.items()}
+        self._columns = {
+            column: np.array(indices) for column, indices in columns.items()}
+
+        self.set_offset(offset)
+
+    def set_offset(self, offset: Point) -> None:
+        """ Move every well for a new labware offset """
+        wells = self._relative.copy()
+        wells['x'] += offset.x
+        wells['y'] += offset.y
+        wells['z'] += offset.z
+        wells.setflags(write=False)
+        self._wells = wells
+        self._tops = np.stack(
+            (wells['x'], wells['y'], wells['z']), axis=-1)
+        self._tops.setflags(write=False)
+
+    @property
+    def wells(self) -> np.ndarray:
+        """ The read-only structured array of :py:data:`WELL_DTYPE`
+        records, in the definition's ordering """
+        return self._wells
+
+    @property
+    def names(self) -> List[str]:
+        return self._names
+
+    def indices(self, names: Sequence[str]) -> np.ndarray:
+        """ The indices of wells by name """
+        return np.array([self._index[name] for name in names], dtype=int)
+
+    def row(self, row: str) -> np.ndarray:
+        """ The indices of the wells in a row, like 'A', left to right """
+        return self._rows[row]
+
+    def column(self, column: str) -> np.ndarray:
+        """ The indices of the wells in a column, like '1', back to front """
+        return self._columns[column]
+
+    def tops(self, z: float = 0.0, indices: np.ndarray = None) -> np.ndarray:
+        """ The centers of the tops of wells, offset by ``z`` mm """
+        tops = self._tops if indices is None else self._tops[indices]
+        return tops + (0.0, 0.0, z)
+
+    def bottoms(self, z: float = 0.0,
+                indices: np.ndarray = None) -> np.ndarray:
+        """ The centers of the bottoms of wells, offset by ``z`` mm """
+        depths = self._wells['depth'] if indices is None\
+            else self._wells['depth'][indices]
+        positions = self.tops(z, indices)
+        positions[:, 2] -= depths
+        return positions
+
+    def centers(self, indices: np.ndarray = None) -> np.ndarray:
+        """ The centers of wells """
+        depths = self._wells['depth'] if indices is None\
+            else self._wells['depth'][indices]
+        positions = self.tops(0.0, indices)
+        positions[:, 2] -= depths / 2.0
+        return positions
@@ -3,6 +3,7 @@ from typing import List, Dict
 
 from opentrons.protocols.geometry.deck_item import DeckItem
 from opentrons.protocols.geometry.labware_geometry import LabwareGeometry
+from opentrons.protocols.geometry.well_array import WellArray
 from opentrons.protocols.implementations.tip_tracker import TipTracker
 from opentrons.protocols.implementations.well import WellImplementation
 from opentrons.protocols.implementations.well_grid import WellGrid
@@ -85,3 +86,7 @@ class LabwareInterface(DeckItem):
     @abstractmethod
     def get_geometry(self) -> LabwareGeometry:
         ...
+
+    @abstractmethod
+    def get_well_array(self) -> WellArray:
+        ...
@@ -1,7 +1,8 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from opentrons.calibration_storage import helpers
 from opentrons.protocols.geometry.labware_geometry import LabwareGeometry
+from opentrons.protocols.geometry.well_array import WellArray
 from opentrons.protocols.geometry.well_geometry import WellGeometry
 from opentrons.protocols.implementations.interfaces.labware import \
     LabwareInterface
@@ -61,6 +62,8 @@ class LabwareImplementation(LabwareInterface):
         )
 
         self._calibrated_offset = Point(0, 0, 0)
+        # Built on the first get_well_array, most protocols never use it
+        self._well_array: Optional[WellArray] = None
         # Will cause building of the wells
         self.set_calibration(self._calibrated_offset)
 
@@ -92,6 +95,7 @@ class LabwareImplementation(LabwareInterface):
             z=self._geometry.offset.z + delta.z
         )
         # The wells must be rebuilt
+        self._well_array = None
         self._wells = self._build_wells()
         self._well_name_grid = WellGrid(wells=self._wells)
         self._tip_tracker = TipTracker(
@@ -132,6 +136,13 @@ class LabwareImplementation(LabwareInterface):
     def get_geometry(self) -> LabwareGeometry:
         return self._geometry
 
+    def get_well_array(self) -> WellArray:
+        if self._well_array is None:
+            self._well_array = WellArray(
+                self._well_definition, self._ordering,
+                self._calibrated_offset)
+        return self._well_array
+
     @property
     def highest_z(self):
         return self._geometry.z_dimension + self._calibrated_offset.z
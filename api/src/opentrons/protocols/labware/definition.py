@@ -8,8 +8,6 @@ from pathlib import Path
 from typing import (
     Any, AnyStr, List, Dict, Union)
 
-import jsonschema  # type: ignore
-
 from opentrons.protocols.api_support.util import ModifiedList
 from opentrons.calibration_storage import helpers, modify
 from opentrons.protocols.implementations.interfaces.labware import \
@@ -140,6 +138,9 @@ def verify_definition(contents: Union[
     :raises jsonschema.ValidationError: If the definition is not valid.
     :returns: The parsed definition
     """
+    # jsonschema is slow to import, so wait until something is validated
+    import jsonschema  # type: ignore
+
     schema_body = load_shared_data('labware/schemas/2.json').decode('utf-8')
     labware_schema_v2 = json.loads(schema_body)
 
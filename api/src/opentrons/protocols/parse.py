@@ -12,8 +12,6 @@ from io import BytesIO
 from zipfile import ZipFile
 from typing import Any, Dict, Optional, Union, Tuple, TYPE_CHECKING
 
-import jsonschema  # type: ignore
-
 from opentrons.config import feature_flags as ff
 from opentrons_shared_data import load_shared_data, protocol
 from .types import (Protocol, PythonProtocol, JsonProtocol,
@@ -336,6 +334,9 @@ def _get_schema_for_protocol(version_num: int) -> protocol.Schema:
 def validate_json(
         protocol_json: Dict[Any, Any]) -> Tuple[int, 'JsonProtocolDef']:
     """ Validates a json protocol and returns its schema version """
+    # jsonschema is slow to import, and only json protocols need it
+    import jsonschema  # type: ignore
+
     # Check if this is actually a labware
     labware_schema_v2 = json.loads(load_shared_data(
         'labware/schemas/2.json').decode('utf-8'))
@@ -6,6 +6,7 @@ a protocol from the command line.
 
 import argparse
 import asyncio
+import json
 
 import sys
 import logging
@@ -25,9 +26,10 @@ import opentrons.broker
 from opentrons.config import IS_ROBOT, JUPYTER_NOTEBOOK_LABWARE_DIR
 from opentrons import protocol_api
 from opentrons.protocols.api_support.util import HardwareToManage
-from opentrons.protocols import parse, bundle
+from opentrons.protocols import analysis, parse, bundle
 from opentrons.protocols.types import (
     PythonProtocol, BundleContents, APIVersion)
+from .util import tracing
 from .util.entrypoint_util import labware_from_paths, datafiles_from_paths
 
 if TYPE_CHECKING:
@@ -107,6 +109,7 @@ class CommandScraper:
         payload = message['payload']
         if message['$'] == 'before':
             self._commands.append({'level': self._depth,
+                                   'name': message['name'],
                                    'payload': payload,
                                    'logs': []})
             self._depth += 1
@@ -255,6 +258,8 @@ def simulate(protocol_file: TextIO,
         - ``level``: The depth at which this command is nested - if this an
                      aspirate inside a mix inside a transfer, for instance,
                      it would be 3.
+        - ``name``: The name of the command, one of the names in
+                    :py:mod:`opentrons.commands.types`.
         - ``payload``: The command, its arguments, and how to format its text.
                        For more specific details see
                        :py:mod:`opentrons.commands`. To format a message from
@@ -478,9 +483,19 @@ def get_arguments(
         help='Print the opentrons package version and exit')
     parser.add_argument(
         '-o', '--output', action='store',
-        help='What to output during simulations',
-        choices=['runlog', 'nothing'],
+        help='What to output during simulations. "analysis" prints the '
+             'tips, liquid volumes, labware, modules and pipettes the '
+             'protocol uses as JSON, and caches it next to the protocol '
+             'file so that analyzing the same protocol again is instant.',
+        choices=['runlog', 'analysis', 'nothing'],
         default='runlog')
+    parser.add_argument(
+        '-t', '--trace', action='store', default=None, metavar='TRACE_FILE',
+        help='Record timing spans of the run (protocol commands, hardware '
+             'calls, motion planning and serial traffic to the robot) and '
+             'write them to TRACE_FILE. A TRACE_FILE ending in .bin is '
+             'written in a compact binary format; anything else is written '
+             'as a Chrome trace (load it in chrome://tracing).')
     return parser
 
 
@@ -505,6 +520,25 @@ def _get_bundle_dest(
         return None
 
 
+def _analysis_inputs(labware_paths: List[str],
+                     data_paths: List[str],
+                     hardware_simulator_file_path: Optional[str]
+                     ) -> Dict[str, bytes]:
+    """ Everything besides the protocol that a simulation reads, by name,
+    so that analyses of one protocol with different inputs aren't mixed up
+    in the cache """
+    inputs = {
+        f'labware:{uri}': json.dumps(definition, sort_keys=True).encode()
+        for uri, definition in labware_from_paths(labware_paths).items()}
+    inputs.update({
+        f'data:{name}': data
+        for name, data in datafiles_from_paths(data_paths).items()})
+    if hardware_simulator_file_path:
+        inputs['hardware_simulator'] = pathlib.Path(
+            hardware_simulator_file_path).read_bytes()
+    return inputs
+
+
 # Note - this script is also set up as a setuptools entrypoint and thus does
 # an absolute minimum of work since setuptools does something odd generating
 # the scripts
@@ -517,15 +551,33 @@ def main() -> int:
     args = parser.parse_args()
     # Try to migrate api v1 containers if needed
 
-    runlog, maybe_bundle = simulate(
-        args.protocol,
-        args.protocol.name,
-        getattr(args, 'custom_labware_path', []),
-        getattr(args, 'custom_data_path', [])
-        + getattr(args, 'custom_data_file', []),
-        hardware_simulator_file_path=getattr(args,
-                                             'custom_hardware_simulator_file'),
-        log_level=args.log_level)
+    labware_paths = getattr(args, 'custom_labware_path', [])
+    data_paths = getattr(args, 'custom_data_path', [])\
+        + getattr(args, 'custom_data_file', [])
+    hardware_simulator_file_path = getattr(
+        args, 'custom_hardware_simulator_file')
+
+    protocol_path = pathlib.Path(args.protocol.name)
+    # Protocols piped through stdin don't have anywhere to cache analyses
+    cache_analysis = args.output == 'analysis' and protocol_path.is_file()
+    if cache_analysis:
+        contents = args.protocol.read()
+        args.protocol.seek(0)
+        inputs = _analysis_inputs(
+            labware_paths, data_paths, hardware_simulator_file_path)
+        cached = analysis.load_cached(protocol_path, contents, inputs)
+        if cached is not None:
+            print(json.dumps(cached, indent=2))
+            return 0
+
+    with tracing.recording(getattr(args, 'trace', None)):
+        runlog, maybe_bundle = simulate(
+            args.protocol,
+            args.protocol.name,
+            labware_paths,
+            data_paths,
+            hardware_simulator_file_path=hardware_simulator_file_path,
+            log_level=args.log_level)
 
     if maybe_bundle:
         bundle_name = getattr(args, 'bundle', None)
@@ -539,6 +591,11 @@ def main() -> int:
 
     if args.output == 'runlog':
         print(format_runlog(runlog))
+    elif args.output == 'analysis':
+        result = analysis.analyze(runlog)
+        if cache_analysis:
+            analysis.save_cached(protocol_path, contents, result, inputs)
+        print(json.dumps(result, indent=2))
 
     return 0
 
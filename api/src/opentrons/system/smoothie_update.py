@@ -1,6 +1,71 @@
-""" Functions and variables for the smoothie update process """
+""" Functions and variables for the smoothie update process
+
+An update runs in phases: the hex image is checked, the smoothie is put
+into programming mode, the programmer (lpc21isp) writes the image, the
+smoothie is restarted and its firmware version is read back to verify that
+it came up. Each phase has its own timeout and reports progress in bytes
+through an optional callback. The image and the programmer's output are
+read in chunks of at most :py:data:`CHUNK_SIZE` bytes as they come, and
+anything that waits on the smoothie itself runs in an executor, so an
+update never blocks the event loop for long.
+"""
+import asyncio
+import binascii
+import enum
+import logging
 import os
+import re
 import shutil
+from dataclasses import dataclass
+from typing import (Any, Awaitable, Callable, Dict, Mapping, Optional,
+                    Sequence, TypeVar)
+
+log = logging.getLogger(__name__)
+
+#: The most bytes of the image or the programmer's output read at once
+CHUNK_SIZE = 4096
+
+
+class UpdatePhase(str, enum.Enum):
+    CHECK = 'check'
+    PREPARE = 'prepare'
+    PROGRAM = 'program'
+    RESTART = 'restart'
+    VERIFY = 'verify'
+
+
+#: How long each phase of an update may take, in seconds. Programming
+#: usually takes around a minute.
+DEFAULT_PHASE_TIMEOUTS: Mapping[UpdatePhase, float] = {
+    UpdatePhase.CHECK: 10.0,
+    UpdatePhase.PREPARE: 15.0,
+    UpdatePhase.PROGRAM: 300.0,
+    UpdatePhase.RESTART: 30.0,
+    UpdatePhase.VERIFY: 15.0,
+}
+
+
+@dataclass(frozen=True)
+class UpdateProgress:
+    """ How far an update has gotten. ``bytes_done`` of ``bytes_total``
+    bytes of the image have been checked in the check phase, and programmed
+    in the program phase. """
+    phase: UpdatePhase
+    bytes_done: int
+    bytes_total: int
+
+
+ProgressCallback = Callable[[UpdateProgress], None]
+
+
+class SmoothieUpdateError(RuntimeError):
+    def __init__(self, phase: UpdatePhase, message: str) -> None:
+        self.phase = phase
+        super().__init__(f'Smoothie update failed to {phase.value}: '
+                         f'{message}')
+
+
+_T = TypeVar('_T')
 
 
 def _ensure_programmer_executable():
@@ -15,3 +80,190 @@ def _ensure_programmer_executable():
     # because if it is None, we’re about to fail when we try to program
     # the smoothie, and we want the exception to bubble up.
     os.chmod(updater_executable, 0o777)
+
+
+def _report(progress: Optional[ProgressCallback], phase: UpdatePhase,
+            done: int, total: int):
+    if progress:
+        try:
+            progress(UpdateProgress(phase, done, total))
+        except Exception:
+            log.exception('Smoothie update progress callback failed')
+
+
+async def run_phase(phase: UpdatePhase,
+                    work: Awaitable[_T],
+                    timeouts: Mapping[UpdatePhase, float] = None) -> _T:
+    """ Run one phase of an update, raising a :py:class:`SmoothieUpdateError`
+    if it fails or takes longer than its timeout """
+    timeout = (timeouts or DEFAULT_PHASE_TIMEOUTS)[phase]
+    log.info(f'Smoothie update: {phase.value}')
+    try:
+        return await asyncio.wait_for(work, timeout)
+    except asyncio.TimeoutError:
+        raise SmoothieUpdateError(phase, f'timed out after {timeout}s')
+    except SmoothieUpdateError:
+        raise
+    except Exception as e:
+        raise SmoothieUpdateError(phase, str(e)) from e
+
+
+async def run_blocking_phase(
+        phase: UpdatePhase,
+        func: Callable[[], _T],
+        timeouts: Mapping[UpdatePhase, float] = None,
+        loop: asyncio.AbstractEventLoop = None) -> _T:
+    """ Run a phase that blocks on the smoothie in an executor, like
+    :py:func:`run_phase`.
+
+    A worker thread can't be interrupted, so if the phase fails or times out
+    this waits for ``func`` to return before raising. Nothing is still using
+    the smoothie's serial port or GPIO once the error is raised, so the
+    caller may retry or reconnect right away. The timeout limits when the
+    failure is detected, not when the error is raised.
+    """
+    checked_loop = loop or asyncio.get_event_loop()
+    work = asyncio.ensure_future(
+        checked_loop.run_in_executor(None, func), loop=checked_loop)
+    try:
+        return await run_phase(phase, asyncio.shield(work), timeouts)
+    except SmoothieUpdateError:
+        if not work.done():
+            log.warning(f'Smoothie update: waiting for {phase.value} to '
+                        'stop before failing')
+            await asyncio.wait([work])
+        raise
+
+
+def _hex_record_size(line: bytes, lineno: int) -> int:
+    """ Check one Intel hex record and return how many bytes of image
+    data it has """
+    if not line.startswith(b':'):
+        raise ValueError(f'line {lineno} is not a hex record')
+    try:
+        record = binascii.unhexlify(line[1:])
+    except binascii.Error:
+        raise ValueError(f'line {lineno} is not valid hex')
+    if len(record) < 5 or len(record) != record[0] + 5:
+        raise ValueError(f'line {lineno} has the wrong length')
+    if sum(record) & 0xff:
+        raise ValueError(f'line {lineno} has a bad checksum')
+    # Only data records (type 0) hold image bytes
+    return record[0] if record[3] == 0 else 0
+
+
+async def check_image(path: str,
+                      progress: ProgressCallback = None) -> int:
+    """ Read an Intel hex image a chunk at a time, checking every record,
+    and return how many bytes of data it holds """
+    file_size = os.path.getsize(path)
+    image_size = 0
+    lineno = 0
+    read = 0
+    partial = b''
+    with open(path, 'rb') as image:
+        while True:
+            chunk = image.read(CHUNK_SIZE)
+            read += len(chunk)
+            lines = (partial + chunk).split(b'\n')
+            partial = lines.pop() if chunk else b''
+            for line in lines:
+                lineno += 1
+                line = line.strip()
+                if line:
+                    image_size += _hex_record_size(line, lineno)
+            _report(progress, UpdatePhase.CHECK, read, file_size)
+            if not chunk:
+                break
+            # Let anything else on the loop run between chunks
+            await asyncio.sleep(0)
+    if not image_size:
+        raise ValueError(f'{path} has no image data')
+    return image_size
+
+
+def _lpc17xx_sector_size(sector: int) -> int:
+    return 4096 if sector < 16 else 32768
+
+
+class ProgrammerOutputParser:
+    """ Tracks how many bytes lpc21isp has programmed from its output.
+
+    lpc21isp prints ``Sector N:`` as it starts writing each flash sector of
+    the LPC17xx on the smoothie, so every sector before the current one is
+    done. It prints ``Download Finished`` once everything is written and
+    verified.
+    """
+    _SECTOR = re.compile(r'Sector (\d+):')
+    _FINISHED = 'Download Finished'
+
+    def __init__(self, image_size: int) -> None:
+        self.image_size = image_size
+        self._sectors_done = 0
+        self._current: Optional[int] = None
+        self._finished = False
+        self._tail = ''
+
+    @property
+    def bytes_done(self) -> int:
+        if self._finished:
+            return self.image_size
+        return min(self._sectors_done, self.image_size)
+
+    def feed(self, text: str) -> int:
+        """ Handle more output and return the bytes programmed so far """
+        # Keep the end of the last chunk in case a message was split
+        text = self._tail + text
+        end = 0
+        for match in self._SECTOR.finditer(text):
+            if self._current is not None:
+                self._sectors_done += _lpc17xx_sector_size(self._current)
+            self._current = int(match.group(1))
+            end = match.end()
+        if self._FINISHED in text:
+            self._finished = True
+        self._tail = text[max(end, len(text) - 32):]
+        return self.bytes_done
+
+
+async def program(command: Sequence[str],
+                  image_size: int,
+                  progress: ProgressCallback = None,
+                  loop: asyncio.AbstractEventLoop = None) -> str:
+    """ Run the programmer and return its output.
+
+    The output is read as it is printed to report progress. If the
+    programmer fails, or this is cancelled (as when its phase times out),
+    the programmer is killed.
+    """
+    kwargs: Dict[str, Any] = {
+        'stdout': asyncio.subprocess.PIPE,
+        'stderr': asyncio.subprocess.STDOUT}
+    if loop:
+        kwargs['loop'] = loop
+    log.info(' '.join(command))
+    proc = await asyncio.create_subprocess_exec(*command, **kwargs)
+    assert proc.stdout
+    parser = ProgrammerOutputParser(image_size)
+    output = []
+    try:
+        while True:
+            chunk = await proc.stdout.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            text = chunk.decode(errors='replace')
+            output.append(text)
+            _report(progress, UpdatePhase.PROGRAM,
+                    parser.feed(text), image_size)
+        returncode = await proc.wait()
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+    result = ''.join(output).strip()
+    if returncode != 0:
+        log.error(f'Smoothie programmer failed: {returncode} {result}')
+        raise RuntimeError(
+            f'programmer exited with {returncode}: {result[-200:]}')
+    _report(progress, UpdatePhase.PROGRAM, image_size, image_size)
+    return result
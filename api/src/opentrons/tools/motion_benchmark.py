@@ -0,0 +1,296 @@
+'''
+Motion stress and throughput benchmark.
+
+Drives a set of canonical workloads through the protocol API and the
+hardware controller and reports, as JSON, per-operation latency histograms,
+the time spent in motion planning and coordinate transforms, and how many
+commands and moves per second each workload achieved.
+
+Runs against the hardware simulator by default, so it can be used on a
+development machine to compare changes. Pass --hardware to run on a robot
+with a p300 single on the left mount and a p300 multi on the right; the deck
+must be empty, since the workloads move to where their labware would be.
+
+Examples of calling this script:
+
+    python -m opentrons.tools.motion_benchmark -o bench.json
+    python -m opentrons.tools.motion_benchmark -w plate_fill -w tip_cycling
+    python -m opentrons.tools.motion_benchmark --hardware -c 2
+
+'''
+
+import bisect
+import collections
+import json
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from opentrons import __version__
+from opentrons.hardware_control import API, ThreadManager
+from opentrons.protocol_api import ProtocolContext
+from opentrons.types import Mount, Point
+from opentrons.util import tracing
+from . import args_handler
+
+TIPRACK = 'opentrons_96_tiprack_300ul'
+PLATE = 'corning_96_wellplate_360ul_flat'
+PCR_PLATE = 'nest_96_wellplate_100ul_pcr_full_skirt'
+PCR_BLOCK = 'opentrons_96_aluminumblock_generic_pcr_strip_200ul'
+RESERVOIR = 'nest_12_reservoir_15ml'
+
+SINGLE = 'p300_single_gen2'
+MULTI = 'p300_multi_gen2'
+
+#: Upper bounds of the latency histogram buckets, in microseconds: 1, 2 and
+#: 5 times each power of ten from 1us to 50s
+BUCKETS_US = [mult * 10 ** exp for exp in range(0, 8) for mult in (1, 2, 5)]
+
+Workload = Callable[[ProtocolContext, int], None]
+
+
+def plate_fill(ctx: ProtocolContext, columns: int):
+    """ Fill the wells of a plate one at a time from a reservoir """
+    tiprack = ctx.load_labware(TIPRACK, '1')
+    reservoir = ctx.load_labware(RESERVOIR, '2')
+    plate = ctx.load_labware(PLATE, '3')
+    pipette = ctx.load_instrument(SINGLE, 'left', tip_racks=[tiprack])
+    pipette.distribute(
+        20, reservoir['A1'], plate.wells()[:columns * 8],
+        disposal_volume=0)
+
+
+def serial_dilution(ctx: ProtocolContext, columns: int):
+    """ Add diluent to a row of columns with an 8-channel pipette, then
+    dilute down the row with a fresh tip and a mix for each step """
+    tiprack = ctx.load_labware(TIPRACK, '1')
+    reservoir = ctx.load_labware(RESERVOIR, '2')
+    plate = ctx.load_labware(PLATE, '3')
+    pipette = ctx.load_instrument(MULTI, 'right', tip_racks=[tiprack])
+    row = plate.rows()[0][:columns]
+    pipette.transfer(100, reservoir['A1'], row)
+    if columns > 1:
+        pipette.transfer(
+            100, row[:-1], row[1:], mix_after=(3, 50), new_tip='always')
+
+
+def tip_cycling(ctx: ProtocolContext, columns: int):
+    """ Pick up, return, pick up again and drop each column of tips with an
+    8-channel pipette """
+    tipracks = [ctx.load_labware(TIPRACK, slot) for slot in ('1', '2')]
+    pipette = ctx.load_instrument(MULTI, 'right', tip_racks=tipracks)
+    for rack in tipracks:
+        for column in rack.columns()[:columns]:
+            pipette.pick_up_tip(column[0])
+            pipette.return_tip()
+            pipette.pick_up_tip(column[0])
+            pipette.drop_tip()
+
+
+def module_heavy(ctx: ProtocolContext, columns: int):
+    """ Move samples from a cold block through a thermocycler profile and
+    onto a magnetic module """
+    tipracks = [ctx.load_labware(TIPRACK, slot) for slot in ('2', '3')]
+    temp_mod = ctx.load_module('temperature module gen2', '1')
+    cold_plate = temp_mod.load_labware(PCR_BLOCK)
+    mag_mod = ctx.load_module('magnetic module gen2', '4')
+    mag_plate = mag_mod.load_labware(PCR_PLATE)
+    tc_mod = ctx.load_module('thermocycler')
+    tc_plate = tc_mod.load_labware(PCR_PLATE)
+    pipette = ctx.load_instrument(MULTI, 'right', tip_racks=tipracks)
+
+    temp_mod.set_temperature(4)
+    tc_mod.open_lid()
+    tc_mod.set_block_temperature(4)
+    for source, dest in zip(cold_plate.rows()[0][:columns],
+                            tc_plate.rows()[0][:columns]):
+        pipette.transfer(10, source, dest, mix_after=(2, 10))
+    tc_mod.close_lid()
+    tc_mod.set_lid_temperature(105)
+    tc_mod.execute_profile(
+        steps=[{'temperature': 95, 'hold_time_seconds': 10},
+               {'temperature': 57, 'hold_time_seconds': 10}],
+        repetitions=columns, block_max_volume=10)
+    tc_mod.deactivate_lid()
+    tc_mod.open_lid()
+    for source, dest in zip(tc_plate.rows()[0][:columns],
+                            mag_plate.rows()[0][:columns]):
+        pipette.transfer(10, source, dest)
+    mag_mod.engage(height_from_base=10)
+    mag_mod.disengage()
+    tc_mod.deactivate()
+    temp_mod.deactivate()
+
+
+def gantry_moves(ctx: ProtocolContext, columns: int):
+    """ Move the left mount over the wells of a plate directly through the
+    hardware controller, with no protocol api planning """
+    plate = ctx.load_labware(PLATE, '5')
+    hardware = ctx._hw_manager.hardware
+    hardware.cache_instruments({Mount.LEFT: SINGLE})
+    hardware.home()
+    for well in plate.wells()[:columns * 8]:
+        hardware.move_to(Mount.LEFT, well.top(40).point)
+        hardware.move_rel(Mount.LEFT, Point(0, 0, -10))
+        hardware.move_rel(Mount.LEFT, Point(0, 0, 10))
+    hardware.home()
+
+
+WORKLOADS: Dict[str, Workload] = {
+    'plate_fill': plate_fill,
+    'serial_dilution': serial_dilution,
+    'tip_cycling': tip_cycling,
+    'module_heavy': module_heavy,
+    'gantry_moves': gantry_moves,
+}
+
+
+def latency_stats(durations_ns: Sequence[int]) -> Dict[str, Any]:
+    """ Summarize latencies as a count, total, percentiles and a histogram
+    of the non-empty :py:data:`BUCKETS_US` buckets, all in microseconds """
+    ordered = sorted(duration / 1000 for duration in durations_ns)
+    if not ordered:
+        return {'count': 0}
+
+    def percentile(pct: float) -> float:
+        return round(ordered[min(len(ordered) - 1,
+                                 int(len(ordered) * pct / 100))], 1)
+
+    counts: Dict[str, int] = collections.OrderedDict()
+    for duration in ordered:
+        idx = bisect.bisect_left(BUCKETS_US, duration)
+        bucket = f'<={BUCKETS_US[idx]}' if idx < len(BUCKETS_US) else 'more'
+        counts[bucket] = counts.get(bucket, 0) + 1
+    return {
+        'count': len(ordered),
+        'total_us': round(sum(ordered), 1),
+        'mean_us': round(sum(ordered) / len(ordered), 1),
+        'p50_us': percentile(50),
+        'p90_us': percentile(90),
+        'p99_us': percentile(99),
+        'max_us': round(ordered[-1], 1),
+        'histogram_us': counts,
+    }
+
+
+def _summarize(events: List[tracing.TraceEvent],
+               wall_time_s: float) -> Dict[str, Any]:
+    by_span: Dict[str, Dict[str, List[int]]] = collections.defaultdict(
+        lambda: collections.defaultdict(list))
+    for event in tracing.spans(events):
+        by_span[event.category][event.name].append(event.duration_ns)
+
+    def total_s(category: str) -> float:
+        return sum(sum(durations)
+                   for durations in by_span[category].values()) / 1e9
+
+    def count(category: str) -> int:
+        return sum(len(durations) for durations in by_span[category].values())
+
+    # Protocol api commands nest, so this counts a transfer and each of
+    # its aspirates and dispenses
+    command_count = count('command')
+    moves = count('hardware')
+    return {
+        'wall_time_s': round(wall_time_s, 4),
+        'commands': command_count,
+        'commands_per_s': round(command_count / wall_time_s, 1),
+        'moves': moves,
+        'moves_per_s': round(moves / wall_time_s, 1),
+        'gcodes': count('smoothie.gcode'),
+        'planning_s': round(total_s('planning'), 4),
+        'transform_s': round(total_s('hardware.transform'), 4),
+        'motion_lock_s': round(total_s('hardware.lock'), 4),
+        'spans_us': {category: {name: latency_stats(durations)
+                                for name, durations in sorted(names.items())}
+                     for category, names in sorted(by_span.items())},
+    }
+
+
+def run_workload(hardware: ThreadManager, workload: Workload,
+                 columns: int) -> Dict[str, Any]:
+    """ Run one workload on a fresh protocol context and return its
+    metrics """
+    ctx = ProtocolContext(hardware=hardware)
+    ctx.home()
+    tracer = tracing.enable()
+    start = time.perf_counter()
+    try:
+        workload(ctx, columns)
+    finally:
+        wall_time_s = time.perf_counter() - start
+        tracing.disable()
+    return _summarize(tracer.events, wall_time_s)
+
+
+def run(workloads: Sequence[str], columns: int = 12,
+        port: Optional[str] = None) -> Dict[str, Any]:
+    """ Run workloads by name and return the report.
+
+    :param workloads: Names from :py:data:`WORKLOADS`
+    :param columns: How many plate columns each workload covers, from 1
+                    to 12
+    :param port: The smoothie's serial port to run on a robot, or ``None``
+                 to use the simulator
+    """
+    if not 1 <= columns <= 12:
+        raise ValueError(f'columns must be between 1 and 12, not {columns}')
+    shared = ThreadManager(API.build_hardware_controller, None, port)\
+        if port is not None else None
+    results = {}
+    try:
+        for name in workloads:
+            # Each simulated workload gets its own simulator so that the
+            # results don't depend on what ran before
+            hardware = shared or ThreadManager(API.build_hardware_simulator)
+            try:
+                results[name] = run_workload(
+                    hardware, WORKLOADS[name], columns)
+            finally:
+                if not shared:
+                    hardware.clean_up()
+    finally:
+        if shared:
+            shared.clean_up()
+    return {
+        'environment': {
+            'opentrons': __version__,
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'simulating': port is None,
+            'columns': columns,
+        },
+        'workloads': results,
+    }
+
+
+def main():
+    parser = args_handler.root_argparser(
+        'Opentrons motion stress and throughput benchmark')
+    parser.add_argument(
+        '--hardware', action='store_true',
+        help='Run on the robot through the smoothie at --port instead of '
+             'the simulator')
+    parser.add_argument(
+        '-w', '--workload', action='append', choices=list(WORKLOADS),
+        help='Workloads to run, all by default')
+    parser.add_argument(
+        '-c', '--columns', type=int, default=12,
+        help='How many plate columns each workload covers (1-12)')
+    parser.add_argument(
+        '-o', '--output', type=str, default=None,
+        help='File to write the JSON report to instead of stdout')
+    args = parser.parse_args()
+    report = run(args.workload or list(WORKLOADS), args.columns,
+                 args.port if args.hardware else None)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,7 @@ import logging
 import numpy as np  # type: ignore
 from numpy import insert, dot  # type: ignore
 from numpy.linalg import inv  # type: ignore
-from typing import List, Tuple, Union
+from typing import List, NamedTuple, Sequence, Tuple, Union
 
 from opentrons.calibration_storage.types import AttitudeMatrix
 from opentrons.config import feature_flags as ff
@@ -19,6 +19,21 @@ SolvePoints = Tuple[
     Tuple[float, float, float],
     Tuple[float, float, float]]
 
+#: Three or more points to fit a transform to
+FitPoints = Sequence[Sequence[float]]
+
+
+class Fit(NamedTuple):
+    """ A transform fit to pairs of expected and actual points """
+    #: The transform from expected points to actual points
+    transform: np.ndarray
+    #: The distance from where the transform puts each expected point to the
+    #: matching actual point
+    residuals: np.ndarray
+    #: The condition number of the expected points. Large values mean the
+    #: points are close to collinear and the fit is sensitive to error.
+    condition_number: float
+
 
 def identity_deck_transform() -> np.ndarray:
     """ The default deck transform """
@@ -28,38 +43,67 @@ def identity_deck_transform() -> np.ndarray:
         return np.identity(4)
 
 
+def _lstsq(ex: np.ndarray, ac: np.ndarray) -> Tuple[np.ndarray, float]:
+    """ Find the transform t minimizing the error of ac = t . ex for the
+    rows of ex and ac, and the condition number of ex """
+    if ex.shape != ac.shape or ex.ndim != 2 or ex.shape[0] < ex.shape[1]:
+        raise ValueError(
+            f'Need the same number of expected and actual points, and at '
+            f'least {ex.shape[-1]}, not {ex.shape} and {ac.shape}')
+    solution, _, rank, singular = np.linalg.lstsq(ex, ac, rcond=None)
+    if rank < ex.shape[1]:
+        raise np.linalg.LinAlgError('Singular matrix')
+    return solution.transpose(), float(singular[0] / singular[-1])
+
+
+def fit_attitude(expected: FitPoints, actual: FitPoints) -> Fit:
+    """
+    Fit a deck attitude matrix to three or more x-y-z points by least
+    squares.
+
+    With exactly three points this is the transform from
+    :py:func:`solve_attitude`. Only the x-y part of the transform is kept,
+    so the residuals are x-y distances.
+    """
+    ex = np.asarray(expected, dtype=float)
+    ac = np.asarray(actual, dtype=float)
+    t, condition_number = _lstsq(ex, ac)
+
+    transform = np.identity(3)
+    transform[:2, :2] = t[:2, :2]
+    residuals = np.linalg.norm(
+        (ex @ transform.transpose() - ac)[:, :2], axis=1)
+    return Fit(transform, residuals, condition_number)
+
+
 def solve_attitude(
-        expected: SolvePoints,
-        actual: SolvePoints
+        expected: FitPoints,
+        actual: FitPoints
         ) -> AttitudeMatrix:
-    ex = np.array([
-        list(point)
-        for point in expected
-    ]).transpose()
-    ac = np.array([
-            list(point)
-            for point in actual
-        ]).transpose()
-    t = np.dot(ac, inv(ex))
+    return fit_attitude(expected, actual).transform.round(4).tolist()
 
-    mask_transform = np.array([
-        [True, True, False],
-        [True, True, False],
-        [False, False, False]])
-    masked_array = np.ma.masked_array(t, ~mask_transform)
 
-    no_z_component = np.zeros((3, 3))
-    np.put(no_z_component, [8, 8], 1)
+def fit_affine(expected: FitPoints, actual: FitPoints) -> Fit:
+    """
+    Fit a 2-D affine transform to three or more x-y points by least squares.
 
-    transform = masked_array.filled(0) + no_z_component
-    return transform.round(4).tolist()
+    With exactly three points this is the transform from :py:func:`solve`.
+    """
+    ex = np.insert(np.asarray(expected, dtype=float), 2, 1, axis=1)
+    ac = np.insert(np.asarray(actual, dtype=float), 2, 1, axis=1)
+    transform, condition_number = _lstsq(ex, ac)
+    residuals = np.linalg.norm(
+        (ex @ transform.transpose() - ac)[:, :2], axis=1)
+    return Fit(transform, residuals, condition_number)
 
 
-def solve(expected: List[Tuple[float, float]],
-          actual: List[Tuple[float, float]]) -> np.ndarray:
+def solve(expected: FitPoints,
+          actual: FitPoints) -> np.ndarray:
     """
     Takes two lists of 3 x-y points each, and calculates the matrix
-    representing the transformation from one space to the other.
+    representing the transformation from one space to the other. With more
+    than 3 points each, this is the least squares fit from
+    :py:func:`fit_affine`.
 
     The 3x3 matrix returned by this method represents the 2-D transformation
     matrix from the actual point to the expected point.
@@ -93,36 +137,7 @@ def solve(expected: List[Tuple[float, float]],
 
         The return value of this function is the transformation matrix T
     """
-    # Note: input list shape validation is handled by the type checker
-
-    # Turn expected and actual matricies into numpy ndarrays with the last row
-    # of [1 1 1] appended, and then take the dot product of the resulting
-    # actual matrix with the inverse of the resulting expected matrix.
-
-    # Shape of `expected` and `actual`:
-    # [ (x1, y1),
-    #   (x2, y2),
-    #   (x3, y3) ]
-    ex = np.array([
-            list(point) + [1]
-            for point in expected
-        ]).transpose()
-
-    ac = np.array([
-            list(point) + [1]
-            for point in actual
-        ]).transpose()
-    # Shape of `ex` and `ac`:
-    # [ x1 x2 x3 ]
-    # [ y1 y2 y3 ]
-    # [  1  1  1 ]
-
-    transform = np.dot(ac, inv(ex))
-    # `dot` in numpy is a misnomer. When both arguments are square, N-
-    # dimensional arrays, the return type is the result of performing matrix
-    # multiplication, rather than the dot-product (so the return here will be
-    # a 4x4 matrix)
-    return transform
+    return fit_affine(expected, actual).transform
 
 
 def add_z(xy: np.ndarray, z: float) -> np.ndarray:
@@ -202,3 +217,44 @@ def apply_reverse(
     """ Like apply_transform but inverts the transform first
     """
     return apply_transform(inv(t), pos, with_offsets)
+
+
+def apply_transforms(
+        t: Union[List[List[float]], np.ndarray],
+        points: FitPoints,
+        with_offsets=True) -> np.ndarray:
+    """
+    Like :py:func:`apply_transform` for a batch of points at once.
+
+    :param t: A transformation matrix from one 3D space [A] to another [B]
+    :param points: N XYZ points in space A
+    :param with_offsets: Whether to apply the transform as an affine transform
+                         or as a standard transform
+    :return: An (N, 3) array of the corresponding points in space B
+    """
+    pts = np.asarray(points, dtype=float)
+    if with_offsets:
+        pts = np.insert(pts, pts.shape[1], 1, axis=1)
+    return (pts @ np.asarray(t, dtype=float).transpose())[:, :3]
+
+
+def exceeds_thresholds(differences: FitPoints,
+                       thresholds: FitPoints) -> np.ndarray:
+    """
+    Check a batch of differences between points against thresholds.
+
+    Each difference is measured only along the axes its threshold vector
+    has, so a threshold of (x, y, 0) checks the distance in x-y and one of
+    (0, 0, z) the distance in z.
+
+    :param differences: N XYZ differences between points
+    :param thresholds: N XYZ threshold vectors, or one for every difference
+    :return: An array of N booleans, true where a difference is longer than
+             its threshold vector
+    """
+    diffs = np.asarray(differences, dtype=float).reshape(-1, 3)
+    limits = np.broadcast_to(
+        np.asarray(thresholds, dtype=float).reshape(-1, 3), diffs.shape)
+    measured = np.where(limits != 0, diffs, 0)
+    return np.linalg.norm(measured, axis=-1)\
+        > np.linalg.norm(limits, axis=-1)
@@ -0,0 +1,352 @@
+""" opentrons.util.tracing: opt-in timing spans for protocol runs
+
+When enabled, the protocol api, the hardware controller adapters, the
+hardware controller and the smoothie driver record nested, timestamped spans
+of what they are doing. The result can be written as a Chrome trace (load it
+in chrome://tracing or https://ui.perfetto.dev) or in a compact binary form.
+
+Tracing is off by default. While it is off, every instrumentation point costs
+a single check of a module global.
+
+Example
+-------
+.. code-block::
+    >>> from opentrons.util import tracing
+    >>> tracer = tracing.enable()
+    >>> ... # run or simulate a protocol
+    >>> tracing.disable()
+    >>> tracer.write_chrome_trace('run.json')
+"""
+import asyncio
+import collections
+import contextlib
+import functools
+import json
+import os
+import struct
+import threading
+import time
+from typing import (Any, Callable, Deque, Dict, Iterator, List, NamedTuple,
+                    Optional, Tuple, TypeVar, cast)
+
+#: Default cap on recorded events; the oldest are dropped past this
+DEFAULT_MAX_EVENTS = 1000000
+
+BINARY_MAGIC = b'OTTRACE2'
+_STRING_RECORD = b'S'
+_EVENT_RECORD = b'E'
+_STRING_HEADER = struct.Struct('<II')
+_EVENT = struct.Struct('<cIIIQQQ')
+
+Func = TypeVar('Func', bound=Callable)
+
+
+class TraceEvent(NamedTuple):
+    #: 'B' (span begin), 'E' (span end) or 'X' (complete span)
+    phase: str
+    name: str
+    category: str
+    #: Monotonic clock, in nanoseconds
+    timestamp_ns: int
+    #: Only set for complete spans
+    duration_ns: int
+    thread_id: int
+    args: Optional[Dict[str, Any]] = None
+
+
+class Tracer:
+    """ Collects trace events from any thread """
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        # deque.append is atomic, so recording needs no lock
+        self._events: Deque[TraceEvent] = collections.deque(
+            maxlen=max_events)
+        # The (name, category) of the spans begun and not yet ended on each
+        # thread, innermost last. Only a thread's own spans are changed
+        # from it.
+        self._open: Dict[int, List[Tuple[str, str]]] = {}
+
+    @property
+    def events(self) -> List[TraceEvent]:
+        return list(self._events)
+
+    def clear(self) -> None:
+        self._events.clear()
+
+    def begin(self, name: str, category: str,
+              args: Dict[str, Any] = None) -> None:
+        thread_id = threading.get_ident()
+        self._open.setdefault(thread_id, []).append((name, category))
+        self._events.append(TraceEvent(
+            'B', name, category, time.monotonic_ns(), 0, thread_id, args))
+
+    def end(self, name: str, category: str) -> None:
+        thread_id = threading.get_ident()
+        open_spans = self._open.get(thread_id, [])
+        for index in range(len(open_spans) - 1, -1, -1):
+            if open_spans[index] == (name, category):
+                del open_spans[index]
+                break
+        self._events.append(TraceEvent(
+            'E', name, category, time.monotonic_ns(), 0, thread_id))
+
+    def open_spans(self) -> int:
+        """ How many spans begun on this thread have not been ended """
+        return len(self._open.get(threading.get_ident(), []))
+
+    def end_open_spans(self, depth: int = 0) -> None:
+        """ End the spans begun on this thread that are still open,
+        innermost first, until only ``depth`` are left. Use this when
+        something that began spans raised before it could end them.
+        """
+        open_spans = self._open.get(threading.get_ident(), [])
+        while len(open_spans) > depth:
+            self.end(*open_spans[-1])
+
+    def complete(self, name: str, category: str, start_ns: int,
+                 end_ns: int, args: Dict[str, Any] = None) -> None:
+        self._events.append(TraceEvent(
+            'X', name, category, start_ns, end_ns - start_ns,
+            threading.get_ident(), args))
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """ Build a Chrome trace event format object of the events so far """
+        pid = os.getpid()
+        trace_events = []
+        for event in self.events:
+            as_dict: Dict[str, Any] = {
+                'name': event.name,
+                'cat': event.category,
+                'ph': event.phase,
+                'ts': event.timestamp_ns / 1000,
+                'pid': pid,
+                'tid': event.thread_id,
+            }
+            if event.phase == 'X':
+                as_dict['dur'] = event.duration_ns / 1000
+            if event.args:
+                as_dict['args'] = event.args
+            trace_events.append(as_dict)
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(self.to_chrome_trace(), f, default=str)
+
+    def write_binary(self, path: str) -> None:
+        """ Write the events in the compact binary format read back by
+        :py:func:`read_binary`.
+
+        Strings (names, categories and json-encoded args) are written once
+        and then referred to by index.
+        """
+        strings: Dict[str, int] = {}
+
+        with open(path, 'wb') as f:
+            f.write(BINARY_MAGIC)
+
+            def intern(value: str) -> int:
+                if value not in strings:
+                    # index 0 is reserved for "no string"
+                    strings[value] = len(strings) + 1
+                    encoded = value.encode()
+                    f.write(_STRING_RECORD)
+                    f.write(_STRING_HEADER.pack(strings[value], len(encoded)))
+                    f.write(encoded)
+                return strings[value]
+
+            for event in self.events:
+                args_id = intern(json.dumps(event.args, default=str))\
+                    if event.args else 0
+                name_id = intern(event.name)
+                category_id = intern(event.category)
+                f.write(_EVENT_RECORD)
+                f.write(_EVENT.pack(
+                    event.phase.encode(), name_id, category_id, args_id,
+                    event.timestamp_ns, event.duration_ns, event.thread_id))
+
+
+def read_binary(path: str) -> List[TraceEvent]:
+    """ Read events written by :py:meth:`Tracer.write_binary` """
+    strings: Dict[int, str] = {0: ''}
+    events = []
+    with open(path, 'rb') as f:
+        if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError(f'{path} is not a binary trace file')
+        while True:
+            tag = f.read(1)
+            if not tag:
+                break
+            if tag == _STRING_RECORD:
+                index, length = _STRING_HEADER.unpack(
+                    f.read(_STRING_HEADER.size))
+                strings[index] = f.read(length).decode()
+            elif tag == _EVENT_RECORD:
+                phase, name, category, args, ts, dur, tid = _EVENT.unpack(
+                    f.read(_EVENT.size))
+                events.append(TraceEvent(
+                    phase.decode(), strings[name], strings[category],
+                    ts, dur, tid,
+                    json.loads(strings[args]) if args else None))
+            else:
+                raise ValueError(f'Bad record {tag!r} in {path}')
+    return events
+
+
+_tracer: Optional[Tracer] = None
+
+
+def enable(max_events: int = DEFAULT_MAX_EVENTS) -> Tracer:
+    """ Start recording spans into a new :py:class:`Tracer`, returning it """
+    global _tracer
+    _tracer = Tracer(max_events)
+    return _tracer
+
+
+def disable() -> Optional[Tracer]:
+    """ Stop recording spans, returning the tracer that was active if any """
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def write(tracer: Tracer, path: str) -> None:
+    """ Write a trace, in binary if the path ends in ``.bin`` and as a Chrome
+    trace otherwise
+    """
+    if path.endswith('.bin'):
+        tracer.write_binary(path)
+    else:
+        tracer.write_chrome_trace(path)
+
+
+@contextlib.contextmanager
+def recording(path: Optional[str]) -> Iterator[Optional[Tracer]]:
+    """ Trace everything run inside the block and write the trace to
+    ``path`` afterwards (see :py:func:`write`). If ``path`` is ``None``,
+    tracing is left off.
+    """
+    if path is None:
+        yield None
+        return
+    tracer = enable()
+    try:
+        yield tracer
+    finally:
+        disable()
+        # Don't leave spans open if the block raised
+        tracer.end_open_spans()
+        write(tracer, path)
+
+
+def begin(name: str, category: str, args: Dict[str, Any] = None) -> None:
+    """ Open a span that must be closed by :py:func:`end` on the same thread.
+    """
+    tracer = _tracer
+    if tracer is not None:
+        tracer.begin(name, category, args)
+
+
+def end(name: str, category: str) -> None:
+    tracer = _tracer
+    if tracer is not None:
+        tracer.end(name, category)
+
+
+class _Span:
+    __slots__ = ('_tracer', '_name', '_category', '_args', '_start')
+
+    def __init__(self, tracer: Tracer, name: str, category: str,
+                 args: Optional[Dict[str, Any]]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start = 0
+
+    def __enter__(self) -> '_Span':
+        self._start = time.monotonic_ns()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._tracer.complete(
+            self._name, self._category, self._start, time.monotonic_ns(),
+            self._args)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, category: str, args: Dict[str, Any] = None) -> Any:
+    """ A context manager that records the time spent inside it as a span.
+
+    Unlike :py:func:`begin` and :py:func:`end`, spans made this way may be
+    used in coroutines that interleave on one thread.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, category, args)
+
+
+def traced(category: str, name: str = None) -> Callable[[Func], Func]:
+    """ Decorate a function or coroutine function to record each call as a
+    span named after it
+    """
+    def decorator(func: Func) -> Func:
+        span_name = name or func.__qualname__
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if _tracer is None:
+                    return await func(*args, **kwargs)
+                with span(span_name, category):
+                    return await func(*args, **kwargs)
+            return cast(Func, async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with span(span_name, category):
+                return func(*args, **kwargs)
+        return cast(Func, wrapper)
+
+    return decorator
+
+
+def spans(events: List[TraceEvent], category: str = None
+          ) -> Iterator[TraceEvent]:
+    """ Iterate over the complete spans (including begin/end pairs, which are
+    joined) in ``events``, optionally only of one category
+    """
+    open_spans: Dict[int, List[TraceEvent]] = collections.defaultdict(list)
+    for event in events:
+        if event.phase == 'B':
+            open_spans[event.thread_id].append(event)
+            continue
+        if event.phase == 'E':
+            stack = open_spans[event.thread_id]
+            if not stack:
+                continue
+            started = stack.pop()
+            event = started._replace(
+                phase='X',
+                duration_ns=event.timestamp_ns - started.timestamp_ns)
+        if category is None or event.category == category:
+            yield event
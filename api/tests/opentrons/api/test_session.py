@@ -8,6 +8,7 @@ from opentrons.api import session
 from opentrons.api.session import (
     _accumulate, _dedupe)
 from opentrons.hardware_control import ThreadedAsyncForbidden
+from opentrons.hardware_control.simulator_pool import SimulatorPool
 
 from tests.opentrons.conftest import state
 from functools import partial
@@ -199,6 +200,24 @@ async def test_requested_as(session_manager, protocol, protocol_file):
     assert session.get_instruments()[0].requested_as == 'p300_single_gen2'
 
 
+@pytest.mark.parametrize('protocol_file', ['testosaur_v2.py'])
+async def test_simulation_hardware_reused(
+        session_manager, protocol, protocol_file, monkeypatch):
+    pool = SimulatorPool()
+    monkeypatch.setattr(session, 'get_default_pool', lambda: pool)
+    try:
+        sess = session_manager.create(name='<blank>', contents=protocol.text)
+        assert pool.idle_count == 1
+        [(_, simulator)] = pool._idle
+        commands = sess.commands
+        sess.refresh()
+        [(_, reused)] = pool._idle
+        assert reused is simulator
+        assert sess.commands == commands
+    finally:
+        pool.clear()
+
+
 # TODO(artyom 20171018): design a small protocol specifically for the test
 @pytest.mark.parametrize('protocol_file', ['bradford_assay.py'])
 async def test_drop_tip_with_trash(session_manager, protocol, protocol_file):
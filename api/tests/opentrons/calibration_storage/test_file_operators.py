@@ -0,0 +1,88 @@
+import json
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from opentrons.calibration_storage import file_operators as io
+
+
+@pytest.fixture
+def cal_dir(ot_config_tempdir, tmp_path):
+    io.journal_path().parent.mkdir(parents=True, exist_ok=True)
+    directory = tmp_path / 'calibrations'
+    directory.mkdir()
+    return directory
+
+
+def test_save_atomic(cal_dir):
+    path = cal_dir / 'cal.json'
+    io.save_to_file(path, {'a': 1})
+    io.save_to_file(path, {'a': 2, 'lastModified': datetime(2020, 1, 1)})
+    assert io.read_cal_file(path) == {
+        'a': 2, 'lastModified': datetime(2020, 1, 1)}
+    assert os.listdir(cal_dir) == ['cal.json']
+
+
+def test_save_failure_keeps_old_contents(cal_dir):
+    path = cal_dir / 'cal.json'
+    io.save_to_file(path, {'a': 1})
+    with patch('os.fsync', side_effect=OSError('disk gone')):
+        with pytest.raises(OSError):
+            io.save_to_file(path, {'a': 2})
+    assert io.read_cal_file(path) == {'a': 1}
+    assert os.listdir(cal_dir) == ['cal.json']
+
+
+def test_batch(cal_dir):
+    index = cal_dir / 'index.json'
+    data = cal_dir / 'data.json'
+    with io.batch():
+        io.save_to_file(index, {'ids': [1]})
+        with io.batch():
+            blob = io.read_cal_file(index)
+            blob['ids'].append(2)
+            io.save_to_file(index, blob)
+        io.save_to_file(data, {'value': 3})
+        assert not index.exists()
+        assert not data.exists()
+    assert io.read_cal_file(index) == {'ids': [1, 2]}
+    assert io.read_cal_file(data) == {'value': 3}
+    assert not io.journal_path().exists()
+
+
+def test_failed_batch_writes_nothing(cal_dir):
+    path = cal_dir / 'cal.json'
+    with pytest.raises(RuntimeError):
+        with io.batch():
+            io.save_to_file(path, {'a': 1})
+            raise RuntimeError('cancelled')
+    assert not path.exists()
+    # Later saves are not batched
+    io.save_to_file(path, {'a': 2})
+    assert io.read_cal_file(path) == {'a': 2}
+
+
+def test_replay_journal(cal_dir):
+    assert not io.replay_journal()
+
+    first = cal_dir / 'first.json'
+    second = cal_dir / 'second.json'
+    io.save_to_file(first, {'old': True})
+    # A commit interrupted after the journal was written
+    io.journal_path().write_text(json.dumps({'files': {
+        str(first): json.dumps({'new': True}),
+        str(second): json.dumps({'new': True}),
+    }}))
+
+    assert io.replay_journal()
+    assert io.read_cal_file(first) == {'new': True}
+    assert io.read_cal_file(second) == {'new': True}
+    assert not io.journal_path().exists()
+
+
+def test_replay_unreadable_journal(cal_dir):
+    io.journal_path().write_text('{"files": {"/some/pa')
+    assert not io.replay_journal()
+    assert not io.journal_path().exists()
@@ -29,7 +29,7 @@ def model2():
 @pytest.fixture
 def hw_with_pipettes(monkeypatch, sync_hardware, model1, model2):
     if model1:
-        def fake_gai(expected):
+        def fake_gai(expected, force=False):
             return {
                 Mount.LEFT: {
                     'config': pc.load(model1[0]),
@@ -43,7 +43,7 @@ def hw_with_pipettes(monkeypatch, sync_hardware, model1, model2):
             fake_gai)
     elif model2:
 
-        def fake_gai(expected):
+        def fake_gai(expected, force=False):
             return {
                 Mount.LEFT: {'config': pc.load(model2[0]), 'id': 'fakeid'},
                 Mount.RIGHT: {'config': pc.load(model2[0]), 'id': 'fakeid2'}}
@@ -1,7 +1,10 @@
 from math import pi, sin, cos
-from opentrons.util.linal import solve, add_z, apply_transform
+from opentrons.util.linal import (
+    solve, add_z, apply_transform, apply_transforms, fit_affine,
+    fit_attitude, solve_attitude, exceeds_thresholds)
 from numpy.linalg import inv
 import numpy as np
+import pytest
 
 
 def test_solve():
@@ -68,3 +71,57 @@ def test_apply_transform():
 
     result = apply_transform(inv(transform), (x, y, z))
     assert result == expected
+
+
+def test_fit_affine_least_squares():
+    expected = np.array([[0, 0], [100, 0], [0, 100], [100, 100], [50, 50]])
+    transform = np.array([
+        [1.001, 0.002, 0.5],
+        [-0.002, 0.999, -0.25],
+        [0, 0, 1]])
+    actual = apply_transforms(transform, expected)[:, :2]
+
+    fit = fit_affine(expected, actual)
+    assert np.allclose(fit.transform, transform)
+    assert np.allclose(fit.residuals, 0)
+    assert fit.condition_number > 1
+
+    # One bad point shows up in the residuals
+    actual[4] += (1, 0)
+    fit = fit_affine(expected, actual)
+    assert fit.residuals.argmax() == 4
+
+
+def test_fit_matches_solve_for_three_points():
+    expected = [(12.13, 9.0, 10.0), (380.87, 9.0, 12.0), (12.13, 258.0, 11.0)]
+    actual = [(12.5, 8.0, 10.1), (381.0, 9.5, 12.2), (12.0, 258.3, 11.0)]
+
+    ex = np.array(expected).transpose()
+    ac = np.array(actual).transpose()
+    exact = np.dot(ac, inv(ex))
+    attitude = np.array(solve_attitude(expected, actual))
+    assert np.allclose(attitude[:2, :2], exact[:2, :2].round(4))
+    assert np.array_equal(attitude[2], [0, 0, 1])
+    assert np.array_equal(attitude[:, 2], [0, 0, 1])
+
+    fit = fit_attitude(expected, actual)
+    assert fit.residuals.shape == (3,)
+
+
+def test_fit_rejects_bad_points():
+    with pytest.raises(ValueError):
+        fit_affine([(0, 0), (1, 0)], [(0, 0), (1, 0)])
+    with pytest.raises(ValueError):
+        fit_affine([(0, 0), (1, 0), (0, 1)], [(0, 0), (1, 0)])
+    with pytest.raises(np.linalg.LinAlgError):
+        fit_affine([(0, 0), (1, 1), (2, 2)], [(0, 0), (1, 1), (2, 2)])
+
+
+def test_exceeds_thresholds():
+    differences = [(1, 1, 5), (2, 2, 0), (5, 5, 0.5), (0, 0, 1)]
+    thresholds = [(1.8, 1.8, 0), (1.8, 1.8, 0), (0, 0, 0.8), (0, 0, 0.8)]
+    assert exceeds_thresholds(differences, thresholds).tolist() == [
+        False, True, False, True]
+    assert exceeds_thresholds(differences, (0, 0, 0.8)).tolist() == [
+        True, False, False, True]
+    assert exceeds_thresholds([], []).tolist() == []
@@ -53,6 +53,38 @@ def test_versioned_aspiration(pipette_model, monkeypatch):
     assert now.ul_per_mm['aspirate'] != was.ul_per_mm['aspirate']
 
 
+@pytest.mark.parametrize('pipette_model', pipette_config.config_models)
+def test_volume_conversion_table(pipette_model):
+    config = pipette_config.load(pipette_model)
+    for action, sequence in config.ul_per_mm.items():
+        table = pipette_config.VolumeConversionTable(sequence)
+        volumes = [0.5, config.max_volume] + [
+            v for piece in sequence for v in (piece[0], piece[0] + 0.001)
+            if v <= sequence[-1][0]]
+        expected = [pipette_config.piecewise_volume_conversion(v, sequence)
+                    for v in volumes]
+        assert [table.ul_per_mm(v) for v in volumes] == expected
+        assert table.ul_per_mm_array(volumes).tolist()\
+            == pytest.approx(expected)
+
+
+def test_volume_conversion_table_edges():
+    # The second piece can never be picked since the first one covers it
+    sequence = [[10, 1, 0], [5, 2, 0], [20, 3, 0]]
+    table = pipette_config.VolumeConversionTable(sequence)
+    for volume in (1, 5, 10, 10.5, 20):
+        assert table.ul_per_mm(volume)\
+            == pipette_config.piecewise_volume_conversion(volume, sequence)
+    assert table.ul_per_mm_array([[1, 15], [10, 20]]).tolist()\
+        == [[1, 45], [10, 60]]
+    with pytest.raises(IndexError):
+        table.ul_per_mm(21)
+    with pytest.raises(IndexError):
+        table.ul_per_mm_array([1, 21])
+    with pytest.raises(IndexError):
+        pipette_config.piecewise_volume_conversion(21, sequence)
+
+
 # TODO:
 # TODO: dispense agree
 @pytest.mark.parametrize('pipette_model', pipette_config.config_models)
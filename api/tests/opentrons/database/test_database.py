@@ -60,3 +60,45 @@ def test_invalid_container_name(robot):
     error_type = ValueError
     with pytest.raises(error_type):
         database.load_container("fake_container")
+
+
+@pytest.mark.api1_only
+def test_load_container_returns_independent_copies(robot):
+    first = database.load_container('96-flat')
+    second = database.load_container('96-flat')
+    assert first is not second
+    assert first[0] is not second[0]
+    assert [w.get_name() for w in first] == [w.get_name() for w in second]
+    assert first['B2'].coordinates() == second['B2'].coordinates()
+    assert first['B2'].properties == second['B2'].properties
+
+    first._coordinates = Vector(1, 2, 3)
+    first['A1'].properties['depth'] = 1000
+    third = database.load_container('96-flat')
+    assert third._coordinates == second._coordinates
+    assert third['A1'].properties == second['A1'].properties
+
+
+@pytest.mark.api1_only
+def test_container_cache_invalidated_on_change(robot):
+    lw_name = 'cache-test-plate'
+    if lw_name in database.list_all_containers():
+        database.delete_container(lw_name)
+    container = Container()
+    container.add(Well(properties={'diameter': 5, 'depth': 10}),
+                  'A1', (0, 0, 0))
+    database.save_new_container(container, lw_name)
+    try:
+        loaded = database.load_container(lw_name)
+        assert loaded._coordinates == Vector(0, 0, 0)
+
+        loaded.properties['type'] = lw_name
+        loaded._coordinates = Vector(5, 6, 7)
+        database.overwrite_container(loaded)
+        assert database.load_container(lw_name)._coordinates\
+            == Vector(5, 6, 7)
+    finally:
+        database.delete_container(lw_name)
+
+    with pytest.raises(ValueError):
+        database.load_container(lw_name)
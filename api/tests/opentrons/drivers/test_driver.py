@@ -570,6 +570,50 @@ def test_read_pipette_v13(smoothie, monkeypatch):
     assert res == 'p300_single_v1.3'
 
 
+def test_read_pipettes(smoothie, monkeypatch):
+    driver = smoothie
+    driver.simulating = False
+    memory = {
+        'L': {driver_3_0.GCODES['READ_INSTRUMENT_ID']: b'P3HSV2020',
+              driver_3_0.GCODES['READ_INSTRUMENT_MODEL']: b'p300_single_v2.0'},
+        'R': {driver_3_0.GCODES['READ_INSTRUMENT_ID']: b'P20MV2020',
+              driver_3_0.GCODES['READ_INSTRUMENT_MODEL']: b'p20_multi_v2.0'}}
+    sent = []
+
+    def _new_send_message(
+            command, timeout=None, suppress_error_msg=True):
+        sent.append(command)
+        for gcode in (driver_3_0.GCODES['READ_INSTRUMENT_ID'],
+                      driver_3_0.GCODES['READ_INSTRUMENT_MODEL']):
+            if command.startswith(gcode):
+                mount = command[len(gcode):]
+                return mount + ':' + driver_3_0._byte_array_to_hex_string(
+                    memory[mount][gcode])
+        return ''
+
+    monkeypatch.setattr(driver, '_send_command', _new_send_message)
+
+    found = driver.read_pipettes()
+    assert found == {'left': ('P3HSV2020', 'p300_single_v2.0'),
+                     'right': ('P20MV2020', 'p20_multi_v2.0')}
+    # The motors are disengaged and the lines left to settle only once
+    assert len([c for c in sent
+                if c.startswith(driver_3_0.GCODES['DWELL'])]) == 1
+    assert len(sent) == 6
+
+    # A pipette with a known serial number does not have its model read
+    # again, but a swapped one does
+    memory['R'][driver_3_0.GCODES['READ_INSTRUMENT_ID']] = b'P1KSV2020'
+    memory['R'][driver_3_0.GCODES['READ_INSTRUMENT_MODEL']]\
+        = b'p1000_single_v2.0'
+    sent.clear()
+    found = driver.read_pipettes(known=found)
+    assert found == {'left': ('P3HSV2020', 'p300_single_v2.0'),
+                     'right': ('P1KSV2020', 'p1000_single_v2.0')}
+    assert driver_3_0.GCODES['READ_INSTRUMENT_MODEL'] + 'L' not in sent
+    assert driver_3_0.GCODES['READ_INSTRUMENT_MODEL'] + 'R' in sent
+
+
 def test_fast_home(smoothie, monkeypatch):
     driver = smoothie
 
@@ -100,18 +100,13 @@ async def test_cache_instruments_hc(monkeypatch, dummy_instruments,
                                     running_on_pi, cntrlr_mock_connect, loop):
     hw_api_cntrlr = await hc.API.build_hardware_controller(loop=loop)
 
-    def mock_driver_model(mount):
-        attached_pipette = {'left': LEFT_PIPETTE_MODEL, 'right': None}
-        return attached_pipette[mount]
+    def mock_driver_read_pipettes(mounts, known=None):
+        attached_pipette = {'left': (LEFT_PIPETTE_ID, LEFT_PIPETTE_MODEL),
+                            'right': (None, None)}
+        return {mount: attached_pipette[mount] for mount in mounts}
 
-    def mock_driver_id(mount):
-        attached_pipette = {'left': LEFT_PIPETTE_ID, 'right': None}
-        return attached_pipette[mount]
-
-    monkeypatch.setattr(hw_api_cntrlr._backend._smoothie_driver,
-                        'read_pipette_model', mock_driver_model)
     monkeypatch.setattr(hw_api_cntrlr._backend._smoothie_driver,
-                        'read_pipette_id', mock_driver_id)
+                        'read_pipettes', mock_driver_read_pipettes)
 
     await hw_api_cntrlr.cache_instruments()
     attached = hw_api_cntrlr.attached_instruments
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from pathlib import Path
 from unittest import mock
 import pytest
@@ -59,6 +60,62 @@ async def test_module_caching():
     assert two_magdecks[1] is not two_magdecks[0]
 
 
+async def test_register_modules_concurrently(monkeypatch):
+    import opentrons.hardware_control as hardware_control
+    from opentrons.hardware_control import api as hc_api
+    api = await hardware_control.API.build_hardware_simulator()
+    monkeypatch.setattr(hc_api, 'MODULE_BUILD_TIMEOUT_S', 0.5)
+    build = api._backend.build_module
+    in_progress = 0
+    most_in_progress = 0
+
+    async def slow_build(port, model, **kwargs):
+        nonlocal in_progress, most_in_progress
+        in_progress += 1
+        most_in_progress = max(most_in_progress, in_progress)
+        try:
+            await asyncio.sleep(5 if 'stuck' in port else 0.05)
+            if 'broken' in port:
+                raise RuntimeError('no response')
+            return await build(port=port, model=model, **kwargs)
+        finally:
+            in_progress -= 1
+
+    monkeypatch.setattr(api._backend, 'build_module', slow_build)
+    await api.register_modules(new_mods_at_ports=[
+        ModuleAtPort(port='/dev/ot_module_sim_tempdeck0', name='tempdeck'),
+        ModuleAtPort(port='/dev/ot_module_sim_stuck1', name='magdeck'),
+        ModuleAtPort(port='/dev/ot_module_sim_broken2', name='magdeck'),
+        ModuleAtPort(port='/dev/ot_module_sim_magdeck3', name='magdeck'),
+    ])
+    assert most_in_progress == 4
+    # Modules that fail or time out are left out, the rest stay in order
+    assert [mod.port for mod in api.attached_modules] == [
+        '/dev/ot_module_sim_tempdeck0', '/dev/ot_module_sim_magdeck3']
+    # Only modules attached during hardware bring-up are timed
+    assert api.startup_timing == {}
+
+
+async def test_module_build_timeout_closes_port(monkeypatch, loop):
+    disconnected = asyncio.Event()
+
+    def slow_connect(self):
+        time.sleep(0.2)
+
+    monkeypatch.setattr(tempdeck.TempDeck, '_connect_driver', slow_connect)
+    monkeypatch.setattr(tempdeck.SimulatingDriver, 'disconnect',
+                        lambda self: disconnected.set())
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(tempdeck.TempDeck.build(
+            port='/dev/ot_module_sim_tempdeck0',
+            execution_manager=ExecutionManager(loop=loop),
+            simulating=True,
+            loop=loop), 0.05)
+    # The port is closed once the handshake that was given up on is done
+    assert not disconnected.is_set()
+    await asyncio.wait_for(disconnected.wait(), 1)
+
+
 async def test_module_update_integration(monkeypatch, loop):
     from opentrons.hardware_control import modules
 
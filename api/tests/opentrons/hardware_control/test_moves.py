@@ -1,3 +1,4 @@
+import asyncio
 from unittest import mock
 import pytest
 from opentrons import types
@@ -458,3 +459,68 @@ async def test_move_rel_bounds(
         await hardware_api.move_rel(
             types.Mount.RIGHT, types.Point(0, 0, 2000),
             check_bounds=MotionChecks.HIGH)
+
+
+async def test_cached_position_does_not_wait_for_motion(hardware_api, loop):
+    await hardware_api.home()
+    before = hardware_api.position_snapshot
+    homed = dict(before.position)
+    async with hardware_api._motion_lock:
+        # would hang if reading the cached position took the motion lock
+        position = await asyncio.wait_for(
+            hardware_api.current_position(types.Mount.RIGHT), 1)
+    assert position[Axis.X] == before.position[Axis.X]
+
+    await hardware_api.move_rel(types.Mount.RIGHT, types.Point(-10, 0, 0))
+    after = hardware_api.position_snapshot
+    assert after.generation == before.generation + 1
+    assert after.position[Axis.X] == before.position[Axis.X] - 10
+    # the old snapshot isn't changed by the move
+    assert before.position == homed
+
+
+async def test_refreshes_are_coalesced(hardware_api, loop):
+    await hardware_api.home()
+    update_position = mock.Mock(
+        side_effect=hardware_api._backend.update_position)
+    hardware_api._backend.update_position = update_position
+
+    async with hardware_api._motion_lock:
+        # refreshes wait for motion, so these all queue up behind the lock
+        refreshes = [
+            loop.create_task(hardware_api.current_position(
+                types.Mount.RIGHT, refresh=True))
+            for _ in range(5)]
+        await asyncio.sleep(0)
+    positions = await asyncio.gather(*refreshes)
+
+    assert update_position.call_count == 1
+    assert all(position == positions[0] for position in positions)
+
+    # a refresh asked for after that one finished reads again
+    await hardware_api.current_position(types.Mount.RIGHT, refresh=True)
+    assert update_position.call_count == 2
+
+
+async def test_cancelled_refresh_does_not_cancel_others(hardware_api, loop):
+    await hardware_api.home()
+    update_position = mock.Mock(
+        side_effect=hardware_api._backend.update_position)
+    hardware_api._backend.update_position = update_position
+
+    async with hardware_api._motion_lock:
+        first = loop.create_task(hardware_api.current_position(
+            types.Mount.RIGHT, refresh=True))
+        await asyncio.sleep(0)
+        second = loop.create_task(hardware_api.current_position(
+            types.Mount.RIGHT, refresh=True))
+        await asyncio.sleep(0)
+        # the caller that started the read goes away while it waits
+        first.cancel()
+        await asyncio.sleep(0)
+    position = await asyncio.wait_for(second, 1)
+
+    assert first.cancelled()
+    assert update_position.call_count == 1
+    assert position == await hardware_api.current_position(
+        types.Mount.RIGHT)
@@ -241,7 +241,7 @@ async def test_tip_action_currents(
         'set_active_current',
         mock_active_current)
 
-    def fake_attached(stuff):
+    def fake_attached(stuff, force=False):
         return {mount: {'config': pc.load(value['model']),
                         'id': value['id']}
                 for mount, value in dummy_instruments.items()}
@@ -197,3 +197,20 @@ def test_flow_rate_setting():
     assert pip.dispense_flow_rate == 3
     assert pip.blow_out_flow_rate == 4
     assert pip.config is config
+
+
+def test_ul_per_mm_tracks_config():
+    pip = pipette.Pipette(pipette_config.load('p300_single_v2.0'),
+                          {'single': [0, 0, 0], 'multi': [0, 0, 0]},
+                          PIP_CAL,
+                          'testID')
+    sequence = pip.config.ul_per_mm['aspirate']
+    assert pip.ul_per_mm(100, 'aspirate')\
+        == pipette_config.piecewise_volume_conversion(100, sequence)
+    assert pip.ul_per_mm_array([100, 200], 'aspirate').tolist()\
+        == pytest.approx([pip.ul_per_mm(100, 'aspirate'),
+                          pip.ul_per_mm(200, 'aspirate')])
+    pip.update_config_item(
+        'ul_per_mm', {'aspirate': [[300, 0, 10]], 'dispense': [[300, 0, 5]]})
+    assert pip.ul_per_mm(100, 'aspirate') == 10
+    assert pip.ul_per_mm(100, 'dispense') == 5
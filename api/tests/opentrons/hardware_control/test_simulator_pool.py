@@ -0,0 +1,49 @@
+from opentrons import types
+from opentrons.hardware_control.simulator_pool import SimulatorPool
+
+
+def test_simulators_reused_and_reset():
+    pool = SimulatorPool(max_idle=2)
+    instruments = {types.Mount.LEFT: {'model': 'p300_single_v2.0',
+                                      'id': 'P3HS'}}
+    try:
+        with pool.simulator(instruments, ['tempdeck']) as first:
+            module = first.attached_modules[0]
+            first.add_tip(types.Mount.LEFT, 50)
+            first.move_to(types.Mount.LEFT, types.Point(100, 100, 100))
+            assert first.attached_instruments[types.Mount.LEFT]['has_tip']
+            moved = first.gantry_position(types.Mount.LEFT)
+        assert pool.idle_count == 1
+
+        with pool.simulator(instruments, ['tempdeck']) as second:
+            assert second is first
+            assert pool.idle_count == 0
+            assert not second.attached_instruments[
+                types.Mount.LEFT]['has_tip']
+            assert second.gantry_position(types.Mount.LEFT) != moved
+            [new_module] = second.attached_modules
+            assert new_module is not module
+            assert new_module.name() == 'tempdeck'
+
+            # A different setup needs a different simulator
+            with pool.simulator(instruments, []) as third:
+                assert third is not second
+                assert not third.attached_modules
+        assert pool.idle_count == 2
+    finally:
+        pool.clear()
+    assert pool.idle_count == 0
+
+
+def test_least_recently_used_evicted():
+    pool = SimulatorPool(max_idle=1)
+    try:
+        with pool.simulator({}, ['magdeck']) as magdeck_sim:
+            pass
+        with pool.simulator({}, ['tempdeck']):
+            pass
+        assert pool.idle_count == 1
+        with pool.simulator({}, ['magdeck']) as again:
+            assert again is not magdeck_sim
+    finally:
+        pool.clear()
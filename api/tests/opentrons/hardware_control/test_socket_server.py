@@ -243,3 +243,122 @@ def test_serializers(paramtype, native, serializable):
     serdes = sockserv._SERDES[paramtype]
     assert serdes.serializer(native) == serializable
     assert serdes.deserializer(serializable) == native
+
+
+@pytest.mark.parametrize('framing', list(sockserv.Framing))
+def test_framers_split_messages(framing):
+    messages = ['{"a": "}{\\"]"}', '[1, {"b": [2]}]', '{"c": "é☃"}']
+    framer = sockserv.build_framer(framing)
+    data = b''.join(framer.frame(m) for m in messages)
+    received = []
+    # One byte at a time splits multibyte characters
+    for i in range(len(data)):
+        framer.feed(data[i:i+1])
+        message = framer.pop()
+        while message is not None:
+            received.append(message)
+            message = framer.pop()
+    assert received == messages
+    assert framer.remaining() == b''
+
+    framer.feed(data)
+    assert [framer.pop(), framer.pop(), framer.pop(), framer.pop()]\
+        == messages + [None]
+
+
+def test_concatenated_framer_drops_garbage():
+    framer = sockserv.ConcatenatedFramer()
+    framer.feed(b'garbage {"ok": true} more garbage {"incomp')
+    assert framer.pop() == '{"ok": true}'
+    assert framer.pop() is None
+    assert framer.remaining() == b'{"incomp'
+
+
+def test_length_framer_limit():
+    framer = sockserv.LengthPrefixedFramer(max_size=4)
+    framer.feed(framer.frame('{"too": "long"}'))
+    with pytest.raises(sockserv.FramingError):
+        framer.pop()
+
+
+@pytest.mark.parametrize('framing', [sockserv.Framing.newline,
+                                     sockserv.Framing.length])
+async def test_negotiate_framing(hc_stream_server, loop, framing):
+    sock, server = hc_stream_server
+    reader, writer = await asyncio.open_unix_connection(sock)
+    decoder = sockserv.JsonStreamDecoder(reader)
+    assert await sockserv.negotiate_framing(
+        decoder, writer, ['nonsense', framing]) == framing
+    assert decoder.framing == framing
+    writer.write(decoder.frame(json.dumps(
+        {'jsonrpc': '2.0', 'method': 'aouhsoashdas', 'id': 1})))
+    resp = await decoder.read_object()
+    assert resp['id'] == 1
+    assert resp['error']['code'] == -32601
+
+
+async def test_negotiate_framing_fallback(hc_stream_server, loop,
+                                          monkeypatch):
+    sock, server = hc_stream_server
+
+    async def old_dispatch(call_str):
+        return json.dumps({'jsonrpc': '2.0', 'id': json.loads(call_str)['id'],
+                           'error': {'code': -32601,
+                                     'message': 'Method not found'}})
+
+    # A server that doesn't know about framing passes it to dispatch
+    monkeypatch.setattr(sockserv.JsonRpcProtocol, '_negotiate',
+                        lambda self, message: False)
+    monkeypatch.setattr(server, '_dispatch', old_dispatch)
+    reader, writer = await asyncio.open_unix_connection(sock)
+    decoder = sockserv.JsonStreamDecoder(reader)
+    assert await sockserv.negotiate_framing(decoder, writer)\
+        == sockserv.Framing.concatenated
+    assert decoder.framing == sockserv.Framing.concatenated
+
+
+async def test_batch_and_pipelining(hc_stream_server, loop, monkeypatch):
+    sock, server = hc_stream_server
+    release = asyncio.Event()
+
+    async def fake_dispatch(call_str):
+        call = json.loads(call_str)
+        if isinstance(call, list):
+            return json.dumps([{'id': c['id'], 'result': 'batched'}
+                               for c in call])
+        if call['method'] == 'slow':
+            await release.wait()
+        return json.dumps({'id': call['id'], 'result': call['method']})
+
+    monkeypatch.setattr(server, '_dispatch', fake_dispatch)
+    reader, writer = await asyncio.open_unix_connection(sock)
+    decoder = sockserv.JsonStreamDecoder(reader)
+    await sockserv.negotiate_framing(decoder, writer,
+                                     [sockserv.Framing.newline])
+    # Everything in a single write
+    writer.write(b''.join(decoder.frame(json.dumps(c)) for c in [
+        {'method': 'slow', 'id': 1},
+        {'method': 'fast', 'id': 2},
+        [{'method': 'a', 'id': 3}, {'method': 'b', 'id': 4}]]))
+    await writer.drain()
+    first = await decoder.read_object()
+    second = await decoder.read_object()
+    assert sorted([first, second], key=lambda r: str(type(r))) == [
+        {'id': 2, 'result': 'fast'},
+        [{'id': 3, 'result': 'batched'}, {'id': 4, 'result': 'batched'}]]
+    release.set()
+    assert await decoder.read_object() == {'id': 1, 'result': 'slow'}
+
+
+async def test_real_batch(hc_stream_server, loop):
+    sock, server = hc_stream_server
+    reader, writer = await asyncio.open_unix_connection(sock)
+    decoder = sockserv.JsonStreamDecoder(reader)
+    writer.write(json.dumps([
+        {'jsonrpc': '2.0', 'method': 'delay',
+         'params': {'duration_s': 0}, 'id': 1},
+        {'jsonrpc': '2.0', 'method': 'delay', 'params': {'duration_s': 0}},
+        {'jsonrpc': '2.0', 'method': 'aouhsoashdas', 'id': 2}]).encode())
+    resp = sorted(await decoder.read_object(), key=lambda r: r['id'])
+    assert resp[0] == {'jsonrpc': '2.0', 'result': None, 'id': 1}
+    assert resp[1]['error']['code'] == -32601
@@ -1,6 +1,7 @@
 from typing import List
 
-from opentrons.hardware_control.util import plan_arc, check_motion_bounds
+from opentrons.hardware_control.util import (
+    plan_arc, check_motion_bounds, PhaseTimer)
 from opentrons.hardware_control.types import (
     CriticalPoint, MotionChecks, OutOfBoundsMove, Axis)
 from opentrons.types import Point
@@ -97,3 +98,19 @@ def test_check_motion_bounds(xformed, deck, bounds, check, catch, phrase):
             check_motion_bounds(xformed, deck, bounds, check)
     else:
         check_motion_bounds(xformed, deck, bounds, check)
+
+
+def test_phase_timer():
+    timer = PhaseTimer()
+    assert timer.report() == 'no phases recorded'
+    with timer.phase('outer'):
+        with timer.phase('inner'):
+            pass
+    with pytest.raises(RuntimeError):
+        with timer.phase('failed'):
+            raise RuntimeError()
+    durations = timer.durations
+    assert list(durations) == ['inner', 'outer', 'failed']
+    assert durations['inner'] <= durations['outer']
+    assert timer.report().startswith('0.')
+    assert 'outer' in timer.report()
@@ -178,3 +178,42 @@ async def test_executor_handles_unexpected_error(
     assert type(failed_cmd) == cmd.FailedCommand
     assert type(failed_cmd.error) == errors.UnexpectedProtocolError
     assert str(failed_cmd.error) == str(error)
+
+
+async def test_executor_prepares_load_labware(
+    executor: CommandExecutor,
+    mock_equipment_handler: AsyncMock,
+    mock_pipetting_handler: AsyncMock,
+) -> None:
+    """CommandExecutor should route preparations to the handlers."""
+    req = cmd.LoadLabwareRequest(
+        location=DeckSlotLocation(DeckSlotName.SLOT_1),
+        loadName="load-name",
+        namespace="opentrons-test",
+        version=1,
+    )
+
+    await executor.prepare_command(req)
+    await executor.prepare_command(cmd.MoveToWellRequest(
+        pipetteId="pipette-id",
+        labwareId="labware-id",
+        wellName="A1",
+    ))
+
+    mock_equipment_handler.prepare_load_labware.assert_called_once_with(req)
+
+
+async def test_executor_preparation_never_fails(
+    executor: CommandExecutor,
+    mock_equipment_handler: AsyncMock,
+) -> None:
+    """A failed preparation is left for execution to handle."""
+    mock_equipment_handler.prepare_load_labware.side_effect = \
+        errors.LabwareDoesNotExistError("oh no")
+
+    await executor.prepare_command(cmd.LoadLabwareRequest(
+        location=DeckSlotLocation(DeckSlotName.SLOT_1),
+        loadName="load-name",
+        namespace="opentrons-test",
+        version=1,
+    ))
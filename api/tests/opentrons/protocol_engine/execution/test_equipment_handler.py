@@ -105,6 +105,51 @@ async def test_load_labware_gets_labware_cal_data(
     )
 
 
+async def test_load_labware_uses_prepared_data(
+    mock_labware_data,
+    handler,
+    minimal_labware_def
+):
+    """A prepared LoadLabwareRequest should not fetch its data again."""
+    req = LoadLabwareRequest(
+        location=DeckSlotLocation(DeckSlotName.SLOT_3),
+        loadName="load-name",
+        namespace="opentrons-test",
+        version=1
+    )
+    await handler.prepare_load_labware(req)
+    mock_labware_data.get_labware_definition.reset_mock()
+    mock_labware_data.get_labware_calibration.reset_mock()
+
+    res = await handler.handle_load_labware(req)
+
+    assert res.definition == minimal_labware_def
+    assert res.calibration == (1, 2, 3)
+    mock_labware_data.get_labware_definition.assert_not_called()
+    mock_labware_data.get_labware_calibration.assert_not_called()
+
+    # prepared data is only used once
+    await handler.handle_load_labware(req)
+    mock_labware_data.get_labware_definition.assert_called_once()
+
+
+async def test_load_labware_discard_prepared(mock_labware_data, handler):
+    """Discarded preparations should not be used."""
+    req = LoadLabwareRequest(
+        location=DeckSlotLocation(DeckSlotName.SLOT_3),
+        loadName="load-name",
+        namespace="opentrons-test",
+        version=1
+    )
+    await handler.prepare_load_labware(req)
+    handler.discard_prepared()
+    mock_labware_data.get_labware_definition.reset_mock()
+
+    await handler.handle_load_labware(req)
+
+    mock_labware_data.get_labware_definition.assert_called_once()
+
+
 async def test_load_pipette_assigns_id(
     mock_id_generator,
     handler
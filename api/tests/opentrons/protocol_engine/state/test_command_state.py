@@ -26,3 +26,35 @@ def test_state_store_handles_command(store: StateStore, now: datetime) -> None:
     store.handle_command(cmd, command_id="unique-id")
 
     assert store.commands.get_command_by_id("unique-id") == cmd
+
+
+def _pending_load(now: datetime, slot: DeckSlotName) -> PendingCommand:
+    return PendingCommand[LoadLabwareRequest, LoadLabwareResult](
+        created_at=now,
+        request=LoadLabwareRequest(
+            loadName="load-name",
+            namespace="opentrons-test",
+            version=1,
+            location=DeckSlotLocation(slot),
+        )
+    )
+
+
+def test_get_commands_paginated(store: StateStore, now: datetime) -> None:
+    """It should return pages of commands in the order they were added."""
+    commands = [
+        (f"command-{i}", _pending_load(now, slot))
+        for i, slot in enumerate(DeckSlotName)
+    ]
+    for command_id, command in commands:
+        store.handle_command(command, command_id=command_id)
+    # updating a command keeps its place
+    store.handle_command(commands[1][1], command_id="command-0")
+
+    assert store.commands.get_command_count() == len(commands)
+    assert store.commands.get_commands(offset=2, limit=3) == commands[2:5]
+    assert store.commands.get_commands(offset=10) == commands[10:]
+    assert store.commands.get_commands(offset=20, limit=5) == []
+    assert store.commands.get_all_commands() == [
+        ("command-0", commands[1][1]), *commands[1:]
+    ]
@@ -1,6 +1,5 @@
 """Test state getters for retrieving geometry views of state."""
 import pytest
-from mock import MagicMock
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
 from opentrons_shared_data.labware.dev_types import LabwareDefinition
@@ -8,25 +7,8 @@ from opentrons.types import Point, DeckSlotName
 
 from opentrons.protocol_engine import StateStore, errors
 from opentrons.protocol_engine.types import DeckSlotLocation
-from opentrons.protocol_engine.state import LabwareData
-from opentrons.protocol_engine.state.labware import LabwareStore
-from opentrons.protocol_engine.state.geometry import GeometryStore
 
-
-@pytest.fixture
-def mock_labware_store() -> MagicMock:
-    return MagicMock(spec=LabwareStore)
-
-
-@pytest.fixture
-def geometry_store(
-    mock_labware_store: MagicMock,
-    standard_deck_def: DeckDefinitionV2,
-) -> GeometryStore:
-    return GeometryStore(
-        labware_store=mock_labware_store,
-        deck_definition=standard_deck_def,
-    )
+from .test_labware_state import load_labware
 
 
 def test_get_deck_definition(
@@ -75,101 +57,175 @@ def test_get_slot_position(
 def test_get_labware_highest_z(
     standard_deck_def: DeckDefinitionV2,
     well_plate_def: LabwareDefinition,
-    mock_labware_store: MagicMock,
-    geometry_store: GeometryStore,
+    store: StateStore,
 ) -> None:
     """It should get the absolute location of a labware's highest Z point."""
-    labware_data = LabwareData(
-        definition=well_plate_def,
+    load_labware(
+        store=store,
+        labware_id="labware-id",
         location=DeckSlotLocation(DeckSlotName.SLOT_3),
-        calibration=(1, -2, 3)
+        definition=well_plate_def,
+        calibration=(1, -2, 3),
     )
+    slot_pos = store.geometry.get_slot_position(DeckSlotName.SLOT_3)
 
-    mock_labware_store.state.get_labware_data_by_id.return_value = labware_data
-    slot_pos = geometry_store.state.get_slot_position(DeckSlotName.SLOT_3)
-
-    highest_z = geometry_store.state.get_labware_highest_z("labware-id")
+    highest_z = store.geometry.get_labware_highest_z("labware-id")
 
-    mock_labware_store.state.get_labware_data_by_id.assert_called_with(
-        "labware-id"
-    )
     assert highest_z == (
-        labware_data.definition["dimensions"]["zDimension"] +
+        well_plate_def["dimensions"]["zDimension"] +
         slot_pos[2] +
         3
     )
 
 
+def test_get_labware_highest_z_raises_with_bad_id(store: StateStore) -> None:
+    """It should raise a LabwareDoesNotExistError for unknown labware."""
+    with pytest.raises(errors.LabwareDoesNotExistError):
+        store.geometry.get_labware_highest_z("not-loaded")
+
+
 def test_get_all_labware_highest_z(
     standard_deck_def: DeckDefinitionV2,
     well_plate_def: LabwareDefinition,
     reservoir_def: LabwareDefinition,
-    mock_labware_store: MagicMock,
-    geometry_store: GeometryStore,
+    store: StateStore,
 ) -> None:
     """It should get the highest Z amongst all labware."""
-    plate_data = LabwareData(
-        definition=well_plate_def,
+    assert store.geometry.get_all_labware_highest_z() == 0
+
+    load_labware(
+        store=store,
+        labware_id="plate-id",
         location=DeckSlotLocation(DeckSlotName.SLOT_3),
-        calibration=(1, -2, 3)
+        definition=well_plate_def,
+        calibration=(1, -2, 3),
     )
-    reservoir_data = LabwareData(
-        definition=reservoir_def,
+    load_labware(
+        store=store,
+        labware_id="reservoir-id",
         location=DeckSlotLocation(DeckSlotName.SLOT_4),
-        calibration=(1, -2, 3)
+        definition=reservoir_def,
+        calibration=(1, -2, 3),
     )
 
-    def mock_get_lw_by_id(labware_id: str) -> LabwareData:
-        if labware_id == "plate-id":
-            return plate_data
-        elif labware_id == "reservoir-id":
-            return reservoir_data
-        else:
-            raise ValueError(f"unexpected labware {labware_id}")
-
-    mock_labware_store.state.get_labware_data_by_id.side_effect = \
-        mock_get_lw_by_id
-    mock_labware_store.state.get_all_labware.return_value = [
-        ("plate-id", plate_data),
-        ("reservoir-id", reservoir_data),
-    ]
-
-    plate_z = geometry_store.state.get_labware_highest_z("plate-id")
-    reservoir_z = geometry_store.state.get_labware_highest_z("reservoir-id")
-    all_z = geometry_store.state.get_all_labware_highest_z()
+    plate_z = store.geometry.get_labware_highest_z("plate-id")
+    reservoir_z = store.geometry.get_labware_highest_z("reservoir-id")
+    all_z = store.geometry.get_all_labware_highest_z()
 
     assert all_z == max(plate_z, reservoir_z)
 
 
+def test_get_all_labware_highest_z_after_reload(
+    well_plate_def: LabwareDefinition,
+    reservoir_def: LabwareDefinition,
+    store: StateStore,
+) -> None:
+    """It should forget the old height of labware that is loaded again."""
+    for labware_id, definition in (("plate-id", well_plate_def),
+                                   ("reservoir-id", reservoir_def)):
+        load_labware(
+            store=store,
+            labware_id=labware_id,
+            location=DeckSlotLocation(DeckSlotName.SLOT_1),
+            definition=definition,
+            calibration=(0, 0, 0),
+        )
+    highest_id = max(
+        ("plate-id", "reservoir-id"),
+        key=store.geometry.get_labware_highest_z
+    )
+    lowest_id = ({"plate-id", "reservoir-id"} - {highest_id}).pop()
+
+    load_labware(
+        store=store,
+        labware_id=highest_id,
+        location=DeckSlotLocation(DeckSlotName.SLOT_1),
+        definition=store.labware.get_labware_data_by_id(lowest_id).definition,
+        calibration=(0, 0, -10),
+    )
+
+    assert store.geometry.get_all_labware_highest_z() == \
+        store.geometry.get_labware_highest_z(lowest_id)
+
+
+def test_get_all_labware_highest_z_many_labware(
+    well_plate_def: LabwareDefinition,
+    reservoir_def: LabwareDefinition,
+    store: StateStore,
+) -> None:
+    """It should track the highest Z through a long stream of loads."""
+    expected = 0.0
+    for i in range(500):
+        load_labware(
+            store=store,
+            labware_id=f"labware-{i}",
+            location=DeckSlotLocation(DeckSlotName(i % 11 + 1)),
+            definition=well_plate_def if i % 2 else reservoir_def,
+            calibration=(0, 0, (i * 37) % 101 / 10),
+        )
+        expected = max(
+            expected,
+            store.geometry.get_labware_highest_z(f"labware-{i}")
+        )
+        assert store.geometry.get_all_labware_highest_z() == expected
+
+    # reload the highest labware well below everything else
+    highest_id = max(
+        (f"labware-{i}" for i in range(500)),
+        key=store.geometry.get_labware_highest_z
+    )
+    load_labware(
+        store=store,
+        labware_id=highest_id,
+        location=DeckSlotLocation(DeckSlotName.SLOT_1),
+        definition=well_plate_def,
+        calibration=(0, 0, -100),
+    )
+    assert store.geometry.get_all_labware_highest_z() == max(
+        store.geometry.get_labware_highest_z(f"labware-{i}")
+        for i in range(500)
+    )
+
+
 def test_get_well_position(
     well_plate_def: LabwareDefinition,
     standard_deck_def: DeckDefinitionV2,
-    mock_labware_store: MagicMock,
-    geometry_store: GeometryStore,
+    store: StateStore,
 ) -> None:
     """It should be able to get the position of a well top in a labware."""
-    labware_data = LabwareData(
-        definition=well_plate_def,
+    load_labware(
+        store=store,
+        labware_id="plate-id",
         location=DeckSlotLocation(DeckSlotName.SLOT_3),
-        calibration=(1, -2, 3)
+        definition=well_plate_def,
+        calibration=(1, -2, 3),
     )
     well_def = well_plate_def["wells"]["B2"]
 
-    mock_labware_store.state.get_labware_data_by_id.return_value = labware_data
-    mock_labware_store.state.get_well_definition.return_value = well_def
-
-    point = geometry_store.state.get_well_position("plate-id", "B2")
+    point = store.geometry.get_well_position("plate-id", "B2")
     slot_pos = standard_deck_def["locations"]["orderedSlots"][2]["position"]
 
-    mock_labware_store.state.get_labware_data_by_id.assert_called_with(
-        "plate-id"
-    )
-    mock_labware_store.state.get_well_definition.assert_called_with(
-        "plate-id",
-        "B2"
-    )
     assert point == Point(
         x=slot_pos[0] + 1 + well_def["x"],
         y=slot_pos[1] - 2 + well_def["y"],
         z=slot_pos[2] + 3 + well_def["z"] + well_def["depth"],
     )
+
+
+def test_get_well_position_raises_with_bad_ids(
+    well_plate_def: LabwareDefinition,
+    store: StateStore,
+) -> None:
+    """It should raise if the labware or the well does not exist."""
+    load_labware(
+        store=store,
+        labware_id="plate-id",
+        location=DeckSlotLocation(DeckSlotName.SLOT_3),
+        definition=well_plate_def,
+        calibration=(1, -2, 3),
+    )
+
+    with pytest.raises(errors.LabwareDoesNotExistError):
+        store.geometry.get_well_position("not-loaded", "B2")
+    with pytest.raises(errors.WellDoesNotExistError):
+        store.geometry.get_well_position("plate-id", "Z42")
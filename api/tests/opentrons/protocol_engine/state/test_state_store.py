@@ -0,0 +1,191 @@
+"""Tests for state snapshots and earlier revisions."""
+import pytest
+from datetime import datetime, timezone
+from typing import Any
+
+from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
+from opentrons_shared_data.labware.dev_types import LabwareDefinition
+from opentrons.types import DeckSlotName, MountType
+
+from opentrons.protocol_engine import command_models as cmd, errors, StateStore
+from opentrons.protocol_engine.state import LocationData
+from opentrons.protocol_engine.types import DeckSlotLocation
+
+
+def completed(request: Any, result: Any) -> cmd.CompletedCommand:
+    now = datetime.now(tz=timezone.utc)
+    return cmd.CompletedCommand(
+        created_at=now,
+        started_at=now,
+        completed_at=now,
+        request=request,
+        result=result,
+    )
+
+
+def load_labware(
+    store: StateStore,
+    labware_id: str,
+    slot: DeckSlotName,
+    definition: LabwareDefinition,
+) -> None:
+    request = cmd.LoadLabwareRequest(
+        loadName="load-name",
+        namespace="opentrons-test",
+        version=1,
+        location=DeckSlotLocation(slot),
+    )
+    result = cmd.LoadLabwareResult(
+        labwareId=labware_id,
+        definition=definition,
+        calibration=(0, 0, 0),
+    )
+    store.handle_command(
+        cmd.RunningCommand[cmd.LoadLabwareRequest, cmd.LoadLabwareResult](
+            created_at=datetime.now(tz=timezone.utc),
+            started_at=datetime.now(tz=timezone.utc),
+            request=request,
+        ),
+        f"load-{labware_id}",
+    )
+    store.handle_command(completed(request, result), f"load-{labware_id}")
+
+
+def move_to_well(store: StateStore, labware_id: str, well_name: str) -> None:
+    request = cmd.MoveToWellRequest(
+        pipetteId="pipette-id",
+        labwareId=labware_id,
+        wellName=well_name,
+    )
+    store.handle_command(
+        completed(request, cmd.MoveToWellResult()),
+        f"move-{labware_id}-{well_name}",
+    )
+
+
+@pytest.fixture
+def loaded_store(
+    standard_deck_def: DeckDefinitionV2,
+    well_plate_def: LabwareDefinition,
+) -> StateStore:
+    store = StateStore(deck_definition=standard_deck_def, checkpoint_interval=4)
+    store.handle_command(
+        completed(
+            cmd.LoadPipetteRequest(
+                pipetteName="p300_single", mount=MountType.LEFT
+            ),
+            cmd.LoadPipetteResult(pipetteId="pipette-id"),
+        ),
+        "load-pipette",
+    )
+    load_labware(store, "plate-1", DeckSlotName.SLOT_1, well_plate_def)
+    move_to_well(store, "plate-1", "A1")
+    load_labware(store, "plate-2", DeckSlotName.SLOT_2, well_plate_def)
+    move_to_well(store, "plate-2", "B1")
+    return store
+
+
+def test_snapshot_does_not_change(
+    loaded_store: StateStore,
+    well_plate_def: LabwareDefinition,
+) -> None:
+    """A snapshot should not see commands handled after it was taken."""
+    snapshot = loaded_store.get_snapshot()
+    assert loaded_store.get_snapshot() is snapshot
+    highest_z = snapshot.geometry.get_all_labware_highest_z()
+
+    load_labware(loaded_store, "plate-3", DeckSlotName.SLOT_3, well_plate_def)
+    move_to_well(loaded_store, "plate-3", "C1")
+
+    assert loaded_store.get_snapshot() is not snapshot
+    assert loaded_store.commands.get_command_count() == 7
+    assert snapshot.commands.get_command_count() == 5
+    assert snapshot.commands.get_command_by_id("load-plate-3") is None
+    assert len(snapshot.labware.get_all_labware()) == 2
+    assert snapshot.motion.get_current_location_data() == LocationData(
+        pipette_id="pipette-id", labware_id="plate-2", well_name="B1"
+    )
+    assert snapshot.geometry.get_all_labware_highest_z() == highest_z
+    # snapshot getters that look at other substates use the snapshot's
+    with pytest.raises(errors.LabwareDoesNotExistError):
+        snapshot.geometry.get_well_position("plate-3", "A1")
+
+
+@pytest.mark.parametrize("revision", range(8))
+def test_get_state_at(loaded_store: StateStore, revision: int) -> None:
+    """It should rebuild each revision to match a snapshot taken then."""
+    snapshots = []
+    store = StateStore(
+        deck_definition=loaded_store.geometry.get_deck_definition(),
+        checkpoint_interval=4,
+    )
+    snapshots.append(store.get_snapshot())
+    for command_id, command in loaded_store.commands._log:
+        store.handle_command(command, command_id)
+        snapshots.append(store.get_snapshot())
+
+    expected = snapshots[revision]
+    state = loaded_store.get_state_at(revision)
+
+    assert state.commands.revision == revision
+    assert state.commands.get_all_commands() == \
+        expected.commands.get_all_commands()
+    assert state.labware.get_all_labware() == \
+        expected.labware.get_all_labware()
+    assert state.pipettes.get_all_pipettes() == \
+        expected.pipettes.get_all_pipettes()
+    assert state.geometry.get_all_labware_highest_z() == \
+        expected.geometry.get_all_labware_highest_z()
+    assert state.motion.get_current_location_data() == \
+        expected.motion.get_current_location_data()
+
+
+def test_get_state_at_does_not_change_store(loaded_store: StateStore) -> None:
+    """Rebuilding an earlier revision should leave the store alone."""
+    before = loaded_store.get_snapshot()
+    loaded_store.get_state_at(3)
+
+    assert loaded_store.revision == 7
+    assert loaded_store.get_snapshot() is before
+    assert len(loaded_store.labware.get_all_labware()) == 2
+
+
+@pytest.mark.parametrize("revision", [-1, 8])
+def test_get_state_at_bad_revision(
+    loaded_store: StateStore,
+    revision: int
+) -> None:
+    """It should raise for revisions that don't exist yet."""
+    with pytest.raises(errors.StateRevisionDoesNotExistError):
+        loaded_store.get_state_at(revision)
+
+
+def test_get_state_at_pruned_revision(
+    standard_deck_def: DeckDefinitionV2,
+    well_plate_def: LabwareDefinition,
+) -> None:
+    """It should only keep the last few checkpoints."""
+    store = StateStore(
+        deck_definition=standard_deck_def,
+        checkpoint_interval=2,
+        max_checkpoints=2,
+    )
+    load_labware(store, "plate-1", DeckSlotName.SLOT_1, well_plate_def)
+    load_labware(store, "plate-2", DeckSlotName.SLOT_2, well_plate_def)
+    load_labware(store, "plate-3", DeckSlotName.SLOT_3, well_plate_def)
+
+    # checkpoints at revisions 4 and 6 are kept
+    assert store.revision == 6
+    for revision in range(4):
+        with pytest.raises(errors.StateRevisionPrunedError):
+            store.get_state_at(revision)
+
+    # plate-3 is still running at revision 5
+    state = store.get_state_at(5)
+    assert [lw[0] for lw in state.labware.get_all_labware()] == \
+        ["plate-1", "plate-2"]
+    assert state.commands.get_command_by_id("load-plate-3") == \
+        store.commands._log[4][1]
+    # the command history itself is not pruned
+    assert [c[0] for c in store.commands.get_all_commands()] == \
+        ["load-plate-1", "load-plate-2", "load-plate-3"]
@@ -1,16 +1,18 @@
 """Tests for the ProtocolEngine class."""
+import asyncio
 from datetime import datetime, timezone, timedelta
 from math import isclose
 from mock import AsyncMock, MagicMock  # type: ignore[attr-defined]
-from typing import cast
+from typing import Any, List, cast
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV2
-from opentrons.protocol_engine import ProtocolEngine
+from opentrons.protocol_engine import ProtocolEngine, errors
 from opentrons.protocol_engine.command_models import (
     MoveToWellRequest,
     MoveToWellResult,
     RunningCommand,
-    CompletedCommand
+    CompletedCommand,
+    FailedCommand,
 )
 
 
@@ -101,3 +103,89 @@ async def test_execute_command_adds_result_to_state(
         completed_cmd,
         command_id="unique-id",
     )
+
+
+def move_requests(count: int) -> List[Any]:
+    return [
+        (
+            MoveToWellRequest(
+                pipetteId="123",
+                labwareId="abc",
+                wellName=f"A{i + 1}"
+            ),
+            f"command-{i}",
+        )
+        for i in range(count)
+    ]
+
+
+async def test_execute_commands_pipelines_preparation(
+    engine: ProtocolEngine,
+    mock_executor: AsyncMock,
+    mock_state_store: MagicMock,
+) -> None:
+    """It should prepare the next command while executing one."""
+    requests = move_requests(3)
+    events: List[Any] = []
+
+    async def prepare_command(request: MoveToWellRequest) -> None:
+        events.append(("prepare", request.wellName))
+
+    async def execute_command(command: Any) -> Any:
+        # let preparations run while "moving"
+        await asyncio.sleep(0)
+        events.append(("execute", command.request.wellName))
+        return command.to_completed(MoveToWellResult(), datetime.now())
+
+    mock_executor.prepare_command.side_effect = prepare_command
+    mock_executor.execute_command.side_effect = execute_command
+
+    results = [r async for r in engine.execute_commands(requests)]
+
+    assert [r.request for r in results] == [req for req, _ in requests]
+    assert events == [
+        ("prepare", "A1"),
+        ("prepare", "A2"),
+        ("execute", "A1"),
+        ("prepare", "A3"),
+        ("execute", "A2"),
+        ("execute", "A3"),
+    ]
+    stored = [
+        (c[0][0].request.wellName, type(c[0][0]), c[1]["command_id"])
+        for c in mock_state_store.handle_command.call_args_list
+    ]
+    assert stored == [
+        ("A1", RunningCommand, "command-0"),
+        ("A1", CompletedCommand, "command-0"),
+        ("A2", RunningCommand, "command-1"),
+        ("A2", CompletedCommand, "command-1"),
+        ("A3", RunningCommand, "command-2"),
+        ("A3", CompletedCommand, "command-2"),
+    ]
+
+
+async def test_execute_commands_stops_after_failure(
+    engine: ProtocolEngine,
+    mock_executor: AsyncMock,
+) -> None:
+    """It should not execute commands after a failed one."""
+    requests = move_requests(4)
+
+    async def execute_command(command: Any) -> Any:
+        if command.request.wellName == "A2":
+            return command.to_failed(
+                errors.FailedToPlanMoveError("oh no"),
+                datetime.now()
+            )
+        return command.to_completed(MoveToWellResult(), datetime.now())
+
+    mock_executor.execute_command.side_effect = execute_command
+
+    results = [
+        r async for r in engine.execute_commands(requests, lookahead=2)
+    ]
+
+    assert [type(r) for r in results] == [CompletedCommand, FailedCommand]
+    assert mock_executor.execute_command.call_count == 2
+    mock_executor.discard_prepared.assert_called_once()
@@ -13,6 +13,7 @@ from opentrons.protocol_api import (
 from opentrons.protocols.execution import execute
 from opentrons.protocols.execution.execute_json_v3 import (
     _aspirate, _dispense, _delay, _drop_tip, _blowout, dispatch_json,
+    compile_json,
     _pick_up_tip, _touch_tip, _air_gap, _move_to_slot,
     load_labware_from_json_defs, _get_well, _set_flow_rate,
     _get_location_with_offset, load_pipettes_from_json)
@@ -362,39 +363,51 @@ def test_dispatch_json():
         "moveToSlot": m._move_to_slot
     }
 
+    well = mock.sentinel.well
+    plate = mock.create_autospec(labware.Labware)
+    plate.wells_by_name.return_value = {'A1': well}
+    context = mock.MagicMock()
+    context.deck = {'1': mock.sentinel.slot}
+    instruments = {'pipetteId': mock.sentinel.pipette}
+    loaded_labware = {'plateId': plate}
+    access = {'pipette': 'pipetteId', 'labware': 'plateId', 'well': 'A1'}
+    liquid = {**access, 'volume': 10, 'flowRate': 3,
+              'offsetFromBottomMm': 1}
+
     with mock.patch(
         'opentrons.protocols.execution.execute_json_v3.dispatcher_map',
             new=mock_dispatcher_map):
         protocol_data = {'commands': [
-            {'command': 'delay', 'params': 'delay_params'},
-            {'command': 'blowout', 'params': 'blowout_params'},
-            {'command': 'pickUpTip', 'params': 'pickUpTip_params'},
-            {'command': 'dropTip', 'params': 'dropTip_params'},
-            {'command': 'aspirate', 'params': 'aspirate_params'},
-            {'command': 'dispense', 'params': 'dispense_params'},
-            {'command': 'touchTip', 'params': 'touchTip_params'},
-            {'command': 'moveToSlot', 'params': 'moveToSlot_params'},
+            {'command': 'delay', 'params': {'wait': 1}},
+            {'command': 'blowout', 'params': {**access, 'flowRate': 3}},
+            {'command': 'pickUpTip', 'params': access},
+            {'command': 'dropTip', 'params': access},
+            {'command': 'aspirate', 'params': liquid},
+            {'command': 'dispense', 'params': liquid},
+            {'command': 'touchTip',
+             'params': {**access, 'offsetFromBottomMm': 1}},
+            {'command': 'moveToSlot',
+             'params': {'pipette': 'pipetteId', 'slot': '1'}},
         ]}
-        context = mock.sentinel.context
-        instruments = mock.sentinel.instruments
-        loaded_labware = mock.sentinel.loaded_labware
         dispatch_json(
             context, protocol_data, instruments, loaded_labware)
 
+        wells = {'plateId': {'A1': well}}
         assert m.mock_calls == [
-            mock.call._delay(context, 'delay_params'),
-            mock.call._blowout(instruments, loaded_labware, 'blowout_params'),
-            mock.call._pick_up_tip(
-                instruments, loaded_labware, 'pickUpTip_params'),
-            mock.call._drop_tip(instruments, loaded_labware, 'dropTip_params'),
-            mock.call._aspirate(
-                instruments, loaded_labware, 'aspirate_params'),
-            mock.call._dispense(
-                instruments, loaded_labware, 'dispense_params'),
+            mock.call._delay(context, {'wait': 1}),
+            mock.call._blowout(
+                instruments, wells, {**access, 'flowRate': 3}),
+            mock.call._pick_up_tip(instruments, wells, access),
+            mock.call._drop_tip(instruments, wells, access),
+            mock.call._aspirate(instruments, wells, liquid),
+            mock.call._dispense(instruments, wells, liquid),
             mock.call._touch_tip(
-                instruments, loaded_labware, 'touchTip_params'),
-            mock.call._move_to_slot(context, instruments, 'moveToSlot_params')
+                instruments, wells, {**access, 'offsetFromBottomMm': 1}),
+            mock.call._move_to_slot(
+                context, instruments, {'pipette': 'pipetteId', 'slot': '1'})
         ]
+        # the well table is only built once per labware
+        plate.wells_by_name.assert_called_once_with()
 
 
 def test_dispatch_json_invalid_command():
@@ -407,6 +420,34 @@ def test_dispatch_json_invalid_command():
             loaded_labware=None)
 
 
+@pytest.mark.parametrize('bad_params', [
+    {'pipette': 'otherPipetteId', 'labware': 'plateId', 'well': 'A1'},
+    {'pipette': 'pipetteId', 'labware': 'otherPlateId', 'well': 'A1'},
+    {'pipette': 'pipetteId', 'labware': 'plateId', 'well': 'H12'},
+    {'pipette': 'pipetteId', 'labware': 'plateId', 'well': 'A1',
+     'volume': 10, 'offsetFromBottomMm': 1, 'flowRate': 0},
+])
+def test_compile_json_rejects_bad_references(bad_params):
+    m = mock.MagicMock()
+    plate = mock.create_autospec(labware.Labware)
+    plate.wells_by_name.return_value = {'A1': mock.sentinel.well}
+    good_params = {'pipette': 'pipetteId', 'labware': 'plateId',
+                   'well': 'A1'}
+    protocol_data = {'commands': [
+        {'command': 'pickUpTip', 'params': good_params},
+        {'command': 'aspirate', 'params': bad_params},
+    ]}
+    with mock.patch(
+        'opentrons.protocols.execution.execute_json_v3.dispatcher_map',
+            new={'pickUpTip': m._pick_up_tip, 'aspirate': m._aspirate}):
+        with pytest.raises(RuntimeError, match='Command 1'):
+            compile_json(
+                mock.sentinel.context, protocol_data,
+                {'pipetteId': mock.sentinel.pipette}, {'plateId': plate})
+    # nothing runs if any command is invalid
+    assert m.mock_calls == []
+
+
 def test_papi_execute_json_v3(monkeypatch, loop, get_json_protocol_fixture):
     protocol_data = get_json_protocol_fixture(
         '3', 'testAllAtomicSingleV3', False)
@@ -19,7 +19,7 @@ from opentrons.protocols.execution.execute_json_v4 import (
 import opentrons.protocols.execution.execute_json_v4 as v4
 from opentrons.protocol_api import (
     MagneticModuleContext, TemperatureModuleContext, ThermocyclerContext,
-    ProtocolContext)
+    ProtocolContext, labware)
 from opentrons.protocols.execution import execute
 from opentrons_shared_data.protocol.constants import (
     JsonPipetteCommand as JPC,
@@ -279,16 +279,24 @@ def test_dispatch_json(
     mock_temperature_module = mock.create_autospec(TemperatureModuleContext)
     mock_thermocycler_module = mock.create_autospec(ThermocyclerContext)
 
+    well = mock.sentinel.well
+    plate = mock.create_autospec(labware.Labware)
+    plate.wells_by_name.return_value = {'A1': well}
+    access = {'pipette': 'pipetteId', 'labware': 'plateId', 'well': 'A1'}
+    liquid = {**access, 'volume': 10, 'flowRate': 3,
+              'offsetFromBottomMm': 1}
+    move = {'pipette': 'pipetteId', 'slot': '1'}
+
     protocol_data = {'commands': [
         # Pipette
-        {'command': 'delay', 'params': 'delay_params'},
-        {'command': 'blowout', 'params': 'blowout_params'},
-        {'command': 'pickUpTip', 'params': 'pickUpTip_params'},
-        {'command': 'dropTip', 'params': 'dropTip_params'},
-        {'command': 'aspirate', 'params': 'aspirate_params'},
-        {'command': 'dispense', 'params': 'dispense_params'},
-        {'command': 'touchTip', 'params': 'touchTip_params'},
-        {'command': 'moveToSlot', 'params': 'moveToSlot_params'},
+        {'command': 'delay', 'params': {'wait': 1}},
+        {'command': 'blowout', 'params': {**access, 'flowRate': 3}},
+        {'command': 'pickUpTip', 'params': access},
+        {'command': 'dropTip', 'params': access},
+        {'command': 'aspirate', 'params': liquid},
+        {'command': 'dispense', 'params': liquid},
+        {'command': 'touchTip', 'params': access},
+        {'command': 'moveToSlot', 'params': move},
         # Magnetic Module
         {'command': 'magneticModule/engageMagnet',
             'params': {'module': magnetic_module_id}},
@@ -369,9 +377,11 @@ def test_dispatch_json(
         }
     ]}
 
-    context = mock.sentinel.context
-    instruments = mock.sentinel.instruments
-    loaded_labware = mock.sentinel.loaded_labware
+    context = mock.MagicMock()
+    context.deck = {'1': mock.sentinel.slot}
+    instruments = {'pipetteId': mock.sentinel.pipette}
+    loaded_labware = {'plateId': plate}
+    wells = {'plateId': {'A1': well}}
 
     modules = {
         magnetic_module_id: mock_magnetic_module,
@@ -393,18 +403,14 @@ def test_dispatch_json(
 
     assert mockObj.mock_calls == [
         # Pipette
-        mock.call._delay(context, 'delay_params'),
-        mock.call._blowout(instruments, loaded_labware, 'blowout_params'),
-        mock.call._pick_up_tip(
-            instruments, loaded_labware, 'pickUpTip_params'),
-        mock.call._drop_tip(instruments, loaded_labware, 'dropTip_params'),
-        mock.call._aspirate(
-            instruments, loaded_labware, 'aspirate_params'),
-        mock.call._dispense(
-            instruments, loaded_labware, 'dispense_params'),
-        mock.call._touch_tip(
-            instruments, loaded_labware, 'touchTip_params'),
-        mock.call._move_to_slot(context, instruments, 'moveToSlot_params'),
+        mock.call._delay(context, {'wait': 1}),
+        mock.call._blowout(instruments, wells, {**access, 'flowRate': 3}),
+        mock.call._pick_up_tip(instruments, wells, access),
+        mock.call._drop_tip(instruments, wells, access),
+        mock.call._aspirate(instruments, wells, liquid),
+        mock.call._dispense(instruments, wells, liquid),
+        mock.call._touch_tip(instruments, wells, access),
+        mock.call._move_to_slot(context, instruments, move),
         # Magnetic module
         mock.call._engage_magnet(
             mock_magnetic_module, {'module': magnetic_module_id}
@@ -500,6 +506,43 @@ def test_dispatch_json_invalid_command(
         )
 
 
+def test_compile_json_checks_modules(
+    pipette_command_map,
+    magnetic_module_command_map,
+    temperature_module_command_map,
+    thermocycler_module_command_map,
+    mockObj
+):
+    modules = {'magId': mock.create_autospec(MagneticModuleContext)}
+    maps = dict(
+        pipette_command_map=pipette_command_map,
+        magnetic_module_command_map=magnetic_module_command_map,
+        temperature_module_command_map=temperature_module_command_map,
+        thermocycler_module_command_map=thermocycler_module_command_map)
+    engage = {'command': 'magneticModule/engageMagnet',
+              'params': {'module': 'magId', 'engageHeight': 3}}
+
+    # a module id that was never loaded
+    with pytest.raises(RuntimeError, match='Command 1'):
+        v4.compile_json(
+            None, {'commands': [
+                engage,
+                {'command': 'magneticModule/disengageMagnet',
+                 'params': {'module': 'otherId'}}]},
+            {}, {}, modules, **maps)
+
+    # a module of the wrong type
+    with pytest.raises(RuntimeError, match='TemperatureModuleContext'):
+        v4.compile_json(
+            None, {'commands': [
+                engage,
+                {'command': 'temperatureModule/deactivate',
+                 'params': {'module': 'magId'}}]},
+            {}, {}, modules, **maps)
+
+    assert mockObj.mock_calls == []
+
+
 def test_papi_execute_json_v4(monkeypatch, loop, get_json_protocol_fixture):
     protocol_data = get_json_protocol_fixture(
         '4', 'testModulesProtocol', False)
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from opentrons.protocols.geometry.well_array import WellArray
+from opentrons.protocols.implementations.labware import \
+    LabwareImplementation
+from opentrons.protocols.labware.definition import get_labware_definition
+from opentrons.types import Location, Point
+
+
+def _as_array(points):
+    return np.array([tuple(point) for point in points])
+
+
+@pytest.mark.parametrize('load_name', [
+    'corning_384_wellplate_112ul_flat',
+    'nest_12_reservoir_15ml',
+    'opentrons_96_tiprack_300ul',
+])
+def test_matches_well_geometry(load_name):
+    labware = LabwareImplementation(
+        get_labware_definition(load_name), Location(Point(10, 20, 30), None))
+    labware.set_calibration(Point(1, -2, 0.5))
+    geometries = [well.get_geometry() for well in labware.get_wells()]
+    array = labware.get_well_array()
+
+    assert array.names == [well.get_name() for well in labware.get_wells()]
+    assert np.allclose(array.tops(), _as_array(g.top() for g in geometries))
+    assert np.allclose(
+        array.tops(5), _as_array(g.top(5) for g in geometries))
+    assert np.allclose(
+        array.bottoms(1), _as_array(g.bottom(1) for g in geometries))
+    assert np.allclose(
+        array.centers(), _as_array(g.center() for g in geometries))
+    assert np.allclose(array.wells['max_volume'],
+                       [g.max_volume for g in geometries])
+
+
+def test_rows_and_columns():
+    labware = LabwareImplementation(
+        get_labware_definition('corning_96_wellplate_360ul_flat'),
+        Location(Point(0, 0, 0), None))
+    array = labware.get_well_array()
+    grid = labware.get_well_grid()
+
+    row = array.row('B')
+    assert [array.names[idx] for idx in row]\
+        == [well.get_name() for well in grid.get_row('B')]
+    assert np.allclose(
+        array.tops(indices=row),
+        _as_array(well.get_geometry().top() for well in grid.get_row('B')))
+
+    column = array.column('12')
+    assert [array.names[idx] for idx in column]\
+        == [well.get_name() for well in grid.get_column('12')]
+    assert np.allclose(
+        array.bottoms(indices=array.indices(['H12', 'A1'])),
+        _as_array([labware.get_wells_by_name()['H12'].get_geometry().bottom(),
+                   labware.get_wells_by_name()['A1'].get_geometry().bottom()]))
+
+
+def test_read_only():
+    array = WellArray(
+        get_labware_definition('nest_12_reservoir_15ml')['wells'],
+        ['A1', 'A2'], Point(0, 0, 0))
+    assert np.isnan(array.wells['diameter']).all()
+    with pytest.raises(ValueError):
+        array.wells['x'][0] = 1
+    # Accessors return copies, so callers can modify them
+    tops = array.tops()
+    tops[0, 0] = 100
+    assert array.tops()[0, 0] != 100
+
+
+def test_built_lazily_and_recalibrated():
+    labware = LabwareImplementation(
+        get_labware_definition('corning_96_wellplate_360ul_flat'),
+        Location(Point(0, 0, 0), None))
+    assert labware._well_array is None
+    before = labware.get_well_array()
+    assert labware.get_well_array() is before
+
+    labware.set_calibration(Point(1, 2, 3))
+    after = labware.get_well_array()
+    assert after is not before
+    assert np.allclose(after.tops() - before.tops(), (1, 2, 3))
+    assert np.allclose(
+        after.tops(indices=after.indices(['A1'])),
+        _as_array([labware.get_wells_by_name()['A1'].get_geometry().top()]))
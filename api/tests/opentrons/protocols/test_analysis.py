@@ -0,0 +1,90 @@
+import io
+
+import pytest
+
+from opentrons import simulate
+from opentrons.protocols import analysis
+
+PROTOCOL = '''
+metadata = {'apiLevel': '2.8'}
+
+
+def run(ctx):
+    tiprack = ctx.load_labware('opentrons_96_tiprack_300ul', '1')
+    plate = ctx.load_labware('corning_96_wellplate_360ul_flat', '2')
+    reservoir = ctx.load_labware('nest_12_reservoir_15ml', '3')
+    multi = ctx.load_instrument(
+        'p300_multi_gen2', 'right', tip_racks=[tiprack])
+    single = ctx.load_instrument(
+        'p300_single_gen2', 'left', tip_racks=[tiprack])
+    multi.transfer(100, reservoir['A1'], plate['A1'])
+    single.transfer(300, plate['A1'], plate['B2'])
+    single.transfer(200, plate['C1'], plate['B2'])
+    tempdeck = ctx.load_module('temperature module gen2', '4')
+    tempdeck.set_temperature(4)
+'''
+
+
+@pytest.fixture
+def runlog():
+    return simulate.simulate(io.StringIO(PROTOCOL), 'protocol.py')[0]
+
+
+def test_analyze(runlog):
+    result = analysis.analyze(runlog)
+    assert result['commands']['count'] == len(runlog)
+    assert result['commands']['by_name']['command.PICK_UP_TIP'] == 3
+
+    # The multi picks up a column of tips and the single the next two
+    assert result['tips'] == {
+        'Opentrons 96 Tip Rack 300 µL on 1': {
+            'pick_ups': 3, 'tips_used': 10, 'capacity': 96}}
+
+    wells = result['wells']
+    # All eight channels go into the one reservoir well
+    assert wells['A1 of NEST 12 Well Reservoir 15 mL on 3']['required']\
+        == 800
+    plate_a1 = wells['A1 of Corning 96 Well Plate 360 µL Flat on 2']
+    assert plate_a1['dispensed'] == 100
+    assert plate_a1['aspirated'] == 300
+    assert plate_a1['required'] == 200
+    assert wells['H1 of Corning 96 Well Plate 360 µL Flat on 2']['net']\
+        == 100
+    plate_b2 = wells['B2 of Corning 96 Well Plate 360 µL Flat on 2']
+    assert plate_b2['peak'] == 500
+    assert result['warnings'] == [
+        'B2 of Corning 96 Well Plate 360 µL Flat on 2 would hold up to '
+        '500 uL but only fits 360 uL']
+
+    plate = result['labware']['Corning 96 Well Plate 360 µL Flat on 2']
+    assert plate['load_name'] == 'corning_96_wellplate_360ul_flat'
+    assert plate['wells'][:2] == ['A1', 'B1']
+    assert 'B2' in plate['wells']
+    assert result['modules'] == {'tempdeck': {'TEMPDECK_SET_TEMP': 1}}
+
+    assert [(segment['mount'], segment['instrument'])
+            for segment in result['pipette_timeline']] == [
+        ('right', 'p300_multi_gen2'), ('left', 'p300_single_gen2')]
+    assert result['pipette_timeline'][1]['last'] < len(runlog) - 1
+
+
+def test_cache(runlog, tmp_path):
+    protocol_path = tmp_path / 'protocol.py'
+    contents = PROTOCOL.encode()
+    protocol_path.write_bytes(contents)
+    assert analysis.load_cached(protocol_path, contents) is None
+
+    result = analysis.analyze(runlog)
+    cache_path = analysis.save_cached(protocol_path, contents, result)
+    assert cache_path == tmp_path / 'protocol.py.analysis.json'
+    assert analysis.load_cached(protocol_path, contents) == result
+    # A cached analysis of other contents isn't used
+    assert analysis.load_cached(protocol_path, contents + b'\n') is None
+    # Nor is one made with other custom labware or data files
+    inputs = {'data:volumes.csv': b'A1,100\n'}
+    assert analysis.load_cached(protocol_path, contents, inputs) is None
+    analysis.save_cached(protocol_path, contents, result, inputs)
+    assert analysis.load_cached(protocol_path, contents, inputs) == result
+    assert analysis.load_cached(
+        protocol_path, contents, {'data:volumes.csv': b'A1,200\n'}) is None
+    assert analysis.load_cached(protocol_path, contents) is None
@@ -0,0 +1,124 @@
+import sys
+import time
+
+import pytest
+
+from opentrons.system import smoothie_update
+from opentrons.system.smoothie_update import UpdatePhase
+
+# Two 16 byte data records and an end of file record
+HEX = (':10000000000102030405060708090A0B0C0D0E0F78\n'
+       ':10001000101112131415161718191A1B1C1D1E1F68\n'
+       ':00000001FF\n')
+
+# Prints what lpc21isp does while it programs, a little at a time
+FAKE_PROGRAMMER = '''
+import sys, time
+sys.stdout.write('Wiping Device. OK\\n')
+for sector in (1, 2, 0):
+    sys.stdout.write(f'Sector {sector}: ')
+    for _ in range(3):
+        sys.stdout.write('.')
+        sys.stdout.flush()
+        time.sleep(0.01)
+    sys.stdout.write('\\n')
+sys.stdout.write('Download Finished and Verified correct... taking 1 seconds\\n')
+'''
+
+
+@pytest.fixture
+def hex_file(tmp_path):
+    path = tmp_path / 'smoothie.hex'
+    path.write_text(HEX)
+    return str(path)
+
+
+async def test_check_image(hex_file, monkeypatch, loop):
+    monkeypatch.setattr(smoothie_update, 'CHUNK_SIZE', 20)
+    progress = []
+    assert await smoothie_update.check_image(
+        hex_file, progress.append) == 32
+    assert all(p.phase == UpdatePhase.CHECK for p in progress)
+    assert progress[-1].bytes_done == progress[-1].bytes_total == len(HEX)
+    assert len(progress) > 2
+
+
+async def test_check_image_rejects_bad_records(tmp_path, loop):
+    path = tmp_path / 'bad.hex'
+    path.write_text(HEX.replace('0F78', '0F79'))
+    with pytest.raises(ValueError, match='line 1 has a bad checksum'):
+        await smoothie_update.check_image(str(path))
+    path.write_text('not a hex file\n')
+    with pytest.raises(ValueError, match='not a hex record'):
+        await smoothie_update.check_image(str(path))
+
+
+def test_programmer_output_parser():
+    parser = smoothie_update.ProgrammerOutputParser(50000)
+    assert parser.feed('Wiping Device. OK\nSector 1: ...') == 0
+    # A sector heading split across reads still counts
+    assert parser.feed('.\nSec') == 0
+    assert parser.feed('tor 2: ..') == 4096
+    assert parser.feed('.\nSector 0: .') == 8192
+    assert parser.feed('\nDownload Finished and Verified') == 50000
+
+
+async def test_program_reports_progress(loop):
+    progress = []
+    output = await smoothie_update.program(
+        [sys.executable, '-c', FAKE_PROGRAMMER], 10000, progress.append)
+    assert output.startswith('Wiping Device')
+    assert output.endswith('taking 1 seconds')
+    done = [p.bytes_done for p in progress]
+    assert done == sorted(done)
+    assert done[-1] == 10000
+    assert 4096 in done
+
+
+async def test_program_failure(loop):
+    with pytest.raises(smoothie_update.SmoothieUpdateError) as exc:
+        await smoothie_update.run_phase(
+            UpdatePhase.PROGRAM,
+            smoothie_update.program(
+                [sys.executable, '-c',
+                 'print("Synchronizing failed"); raise SystemExit(3)'],
+                100))
+    assert exc.value.phase == UpdatePhase.PROGRAM
+    assert 'exited with 3' in str(exc.value)
+    assert 'Synchronizing failed' in str(exc.value)
+
+
+async def test_phase_timeout_kills_programmer(loop):
+    timeouts = {**smoothie_update.DEFAULT_PHASE_TIMEOUTS,
+                UpdatePhase.PROGRAM: 0.5}
+    start = time.monotonic()
+    with pytest.raises(smoothie_update.SmoothieUpdateError,
+                       match='timed out'):
+        await smoothie_update.run_phase(
+            UpdatePhase.PROGRAM,
+            smoothie_update.program(
+                [sys.executable, '-c', 'import time; time.sleep(30)'], 100),
+            timeouts)
+    assert time.monotonic() - start < 10
+
+
+async def test_blocking_phase_timeout_waits_for_thread(loop):
+    timeouts = {**smoothie_update.DEFAULT_PHASE_TIMEOUTS,
+                UpdatePhase.RESTART: 0.05}
+    finished = []
+
+    def restart():
+        time.sleep(0.3)
+        finished.append(True)
+
+    with pytest.raises(smoothie_update.SmoothieUpdateError,
+                       match='timed out'):
+        await smoothie_update.run_blocking_phase(
+            UpdatePhase.RESTART, restart, timeouts, loop)
+    # The error is only raised once the thread is done with the smoothie
+    assert finished == [True]
+
+
+async def test_blocking_phase_result(loop):
+    assert await smoothie_update.run_blocking_phase(
+        UpdatePhase.VERIFY, lambda: 'v1.2', loop=loop) == 'v1.2'
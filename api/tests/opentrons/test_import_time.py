@@ -0,0 +1,73 @@
+"""Tests that importing the package stays fast.
+
+Each case imports something in a fresh interpreter with ``-X importtime``
+and checks that modules that should only load on first use weren't
+imported, and that the import fits in a time budget. The budgets are a few
+times what the imports take on a laptop, so they only catch big regressions
+like something pulling in the hardware controller again.
+"""
+import subprocess
+import sys
+from typing import Dict, List, Set, Tuple
+
+import pytest
+
+
+def _import_times(statement: str) -> Tuple[Dict[str, int], int]:
+    """Run a statement in a new interpreter and time its imports.
+
+    Return the cumulative import time in microseconds of every module it
+    imported, and the total for the modules imported at the top level.
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True)
+    times: Dict[str, int] = {}
+    top_level = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not cumulative.strip().isdigit():
+            # The header
+            continue
+        # Nested imports are indented two spaces per level
+        if not name[1:].startswith(' '):
+            top_level += int(cumulative)
+        times[name.strip()] = int(cumulative)
+    return times, top_level
+
+
+@pytest.fixture(scope='module')
+def startup_modules() -> Set[str]:
+    """Get the modules the interpreter imports before running anything.
+
+    These are things like the modules used by .pth files.
+    """
+    times, _ = _import_times('pass')
+    return set(times)
+
+
+@pytest.mark.parametrize('statement,budget_ms,lazy', [
+    ('import opentrons', 100,
+     ['opentrons.hardware_control', 'numpy', 'serial', 'jsonrpcserver',
+      'jsonschema', 'pkg_resources', 'systemd']),
+    ('from opentrons import protocol_api', 250,
+     ['opentrons.hardware_control.socket_server', 'jsonrpcserver',
+      'opentrons.legacy_api', 'jsonschema', 'pkg_resources']),
+    ('import opentrons.simulate', 400,
+     ['opentrons.hardware_control.socket_server', 'jsonrpcserver',
+      'opentrons.legacy_api', 'jsonschema', 'pkg_resources']),
+])
+def test_import_time(
+    statement: str, budget_ms: int, lazy: List[str], startup_modules: Set[str]
+) -> None:
+    """It should import quickly without importing lazy modules."""
+    times, _ = _import_times(statement)
+    imported = set(times) - startup_modules
+    assert not imported.intersection(lazy)
+
+    # The fastest of a few runs, to keep a busy machine from failing this
+    best = min(_import_times(statement)[1] for _ in range(3))
+    assert best / 1000 < budget_ms
@@ -10,3 +10,11 @@ def test_find_smoothie_file(monkeypatch, tmpdir):
 
     monkeypatch.setattr(opentrons, 'IS_ROBOT', True)
     assert opentrons._find_smoothie_file() == (dummy_file, 'edge-2cac98asda')
+
+
+def test_hardware_control_attrs():
+    import opentrons
+    from opentrons.hardware_control import API, ThreadManager
+
+    assert opentrons.API is API
+    assert opentrons.ThreadManager is ThreadManager
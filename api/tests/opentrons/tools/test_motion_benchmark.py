@@ -0,0 +1,26 @@
+from opentrons.tools import motion_benchmark
+
+
+def test_latency_stats():
+    stats = motion_benchmark.latency_stats(
+        [1500, 800, 3000, 40000, 2000000, 100_000_000_000])
+    assert stats['count'] == 6
+    assert stats['max_us'] == 100_000_000
+    assert stats['p50_us'] == 40
+    assert stats['histogram_us'] == {
+        '<=1': 1, '<=2': 1, '<=5': 1, '<=50': 1, '<=2000': 1, 'more': 1}
+    assert motion_benchmark.latency_stats([]) == {'count': 0}
+
+
+def test_run_workloads():
+    report = motion_benchmark.run(list(motion_benchmark.WORKLOADS), 1)
+    assert report['environment']['simulating']
+    assert set(report['workloads']) == set(motion_benchmark.WORKLOADS)
+    for name, result in report['workloads'].items():
+        assert result['moves'] > 0, name
+        assert result['transform_s'] > 0, name
+        assert result['spans_us']['hardware']['backend.move']['count']\
+            == result['moves']
+    assert report['workloads']['plate_fill']['commands'] > 0
+    assert report['workloads']['plate_fill']['planning_s'] > 0
+    assert report['workloads']['gantry_moves']['commands'] == 0
@@ -0,0 +1,140 @@
+import io
+import json
+import os
+
+import pytest
+
+from opentrons import commands as cmds, simulate
+from opentrons.util import tracing
+
+
+@pytest.fixture
+def tracer():
+    tracer = tracing.enable()
+    yield tracer
+    tracing.disable()
+
+
+def test_disabled_records_nothing():
+    assert tracing.get_tracer() is None
+
+    @tracing.traced('test')
+    def traced_fn():
+        return 1
+
+    with tracing.span('nothing', 'test'):
+        assert traced_fn() == 1
+    tracing.begin('nothing', 'test')
+    tracing.end('nothing', 'test')
+
+
+def test_spans_nest(tracer):
+    @tracing.traced('test')
+    def inner():
+        return 2
+
+    with tracing.span('outer', 'test', {'a': 1}):
+        tracing.begin('middle', 'other')
+        assert inner() == 2
+        tracing.end('middle', 'other')
+
+    spans = {s.name: s for s in tracing.spans(tracer.events)}
+    outer = spans['outer']
+    middle = spans['middle']
+    inner_span = spans['test_spans_nest.<locals>.inner']
+    assert outer.args == {'a': 1}
+    assert outer.timestamp_ns <= middle.timestamp_ns\
+        <= inner_span.timestamp_ns
+    assert inner_span.timestamp_ns + inner_span.duration_ns\
+        <= middle.timestamp_ns + middle.duration_ns\
+        <= outer.timestamp_ns + outer.duration_ns
+    assert [s.name for s in tracing.spans(tracer.events, 'other')]\
+        == ['middle']
+
+
+async def test_traced_coroutine(tracer):
+    @tracing.traced('test', name='coro')
+    async def coro(value):
+        return value
+
+    assert await coro(3) == 3
+    assert [s.name for s in tracing.spans(tracer.events)] == ['coro']
+
+
+def test_chrome_trace(tracer, tmpdir):
+    with tracing.span('a', 'test', {'b': 'c'}):
+        pass
+    path = str(tmpdir.join('trace.json'))
+    tracing.write(tracer, path)
+    with open(path) as f:
+        written = json.load(f)
+    event, = written['traceEvents']
+    assert event['name'] == 'a'
+    assert event['cat'] == 'test'
+    assert event['ph'] == 'X'
+    assert event['args'] == {'b': 'c'}
+    assert event['dur'] >= 0
+
+
+def test_binary_round_trip(tracer, tmpdir):
+    for _ in range(3):
+        with tracing.span('repeated', 'test'):
+            tracing.begin('b', 'test', {'x': [1, 2]})
+            tracing.end('b', 'test')
+    # Strings longer than 64 KiB fit too
+    tracing.begin('c' * 70000, 'test')
+    tracing.end('c' * 70000, 'test')
+    path = str(tmpdir.join('trace.bin'))
+    tracing.write(tracer, path)
+    assert tracing.read_binary(path) == tracer.events
+
+
+def test_raising_command_ends_its_span(tracer):
+    class Publisher(cmds.CommandPublisher):
+        @cmds.publish.both(command=cmds.comment)
+        def comment(self, msg):
+            # Like a command that publishes its own 'before' and fails
+            # before its 'after'
+            cmds.do_publish(self.broker, cmds.comment, self.comment,
+                            'before', None, None, self, 'inner')
+            raise RuntimeError(msg)
+
+    tracing.begin('outer', 'test')
+    with pytest.raises(RuntimeError):
+        Publisher(None).comment('failed')
+    assert tracer.open_spans() == 1
+    tracing.end('outer', 'test')
+    assert [(e.phase, e.name) for e in tracer.events] == [
+        ('B', 'outer'),
+        ('B', 'command.COMMENT'),
+        ('B', 'command.COMMENT'),
+        ('E', 'command.COMMENT'),
+        ('E', 'command.COMMENT'),
+        ('E', 'outer')]
+    assert tracer.open_spans() == 0
+
+
+def test_recording_ends_open_spans(tmpdir):
+    path = str(tmpdir.join('trace.json'))
+    with pytest.raises(RuntimeError):
+        with tracing.recording(path) as tracer:
+            tracing.begin('left open', 'test')
+            raise RuntimeError()
+    assert [e.phase for e in tracer.events] == ['B', 'E']
+
+
+def test_simulate_traces_protocol(get_json_protocol_fixture, tmpdir):
+    jp = get_json_protocol_fixture('3', 'simple', False)
+    path = str(tmpdir.join('trace.json'))
+    with tracing.recording(path) as tracer:
+        runlog, _ = simulate.simulate(io.StringIO(jp), 'simple.json')
+    assert tracing.get_tracer() is None
+    assert os.path.exists(path)
+
+    events = tracer.events
+    categories = {s.category for s in tracing.spans(events)}
+    assert {'command', 'hardware.sync', 'planning'} <= categories
+    commands = list(tracing.spans(events, 'command'))
+    assert len(commands) == len(runlog)
+    assert [c.args['text'] for c in commands]\
+        == [entry['payload']['text'] for entry in runlog]
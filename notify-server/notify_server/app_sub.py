@@ -1,15 +1,16 @@
 """Subscriber client application."""
 import asyncio
 import argparse
-from typing import List
+from typing import List, Optional
 
 from notify_server.clients.subscriber import create
 
 
-async def run(host_address: str, topics: List[str]) -> None:
+async def run(host_address: str, topics: List[str],
+              snapshot_address: Optional[str] = None) -> None:
     """Run the subscriber client."""
     print(f"Connecting to {host_address} for topics '{topics}'")
-    sub = create(host_address, topics)
+    sub = create(host_address, topics, snapshot_address=snapshot_address)
     async for e in sub:
         print(f"{e.event.createdOn}: topic={e.topic}, "
               f"publisher={e.event.publisher}, data={e.event.data}")
@@ -25,10 +26,16 @@ if __name__ == '__main__':
         required=True,
         help="The address of the notify-server, for "
              "example tcp://localhost:5555")
+    parser.add_argument(
+        "--snapshot-address",
+        help="The snapshot address of the notify-server, for example "
+             "tcp://localhost:5557. If given, the last event of each topic "
+             "is printed first.")
     parser.add_argument(
         "topics",
         nargs="+",
         help="At least one topic that will be subscribed to.")
     args = parser.parse_args()
     asyncio.run(run(host_address=args.server_address,
-                    topics=args.topics))
+                    topics=args.topics,
+                    snapshot_address=args.snapshot_address))
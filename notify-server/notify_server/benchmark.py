@@ -0,0 +1,158 @@
+"""
+Load benchmark.
+
+Runs a server, a publisher and a subscriber in this process, connected over
+local ipc sockets, and reports throughput, latency and the server's queue
+metrics. The subscriber's receive queue uses the same settings as the
+server's. For example, to see how a slow subscriber fares with conflated
+topics:
+
+    python -m notify_server.benchmark -n 20000 -r 5000 --policy conflate \
+        --subscriber-delay 0.001
+"""
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import List
+
+from notify_server.clients import publisher, subscriber
+from notify_server.models.event import Event
+from notify_server.models.sample_events import SampleTwo
+from notify_server.server.server import create_queue, serve, ServerQueue
+from notify_server.settings import Settings, ServerBindAddress, \
+    QueueSettings, QueuePolicy
+
+TOPIC_PREFIX = "benchmark"
+
+
+async def _publish(pub: publisher.Publisher, topics: List[str], count: int,
+                   rate: float) -> float:
+    """Send count events round robin to topics, return seconds taken."""
+    start = time.monotonic()
+    for i in range(count):
+        if rate > 0:
+            delay = start + i / rate - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        await pub.send(topics[i % len(topics)],
+                       Event(createdOn=datetime.now(),
+                             publisher="benchmark",
+                             data=SampleTwo(val1=i, val2="")))
+    return time.monotonic() - start
+
+
+async def _receive(sub: subscriber.Subscriber, delay: float,
+                   quiet: float) -> List[float]:
+    """
+    Receive events until none arrive for quiet seconds.
+
+    :return: The latency of each event in seconds.
+    """
+    latencies: List[float] = []
+    while True:
+        try:
+            entry = await asyncio.wait_for(sub.next_event(), quiet)
+        except asyncio.TimeoutError:
+            return latencies
+        latencies.append(
+            (datetime.now() - entry.event.createdOn).total_seconds())
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _report(count: int, publish_time: float, latencies: List[float],
+            queue: ServerQueue) -> None:
+    received = len(latencies)
+    print(f"sent {count} events in {publish_time:.3f}s "
+          f"({count / publish_time:.0f}/s)")
+    print(f"received {received} events ({count - received} not delivered)")
+    if latencies:
+        print(f"latency ms: p50={_percentile(latencies, .5) * 1000:.2f} "
+              f"p99={_percentile(latencies, .99) * 1000:.2f} "
+              f"max={max(latencies) * 1000:.2f}")
+    print("server queues:")
+    for topic, metrics in sorted(queue.metrics().items()):
+        print(f"  {topic}: {metrics}")
+
+
+async def run(count: int, rate: float, topic_count: int,
+              queue_settings: QueueSettings, subscriber_delay: float) -> None:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        settings = Settings(
+            publisher_address=ServerBindAddress(
+                scheme="ipc", path=os.path.join(tmpdir, "pub")),
+            subscriber_address=ServerBindAddress(
+                scheme="ipc", path=os.path.join(tmpdir, "sub")),
+            snapshot_address=ServerBindAddress(
+                scheme="ipc", path=os.path.join(tmpdir, "snapshot")),
+            queue=queue_settings,
+            metrics_interval=0,
+            production=False)
+        queue = create_queue(settings)
+        server = asyncio.create_task(serve(settings, queue))
+        topics = [f"{TOPIC_PREFIX}{i}" for i in range(topic_count)]
+        sub = subscriber.create(
+            settings.subscriber_address.connection_string(), [TOPIC_PREFIX],
+            queue=queue_settings)
+        pub = publisher.create(settings.publisher_address.connection_string())
+        # Give the subscriber time to connect so no events are missed.
+        await asyncio.sleep(0.2)
+        try:
+            receiving = asyncio.create_task(
+                _receive(sub, subscriber_delay, quiet=1.0))
+            publish_time = await _publish(pub, topics, count, rate)
+            latencies = await receiving
+            _report(count, publish_time, latencies, queue)
+        finally:
+            await pub.stop()
+            await sub.stop()
+            server.cancel()
+            try:
+                await server
+            except asyncio.CancelledError:
+                pass
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog='notify-server-benchmark',
+        description='Opentrons notify-server load benchmark')
+    parser.add_argument(
+        "-n", "--events", type=int, default=10000,
+        help="How many events to publish.")
+    parser.add_argument(
+        "-r", "--rate", type=float, default=0,
+        help="Events per second to publish, or 0 for as fast as possible.")
+    parser.add_argument(
+        "-t", "--topics", type=int, default=4,
+        help="How many topics to spread the events over.")
+    parser.add_argument(
+        "--max-size", type=int, default=1000,
+        help="The queue size of each topic.")
+    parser.add_argument(
+        "--policy", choices=[p.value for p in QueuePolicy],
+        default=QueuePolicy.block.value,
+        help="The queue policy of each topic.")
+    parser.add_argument(
+        "--subscriber-delay", type=float, default=0,
+        help="Seconds the subscriber spends on each event.")
+    args = parser.parse_args()
+    # The server and client tasks log their cancellation at shutdown.
+    logging.getLogger("notify_server").setLevel(logging.CRITICAL)
+    asyncio.run(run(count=args.events,
+                    rate=args.rate,
+                    topic_count=args.topics,
+                    queue_settings=QueueSettings(
+                        max_size=args.max_size,
+                        policy=QueuePolicy(args.policy)),
+                    subscriber_delay=args.subscriber_delay))
@@ -3,32 +3,43 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from asyncio import Task, Queue
+from asyncio import Task
+from typing import Mapping, Optional
 
 from notify_server.clients.queue_entry import QueueEntry
 from notify_server.models.event import Event
 from notify_server.network.connection import create_push, Connection
+from notify_server.settings import QueueSettings
+from notify_server.topic_queue import TopicQueue
 
 log = logging.getLogger(__name__)
 
+SendQueue = TopicQueue[QueueEntry]
 
-def create(host_address: str) -> Publisher:
+
+def create(host_address: str,
+           queue: Optional[QueueSettings] = None,
+           topic_queues: Optional[Mapping[str, QueueSettings]] = None
+           ) -> Publisher:
     """
     Construct a publisher.
 
     :param host_address: uri to connect to.
+    :param queue: Settings of the send queue of topics not in topic_queues.
+        By default, send waits once 1000 events of a topic are queued.
+    :param topic_queues: Settings of the send queue of individual topics.
     """
-    queue: Queue = Queue()
+    send_queue: SendQueue = TopicQueue(default=queue, topics=topic_queues)
     task = asyncio.create_task(_send_task(connection=create_push(host_address),
-                                          queue=queue))
-    return Publisher(task=task, queue=queue)
+                                          queue=send_queue))
+    return Publisher(task=task, queue=send_queue)
 
 
-async def _send_task(connection: Connection, queue: Queue) -> None:
+async def _send_task(connection: Connection, queue: SendQueue) -> None:
     """Run asyncio task that reads from queue and publishes to server."""
     try:
         while True:
-            entry: QueueEntry = await queue.get()
+            _, entry = await queue.get()
             await connection.send_multipart(entry.to_frames())
     except asyncio.CancelledError:
         log.exception("Done")
@@ -39,14 +50,23 @@ async def _send_task(connection: Connection, queue: Queue) -> None:
 class Publisher:
     """Async publisher class."""
 
-    def __init__(self, task: Task, queue: Queue) -> None:
+    def __init__(self, task: Task, queue: SendQueue) -> None:
         """Construct a _Publisher."""
         self._task = task
         self._queue = queue
 
     async def send(self, topic: str, event: Event) -> None:
-        """Publish an event to a topic."""
-        await self._queue.put(QueueEntry(topic, event))
+        """
+        Publish an event to a topic.
+
+        Waits while the topic's send queue is full, if its policy is block.
+        """
+        await self._queue.put(topic, QueueEntry(topic, event))
+
+    @property
+    def queue(self) -> SendQueue:
+        """Get the queue of events waiting to be sent."""
+        return self._queue
 
     async def stop(self) -> None:
         """Stop the publisher task."""
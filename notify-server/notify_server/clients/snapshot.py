@@ -0,0 +1,67 @@
+"""A client of the server's snapshot channel."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import List, Sequence
+
+from notify_server.network.snapshot import Reply, decode_reply, \
+    replay_request, snapshot_request
+from notify_server.network.connection import create_request, Connection
+
+log = logging.getLogger(__name__)
+
+
+def create(host_address: str, topics: Sequence[str],
+           timeout: float = 5.0) -> SnapshotClient:
+    """
+    Create a snapshot client.
+
+    :param host_address: The server snapshot address.
+    :param topics: The topics to get events of.
+    :param timeout: Seconds to wait for each reply.
+    """
+    return SnapshotClient(create_request(host_address), topics, timeout)
+
+
+class SnapshotClient:
+    """Requests the cached events of some topics."""
+
+    def __init__(self, connection: Connection, topics: Sequence[str],
+                 timeout: float) -> None:
+        """Construct."""
+        self._connection = connection
+        self._topics = list(topics)
+        self._timeout = timeout
+
+    async def _request(self, request: List[bytes]) -> Reply:
+        await self._connection.send_multipart(request)
+        return decode_reply(await asyncio.wait_for(
+            self._connection.recv_multipart(), self._timeout))
+
+    async def snapshot(self) -> Reply:
+        """
+        Get the last event of each topic.
+
+        :raises asyncio.TimeoutError: if the server doesn't answer in time.
+            The client can't be used afterwards.
+        :raises MalformedReply:
+        """
+        return await self._request(snapshot_request(self._topics))
+
+    async def replay(self, after: int, before: int) -> Reply:
+        """
+        Get the recent events of the topics.
+
+        Only events numbered between after and before are returned.
+
+        :raises asyncio.TimeoutError: if the server doesn't answer in time.
+            The client can't be used afterwards.
+        :raises MalformedReply:
+        """
+        return await self._request(
+            replay_request(after, before, self._topics))
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._connection.close()
@@ -5,32 +5,69 @@ import logging
 import asyncio
 import typing
 
+import zmq  # type: ignore
+
+from notify_server.clients import snapshot
 from notify_server.clients.queue_entry import QueueEntry, MalformedFrames
 from notify_server.network.connection import create_subscriber, Connection
+from notify_server.network.snapshot import MalformedReply, sequence_of
+from notify_server.settings import QueueSettings
+from notify_server.topic_queue import TopicQueue
 
 log = logging.getLogger(__name__)
 
+#: Seconds to wait before first asking for events published while the
+#: subscription was going live. The wait doubles each time after that.
+CATCH_UP_INTERVAL = 0.05
+#: The longest wait between asking for events published while the
+#: subscription was going live.
+MAX_CATCH_UP_INTERVAL = 1.0
+#: A sequence number after any event, to replay everything up to now.
+_LATEST = 2 ** 63
+
 
 def create(host_address: str,
-           topics: typing.Sequence[str]) -> Subscriber:
+           topics: typing.Sequence[str],
+           queue: typing.Optional[QueueSettings] = None,
+           topic_queues: typing.Optional[
+               typing.Mapping[str, QueueSettings]] = None,
+           snapshot_address: typing.Optional[str] = None
+           ) -> Subscriber:
     """
     Create a subscriber.
 
     :param host_address: The server notify_server address
     :param topics: The topics to subscribe to.
+    :param queue: Settings of the receive queue of topics not in
+        topic_queues. By default, reading from the server pauses once 1000
+        events of a topic are waiting for next_event.
+    :param topic_queues: Settings of the receive queue of individual topics.
+    :param snapshot_address: The server snapshot address. If given, the
+        first events received are the last ones published to each topic
+        before the subscriber connected.
     :return: A _Subscriber instance.
     """
-    return Subscriber(create_subscriber(host_address, topics))
+    return Subscriber(
+        create_subscriber(host_address, topics),
+        TopicQueue(default=queue, topics=topic_queues),
+        snapshot.create(snapshot_address, topics)
+        if snapshot_address else None)
 
 
 class Subscriber:
     """Async Subscriber class."""
 
     def __init__(self,
-                 connection: Connection) -> None:
+                 connection: Connection,
+                 queue: typing.Optional[TopicQueue[QueueEntry]] = None,
+                 snapshot_client: typing.Optional[
+                     snapshot.SnapshotClient] = None
+                 ) -> None:
         """Construct."""
+        self._q: TopicQueue[QueueEntry] = queue or TopicQueue()
+        # Only used until a request to it fails, after which it is closed.
+        self._snapshot_client = snapshot_client
         self._task = asyncio.create_task(self._read_task(connection))
-        self._q: asyncio.Queue = asyncio.Queue()
 
     async def stop(self) -> None:
         """Stop the subscriber task."""
@@ -50,25 +87,117 @@ class Subscriber:
         try:
             queue_entry = QueueEntry.from_frames(frames)
             log.debug("Received event %s", queue_entry)
-            await self._q.put(queue_entry)
+            await self._q.put(queue_entry.topic, queue_entry)
         except MalformedFrames:
             log.exception("exception handling event %s", frames)
 
-    async def _read_task(self,
-                         connection: Connection) -> None:
+    async def _request_snapshot(
+            self,
+            after: typing.Optional[int] = None,
+            before: typing.Optional[int] = None) -> typing.Optional[int]:
+        """
+        Read events from the snapshot channel into the read queue.
+
+        Gets the last event of each topic, or if after and before are given
+        the events numbered between them. A snapshot client can't be used
+        after a failed request, so it is closed and not asked again.
+
+        :return: The sequence number of the last published event, or None if
+            the server couldn't be asked.
+        """
+        snapshot_client = self._snapshot_client
+        if snapshot_client is None:
+            return None
+        try:
+            if after is None or before is None:
+                reply = await snapshot_client.snapshot()
+            else:
+                reply = await snapshot_client.replay(after, before)
+        except (asyncio.TimeoutError, MalformedReply, zmq.ZMQError):
+            log.exception("snapshot request failed")
+            self._snapshot_client = None
+            snapshot_client.close()
+            return None
+        if not reply.complete:
+            log.warning("Events between %s and %s were missed",
+                        after, before)
+        for _, frames in reply.events:
+            await self._process_frames(frames)
+        return reply.sequence
+
+    async def _catch_up(self, joined_at: int, live: asyncio.Event) -> int:
+        """
+        Replay the events published after joined_at until live is set.
+
+        A subscription goes live some time after it is made, and the events
+        published in between are never received. Ask for them, less often
+        as time goes on, until the first live event arrives.
+
+        :return: The sequence number of the last event read.
+        """
+        interval = CATCH_UP_INTERVAL
+        while True:
+            try:
+                await asyncio.wait_for(live.wait(), interval)
+                return joined_at
+            except asyncio.TimeoutError:
+                pass
+            sequence = await self._request_snapshot(joined_at, _LATEST)
+            if sequence is None:
+                return joined_at
+            joined_at = max(joined_at, sequence)
+            interval = min(interval * 2, MAX_CATCH_UP_INTERVAL)
+
+    async def _read_task(self, connection: Connection) -> None:
         """Connect to address and subscribe to topics."""
+        catch_up: typing.Optional[asyncio.Task[int]] = None
+        live = asyncio.Event()
         try:
+            joined_at = None
+            if self._snapshot_client is not None:
+                # The subscription is already made, so published events
+                # after the snapshot are either received or can be replayed.
+                joined_at = await self._request_snapshot()
+                if joined_at is not None:
+                    catch_up = asyncio.create_task(
+                        self._catch_up(joined_at, live))
             while True:
                 s = await connection.recv_multipart()
+                if joined_at is not None:
+                    sequence = sequence_of(s)
+                    if sequence is not None:
+                        if catch_up is not None:
+                            # The subscription is live. Wait for any replay
+                            # in progress so events stay in order.
+                            live.set()
+                            joined_at = await catch_up
+                            catch_up = None
+                        if sequence <= joined_at:
+                            # Already in, or superseded by, the snapshot.
+                            continue
+                        if sequence > joined_at + 1:
+                            # Does nothing if the snapshot client failed.
+                            await self._request_snapshot(joined_at, sequence)
+                    joined_at = None
                 await self._process_frames(s)
         except asyncio.CancelledError:
             log.exception("Done")
         finally:
+            if catch_up is not None:
+                catch_up.cancel()
             connection.close()
+            if self._snapshot_client is not None:
+                self._snapshot_client.close()
 
     async def next_event(self) -> QueueEntry:
         """Get next event."""
-        return typing.cast(QueueEntry, await self._q.get())
+        _, entry = await self._q.get()
+        return entry
+
+    @property
+    def queue(self) -> TopicQueue[QueueEntry]:
+        """Get the queue of received events."""
+        return self._q
 
     def __aiter__(self) -> 'Subscriber':
         """Create an async iterator."""
@@ -2,9 +2,11 @@
 from typing import Union
 
 from notify_server.models.sample_events import SampleTwo, SampleOne
+from notify_server.models.server_metrics import ServerMetrics
 
 
 PayloadType = Union[
     SampleOne,
     SampleTwo,
+    ServerMetrics,
 ]
@@ -0,0 +1,28 @@
+"""Server metrics event models."""
+from typing import Dict
+
+from pydantic import BaseModel, Field
+from typing_extensions import Literal
+
+
+#: The topic the server publishes ServerMetrics events to.
+METRICS_TOPIC = "notify_server.metrics"
+
+
+class QueueMetrics(BaseModel):
+    """Counters of the queued events of one topic."""
+
+    depth: int = Field(..., description="Events queued now")
+    max_depth: int = Field(..., description="Most events ever queued")
+    enqueued: int = Field(..., description="Events put in the queue")
+    dropped: int = Field(
+        ..., description="Events discarded by the drop_oldest policy")
+    conflated: int = Field(
+        ..., description="Events replaced by the conflate policy")
+
+
+class ServerMetrics(BaseModel):
+    """The state of the server's queues."""
+
+    type: Literal["ServerMetrics"] = "ServerMetrics"
+    queues: Dict[str, QueueMetrics]
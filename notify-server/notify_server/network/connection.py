@@ -60,6 +60,30 @@ def create_subscriber(address: str, topics: Sequence[str]) -> Connection:
     return Connection(sock)
 
 
+def create_reply(address: str) -> Connection:
+    """Create a REP server connection."""
+    ctx = Context()
+    sock = ctx.socket(zmq.REP)
+
+    log.info("Replier binding to %s", address)
+    sock.bind(address)
+
+    return Connection(sock)
+
+
+def create_request(address: str) -> Connection:
+    """Create a REQ client connection."""
+    ctx = Context()
+    sock = ctx.socket(zmq.REQ)
+    # Don't hang on close if the server never answered.
+    sock.setsockopt(zmq.LINGER, 0)
+
+    log.info("Requester connecting to %s", address)
+    sock.connect(address)
+
+    return Connection(sock)
+
+
 class Connection:
     """Wrapper for a connected zmq socket."""
 
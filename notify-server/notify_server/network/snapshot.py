@@ -0,0 +1,94 @@
+"""
+Wire format of the snapshot request/reply channel.
+
+Events published by the server carry a third frame: their sequence number,
+which goes up by one for each published event. A subscriber that connects
+late asks the server's snapshot socket for the last event of each of its
+topics, and for any events it missed while its subscription was being set
+up, then uses the sequence numbers to join the live stream without gaps or
+duplicates.
+
+Requests are one of:
+    [SNAPSHOT, topic, ...]: the last event of each topic starting with one
+        of the given prefixes.
+    [REPLAY, after, before, topic, ...]: the recent events of matching topics
+        with after < sequence < before.
+
+Replies are [sequence, complete, (topic, data, sequence)...] where the first
+sequence is that of the last published event and complete is b"0" if some
+requested events are no longer kept.
+"""
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+SNAPSHOT = b"snapshot"
+REPLAY = b"replay"
+
+
+class MalformedReply(Exception):
+    """Exception raised on badly formed snapshot replies."""
+
+    pass
+
+
+class Reply(NamedTuple):
+    """A decoded snapshot or replay reply."""
+
+    sequence: int
+    complete: bool
+    #: (sequence, [topic, data]) of each event, oldest first
+    events: List[Tuple[int, List[bytes]]]
+
+
+def encode_sequence(sequence: int) -> bytes:
+    """Create a sequence number frame."""
+    return str(sequence).encode()
+
+
+def sequence_of(frames: Sequence[bytes]) -> Optional[int]:
+    """Get the sequence number of published frames, if they have one."""
+    try:
+        return int(frames[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def snapshot_request(topics: Sequence[str]) -> List[bytes]:
+    """Create a snapshot request."""
+    return [SNAPSHOT] + [t.encode() for t in topics]
+
+
+def replay_request(after: int, before: int,
+                   topics: Sequence[str]) -> List[bytes]:
+    """Create a replay request."""
+    return [REPLAY, encode_sequence(after), encode_sequence(before)] \
+        + [t.encode() for t in topics]
+
+
+def encode_reply(sequence: int, complete: bool,
+                 events: Sequence[Tuple[int, List[bytes]]]) -> List[bytes]:
+    """Create reply frames."""
+    frames = [encode_sequence(sequence), b"1" if complete else b"0"]
+    for event_sequence, event_frames in events:
+        frames.extend(event_frames[:2])
+        frames.append(encode_sequence(event_sequence))
+    return frames
+
+
+def decode_reply(frames: Sequence[bytes]) -> Reply:
+    """
+    Decode reply frames.
+
+    :raises: MalformedReply
+    """
+    if len(frames) < 2 or (len(frames) - 2) % 3:
+        raise MalformedReply(f"Bad reply length {len(frames)}")
+    try:
+        events = [
+            (int(frames[i + 2]), [frames[i], frames[i + 1]])
+            for i in range(2, len(frames), 3)
+        ]
+        return Reply(sequence=int(frames[0]),
+                     complete=frames[1] == b"1",
+                     events=events)
+    except ValueError as e:
+        raise MalformedReply() from e
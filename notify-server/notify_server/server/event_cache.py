@@ -0,0 +1,73 @@
+"""The server's record of published events."""
+from collections import deque
+from typing import Deque, Dict, List, Sequence, Tuple
+
+CachedEvent = Tuple[int, List[bytes]]
+
+
+def _matches(topic: bytes, prefixes: Sequence[bytes]) -> bool:
+    """Check whether topic is subscribed to, the way zmq does."""
+    return any(topic.startswith(p) for p in prefixes)
+
+
+class EventCache:
+    """
+    Number published events and keep the recent ones.
+
+    The cache keeps the last event of each topic and a bounded ring of the
+    most recent events.
+    """
+
+    def __init__(self, replay_size: int) -> None:
+        """
+        Construct.
+
+        :param replay_size: How many recent events to keep for replay.
+        """
+        self._sequence = 0
+        self._last: Dict[bytes, CachedEvent] = {}
+        self._recent: Deque[CachedEvent] = deque(maxlen=replay_size)
+
+    @property
+    def sequence(self) -> int:
+        """Get the sequence number of the last event, or 0 if there is none."""
+        return self._sequence
+
+    def add(self, frames: List[bytes]) -> int:
+        """Record a published [topic, data] event, return its sequence."""
+        self._sequence += 1
+        event = (self._sequence, frames)
+        self._last[frames[0]] = event
+        self._recent.append(event)
+        return self._sequence
+
+    def snapshot(self, prefixes: Sequence[bytes]) -> List[CachedEvent]:
+        """Get the last event of each matching topic, oldest first."""
+        return sorted((event for topic, event in self._last.items()
+                       if _matches(topic, prefixes)),
+                      key=lambda event: event[0])
+
+    def replay(self, after: int, before: int,
+               prefixes: Sequence[bytes]) -> Tuple[bool, List[CachedEvent]]:
+        """
+        Get the recent events of matching topics, oldest first.
+
+        Only events with sequence numbers between after and before are
+        returned.
+
+        :return: Whether all such events were still kept, and the events.
+        """
+        events = []
+        complete = False
+        for event in reversed(self._recent):
+            sequence, frames = event
+            if sequence <= after:
+                complete = True
+                break
+            if sequence < before and _matches(frames[0], prefixes):
+                events.append(event)
+        else:
+            # Every event is still kept unless older ones were dropped.
+            complete = self._sequence - len(self._recent) <= after
+        events.reverse()
+        return complete, events
@@ -2,22 +2,45 @@
 
 import logging
 import asyncio
-from asyncio import Queue
+from datetime import datetime
+from typing import List, Sequence
 
+from notify_server.clients.queue_entry import QueueEntry
+from notify_server.models.event import Event
+from notify_server.models.server_metrics import METRICS_TOPIC, ServerMetrics
+from notify_server.network import snapshot
 from notify_server.network.connection import create_publisher, create_pull, \
-    Connection
-from notify_server.settings import Settings
+    create_reply, Connection
+from notify_server.server.event_cache import EventCache
+from notify_server.settings import Settings, QueuePolicy, QueueSettings
+from notify_server.topic_queue import TopicQueue
 
 log = logging.getLogger(__name__)
 
+ServerQueue = TopicQueue[List[bytes]]
+
+
+def create_queue(settings: Settings) -> ServerQueue:
+    """
+    Create the queue between the publisher and subscriber servers.
+
+    Unless configured otherwise, metrics events are conflated.
+    """
+    topics = {METRICS_TOPIC: QueueSettings(max_size=1,
+                                           policy=QueuePolicy.conflate)}
+    topics.update(settings.topic_queues)
+    return TopicQueue(default=settings.queue, topics=topics)
+
 
 async def _publisher_server_task(connection: Connection,
-                                 queue: Queue) -> None:
+                                 queue: ServerQueue) -> None:
     """
     Run a task that reads multipart messages: topic, data.
 
     This is the publisher server. Clients connect using zmq.PUSH pattern and
     send messages to topics. Each topic, data pair is enqueued in queue.
+    While a blocking topic's queue is full, no more messages are read, which
+    pushes back on the clients.
 
     :param connection: The network connection.
     :param queue: Queue for received messages.
@@ -27,7 +50,7 @@ async def _publisher_server_task(connection: Connection,
         while True:
             m = await connection.recv_multipart()
             log.debug("Event: %s", m)
-            await queue.put(m)
+            await queue.put(m[0].decode(errors='replace'), m)
     except asyncio.CancelledError:
         log.exception("Done")
     finally:
@@ -35,39 +58,124 @@ async def _publisher_server_task(connection: Connection,
 
 
 async def _subscriber_server_task(connection: Connection,
-                                  queue: Queue) -> None:
+                                  queue: ServerQueue,
+                                  cache: EventCache) -> None:
     """
     Run a task that publishes messages to subscribers.
 
+    Each message is recorded in cache and sent with its sequence number.
+
     :param connection: The network connection.
     :param queue: The queue of multipart messages to send
+    :param cache: The record of published messages.
     :return: None
     """
     try:
         while True:
-            s = await queue.get()
+            _, s = await queue.get()
             log.debug("Publishing: %s", s)
-            await connection.send_multipart(s)
+            # The sequence number must be the third frame.
+            s = s[:2]
+            sequence = cache.add(s)
+            await connection.send_multipart(
+                s + [snapshot.encode_sequence(sequence)])
+    except asyncio.CancelledError:
+        log.exception("Done")
+    finally:
+        connection.close()
+
+
+def handle_snapshot_request(cache: EventCache,
+                            request: Sequence[bytes]) -> List[bytes]:
+    """Create the reply to a snapshot channel request."""
+    try:
+        if request[0] == snapshot.SNAPSHOT:
+            return snapshot.encode_reply(cache.sequence, True,
+                                         cache.snapshot(request[1:]))
+        if request[0] == snapshot.REPLAY:
+            complete, events = cache.replay(
+                int(request[1]), int(request[2]), request[3:])
+            return snapshot.encode_reply(cache.sequence, complete, events)
+    except (IndexError, ValueError):
+        pass
+    log.warning("Bad snapshot request: %s", request)
+    return snapshot.encode_reply(cache.sequence, False, [])
+
+
+async def _snapshot_server_task(connection: Connection,
+                                cache: EventCache) -> None:
+    """
+    Run a task that answers snapshot and replay requests.
+
+    Replies are made between publishing messages, so they are consistent
+    with the sequence numbers of the published stream.
+
+    :param connection: The network connection.
+    :param cache: The record of published messages.
+    :return: None
+    """
+    try:
+        while True:
+            request = await connection.recv_multipart()
+            log.debug("Snapshot request: %s", request)
+            await connection.send_multipart(
+                handle_snapshot_request(cache, request))
     except asyncio.CancelledError:
         log.exception("Done")
     finally:
         connection.close()
 
 
+async def _metrics_task(queue: ServerQueue, interval: float) -> None:
+    """
+    Run a task that periodically publishes the queue metrics.
+
+    :param queue: The queue to report on and publish to.
+    :param interval: Seconds between reports.
+    :return: None
+    """
+    while True:
+        await asyncio.sleep(interval)
+        metrics = ServerMetrics(queues=queue.metrics())
+        log.debug("Metrics: %s", metrics)
+        event = Event(createdOn=datetime.now(),
+                      publisher="notify_server",
+                      data=metrics)
+        await queue.put(METRICS_TOPIC,
+                        QueueEntry(METRICS_TOPIC, event).to_frames())
+
+
+async def serve(settings: Settings, queue: ServerQueue) -> None:
+    """Run the server tasks relaying through queue. Will not return."""
+    cache = EventCache(settings.replay_size)
+    tasks = [
+        asyncio.create_task(
+            _subscriber_server_task(
+                create_publisher(
+                    settings.subscriber_address.connection_string()),
+                queue,
+                cache
+            )
+        ),
+        asyncio.create_task(
+            _snapshot_server_task(
+                create_reply(settings.snapshot_address.connection_string()),
+                cache
+            )
+        ),
+        asyncio.create_task(
+            _publisher_server_task(
+                create_pull(settings.publisher_address.connection_string()),
+                queue
+            )
+        ),
+    ]
+    if settings.metrics_interval > 0:
+        tasks.append(asyncio.create_task(
+            _metrics_task(queue, settings.metrics_interval)))
+    await asyncio.gather(*tasks)
+
+
 async def run(settings: Settings) -> None:
     """Run the server tasks. Will not return."""
-    queue: Queue = Queue()
-
-    subtask = asyncio.create_task(
-        _subscriber_server_task(
-            create_publisher(settings.subscriber_address.connection_string()),
-            queue
-        )
-    )
-    pubtask = asyncio.create_task(
-        _publisher_server_task(
-            create_pull(settings.publisher_address.connection_string()),
-            queue
-        )
-    )
-    await asyncio.gather(subtask, pubtask)
+    await serve(settings, create_queue(settings))
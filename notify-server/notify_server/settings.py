@@ -1,4 +1,6 @@
 """Settings class."""
+from enum import Enum
+from typing import Dict
 
 from typing_extensions import Literal
 from pydantic import BaseSettings, BaseModel, Field
@@ -21,11 +23,56 @@ class ServerBindAddress(BaseModel):
         return f"{self.scheme}://{remainder}"
 
 
+class QueuePolicy(str, Enum):
+    """What a queue does with an event for a topic that is full."""
+
+    #: Wait for room, applying backpressure to the sender.
+    block = "block"
+    #: Discard the oldest queued event of the topic.
+    drop_oldest = "drop_oldest"
+    #: Keep only the latest queued event of the topic, whatever max_size.
+    conflate = "conflate"
+
+
+class QueueSettings(BaseModel):
+    """Bounds of the queued events of a topic."""
+
+    max_size: int = Field(
+        1000, gt=0,
+        description="The most events of a topic that may be queued"
+    )
+    policy: QueuePolicy = Field(
+        QueuePolicy.block,
+        description="What to do with a new event when the topic is full. "
+                    "A conflate topic is full once it has one event queued"
+    )
+
+
 class Settings(BaseSettings):
     """Application Settings."""
 
     publisher_address: ServerBindAddress = ServerBindAddress(scheme="ipc")
     subscriber_address: ServerBindAddress = ServerBindAddress(scheme="tcp")
+    snapshot_address: ServerBindAddress = ServerBindAddress(scheme="tcp",
+                                                            port=5557)
+
+    queue: QueueSettings = Field(
+        QueueSettings(),
+        description="Queue settings of topics not in topic_queues"
+    )
+    topic_queues: Dict[str, QueueSettings] = Field(
+        {},
+        description="Queue settings of individual topics"
+    )
+    replay_size: int = Field(
+        1000, gt=0,
+        description="How many recent events are kept for late subscribers"
+    )
+    metrics_interval: float = Field(
+        10.0,
+        description="Seconds between queue metrics events, or 0 to not "
+                    "publish them"
+    )
 
     production: bool = Field(
         True,
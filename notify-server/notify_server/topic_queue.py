@@ -0,0 +1,153 @@
+"""A bounded queue with per topic limits and overflow policies."""
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import OrderedDict, deque
+from typing import (Deque, Dict, Generic, Mapping, Optional, Tuple,
+                    TypeVar)
+
+from notify_server.models.server_metrics import QueueMetrics
+from notify_server.settings import QueuePolicy, QueueSettings
+
+T = TypeVar("T")
+
+
+class _Topic:
+    """The queued events and counters of one topic."""
+
+    __slots__ = ("settings", "pending", "space", "max_depth", "enqueued",
+                 "dropped", "conflated")
+
+    def __init__(self, settings: QueueSettings) -> None:
+        """Construct."""
+        self.settings = settings
+        #: Sequence numbers of the queued events of this topic, oldest first
+        self.pending: Deque[int] = deque()
+        #: Set when a blocked sender may retry.
+        self.space: Optional[asyncio.Event] = None
+        self.max_depth = 0
+        self.enqueued = 0
+        self.dropped = 0
+        self.conflated = 0
+
+    def metrics(self) -> QueueMetrics:
+        """Create a snapshot of the counters."""
+        return QueueMetrics(depth=len(self.pending),
+                            max_depth=self.max_depth,
+                            enqueued=self.enqueued,
+                            dropped=self.dropped,
+                            conflated=self.conflated)
+
+
+class TopicQueue(Generic[T]):
+    """
+    A FIFO queue of (topic, item) pairs, bounded per topic.
+
+    Items come out in the order they were put in, across all topics. Each
+    topic has its own QueueSettings: once a topic has max_size items queued,
+    a put either waits for a get (block) or discards the topic's oldest item
+    (drop_oldest). A conflate topic holds at most one item whatever its
+    max_size: a put replaces the queued item, if there is one, so only the
+    latest value is delivered, in the queued item's place in line.
+    """
+
+    def __init__(self,
+                 default: Optional[QueueSettings] = None,
+                 topics: Optional[Mapping[str, QueueSettings]] = None
+                 ) -> None:
+        """
+        Construct.
+
+        :param default: Settings of topics not in topics.
+        :param topics: Settings of individual topics.
+        """
+        self._default = default or QueueSettings()
+        self._topic_settings = dict(topics or {})
+        self._topics: Dict[str, _Topic] = {}
+        self._items: OrderedDict[int, Tuple[str, T]] = OrderedDict()
+        self._sequence = itertools.count()
+        self._not_empty: Optional[asyncio.Event] = None
+
+    def _topic(self, topic: str) -> _Topic:
+        t = self._topics.get(topic)
+        if t is None:
+            t = _Topic(self._topic_settings.get(topic, self._default))
+            self._topics[topic] = t
+        return t
+
+    def qsize(self) -> int:
+        """Get the number of queued items."""
+        return len(self._items)
+
+    def empty(self) -> bool:
+        """Check whether the queue is empty."""
+        return not self._items
+
+    def put_nowait(self, topic: str, item: T) -> None:
+        """
+        Queue an item without waiting.
+
+        :raises asyncio.QueueFull: if the topic uses the block policy and is
+            full.
+        """
+        t = self._topic(topic)
+        if t.settings.policy == QueuePolicy.conflate and t.pending:
+            # Replacing the value keeps the item's place in line.
+            self._items[t.pending[0]] = (topic, item)
+            t.enqueued += 1
+            t.conflated += 1
+            return
+        if len(t.pending) >= t.settings.max_size:
+            if t.settings.policy == QueuePolicy.drop_oldest:
+                del self._items[t.pending.popleft()]
+                t.dropped += 1
+            else:
+                raise asyncio.QueueFull()
+
+        sequence = next(self._sequence)
+        self._items[sequence] = (topic, item)
+        t.pending.append(sequence)
+        t.enqueued += 1
+        t.max_depth = max(t.max_depth, len(t.pending))
+        if self._not_empty is not None:
+            self._not_empty.set()
+
+    async def put(self, topic: str, item: T) -> None:
+        """Queue an item, waiting for room if the topic must not drop any."""
+        t = self._topic(topic)
+        while t.settings.policy == QueuePolicy.block \
+                and len(t.pending) >= t.settings.max_size:
+            if t.space is None:
+                t.space = asyncio.Event()
+            t.space.clear()
+            await t.space.wait()
+        self.put_nowait(topic, item)
+
+    def get_nowait(self) -> Tuple[str, T]:
+        """
+        Remove and return the oldest (topic, item).
+
+        :raises asyncio.QueueEmpty: if there are no items.
+        """
+        if not self._items:
+            raise asyncio.QueueEmpty()
+        _, (topic, item) = self._items.popitem(last=False)
+        t = self._topics[topic]
+        t.pending.popleft()
+        if t.space is not None:
+            t.space.set()
+        return topic, item
+
+    async def get(self) -> Tuple[str, T]:
+        """Remove and return the oldest (topic, item), waiting for one."""
+        while not self._items:
+            if self._not_empty is None:
+                self._not_empty = asyncio.Event()
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def metrics(self) -> Dict[str, QueueMetrics]:
+        """Get the queue metrics of each topic seen so far."""
+        return {topic: t.metrics() for topic, t in self._topics.items()}
@@ -19,6 +19,8 @@ def integration_environment() -> None:
         json.dumps({"scheme": "tcp", "host": "127.0.0.1", "port": 5555})
     environ['OT_NOTIFY_SERVER_subscriber_address'] =\
         json.dumps({"scheme": "tcp", "host": "127.0.0.1", "port": 5556})
+    environ['OT_NOTIFY_SERVER_snapshot_address'] =\
+        json.dumps({"scheme": "tcp", "host": "127.0.0.1", "port": 5557})
     # Set production to false
     environ['OT_NOTIFY_SERVER_production'] = "false"
 
@@ -1,11 +1,12 @@
 """Pub sub integration tests."""
-from asyncio import Task, sleep
+from asyncio import Task, sleep, wait_for
 from typing import AsyncGenerator, Tuple
 
 import pytest
 
-from notify_server.clients import publisher, subscriber
+from notify_server.clients import publisher, snapshot, subscriber
 from notify_server.models.event import Event
+from notify_server.network.connection import create_subscriber
 from notify_server.settings import Settings
 
 pytestmark = pytest.mark.asyncio
@@ -73,3 +74,71 @@ async def test_two_pub_two_sub_two_topics(
     e = await subscriber_all_topics.next_event()
     assert e.topic == "topic2"
     assert e.event == event
+
+
+async def test_late_subscriber_gets_snapshot(
+        server_fixture: Task,
+        two_publishers: Tuple[publisher.Publisher, publisher.Publisher],
+        settings: Settings,
+        event: Event) -> None:
+    """Test that a late subscriber gets the last event of each topic."""
+    await sleep(.1)
+    pub, _ = two_publishers
+    events = [event.copy(update={"publisher": str(i)}) for i in range(4)]
+
+    await pub.send("topic1", events[0])
+    await pub.send("topic2", events[1])
+    await pub.send("topic1", events[2])
+    await sleep(.1)
+
+    sub = subscriber.create(settings.subscriber_address.connection_string(),
+                            TOPICS,
+                            snapshot_address=settings.snapshot_address.
+                            connection_string())
+    try:
+        e = await sub.next_event()
+        assert (e.topic, e.event) == ("topic2", events[1])
+        e = await sub.next_event()
+        assert (e.topic, e.event) == ("topic1", events[2])
+
+        await sleep(.1)
+        await pub.send("topic2", events[3])
+        e = await sub.next_event()
+        assert (e.topic, e.event) == ("topic2", events[3])
+        assert sub.queue.empty()
+    finally:
+        await sub.stop()
+
+
+async def test_subscriber_catches_up_before_subscription_is_live(
+        server_fixture: Task,
+        two_publishers: Tuple[publisher.Publisher, publisher.Publisher],
+        settings: Settings,
+        event: Event) -> None:
+    """Test that events published before the subscription is live arrive."""
+    await sleep(.1)
+    pub, _ = two_publishers
+    events = [event.copy(update={"publisher": str(i)}) for i in range(3)]
+    await pub.send("topic1", events[0])
+    await sleep(.1)
+
+    # Nothing listens here, so the subscription never goes live and the
+    # events published after the snapshot can only be replayed.
+    sub = subscriber.Subscriber(
+        create_subscriber("tcp://127.0.0.1:5558", TOPICS),
+        snapshot_client=snapshot.create(
+            settings.snapshot_address.connection_string(), TOPICS))
+    try:
+        e = await sub.next_event()
+        assert (e.topic, e.event) == ("topic1", events[0])
+
+        await pub.send("topic2", events[1])
+        await pub.send("topic1", events[2])
+        e = await wait_for(sub.next_event(), 5)
+        assert (e.topic, e.event) == ("topic2", events[1])
+        e = await wait_for(sub.next_event(), 5)
+        assert (e.topic, e.event) == ("topic1", events[2])
+        await sleep(.5)
+        assert sub.queue.empty()
+    finally:
+        await sub.stop()
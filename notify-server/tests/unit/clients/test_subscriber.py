@@ -0,0 +1,111 @@
+"""Unit tests for subscriber module."""
+import asyncio
+from typing import Any, List, Union
+
+import pytest
+
+from notify_server.clients.queue_entry import QueueEntry
+from notify_server.clients.subscriber import Subscriber
+from notify_server.models.event import Event
+from notify_server.network.snapshot import Reply
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeConnection:
+    """A connection that receives prepared frames."""
+
+    def __init__(self, received: List[List[bytes]],
+                 delay: float = 0) -> None:
+        """Construct."""
+        self._received = received
+        self._delay = delay
+
+    async def recv_multipart(self) -> List[bytes]:
+        """Receive the next prepared frames, or wait forever."""
+        if not self._received:
+            await asyncio.Event().wait()
+        await asyncio.sleep(self._delay)
+        return self._received.pop(0)
+
+    def close(self) -> None:
+        """Close."""
+        pass
+
+
+class FakeSnapshotClient:
+    """A snapshot client with prepared replies."""
+
+    def __init__(self, snapshot: Reply,
+                 replay: Union[Reply, Exception]) -> None:
+        """Construct."""
+        self._snapshot = snapshot
+        self._replay = replay
+        self.replayed: List[Any] = []
+        self.closed = False
+
+    async def snapshot(self) -> Reply:
+        """Get the prepared snapshot."""
+        return self._snapshot
+
+    async def replay(self, after: int, before: int) -> Reply:
+        """Get the prepared replay."""
+        self.replayed.append((after, before))
+        if isinstance(self._replay, Exception):
+            raise self._replay
+        return self._replay
+
+    def close(self) -> None:
+        """Close."""
+        self.closed = True
+
+
+async def test_joins_live_stream_without_gaps(event: Event) -> None:
+    """Test that a subscriber with a snapshot client joins the stream."""
+    events = [event.copy(update={"publisher": str(i)}) for i in range(7)]
+
+    def frames(i: int) -> List[bytes]:
+        return QueueEntry("topic", events[i]).to_frames()
+
+    # Events 1 and 3 were published to other topics.
+    snapshot_client = FakeSnapshotClient(
+        snapshot=Reply(sequence=2, complete=True, events=[(2, frames(2))]),
+        replay=Reply(sequence=6, complete=True, events=[(4, frames(4))]))
+    connection = FakeConnection([
+        frames(2) + [b"2"], frames(5) + [b"5"], frames(6) + [b"6"]])
+
+    sub = Subscriber(connection,  # type: ignore
+                     snapshot_client=snapshot_client)  # type: ignore
+    try:
+        received = [(await sub.next_event()).event for _ in range(4)]
+    finally:
+        await sub.stop()
+    assert received == [events[2], events[4], events[5], events[6]]
+    assert snapshot_client.replayed == [(2, 5)]
+
+
+async def test_stops_using_failed_snapshot_client(event: Event) -> None:
+    """Test that a snapshot client isn't used after a request fails."""
+    events = [event.copy(update={"publisher": str(i)}) for i in range(7)]
+
+    def frames(i: int) -> List[bytes]:
+        return QueueEntry("topic", events[i]).to_frames()
+
+    snapshot_client = FakeSnapshotClient(
+        snapshot=Reply(sequence=2, complete=True, events=[(2, frames(2))]),
+        replay=asyncio.TimeoutError())
+    # The live events arrive after a catch up replay has timed out, and
+    # skip event 4.
+    connection = FakeConnection(
+        [frames(5) + [b"5"], frames(6) + [b"6"]], delay=0.2)
+
+    sub = Subscriber(connection,  # type: ignore
+                     snapshot_client=snapshot_client)  # type: ignore
+    try:
+        received = [(await asyncio.wait_for(sub.next_event(), 2)).event
+                    for _ in range(3)]
+    finally:
+        await sub.stop()
+    assert received == [events[2], events[5], events[6]]
+    assert len(snapshot_client.replayed) == 1
+    assert snapshot_client.closed
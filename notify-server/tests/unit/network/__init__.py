@@ -0,0 +1 @@
+"""Network unit tests package."""
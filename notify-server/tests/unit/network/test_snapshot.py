@@ -0,0 +1,34 @@
+"""Unit tests for snapshot module."""
+from typing import List
+
+import pytest
+
+from notify_server.network import snapshot
+
+
+def test_reply_round_trip() -> None:
+    """Test that replies decode to what was encoded."""
+    events = [(3, [b"a", b"{}"]), (5, [b"b", b"{}"])]
+    frames = snapshot.encode_reply(7, False, events)
+    assert frames == [b"7", b"0", b"a", b"{}", b"3", b"b", b"{}", b"5"]
+    assert snapshot.decode_reply(frames) == snapshot.Reply(
+        sequence=7, complete=False, events=events)
+
+
+@pytest.mark.parametrize(argnames=["frames"],
+                         argvalues=[
+                             [[]],
+                             [[b"1", b"1", b"a"]],
+                             [[b"x", b"1"]],
+                             [[b"1", b"1", b"a", b"{}", b"x"]]]
+                         )
+def test_decode_reply_fail(frames: List[bytes]) -> None:
+    """Test that an exception is raised on a bad reply."""
+    with pytest.raises(snapshot.MalformedReply):
+        snapshot.decode_reply(frames)
+
+
+def test_sequence_of() -> None:
+    """Test reading the sequence number of published frames."""
+    assert snapshot.sequence_of([b"a", b"{}", b"12"]) == 12
+    assert snapshot.sequence_of([b"a", b"{}"]) is None
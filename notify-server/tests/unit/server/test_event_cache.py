@@ -0,0 +1,41 @@
+"""Unit tests for event_cache module."""
+from notify_server.server.event_cache import EventCache
+
+
+def test_snapshot_keeps_last_of_each_topic() -> None:
+    """Test that a snapshot has the latest event of matching topics."""
+    cache = EventCache(replay_size=10)
+    assert cache.add([b"temp/1", b"a"]) == 1
+    assert cache.add([b"temp/2", b"b"]) == 2
+    assert cache.add([b"temp/1", b"c"]) == 3
+    assert cache.add([b"run", b"d"]) == 4
+    assert cache.sequence == 4
+    assert cache.snapshot([b"temp"]) == [(2, [b"temp/2", b"b"]),
+                                         (3, [b"temp/1", b"c"])]
+    assert cache.snapshot([b"run", b"temp/1"]) == [(3, [b"temp/1", b"c"]),
+                                                   (4, [b"run", b"d"])]
+    assert cache.snapshot([b"other"]) == []
+
+
+def test_replay() -> None:
+    """Test replaying the recent events between two sequence numbers."""
+    cache = EventCache(replay_size=3)
+    for i in range(1, 6):
+        cache.add([b"even" if i % 2 == 0 else b"odd", bytes([i])])
+
+    assert cache.replay(3, 6, [b"even", b"odd"]) == (
+        True, [(4, [b"even", bytes([4])]), (5, [b"odd", bytes([5])])])
+    assert cache.replay(2, 5, [b"odd"]) == (True, [(3, [b"odd", bytes([3])])])
+    # Events 1 and 2 are no longer kept.
+    assert cache.replay(0, 4, [b"odd"]) == (
+        False, [(3, [b"odd", bytes([3])])])
+    assert cache.replay(2, 4, [b"odd"])[0]
+
+
+def test_replay_before_ring_fills() -> None:
+    """Test that a replay from the start is complete until events drop."""
+    cache = EventCache(replay_size=3)
+    cache.add([b"a", b""])
+    cache.add([b"a", b""])
+    assert cache.replay(0, 3, [b"a"]) == (
+        True, [(1, [b"a", b""]), (2, [b"a", b""])])
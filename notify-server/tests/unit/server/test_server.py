@@ -0,0 +1,40 @@
+"""Unit tests for the server module."""
+from notify_server.models.server_metrics import METRICS_TOPIC
+from notify_server.network import snapshot
+from notify_server.server.event_cache import EventCache
+from notify_server.server.server import create_queue, handle_snapshot_request
+from notify_server.settings import Settings, QueueSettings, QueuePolicy
+
+
+def test_create_queue() -> None:
+    """Test that the server queue follows the settings."""
+    settings = Settings(
+        queue=QueueSettings(max_size=2, policy=QueuePolicy.drop_oldest),
+        topic_queues={"temp": QueueSettings(max_size=1,
+                                            policy=QueuePolicy.conflate)})
+    queue = create_queue(settings)
+    for i in range(3):
+        for topic in ("temp", "other", METRICS_TOPIC):
+            queue.put_nowait(topic, [topic.encode(), bytes([i])])
+
+    metrics = queue.metrics()
+    assert metrics["temp"].conflated == 2
+    assert metrics["other"].dropped == 1
+    assert metrics[METRICS_TOPIC].conflated == 2
+    assert queue.qsize() == 4
+
+
+def test_handle_snapshot_request() -> None:
+    """Test replies to snapshot channel requests."""
+    cache = EventCache(replay_size=2)
+    for i in range(3):
+        cache.add([b"topic", bytes([i])])
+
+    assert handle_snapshot_request(cache, [snapshot.SNAPSHOT, b"top"]) \
+        == [b"3", b"1", b"topic", bytes([2]), b"3"]
+    assert handle_snapshot_request(
+        cache, [snapshot.REPLAY, b"0", b"3", b"topic"]) \
+        == [b"3", b"0", b"topic", bytes([1]), b"2"]
+    assert handle_snapshot_request(cache, [b"nonsense"]) == [b"3", b"0"]
+    assert handle_snapshot_request(cache, [snapshot.REPLAY, b"x"]) \
+        == [b"3", b"0"]
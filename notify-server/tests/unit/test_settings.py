@@ -7,7 +7,8 @@ from unittest.mock import patch, MagicMock
 import pytest
 from _pytest.fixtures import FixtureRequest
 
-from notify_server.settings import Settings, ServerBindAddress
+from notify_server.settings import Settings, ServerBindAddress, \
+    QueueSettings, QueuePolicy
 
 
 @pytest.fixture
@@ -69,3 +70,13 @@ def test_override_subscriber_address(server_address_override: None,
 def test_connection_string(address: ServerBindAddress, expected: str) -> None:
     """Test creation of zmq host address from settings."""
     assert address.connection_string() == expected
+
+
+def test_override_topic_queues(envvar_patch: MagicMock) -> None:
+    """Test environment var override of queue settings."""
+    envvar_patch['OT_NOTIFY_SERVER_topic_queues'] = json.dumps(
+        {"temp": {"max_size": 1, "policy": "conflate"}})
+    s = Settings()
+    assert s.topic_queues == {
+        "temp": QueueSettings(max_size=1, policy=QueuePolicy.conflate)}
+    assert s.queue == QueueSettings()
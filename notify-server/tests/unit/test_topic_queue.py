@@ -0,0 +1,97 @@
+"""Unit tests for topic_queue module."""
+import asyncio
+
+import pytest
+
+from notify_server.models.server_metrics import QueueMetrics
+from notify_server.settings import QueueSettings, QueuePolicy
+from notify_server.topic_queue import TopicQueue
+
+pytestmark = pytest.mark.asyncio
+
+
+def drain(queue: TopicQueue) -> list:
+    """Get everything in the queue."""
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+async def test_fifo_across_topics() -> None:
+    """Test that items come out in the order they were put in."""
+    queue: TopicQueue[int] = TopicQueue()
+    for i, topic in enumerate(("a", "b", "a", "c", "b")):
+        await queue.put(topic, i)
+    assert queue.qsize() == 5
+    assert drain(queue) == [("a", 0), ("b", 1), ("a", 2), ("c", 3), ("b", 4)]
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+
+
+async def test_drop_oldest() -> None:
+    """Test that a full drop_oldest topic discards its oldest item."""
+    queue: TopicQueue[int] = TopicQueue(
+        default=QueueSettings(max_size=2, policy=QueuePolicy.drop_oldest))
+    for i in range(4):
+        queue.put_nowait("a", i)
+        queue.put_nowait("b", i)
+    assert drain(queue) == [("a", 2), ("b", 2), ("a", 3), ("b", 3)]
+    assert queue.metrics()["a"] == QueueMetrics(
+        depth=0, max_depth=2, enqueued=4, dropped=2, conflated=0)
+
+
+async def test_conflate_keeps_place() -> None:
+    """Test that conflate replaces the queued value in its place."""
+    queue: TopicQueue[int] = TopicQueue(
+        topics={"temp": QueueSettings(max_size=1,
+                                      policy=QueuePolicy.conflate)})
+    queue.put_nowait("temp", 1)
+    queue.put_nowait("other", 2)
+    queue.put_nowait("temp", 3)
+    queue.put_nowait("temp", 4)
+    assert drain(queue) == [("temp", 4), ("other", 2)]
+    assert queue.metrics()["temp"].conflated == 2
+    queue.put_nowait("temp", 5)
+    assert drain(queue) == [("temp", 5)]
+
+
+async def test_conflate_keeps_one_item_with_default_size() -> None:
+    """Test that conflate keeps one item per topic, whatever max_size."""
+    queue: TopicQueue[int] = TopicQueue(
+        default=QueueSettings(policy=QueuePolicy.conflate))
+    for value in range(50):
+        queue.put_nowait("temp", value)
+    queue.put_nowait("other", 1)
+    assert drain(queue) == [("temp", 49), ("other", 1)]
+    metrics = queue.metrics()["temp"]
+    assert metrics.conflated == 49
+    assert metrics.max_depth == 1
+
+
+async def test_block_applies_backpressure() -> None:
+    """Test that put waits for room in a full blocking topic."""
+    queue: TopicQueue[int] = TopicQueue(
+        default=QueueSettings(max_size=1, policy=QueuePolicy.block))
+    await queue.put("a", 1)
+    await queue.put("b", 1)
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait("a", 2)
+
+    blocked = asyncio.create_task(queue.put("a", 2))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    assert await queue.get() == ("a", 1)
+    await asyncio.wait_for(blocked, 1)
+    assert drain(queue) == [("b", 1), ("a", 2)]
+    assert queue.metrics()["a"].dropped == 0
+
+
+async def test_get_waits() -> None:
+    """Test that get waits for an item."""
+    queue: TopicQueue[str] = TopicQueue()
+    getter = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+    assert not getter.done()
+    await queue.put("a", "value")
+    assert await asyncio.wait_for(getter, 1) == ("a", "value")
@@ -9,6 +9,7 @@ from opentrons.protocols.implementations.labware import LabwareImplementation
 from robot_server.robot.calibration.session import CalibrationSession, \
     HEIGHT_SAFETY_BUFFER
 from opentrons.types import Mount, Point, Location
+from opentrons.util import linal
 
 from robot_server.robot.calibration.check.util import StateMachine, WILDCARD
 from robot_server.robot.calibration.check.models import ComparisonStatus
@@ -469,15 +470,12 @@ class CheckCalibrationSession(CalibrationSession, StateMachine):
         pip_model = self.pipettes[mount]['model']
         if str(pip_model).startswith('p1000'):
             threshold_vector = P1000_OK_TIP_PICK_UP_VECTOR
-        xyThresholdMag = Point(0, 0, 0).magnitude_to(
-                threshold_vector._replace(z=0))
-        zThresholdMag = Point(0, 0, 0).magnitude_to(
-                threshold_vector._replace(x=0, y=0))
-        xyDiffMag = ref_pt_no_safety._replace(z=0).magnitude_to(
-                jogged_pt._replace(z=0))
-        zDiffMag = ref_pt_no_safety._replace(x=0, y=0).magnitude_to(
-                jogged_pt._replace(x=0, y=0))
-        return xyDiffMag > xyThresholdMag or zDiffMag > zThresholdMag
+        diff = jogged_pt - ref_pt_no_safety
+        # Check the x-y and z distances separately
+        return bool(linal.exceeds_thresholds(
+            [diff, diff],
+            [threshold_vector._replace(z=0),
+             threshold_vector._replace(x=0, y=0)]).any())
 
     async def _pick_up_tip_first_pipette(self):
         """
@@ -617,7 +615,8 @@ class CheckCalibrationSession(CalibrationSession, StateMachine):
 
     def get_comparisons_by_step(
             self) -> typing.Dict[CalibrationCheckState, ComparisonStatus]:
-        comparisons: typing.Dict[CalibrationCheckState, ComparisonStatus] = {}
+        compared: typing.List[
+            typing.Tuple[CalibrationCheckState, Point, Point]] = []
         for comparison_state, comp in COMPARISON_STATE_MAP.items():
             ref_pt = self._saved_points.get(getattr(CalibrationCheckState,
                                                     comp.reference_state),
@@ -626,34 +625,30 @@ class CheckCalibrationSession(CalibrationSession, StateMachine):
             jogged_pt = self._saved_points.get(getattr(CalibrationCheckState,
                                                        comparison_state), None)
 
-            threshold_vector = self._determine_threshold(comparison_state)
             if (ref_pt is not None and jogged_pt is not None):
-                diff_magnitude = None
-                if threshold_vector.z == 0.0:
-                    diff_magnitude = ref_pt._replace(z=0.0).magnitude_to(
-                            jogged_pt._replace(z=0.0))
-                elif threshold_vector.x == 0.0 and \
-                        threshold_vector.y == 0.0:
-                    diff_magnitude = ref_pt._replace(
-                            x=0.0, y=0.0).magnitude_to(jogged_pt._replace(
-                                                       x=0.0, y=0.0))
-                assert diff_magnitude is not None, \
-                    'step comparisons must check z or (x and y) magnitude'
-
-                threshold_mag = Point(0, 0, 0).magnitude_to(
-                        threshold_vector)
-                exceeds = diff_magnitude > threshold_mag
-                tform_type = DeckCalibrationError.UNKNOWN
-
-                if exceeds:
-                    tform_type = self._get_error_source(comparisons,
-                                                        comparison_state)
-                comparisons[getattr(CalibrationCheckState,
-                                    comparison_state)] = \
-                    ComparisonStatus(differenceVector=(jogged_pt - ref_pt),
-                                     thresholdVector=threshold_vector,
-                                     exceedsThreshold=exceeds,
-                                     transformType=str(tform_type))
+                compared.append((comparison_state,
+                                 jogged_pt - ref_pt,
+                                 self._determine_threshold(comparison_state)))
+
+        # Check every step against its threshold at once
+        exceeded = linal.exceeds_thresholds(
+            [diff for _, diff, _ in compared],
+            [threshold for _, _, threshold in compared])
+
+        comparisons: typing.Dict[CalibrationCheckState, ComparisonStatus] = {}
+        for (comparison_state, diff, threshold_vector), exceeds in zip(
+                compared, exceeded):
+            tform_type = DeckCalibrationError.UNKNOWN
+
+            if exceeds:
+                tform_type = self._get_error_source(comparisons,
+                                                    comparison_state)
+            comparisons[getattr(CalibrationCheckState,
+                                comparison_state)] = \
+                ComparisonStatus(differenceVector=diff,
+                                 thresholdVector=threshold_vector,
+                                 exceedsThreshold=bool(exceeds),
+                                 transformType=str(tform_type))
         return comparisons
 
     async def _register_point_first_pipette(self):
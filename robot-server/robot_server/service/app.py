@@ -2,6 +2,7 @@ import logging
 import traceback
 
 from opentrons import __version__
+from opentrons.hardware_control.simulator_pool import get_default_pool
 from fastapi import FastAPI, APIRouter, Depends
 from fastapi.exceptions import RequestValidationError
 from starlette.responses import Response, JSONResponse
@@ -95,6 +96,8 @@ async def on_shutdown():
     await get_session_manager().remove_all()
     # Remove all uploaded protocols
     get_protocol_manager().remove_all()
+    # Stop the simulators kept for protocol sessions
+    get_default_pool().clear()
 
 
 @app.middleware("http")
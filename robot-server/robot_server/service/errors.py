@@ -165,6 +165,11 @@ class CommonErrorDef(ErrorDef):
         title='Action Forbidden',
         format_string='{reason}'
     )
+    PAYLOAD_TOO_LARGE = ErrorCreateDef(
+        status_code=status_codes.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        title='Payload Too Large',
+        format_string='{reason}'
+    )
     RESOURCE_ALREADY_EXISTS = ErrorCreateDef(
         status_code=status_codes.HTTP_403_FORBIDDEN,
         title='Resource Exists',
@@ -1,10 +1,13 @@
 from typing import List, Optional, Union
 
 from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
 from fastapi import APIRouter
 from functools import partial
 
 
+from opentrons import config
 from opentrons.calibration_storage import (
     helpers,
     types as cal_types,
@@ -14,9 +17,13 @@ from opentrons.calibration_storage import (
 from robot_server.service.labware import models as lw_models
 from robot_server.service.errors import RobotServerError, CommonErrorDef
 from robot_server.service.json_api import ErrorResponse, ResponseDataModel
+from robot_server.service.response_cache import ResponseCache, \
+    files_version
 
 router = APIRouter()
 
+response_cache = ResponseCache()
+
 
 """
 These routes serve the current labware offsets on the robot to a client.
@@ -109,10 +116,24 @@ def _check_parent(
                     "labware has been calibrated or not.",
             response_model=lw_models.MultipleCalibrationsResponse)
 async def get_all_labware_calibrations(
+        request: Request,
         loadName: str = None,
         namespace: str = None,
         version: int = None,
-        parent: str = None) -> lw_models.MultipleCalibrationsResponse:
+        parent: str = None) -> Response:
+    return response_cache.respond(
+        request,
+        files_version(config.get_opentrons_path(
+            'labware_calibration_offsets_dir_v2')),
+        lambda: _build_labware_calibrations(
+            loadName, namespace, version, parent))
+
+
+def _build_labware_calibrations(
+        loadName: Optional[str],
+        namespace: Optional[str],
+        version: Optional[int],
+        parent: Optional[str]) -> lw_models.MultipleCalibrationsResponse:
     all_calibrations = get_cal.get_all_calibrations()
 
     if not all_calibrations:
@@ -182,3 +203,4 @@ async def delete_specific_labware_calibration(
         raise RobotServerError(definition=CommonErrorDef.RESOURCE_NOT_FOUND,
                                resource='calibration',
                                id=calibrationId)
+    response_cache.invalidate()
@@ -1,6 +1,8 @@
 import typing
 import asyncio
 from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
 from fastapi import Path, APIRouter, Depends
 
 from opentrons.hardware_control import ThreadManager, modules
@@ -11,33 +13,55 @@ from robot_server.service.legacy.models import V1BasicResponse
 from robot_server.service.errors import V1HandlerError
 from robot_server.service.legacy.models.modules import Module, ModuleSerial,\
     Modules, SerialCommandResponse, SerialCommand
+from robot_server.service.response_cache import ResponseCache
 
 router = APIRouter()
 
+response_cache = ResponseCache()
+
 
 @router.get("/modules",
             description="Describe the modules attached to the OT-2",
             response_model=Modules)
-async def get_modules(hardware: ThreadManager = Depends(get_hardware))\
-        -> Modules:
+async def get_modules(request: Request,
+                      hardware: ThreadManager = Depends(get_hardware))\
+        -> Response:
     attached_modules = hardware.attached_modules   # type: ignore
-    module_data = [
-        Module(
-            name=mod.name(),  # TODO: legacy, remove
-            displayName=mod.name(),  # TODO: legacy, remove
-            model=mod.device_info.get('model'),  # TODO legacy, remove
-            moduleModel=mod.model(),
-            port=mod.port,  # /dev/ttyS0
-            serial=mod.device_info.get('serial'),
-            revision=mod.device_info.get('model'),
-            fwVersion=mod.device_info.get('version'),
-            hasAvailableUpdate=mod.has_available_update(),
-            status=mod.live_data['status'],
-            data=mod.live_data['data']
-        )
-        for mod in attached_modules
-    ]
-    return Modules(modules=module_data)
+
+    def build() -> Modules:
+        module_data = [
+            Module(
+                name=mod.name(),  # TODO: legacy, remove
+                displayName=mod.name(),  # TODO: legacy, remove
+                model=mod.device_info.get('model'),  # TODO legacy, remove
+                moduleModel=mod.model(),
+                port=mod.port,  # /dev/ttyS0
+                serial=mod.device_info.get('serial'),
+                revision=mod.device_info.get('model'),
+                fwVersion=mod.device_info.get('version'),
+                hasAvailableUpdate=mod.has_available_update(),
+                status=mod.live_data['status'],
+                data=mod.live_data['data']
+            )
+            for mod in attached_modules
+        ]
+        return Modules(modules=module_data)
+
+    return response_cache.respond(
+        request, _modules_version(attached_modules), build)
+
+
+def _modules_version(attached_modules: typing.List[AbstractModule]) \
+        -> typing.Hashable:
+    """Everything GET /modules reports, without building the response"""
+    return tuple(
+        (mod.port,
+         mod.name(),
+         mod.model(),
+         repr(mod.device_info),
+         mod.has_available_update(),
+         repr(mod.live_data))
+        for mod in attached_modules)
 
 
 @router.get("/modules/{serial}/data",
@@ -114,6 +138,7 @@ async def post_serial_command(
                         f'Possibly a type mismatch in args',
                 status_code=status.HTTP_400_BAD_REQUEST)
         else:
+            response_cache.invalidate()
             return SerialCommandResponse(message='Success', returnValue=val)
     else:
         raise V1HandlerError(
@@ -149,6 +174,7 @@ async def post_serial_update(
                     matching_module.bundled_fw.path,
                     asyncio.get_event_loop()),
                 100)
+            response_cache.invalidate()
             return V1BasicResponse(
                 message=f'Successfully updated module {serial}'
             )
@@ -2,12 +2,14 @@ import logging
 from typing import Dict
 
 from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
 from fastapi import APIRouter, Depends
 
 from opentrons.hardware_control import ThreadManager
 from opentrons.system import log_control
-from opentrons.config import pipette_config, reset as reset_util, \
-    robot_configs, advanced_settings
+from opentrons.config import CONFIG, pipette_config, \
+    reset as reset_util, robot_configs, advanced_settings
 
 from robot_server.service.dependencies import get_hardware
 from robot_server.service.legacy.models import V1BasicResponse
@@ -17,11 +19,15 @@ from robot_server.service.legacy.models.settings import \
     PipetteSettings, PipetteSettingsUpdate, RobotConfigs, \
     MultiPipetteSettings, PipetteSettingsInfo, PipetteSettingsFields, \
     FactoryResetOption, AdvancedSettingRequest, Links, AdvancedSetting
+from robot_server.service.response_cache import ResponseCache, \
+    files_version, invalidate_all
 
 log = logging.getLogger(__name__)
 
 router = APIRouter()
 
+settings_cache = ResponseCache()
+
 
 @router.post("/settings",
              description="Change an advanced setting (feature flag)",
@@ -40,6 +46,7 @@ async def post_settings(update: AdvancedSettingRequest)\
         raise V1HandlerError(
             message=str(e),
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    settings_cache.invalidate()
     return _create_settings_response()
 
 
@@ -48,9 +55,14 @@ async def post_settings(update: AdvancedSettingRequest)\
                         "flags) and their values",
             response_model=AdvancedSettingsResponse,
             response_model_exclude_unset=True)
-async def get_settings() -> AdvancedSettingsResponse:
+async def get_settings(request: Request) -> Response:
     """Get advanced setting (feature flags)"""
-    return _create_settings_response()
+    return settings_cache.respond(
+        request,
+        (files_version(CONFIG['feature_flags_file']),
+         advanced_settings.is_restart_required()),
+        _create_settings_response,
+        exclude_unset=True)
 
 
 def _create_settings_response() -> AdvancedSettingsResponse:
@@ -162,6 +174,7 @@ async def post_settings_reset_options(
         -> V1BasicResponse:
     options = set(k for k, v in factory_reset_commands.items() if v)
     reset_util.reset(options)
+    invalidate_all()
 
     message = "Options '{}' were reset".format(
         ", ".join(o.name for o in options)) \
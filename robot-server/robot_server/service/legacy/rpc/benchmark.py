@@ -0,0 +1,108 @@
+"""
+Wire encoding benchmark.
+
+Simulates a protocol in a legacy RPC session and reports the size and
+encode time of the session's object tree in each available encoding, the
+way the RPC server sends it as the result of a call. For example:
+
+    python -m robot_server.service.legacy.rpc.benchmark --transfers 200
+"""
+import argparse
+import asyncio
+import json
+import time
+import typing
+
+from opentrons.api import MainRouter
+from opentrons.hardware_control import API, ThreadManager, ThreadedAsyncLock
+
+from robot_server.service.legacy.rpc import rpc, serialize
+from robot_server.service.legacy.rpc.encoding import Encoding, encode
+
+PROTOCOL = """
+metadata = {{'apiLevel': '2.8'}}
+
+def run(ctx):
+    tips = [ctx.load_labware('opentrons_96_tiprack_300ul', slot)
+            for slot in ('1', '4', '7', '10')]
+    plates = [ctx.load_labware('corning_96_wellplate_360ul_flat', slot)
+              for slot in ('2', '3', '5', '6', '8', '9')]
+    left = ctx.load_instrument('p300_single_gen2', 'left', tip_racks=tips)
+    right = ctx.load_instrument('p300_single_gen2', 'right', tip_racks=tips)
+    left.pick_up_tip()
+    right.pick_up_tip()
+    for i in range({transfers}):
+        pipette = left if i % 2 else right
+        source = plates[i % len(plates)].wells()[i % 96]
+        dest = plates[(i + 1) % len(plates)].wells()[(i * 7) % 96]
+        pipette.transfer(100, source, dest, new_tip='never')
+"""
+
+
+def _measure(payload: typing.Dict[str, typing.Any],
+             encoding: Encoding,
+             repeat: int) -> typing.Tuple[int, float]:
+    """Return the encoded size in bytes and the mean encode time in
+    seconds"""
+    if encoding.binary:
+        def run() -> bytes:
+            return encode(payload, encoding)
+    else:
+        # What starlette's send_json does
+        def run() -> bytes:
+            return json.dumps(payload).encode('utf-8')
+    start = time.perf_counter()
+    for _ in range(repeat):
+        data = run()
+    return len(data), (time.perf_counter() - start) / repeat
+
+
+def run(transfers: int, repeat: int) -> None:
+    """Run the benchmark."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    hardware = ThreadManager(API.build_hardware_simulator)
+    try:
+        router = MainRouter(hardware, loop=loop, lock=ThreadedAsyncLock())
+        start = time.perf_counter()
+        session = router.session_manager.create(
+            name='benchmark.py',
+            contents=PROTOCOL.format(transfers=transfers))
+        print(f"simulated {len(session.commands)} commands in "
+              f"{time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        tree, _ = serialize.get_object_tree(session)
+        print(f"built the object tree in "
+              f"{time.perf_counter() - start:.3f}s")
+        payload = {'$': {'type': rpc.CALL_RESULT_MESSAGE,
+                         'token': 'benchmark',
+                         'status': 'success'},
+                   'data': tree}
+
+        baseline, _ = _measure(payload, Encoding.json, 1)
+        for encoding in Encoding:
+            if not encoding.available:
+                print(f"{encoding.value:>16}: not available")
+                continue
+            size, seconds = _measure(payload, encoding, repeat)
+            print(f"{encoding.value:>16}: {size:>10} bytes "
+                  f"({size / baseline:6.1%}), "
+                  f"{seconds * 1000:8.2f}ms to encode")
+    finally:
+        hardware.clean_up()
+        loop.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog='rpc-encoding-benchmark',
+        description='Opentrons RPC wire encoding benchmark')
+    parser.add_argument(
+        "-t", "--transfers", type=int, default=100,
+        help="How many transfers the simulated protocol does.")
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5,
+        help="How many times to encode the session in each encoding.")
+    args = parser.parse_args()
+    run(transfers=args.transfers, repeat=args.repeat)
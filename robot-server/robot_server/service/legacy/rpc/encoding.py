@@ -0,0 +1,147 @@
+"""
+Wire encodings for messages the RPC server sends.
+
+JSON text frames are the default. A client can ask for a binary encoding by
+connecting with an ``encoding`` query parameter listing the encodings it
+accepts in order of preference, for example
+``/?encoding=msgpack-deflate,json-deflate``. The server uses the first one
+it supports and reports its choice in the ``encoding`` field of the first
+control message. Messages from the client are always JSON text. The
+msgpack encodings need the optional msgpack package.
+
+Binary encodings also intern object and type ids: every ``i`` and ``t`` in
+an object container is replaced by an index into a list of the distinct ids
+in the message, sent as the message's ``ids``. Decoding restores them.
+"""
+import enum
+import json
+import typing
+import zlib
+
+try:
+    import msgpack  # type: ignore
+except ImportError:
+    msgpack = None
+
+
+class Encoding(str, enum.Enum):
+    json = 'json'
+    json_deflate = 'json-deflate'
+    msgpack = 'msgpack'
+    msgpack_deflate = 'msgpack-deflate'
+
+    @property
+    def binary(self) -> bool:
+        return self is not Encoding.json
+
+    @property
+    def deflate(self) -> bool:
+        return self.value.endswith('-deflate')
+
+    @property
+    def available(self) -> bool:
+        return msgpack is not None or not self.value.startswith('msgpack')
+
+
+IDS_KEY = 'ids'
+
+
+def negotiate(requested: typing.Optional[str]) -> Encoding:
+    """
+    Choose the encoding for a connection.
+
+    :param requested: Comma separated encodings the client accepts, most
+        preferred first
+    :return: The first requested encoding that is available, or JSON
+    """
+    for name in (requested or '').split(','):
+        try:
+            encoding = Encoding(name.strip())
+        except ValueError:
+            continue
+        if encoding.available:
+            return encoding
+    return Encoding.json
+
+
+def encode(payload: typing.Dict[str, typing.Any],
+           encoding: Encoding) -> bytes:
+    """Encode a message for a binary encoding"""
+    interned = intern_ids(payload)
+    if encoding in (Encoding.msgpack, Encoding.msgpack_deflate):
+        data = msgpack.packb(interned, use_bin_type=True)
+    else:
+        data = json.dumps(interned, separators=(',', ':')).encode('utf-8')
+    if encoding.deflate:
+        data = zlib.compress(data)
+    return data
+
+
+def decode(data: bytes, encoding: Encoding) -> typing.Dict[str, typing.Any]:
+    """Decode a message encoded by :py:func:`encode`"""
+    if encoding.deflate:
+        data = zlib.decompress(data)
+    if encoding in (Encoding.msgpack, Encoding.msgpack_deflate):
+        # Object trees use string keys, so integer keys only come from the
+        # numbered items of iterable objects
+        payload = msgpack.unpackb(data, raw=False, strict_map_key=False)
+    else:
+        payload = json.loads(data)
+    return restore_ids(payload)
+
+
+def _is_container(node: typing.Dict) -> bool:
+    return 'i' in node and 't' in node and 'v' in node
+
+
+def intern_ids(payload: typing.Dict[str, typing.Any]) \
+        -> typing.Dict[str, typing.Any]:
+    """Replace the object and type ids in a message with indexes into a
+    list of its distinct ids"""
+    ids: typing.List[int] = []
+    indexes: typing.Dict[int, int] = {}
+
+    def index(_id: int) -> int:
+        if _id not in indexes:
+            indexes[_id] = len(ids)
+            ids.append(_id)
+        return indexes[_id]
+
+    def walk(node):
+        if isinstance(node, dict):
+            if _is_container(node):
+                return {**node,
+                        'i': index(node['i']),
+                        't': index(node['t']),
+                        'v': walk(node['v'])}
+            return {k: walk(v) for k, v in node.items()}
+        if isinstance(node, (list, tuple)):
+            return [walk(v) for v in node]
+        return node
+
+    interned = {k: (v if k == '$' else walk(v)) for k, v in payload.items()}
+    interned[IDS_KEY] = ids
+    return interned
+
+
+def restore_ids(payload: typing.Dict[str, typing.Any]) \
+        -> typing.Dict[str, typing.Any]:
+    """Undo :py:func:`intern_ids`"""
+    if IDS_KEY not in payload:
+        return payload
+    ids: typing.List[int] = payload[IDS_KEY]
+
+    def walk(node):
+        if isinstance(node, dict):
+            if _is_container(node):
+                return {**node,
+                        'i': ids[node['i']],
+                        't': ids[node['t']],
+                        'v': walk(node['v'])}
+            return {k: walk(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [walk(v) for v in node]
+        return node
+
+    return {k: (v if k == '$' else walk(v))
+            for k, v in payload.items() if k != IDS_KEY}
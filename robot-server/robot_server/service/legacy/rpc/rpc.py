@@ -8,6 +8,7 @@ from starlette.websockets import WebSocket, WebSocketState
 from starlette.status import WS_1001_GOING_AWAY
 
 from . import serialize
+from .encoding import Encoding, encode, negotiate
 from opentrons.protocols.execution.errors import ExceptionInProtocolError
 from concurrent.futures import ThreadPoolExecutor
 
@@ -30,6 +31,17 @@ class ClientWriterTask(typing.NamedTuple):
     socket: WebSocket
     queue: asyncio.Queue
     task: asyncio.Task
+    encoding: Encoding = Encoding.json
+
+
+async def send_payload(socket: WebSocket,
+                       payload: typing.Dict[str, typing.Any],
+                       encoding: Encoding) -> None:
+    """Send a message in the connection's encoding"""
+    if encoding.binary:
+        await socket.send_bytes(encode(payload, encoding))
+    else:
+        await socket.send_json(payload)
 
 
 class RPCServer(object):
@@ -76,12 +88,14 @@ class RPCServer(object):
 
         self.shutdown()
 
-    def send_worker(self, socket: WebSocket) -> ClientWriterTask:
+    def send_worker(self, socket: WebSocket,
+                    encoding: Encoding = Encoding.json) -> ClientWriterTask:
         """
         Create a send queue and task to read from said queue and send objects
         over socket.
 
         :param socket: Web socket
+        :param encoding: The wire encoding of the socket
         :return: The client object.
         """
         _id = id(socket)
@@ -99,14 +113,15 @@ class RPCServer(object):
                     log.debug(f'Websocket {_id} closed')
                     break
 
-                await socket_.send_json(payload)
+                await send_payload(socket_, payload, encoding)
 
         queue: asyncio.Queue = asyncio.Queue(loop=self.loop)
         task = self.loop.create_task(send_task(socket, queue))
         task.add_done_callback(task_done)
         log.debug(f'Send task for {_id} started')
 
-        return ClientWriterTask(socket=socket, queue=queue, task=task)
+        return ClientWriterTask(socket=socket, queue=queue, task=task,
+                                encoding=encoding)
 
     async def monitor_events(self, instance):
         async for event in instance.notifications:
@@ -137,21 +152,26 @@ class RPCServer(object):
                 )
 
         socket_id = id(socket)
+        encoding = negotiate(socket.query_params.get('encoding'))
 
-        log.info('Opening Websocket {0}'.format(id(socket)))
+        log.info('Opening Websocket {0} with {1} encoding'.format(
+            id(socket), encoding.value))
 
         try:
-            await socket.send_json({
-                '$': {'type': CONTROL_MESSAGE, 'monitor': True},
+            meta = {'type': CONTROL_MESSAGE, 'monitor': True}
+            if encoding.binary:
+                meta['encoding'] = encoding.value
+            await send_payload(socket, {
+                '$': meta,
                 'root': self.call_and_serialize(lambda: self.root),
                 'type': self.call_and_serialize(lambda: type(self.root))
-            })
+            }, encoding)
         except Exception:
             log.exception('While sending root info to {0}'.format(socket_id))
 
         try:
             # Add new client to list of clients
-            self.clients.append(self.send_worker(socket))
+            self.clients.append(self.send_worker(socket, encoding))
             # Async receive client data until websocket is closed
             while socket.client_state != WebSocketState.DISCONNECTED:
                 msg = await socket.receive_json()
@@ -1,7 +1,11 @@
+import typing
+
 from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
 from fastapi import APIRouter
 
-from opentrons import types as ot_types
+from opentrons import config, types as ot_types
 from opentrons.calibration_storage import (
     types as cal_types,
     get as get_cal,
@@ -12,9 +16,13 @@ from robot_server.service.pipette_offset import models as pip_models
 from robot_server.service.errors import RobotServerError, CommonErrorDef
 from robot_server.service.json_api import ErrorResponse, ResponseDataModel
 from robot_server.service.shared_models import calibration as cal_model
+from robot_server.service.response_cache import ResponseCache, \
+    files_version
 
 router = APIRouter()
 
+response_cache = ResponseCache()
+
 
 def _format_calibration(
     calibration: cal_types.PipetteOffsetCalibration
@@ -42,8 +50,19 @@ def _format_calibration(
     summary="Search the robot for any saved pipette offsets",
     response_model=pip_models.MultipleCalibrationsResponse)
 async def get_all_pipette_offset_calibrations(
+        request: Request,
         pipette_id: str = None,
         mount: pip_models.MountType = None
+) -> Response:
+    return response_cache.respond(
+        request,
+        files_version(config.get_opentrons_path('pipette_calibration_dir')),
+        lambda: _build_pipette_offset_calibrations(pipette_id, mount))
+
+
+def _build_pipette_offset_calibrations(
+        pipette_id: typing.Optional[str],
+        mount: typing.Optional[pip_models.MountType]
 ) -> pip_models.MultipleCalibrationsResponse:
     all_calibrations = get_cal.get_all_pipette_offset_calibrations()
 
@@ -77,3 +96,4 @@ async def get_specific_pipette_offset_calibration(
         raise RobotServerError(definition=CommonErrorDef.RESOURCE_NOT_FOUND,
                                resource='PipetteOffsetCalibration',
                                id=f"{pipette_id}&{mount}")
+    response_cache.invalidate()
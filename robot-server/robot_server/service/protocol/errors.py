@@ -34,3 +34,10 @@ class ProtocolUploadCountLimitReached(ProtocolException):
     def __init__(self, msg: str):
         super().__init__(definition=CommonErrorDef.ACTION_FORBIDDEN,
                          reason=msg)
+
+
+class ProtocolUploadTooLarge(ProtocolException):
+    """An uploaded file is larger than allowed"""
+    def __init__(self, msg: str):
+        super().__init__(definition=CommonErrorDef.PAYLOAD_TOO_LARGE,
+                         reason=msg)
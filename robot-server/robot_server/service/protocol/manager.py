@@ -1,3 +1,4 @@
+import asyncio
 import typing
 import logging
 from pathlib import Path
@@ -16,31 +17,38 @@ class ProtocolManager:
 
     def __init__(self):
         self._protocols: typing.Dict[str, UploadedProtocol] = {}
+        # Ids of protocols whose files are being saved
+        self._creating: typing.Set[str] = set()
 
-    def create(self,
-               protocol_file: UploadFile,
-               support_files: typing.List[UploadFile],
-               ) -> UploadedProtocol:
+    async def create(self,
+                     protocol_file: UploadFile,
+                     support_files: typing.List[UploadFile],
+                     ) -> UploadedProtocol:
         """Create a protocol object from upload"""
         protocol_id = Path(protocol_file.filename).stem
-        if protocol_id in self._protocols:
+        if protocol_id in self._protocols or protocol_id in self._creating:
             raise errors.ProtocolAlreadyExistsException(
                 f"A protocol with id '{protocol_id}' already exists"
             )
 
-        if len(self._protocols) >= ProtocolManager.MAX_COUNT:
+        if len(self._protocols) + len(self._creating) \
+                >= ProtocolManager.MAX_COUNT:
             raise errors.ProtocolUploadCountLimitReached(
                 f"Upload limit of {ProtocolManager.MAX_COUNT} has "
                 f"been reached.")
 
+        self._creating.add(protocol_id)
         try:
-            new_protocol = UploadedProtocol(protocol_id,
-                                            protocol_file,
-                                            support_files)
+            # Saving the files blocks, so keep it off the event loop
+            new_protocol = await asyncio.get_event_loop().run_in_executor(
+                None, UploadedProtocol,
+                protocol_id, protocol_file, support_files)
             log.debug(f"Created new protocol: {new_protocol.meta}")
         except (TypeError, IOError) as e:
             log.exception("Failed to create protocol")
             raise errors.ProtocolIOException(str(e))
+        finally:
+            self._creating.discard(protocol_id)
 
         self._protocols[new_protocol.meta.identifier] = new_protocol
         return new_protocol
@@ -7,8 +7,11 @@ from pathlib import Path
 
 from fastapi import UploadFile
 
-from robot_server.service.protocol.errors import ProtocolAlreadyExistsException
-from robot_server.util import FileMeta, save_upload
+from robot_server.service.protocol.errors import \
+    ProtocolAlreadyExistsException, ProtocolUploadTooLarge
+from robot_server.settings import get_settings
+from robot_server.util import FileMeta, save_upload, save_upload_async, \
+    UploadTooLargeError
 from opentrons.util.helpers import utc_now
 
 log = logging.getLogger(__name__)
@@ -34,7 +37,7 @@ class UploadedProtocol:
                  support_files: typing.List[UploadFile]
                  ):
         """
-        Constructor
+        Constructor. This saves the files, so it blocks.
 
         :param protocol_id: The id assigned to this protocol
         :param protocol_file: The uploaded protocol file
@@ -44,9 +47,19 @@ class UploadedProtocol:
                                       prefix=UploadedProtocol.DIR_PREFIX)
 
         temp_dir_path = Path(temp_dir.name)
-        protocol_file_meta = save_upload(temp_dir_path, protocol_file)
-        support_files_meta = [save_upload(temp_dir_path, s)
-                              for s in support_files]
+        max_size = get_settings().protocol_manager_max_file_size
+        try:
+            protocol_file_meta = save_upload(
+                temp_dir_path, protocol_file, max_size)
+            support_files_meta = [
+                save_upload(temp_dir_path, s, max_size)
+                for s in support_files]
+        except UploadTooLargeError as e:
+            temp_dir.cleanup()
+            raise ProtocolUploadTooLarge(str(e))
+        except BaseException:
+            temp_dir.cleanup()
+            raise
 
         self._meta = UploadedProtocolMeta(
             identifier=protocol_id,
@@ -54,18 +67,29 @@ class UploadedProtocol:
             support_files=support_files_meta,
             directory=temp_dir
         )
+        # Names of support files being saved
+        self._adding: typing.Set[str] = set()
 
-    def add(self, support_file: UploadFile):
+    async def add(self, support_file: UploadFile):
         """Add a support file to protocol temp directory"""
         temp_dir = Path(self._meta.directory.name)
 
         path = temp_dir / support_file.filename
-        if path.exists():
+        if path.exists() or support_file.filename in self._adding:
             raise ProtocolAlreadyExistsException(
                 f"File {support_file.filename} already exists"
             )
 
-        file_meta = save_upload(directory=temp_dir, upload_file=support_file)
+        max_size = get_settings().protocol_manager_max_file_size
+        self._adding.add(support_file.filename)
+        try:
+            file_meta = await save_upload_async(directory=temp_dir,
+                                                upload_file=support_file,
+                                                max_size=max_size)
+        except UploadTooLargeError as e:
+            raise ProtocolUploadTooLarge(str(e))
+        finally:
+            self._adding.discard(support_file.filename)
 
         self._meta = replace(
             self._meta,
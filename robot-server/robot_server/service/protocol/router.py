@@ -33,8 +33,9 @@ async def create_protocol(
                         "files, additional python files)"),
         protocol_manager=Depends(get_protocol_manager)):
     """Create protocol from proto file plus optional support files"""
-    new_proto = protocol_manager.create(protocol_file=protocolFile,
-                                        support_files=supportFiles,)
+    new_proto = await protocol_manager.create(
+        protocol_file=protocolFile,
+        support_files=supportFiles,)
     return route_models.ProtocolResponse(
         data=_to_response(new_proto),
         links=get_protocol_links(router, new_proto.meta.identifier)
@@ -91,7 +92,7 @@ async def create_protocol_file(
         file: UploadFile = File(...),
         protocol_manager: ProtocolManager = Depends(get_protocol_manager)):
     proto = protocol_manager.get(protocolId)
-    proto.add(file)
+    await proto.add(file)
     return route_models.ProtocolResponse(
         data=_to_response(proto),
         links=get_protocol_links(router, proto.meta.identifier),
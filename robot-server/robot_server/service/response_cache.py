@@ -0,0 +1,148 @@
+"""Conditional GET support for read endpoints the app polls.
+
+A :py:class:`ResponseCache` keeps the rendered body of a response along
+with the version of the data it was rendered from. The version is anything
+cheap to compute that changes whenever the data does, like the modification
+times of the files the response is read from. Until the version changes the
+cached body is reused, and a request whose If-None-Match header matches the
+strong ETag of the body is answered with 304 Not Modified.
+"""
+import hashlib
+import os
+import typing
+from pathlib import Path
+
+from pydantic import BaseModel
+from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
+
+#: How many distinct urls (including query strings) a cache remembers
+DEFAULT_MAX_ENTRIES = 32
+
+FilesVersion = typing.Tuple[typing.Tuple[str, int, int], ...]
+
+
+class _Entry(typing.NamedTuple):
+    version: typing.Hashable
+    etag: str
+    body: bytes
+
+
+_all_caches: typing.List['ResponseCache'] = []
+
+
+class ResponseCache:
+    """The rendered responses of an endpoint, keyed by url"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: typing.Dict[str, _Entry] = {}
+        _all_caches.append(self)
+
+    def invalidate(self) -> None:
+        """Forget all responses. Call after changing the underlying data."""
+        self._entries.clear()
+
+    def respond(self,
+                request: Request,
+                version: typing.Hashable,
+                build: typing.Callable[[], BaseModel],
+                **json_kwargs) -> Response:
+        """
+        Respond to a GET request, building the response model only if the
+        data changed since the last request for the same url.
+
+        :param request: The request
+        :param version: Identifies the state of the data the response is
+            built from
+        :param build: Creates the response model
+        :param json_kwargs: Arguments to the model's json method, to match
+            the route's response_model_exclude_* settings
+        """
+        key = request.url.path + '?' + request.url.query
+        entry = self._entries.pop(key, None)
+        if entry is None or entry.version != version:
+            json_kwargs.setdefault('by_alias', True)
+            body = build().json(**json_kwargs).encode('utf-8')
+            entry = _Entry(version=version, etag=make_etag(body), body=body)
+        self._entries[key] = entry
+        while len(self._entries) > self._max_entries:
+            del self._entries[next(iter(self._entries))]
+
+        headers = {'ETag': entry.etag}
+        if etag_matches(request.headers.get('if-none-match'), entry.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED,
+                            headers=headers)
+        return Response(content=entry.body,
+                        media_type='application/json',
+                        headers=headers)
+
+
+def invalidate_all() -> None:
+    """Forget every cached response, for changes that affect many
+    endpoints like a factory reset"""
+    for cache in _all_caches:
+        cache.invalidate()
+
+
+def make_etag(body: bytes) -> str:
+    """A strong entity tag for a response body"""
+    return f'"{hashlib.sha256(body).hexdigest()}"'
+
+
+def etag_matches(if_none_match: typing.Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an entity tag, using the
+    weak comparison that the header calls for"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*':
+            return True
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _stat_path(path: str,
+               to_visit: typing.List[str],
+               found: typing.List[typing.Tuple[str, int, int]]) -> None:
+    """Record the version of the file at a path, or queue up the entries
+    of the directory at it. A path that does not exist is skipped."""
+    try:
+        entries = list(os.scandir(path))
+    except NotADirectoryError:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return
+        found.append((path, stat.st_mtime_ns, stat.st_size))
+        return
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.is_dir():
+            to_visit.append(entry.path)
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            # Removed since the directory was listed
+            continue
+        found.append((entry.path, stat.st_mtime_ns, stat.st_size))
+
+
+def files_version(*paths: Path) -> FilesVersion:
+    """
+    The name, modification time and size of every file under the paths,
+    which changes when any of the files is written, added or removed.
+    Paths that do not exist are skipped.
+    """
+    found: typing.List[typing.Tuple[str, int, int]] = []
+    to_visit = [str(p) for p in paths]
+    while to_visit:
+        _stat_path(to_visit.pop(), to_visit, found)
+    return tuple(sorted(found))
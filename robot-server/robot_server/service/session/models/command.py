@@ -293,10 +293,22 @@ class SessionCommand(BasicSessionCommand):
     result: typing.Optional[CommandResultType] = None
 
 
+class SessionCommandBatch(BaseModel):
+    """An ordered list of session commands to execute"""
+    commands: typing.List[BasicSessionCommand] = Field(
+        ...,
+        description="The commands to execute in order. Execution stops at "
+                    "the first command that fails.",
+        min_items=1)
+
+
 # Session command requests/responses
 CommandRequest = RequestModel[
     BasicSessionCommand
 ]
+CommandBatchRequest = RequestModel[
+    SessionCommandBatch
+]
 CommandResponse = ResponseModel[
     SessionCommand, dict
 ]
@@ -1,19 +1,25 @@
 import logging
+import typing
 
 from starlette import status as http_status_codes
-from fastapi import APIRouter, Query, Depends
+from starlette.responses import StreamingResponse
+from fastapi import APIRouter, Query, Depends, Request
 
 from robot_server.service.session.models.common import IdentifierType
 from robot_server.service.dependencies import get_session_manager
-from robot_server.service.errors import RobotServerError, CommonErrorDef
-from robot_server.service.json_api import ResourceLink, ResponseDataModel
+from robot_server.service.errors import RobotServerError, CommonErrorDef, \
+    BaseRobotServerError, build_unhandled_exception_response
+from robot_server.service.json_api import ResourceLink, ResponseDataModel, \
+    ErrorResponse
 from robot_server.service.json_api.resource_links import ResourceLinkKey, \
     ResourceLinks
-from robot_server.service.session.command_execution import create_command
+from robot_server.service.session.command_execution import create_command, \
+    CompletedCommand
 from robot_server.service.session.errors import CommandExecutionException
 from robot_server.service.session.manager import SessionManager, BaseSession
 from robot_server.service.session.models.command import SessionCommand, \
-    CommandResponse, CommandRequest
+    CommandResponse, CommandRequest, CommandBatchRequest, \
+    BasicSessionCommand
 from robot_server.service.session.models.session import SessionResponse, \
     SessionCreateRequest, MultiSessionResponse, SessionType
 from robot_server.service.session.session_types import SessionMetaData
@@ -147,32 +153,125 @@ async def session_command_execute_handler(
     session_obj = get_session(manager=session_manager,
                               session_id=sessionId,
                               api_router=router)
-    if not session_manager.is_active(session_obj.meta.identifier):
+    check_session_active(session_manager, session_obj)
+
+    command_result = await execute_command(session_obj,
+                                           command_request.data.attributes)
+
+    return CommandResponse(
+        data=command_response_data(command_result),
+        links=get_valid_session_links(sessionId, router)
+    )
+
+
+NDJSON = "application/x-ndjson"
+
+
+@router.post(f"{PATH_SESSION_BY_ID}/commands/execute/batch",
+             description="Execute a list of commands in order, streaming "
+                         "the result of each as it completes. The response "
+                         "is newline delimited JSON with one command "
+                         "resource per line. Execution stops at the first "
+                         "failing command, whose errors are the last line, "
+                         "or when the client disconnects.",
+             responses={
+                 200: {
+                     "content": {NDJSON: {}},
+                     "description": "The command results"
+                 }
+             })
+async def session_command_execute_batch_handler(
+        request: Request,
+        sessionId: IdentifierType,
+        command_request: CommandBatchRequest,
+        session_manager: SessionManager = Depends(get_session_manager),
+) -> StreamingResponse:
+    """
+    Execute a batch of session commands
+    """
+    session_obj = get_session(manager=session_manager,
+                              session_id=sessionId,
+                              api_router=router)
+    check_session_active(session_manager, session_obj)
+
+    return StreamingResponse(
+        _execute_batch(request,
+                       session_manager,
+                       session_obj,
+                       command_request.data.attributes.commands),
+        media_type=NDJSON)
+
+
+async def _execute_batch(request: Request,
+                         session_manager: SessionManager,
+                         session_obj: BaseSession,
+                         commands: typing.List[BasicSessionCommand]) \
+        -> typing.AsyncIterator[str]:
+    """Execute the commands one at a time, yielding a line for each
+    result and stopping at the first error or when the client is gone"""
+    for index, command in enumerate(commands):
+        # Nothing stops the response when the client disconnects, so check
+        # before moving anything
+        if await request.is_disconnected():
+            log.info(f"Command batch stopped: client disconnected after "
+                     f"{index} of {len(commands)} commands")
+            return
+        try:
+            # The session can be deactivated while the batch is running
+            check_session_active(session_manager, session_obj)
+            command_result = await execute_command(session_obj, command)
+        except BaseRobotServerError as e:
+            log.info(f"Command batch stopped: {e}")
+            yield ErrorResponse(errors=[e.error]).json(
+                exclude_unset=True, exclude_none=True) + "\n"
+            return
+        except Exception as e:
+            log.exception("Command batch stopped by unhandled exception")
+            yield build_unhandled_exception_response(e).json(
+                exclude_unset=True) + "\n"
+            return
+        yield CommandResponse(data=command_response_data(command_result))\
+            .json(exclude_unset=True, exclude_defaults=True) + "\n"
+
+
+def check_session_active(session_manager: SessionManager,
+                         session_obj: BaseSession) -> None:
+    """Raise a CommandExecutionException if the session cannot execute
+    commands"""
+    session_id = session_obj.meta.identifier
+    if not session_manager.is_active(session_id):
         raise CommandExecutionException(
-            reason=f"Session '{sessionId}' is not active. "
+            reason=f"Session '{session_id}' is not active. "
                    "Only the active session can execute commands")
 
-    command = create_command(command_request.data.attributes.command,
-                             command_request.data.attributes.data)
+
+async def execute_command(session_obj: BaseSession,
+                          command_request: BasicSessionCommand) \
+        -> CompletedCommand:
+    """Create and execute a command in the session"""
+    command = create_command(command_request.command,
+                             command_request.data)
     command_result = await session_obj.command_executor.execute(command)
 
     log.info(f"Command completed: {command}")
     log.debug(f"Command result: {command_result}")
-
-    return CommandResponse(
-        data=ResponseDataModel.create(
-            attributes=SessionCommand(
-                data=command_result.content.data,
-                command=command_result.content.name,
-                status=command_result.result.status,
-                createdAt=command_result.meta.created_at,
-                startedAt=command_result.result.started_at,
-                completedAt=command_result.result.completed_at,
-                result=command_result.result.data,
-            ),
-            resource_id=command_result.meta.identifier
+    return command_result
+
+
+def command_response_data(command_result: CompletedCommand) \
+        -> ResponseDataModel:
+    """Create the response resource of a completed command"""
+    return ResponseDataModel.create(
+        attributes=SessionCommand(
+            data=command_result.content.data,
+            command=command_result.content.name,
+            status=command_result.result.status,
+            createdAt=command_result.meta.created_at,
+            startedAt=command_result.result.started_at,
+            completedAt=command_result.result.completed_at,
+            result=command_result.result.data,
         ),
-        links=get_valid_session_links(sessionId, router)
+        resource_id=command_result.meta.identifier
     )
 
 
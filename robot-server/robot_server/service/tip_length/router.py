@@ -1,6 +1,11 @@
+import typing
+
 from starlette import status
+from starlette.requests import Request
+from starlette.responses import Response
 from fastapi import APIRouter
 
+from opentrons import config
 from opentrons.calibration_storage import (
     types as cal_types,
     get as get_cal,
@@ -11,10 +16,14 @@ from robot_server.service.tip_length import models as tl_models
 from robot_server.service.errors import RobotServerError, CommonErrorDef
 from robot_server.service.json_api import ErrorResponse, ResponseDataModel
 from robot_server.service.shared_models import calibration as cal_model
+from robot_server.service.response_cache import ResponseCache, \
+    files_version
 
 
 router = APIRouter()
 
+response_cache = ResponseCache()
+
 
 def _format_calibration(
     calibration: cal_types.TipLengthCalibration
@@ -40,8 +49,19 @@ def _format_calibration(
     summary="Search the robot for any saved tip length calibration",
     response_model=tl_models.MultipleCalibrationsResponse)
 async def get_all_tip_length_calibrations(
+    request: Request,
     tiprack_hash: str = None,
     pipette_id: str = None
+) -> Response:
+    return response_cache.respond(
+        request,
+        files_version(config.get_tip_length_cal_path()),
+        lambda: _build_tip_length_calibrations(tiprack_hash, pipette_id))
+
+
+def _build_tip_length_calibrations(
+    tiprack_hash: typing.Optional[str],
+    pipette_id: typing.Optional[str]
 ) -> tl_models.MultipleCalibrationsResponse:
     all_calibrations = get_cal.get_all_tip_length_calibrations()
 
@@ -74,3 +94,4 @@ async def delete_specific_tip_length_calibration(
         raise RobotServerError(definition=CommonErrorDef.RESOURCE_NOT_FOUND,
                                resource='TipLengthCalibration',
                                id=f"{tiprack_hash}&{pipette_id}")
+    response_cache.invalidate()
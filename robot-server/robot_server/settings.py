@@ -74,5 +74,11 @@ class RobotServerSettings(BaseSettings):
         description="The maximum number of protocols allowed for upload"
     )
 
+    protocol_manager_max_file_size: int = Field(
+        100 * 1024 * 1024,
+        description="The largest protocol or support file allowed for "
+                    "upload, in bytes"
+    )
+
     class Config:
         env_prefix = "OT_ROBOT_SERVER_"
@@ -1,10 +1,15 @@
+import asyncio
 import hashlib
+import typing
 from dataclasses import dataclass
 from pathlib import Path
 
 from fastapi import UploadFile
 from opentrons.util.helpers import utc_now
 
+#: How much of an uploaded file is held in memory at once while saving it
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class duration:
     """Context manager to mark start and end times of a block"""
@@ -23,15 +28,56 @@ class FileMeta:
     content_hash: str
 
 
-def save_upload(directory: Path, upload_file: UploadFile) -> FileMeta:
-    """Save an uploaded file."""
+class UploadTooLargeError(ValueError):
+    """An uploaded file is larger than allowed"""
+    def __init__(self, filename: str, max_size: int):
+        super().__init__(
+            f"File {filename} is larger than the limit of {max_size} bytes")
+        self.filename = filename
+        self.max_size = max_size
+
+
+def save_upload(directory: Path,
+                upload_file: UploadFile,
+                max_size: typing.Optional[int] = None) -> FileMeta:
+    """
+    Save an uploaded file, a chunk at a time, hashing it as it goes.
+
+    This blocks, so async code should use :py:func:`save_upload_async`.
+
+    :param directory: Where to save the file
+    :param upload_file: The file
+    :param max_size: The largest file allowed, in bytes. If the upload is
+        larger, nothing is saved and UploadTooLargeError is raised.
+    """
     path = directory / upload_file.filename
+    content_hash = hashlib.sha256()
+    size = 0
+    p = path.open('wb')
+    try:
+        with p:
+            while True:
+                chunk = upload_file.file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise UploadTooLargeError(upload_file.filename, max_size)
+                content_hash.update(chunk)
+                p.write(chunk)
+    except BaseException:
+        # Don't leave a partial file behind
+        path.unlink()
+        raise
 
-    contents = upload_file.file.read()
-    content_hash = hashlib.sha256(contents).hexdigest()
+    return FileMeta(path=path, content_hash=content_hash.hexdigest())
 
-    # write contents to file
-    with path.open('wb') as p:
-        p.write(contents)
 
-    return FileMeta(path=path, content_hash=content_hash)
+async def save_upload_async(directory: Path,
+                            upload_file: UploadFile,
+                            max_size: typing.Optional[int] = None) \
+        -> FileMeta:
+    """Save an uploaded file in a worker thread. See
+    :py:func:`save_upload`."""
+    return await asyncio.get_event_loop().run_in_executor(
+        None, save_upload, directory, upload_file, max_size)
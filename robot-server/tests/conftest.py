@@ -17,6 +17,7 @@ from opentrons.protocols.implementations.labware import LabwareImplementation
 from starlette.testclient import TestClient
 from robot_server.service.app import app
 from robot_server.service.dependencies import get_hardware, verify_hardware
+from robot_server.service.response_cache import invalidate_all
 from opentrons.hardware_control import API, HardwareAPILike, ThreadedAsyncLock
 from opentrons import config
 
@@ -55,6 +56,9 @@ def override_hardware(hardware):
 
     app.dependency_overrides[verify_hardware] = verify_hardware_override
     app.dependency_overrides[get_hardware] = get_hardware_override
+    # Responses cached by earlier tests may come from other hardware or
+    # patched data
+    invalidate_all()
 
 
 @pytest.fixture
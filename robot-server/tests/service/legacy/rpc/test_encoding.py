@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from robot_server.service.dependencies import get_rpc_server
+from robot_server.service.legacy.rpc import rpc, serialize
+from robot_server.service.legacy.rpc.encoding import Encoding, negotiate, \
+    encode, decode, intern_ids, restore_ids
+
+
+class Foo:
+    def __init__(self, value, child=None):
+        self.value = value
+        self.child = child
+
+
+@pytest.fixture
+def payload():
+    tree, _ = serialize.get_object_tree(
+        [Foo(0, Foo(1)), Foo(2, Foo(3)), {'a': 1}])
+    return {'$': {'type': rpc.CALL_RESULT_MESSAGE, 'token': 'abc'},
+            'data': tree}
+
+
+@pytest.mark.parametrize(argnames="requested,expected",
+                         argvalues=[
+                             [None, Encoding.json],
+                             ['', Encoding.json],
+                             ['bogus', Encoding.json],
+                             ['json-deflate', Encoding.json_deflate],
+                             ['bogus, json-deflate,json',
+                              Encoding.json_deflate],
+                         ])
+def test_negotiate(requested, expected):
+    assert negotiate(requested) == expected
+
+
+def test_negotiate_unavailable(monkeypatch):
+    monkeypatch.setattr(
+        'robot_server.service.legacy.rpc.encoding.msgpack', None)
+    assert negotiate('msgpack,json-deflate') == Encoding.json_deflate
+    assert negotiate('msgpack-deflate') == Encoding.json
+
+
+def test_intern_ids(payload):
+    interned = intern_ids(payload)
+    # Four Foos, the list, one dict and the types of Foo and dict
+    assert sorted(interned['ids']) == sorted(
+        set([o['i'] for o in payload['data'][:2]]
+            + [o['v']['child']['i'] for o in payload['data'][:2]]
+            + [o['t'] for o in payload['data'][:2]]
+            + [payload['data'][2]['i'], payload['data'][2]['t']]))
+    assert interned['data'][0]['i'] == 0
+    assert interned['data'][0]['t'] == 1
+    assert interned['data'][1]['t'] == 1
+    assert interned['$'] == payload['$']
+    assert restore_ids(interned) == payload
+
+
+@pytest.mark.parametrize('encoding', [Encoding.json_deflate,
+                                      Encoding.msgpack,
+                                      Encoding.msgpack_deflate])
+def test_encode_round_trip(payload, encoding):
+    if not encoding.available:
+        pytest.skip('msgpack is not installed')
+    encoded = encode(payload, encoding)
+    assert isinstance(encoded, bytes)
+    assert decode(encoded, encoding) == payload
+
+
+def test_binary_connection(api_client):
+    root = Foo(0)
+
+    async def get_server():
+        return rpc.RPCServer(None, root)
+
+    api_client.app.dependency_overrides[get_rpc_server] = get_server
+
+    with api_client.websocket_connect("/?encoding=bogus,json-deflate") \
+            as socket:
+        control = decode(socket.receive_bytes(), Encoding.json_deflate)
+        assert control['$'] == {'type': rpc.CONTROL_MESSAGE,
+                                'monitor': True,
+                                'encoding': 'json-deflate'}
+        assert control['root'] == json.loads(json.dumps(
+            serialize.get_object_tree(root)[0]))
+
+        socket.send_json({'$': {'ping': True}})
+        pong = decode(socket.receive_bytes(), Encoding.json_deflate)
+        assert pong == {'$': {'type': rpc.PONG_MESSAGE}}
@@ -7,6 +7,7 @@ from robot_server.service.protocol import errors
 from robot_server.service.protocol.manager import ProtocolManager, UploadFile
 from robot_server.service.protocol.protocol import UploadedProtocolMeta, \
     UploadedProtocol
+from robot_server.settings import get_settings
 
 
 @pytest.fixture
@@ -37,45 +38,46 @@ def mock_uploaded_control_constructor(mock_uploaded_protocol):
 
 
 @pytest.fixture
-def manager_with_mock_protocol(mock_uploaded_control_constructor,
-                               mock_upload_file):
+async def manager_with_mock_protocol(loop,
+                                     mock_uploaded_control_constructor,
+                                     mock_upload_file):
     manager = ProtocolManager()
-    manager.create(mock_upload_file, [])
+    await manager.create(mock_upload_file, [])
     return manager
 
 
 class TestCreate:
-    def test_create(self, mock_uploaded_control_constructor,
-                    mock_upload_file, mock_uploaded_protocol):
+    async def test_create(self, mock_uploaded_control_constructor,
+                          mock_upload_file, mock_uploaded_protocol):
         manager = ProtocolManager()
-        p = manager.create(mock_upload_file, [])
+        p = await manager.create(mock_upload_file, [])
         mock_uploaded_control_constructor.assert_called_once_with(
             Path(mock_upload_file.filename).stem, mock_upload_file, [])
         assert p == mock_uploaded_protocol
         assert manager._protocols[mock_uploaded_protocol.meta.identifier] == p
 
-    def test_create_already_exists(self,
-                                   mock_upload_file,
-                                   manager_with_mock_protocol):
-        with pytest.raises(errors.ProtocolAlreadyExistsException):
-            manager_with_mock_protocol.create(mock_upload_file, [])
-
-    def test_create_upload_limit_reached(self,
+    async def test_create_already_exists(self,
                                          mock_upload_file,
                                          manager_with_mock_protocol):
+        with pytest.raises(errors.ProtocolAlreadyExistsException):
+            await manager_with_mock_protocol.create(mock_upload_file, [])
+
+    async def test_create_upload_limit_reached(self,
+                                               mock_upload_file,
+                                               manager_with_mock_protocol):
         ProtocolManager.MAX_COUNT = 1
         m = MagicMock(spec=UploadFile)
         m.filename = "123_" + mock_upload_file.filename
         with pytest.raises(errors.ProtocolUploadCountLimitReached):
-            manager_with_mock_protocol.create(m, [])
+            await manager_with_mock_protocol.create(m, [])
 
     @pytest.mark.parametrize(argnames="exception", argvalues=[
         TypeError, IOError
     ])
-    def test_create_raises(self,
-                           exception,
-                           mock_upload_file,
-                           mock_uploaded_protocol):
+    async def test_create_raises(self,
+                                 exception,
+                                 mock_upload_file,
+                                 mock_uploaded_protocol):
         with patch("robot_server.service.protocol.manager.UploadedProtocol") \
                 as mock_construct:
             def raiser(*args, **kwargs):
@@ -85,7 +87,7 @@ class TestCreate:
 
             with pytest.raises(errors.ProtocolIOException):
                 manager = ProtocolManager()
-                manager.create(mock_upload_file, [])
+                await manager.create(mock_upload_file, [])
 
 
 class TestGet:
@@ -129,3 +131,28 @@ class TestRemoveAll:
         manager_with_mock_protocol.remove_all()
         mock_uploaded_protocol.clean_up.assert_called_once()
         assert manager_with_mock_protocol._protocols == {}
+
+
+def _upload(filename, contents):
+    upload = UploadFile(filename)
+    upload.file.write(contents)
+    upload.file.seek(0)
+    return upload
+
+
+async def test_uploaded_protocol_max_file_size_from_settings(loop):
+    """Test that the file size limit is read when files are uploaded"""
+    settings = get_settings().copy(
+        update={"protocol_manager_max_file_size": 10})
+    with patch("robot_server.service.protocol.protocol.get_settings",
+               return_value=settings):
+        protocol = UploadedProtocol("p", _upload("p.py", b"x" * 10), [])
+        try:
+            with pytest.raises(errors.ProtocolUploadTooLarge):
+                await protocol.add(_upload("big.csv", b"x" * 11))
+            settings.protocol_manager_max_file_size = 20
+            await protocol.add(_upload("big.csv", b"x" * 11))
+        finally:
+            protocol.clean_up()
+        with pytest.raises(errors.ProtocolUploadTooLarge):
+            UploadedProtocol("q", _upload("q.py", b"x" * 21), [])
@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import MagicMock, patch
 from datetime import datetime
@@ -5,6 +6,7 @@ from datetime import datetime
 import typing
 
 from pydantic.main import BaseModel
+from starlette.requests import Request
 
 from robot_server.service.dependencies import get_session_manager
 from robot_server.service.session.command_execution import CommandExecutor, \
@@ -469,3 +471,150 @@ def test_execute_command_session_inactive(
         ]
     }
     assert response.status_code == 403
+
+
+def batch(*commands):
+    """Helper to create a command batch"""
+    return {
+        "data": {
+            "type": "SessionCommandBatch",
+            "attributes": {
+                "commands": [c["data"]["attributes"] for c in commands]
+            }
+        }
+    }
+
+
+def test_execute_command_batch(api_client,
+                               session_manager_with_session,
+                               mock_session_meta,
+                               mock_command_executor,
+                               command_id,
+                               patch_create_command):
+    response = api_client.post(
+        f"/sessions/{mock_session_meta.identifier}/commands/execute/batch",
+        json=batch(command("calibration.jog",
+                           JogPosition(vector=(1, 2, 3,))),
+                   command("calibration.loadLabware", None)))
+
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert [c[0][0].content.name
+            for c in mock_command_executor.execute.call_args_list] == [
+        CalibrationCommand.jog, CalibrationCommand.load_labware
+    ]
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == [
+        {
+            'data': {
+                'attributes': {
+                    'command': 'calibration.jog',
+                    'data': {'vector': [1.0, 2.0, 3.0]},
+                    'status': 'executed',
+                    'createdAt': '2000-01-01T00:00:00',
+                    'startedAt': '2019-01-01T00:00:00',
+                    'completedAt': '2020-01-01T00:00:00',
+                },
+                'type': 'SessionCommand',
+                'id': command_id,
+            }
+        },
+        {
+            'data': {
+                'attributes': {
+                    'command': 'calibration.loadLabware',
+                    'data': {},
+                    'status': 'executed',
+                    'createdAt': '2000-01-01T00:00:00',
+                    'startedAt': '2019-01-01T00:00:00',
+                    'completedAt': '2020-01-01T00:00:00',
+                },
+                'type': 'SessionCommand',
+                'id': command_id,
+            }
+        },
+    ]
+
+
+def test_execute_command_batch_stops_on_error(api_client,
+                                              session_manager_with_session,
+                                              mock_session_meta,
+                                              mock_command_executor,
+                                              patch_create_command):
+    """Test that commands after a failing one are not executed"""
+    executed = mock_command_executor.execute.side_effect
+
+    async def fail_second(command):
+        if mock_command_executor.execute.call_count == 2:
+            raise CommandExecutionException("Cannot do it")
+        return await executed(command)
+
+    mock_command_executor.execute.side_effect = fail_second
+
+    response = api_client.post(
+        f"/sessions/{mock_session_meta.identifier}/commands/execute/batch",
+        json=batch(*[command("calibration.jog",
+                             JogPosition(vector=(1, 2, 3,)))] * 3))
+
+    assert response.status_code == 200
+    assert mock_command_executor.execute.call_count == 2
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 2
+    assert lines[0]['data']['attributes']['status'] == 'executed'
+    assert lines[1] == {
+        'errors': [
+            {
+                'detail': 'Cannot do it',
+                'status': '403',
+                'title': 'Action Forbidden'
+            }
+        ]
+    }
+
+
+def test_execute_command_batch_stops_on_disconnect(
+        api_client,
+        session_manager_with_session,
+        mock_session_meta,
+        mock_command_executor,
+        patch_create_command):
+    """Test that the rest of a batch is dropped when the client is gone"""
+    async def disconnected_after_first(request):
+        return mock_command_executor.execute.call_count > 0
+
+    with patch.object(Request, "is_disconnected", disconnected_after_first):
+        response = api_client.post(
+            f"/sessions/{mock_session_meta.identifier}/commands/execute/batch",
+            json=batch(*[command("calibration.jog",
+                                 JogPosition(vector=(1, 2, 3,)))] * 3))
+
+    assert response.status_code == 200
+    assert mock_command_executor.execute.call_count == 1
+    assert len(response.text.splitlines()) == 1
+
+
+def test_execute_command_batch_session_inactive(
+        api_client,
+        session_manager_with_session,
+        mock_session_meta,
+        mock_command_executor):
+    """Test that an inactive session rejects the batch before streaming"""
+    session_manager_with_session._active.active_id = None
+
+    response = api_client.post(
+        f"/sessions/{mock_session_meta.identifier}/commands/execute/batch",
+        json=batch(command("calibration.jog",
+                           JogPosition(vector=(1, 2, 3,)))))
+
+    assert response.status_code == 403
+    assert response.json()['errors'][0]['title'] == 'Action Forbidden'
+    mock_command_executor.execute.assert_not_called()
+
+
+def test_execute_command_batch_empty(api_client,
+                                     session_manager_with_session,
+                                     mock_session_meta):
+    response = api_client.post(
+        f"/sessions/{mock_session_meta.identifier}/commands/execute/batch",
+        json=batch())
+    assert response.status_code == 422
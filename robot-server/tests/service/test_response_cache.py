@@ -0,0 +1,88 @@
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from robot_server.service import response_cache
+from robot_server.service.response_cache import etag_matches, files_version
+
+
+@pytest.mark.parametrize(argnames="header,expected",
+                         argvalues=[
+                             [None, False],
+                             ['', False],
+                             ['"abc"', True],
+                             ['W/"abc"', True],
+                             ['"xyz", "abc"', True],
+                             ['"xyz"', False],
+                             ['abc', False],
+                             ['*', True],
+                         ])
+def test_etag_matches(header, expected):
+    assert etag_matches(header, '"abc"') == expected
+
+
+def test_files_version(tmp_path):
+    assert files_version(tmp_path / 'missing') == ()
+
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'sub' / 'a.json').write_text('{}')
+    (tmp_path / 'b.json').write_text('{}')
+    first = files_version(tmp_path)
+    assert [os.path.basename(f[0]) for f in first] == ['b.json', 'a.json']
+    assert files_version(tmp_path) == first
+
+    (tmp_path / 'sub' / 'a.json').write_text('{"changed": 1}')
+    changed = files_version(tmp_path)
+    assert changed != first
+
+    (tmp_path / 'b.json').unlink()
+    assert len(files_version(tmp_path)) == 1
+    assert files_version(tmp_path / 'sub' / 'a.json') == changed[1:]
+
+
+def test_conditional_get(api_client, set_up_tip_length_temp_directory):
+    url = '/calibration/tip_length?pipette_id=pip_1&tiprack_hash=fakehash'
+    resp = api_client.get(url)
+    assert resp.status_code == 200
+    etag = resp.headers['etag']
+    assert len(resp.json()['data']) == 1
+
+    resp = api_client.get(url, headers={'If-None-Match': etag})
+    assert resp.status_code == 304
+    assert resp.headers['etag'] == etag
+    assert resp.content == b''
+
+    resp = api_client.get(url, headers={'If-None-Match': '"other"'})
+    assert resp.status_code == 200
+    assert resp.headers['etag'] == etag
+
+    resp = api_client.delete(url)
+    assert resp.status_code == 200
+
+    resp = api_client.get(url, headers={'If-None-Match': etag})
+    assert resp.status_code == 200
+    assert resp.headers['etag'] != etag
+    assert resp.json()['data'] == []
+
+
+def test_response_rebuilt_only_when_version_changes():
+    cache = response_cache.ResponseCache()
+    request = MagicMock()
+    request.url.path = '/thing'
+    request.url.query = ''
+    request.headers = {}
+    model = MagicMock()
+    model.json.return_value = '{"a": 1}'
+
+    first = cache.respond(request, 1, lambda: model)
+    second = cache.respond(request, 1, lambda: model)
+    third = cache.respond(request, 2, lambda: model)
+    assert model.json.call_count == 2
+    model.json.assert_called_with(by_alias=True)
+    assert first.body == second.body == third.body == b'{"a": 1}'
+    assert first.headers['etag'] == third.headers['etag']
+
+    response_cache.invalidate_all()
+    cache.respond(request, 2, lambda: model)
+    assert model.json.call_count == 3
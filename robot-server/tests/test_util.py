@@ -1,8 +1,11 @@
+import hashlib
 from datetime import timedelta, datetime
 
 import pytest
 from unittest.mock import patch
 
+from fastapi import UploadFile
+
 from robot_server import util
 
 
@@ -48,3 +51,30 @@ def test_duration_raises(mock_utc_now, mock_start_time):
 
     assert t.start == mock_start_time
     assert t.end == mock_start_time + timedelta(days=1)
+
+
+def _upload(filename, contents):
+    upload = UploadFile(filename)
+    upload.file.write(contents)
+    upload.file.seek(0)
+    return upload
+
+
+def test_save_upload(tmp_path):
+    contents = b'x' * (util.UPLOAD_CHUNK_SIZE * 2 + 10)
+    meta = util.save_upload(tmp_path, _upload('big.csv', contents))
+    assert meta.path == tmp_path / 'big.csv'
+    assert meta.path.read_bytes() == contents
+    assert meta.content_hash == hashlib.sha256(contents).hexdigest()
+
+
+def test_save_upload_too_large(tmp_path):
+    with pytest.raises(util.UploadTooLargeError):
+        util.save_upload(tmp_path, _upload('big.csv', b'x' * 11), 10)
+    assert not (tmp_path / 'big.csv').exists()
+
+
+async def test_save_upload_async(loop, tmp_path):
+    meta = await util.save_upload_async(tmp_path,
+                                        _upload('proto.py', b'abc'), 3)
+    assert meta.path.read_bytes() == b'abc'